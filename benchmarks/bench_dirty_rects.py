@@ -0,0 +1,74 @@
+"""
+Бенчмарк режима dirty rects.
+
+Сравнивает процессорное время кадра в простаивающем зале при полной
+перерисовке с pygame.display.flip() и в режиме dirty rects с
+pygame.display.update(rects).
+
+Запуск из корня проекта:
+    python benchmarks/bench_dirty_rects.py
+"""
+import os
+import sys
+import time
+from unittest.mock import patch
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Бенчмарк не требует настоящего окна и звука
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+FRAMES = 600
+
+
+def create_game(screen, dirty_rects):
+    """Создаёт GameCore с тамагочи в памяти (без базы данных)."""
+    from database.models import Tamagotchi
+    from game.core import GameCore
+
+    with patch('game.core.DatabaseManager') as mock_db_manager:
+        mock_db_manager.return_value.get_latest_tamagotchi.return_value = Tamagotchi(name="Бенч")
+        return GameCore(screen, dirty_rects=dirty_rects)
+
+
+def run(game):
+    """Выполняет FRAMES итераций игрового цикла без ожидания таймера.
+
+    Возвращает:
+        float: Процессорное время на кадр в мс
+    """
+    start = time.process_time()
+    for _ in range(FRAMES):
+        game.update()
+        if game.dirty_tracker:
+            game.present_dirty()
+        else:
+            game.draw()
+            pygame.display.flip()
+    return (time.process_time() - start) * 1000 / FRAMES
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    print(f"Кадров: {FRAMES}, комната: зал, тамагочи простаивает")
+    for label, dirty_rects in (("полный кадр", False), ("dirty rects", True)):
+        game = create_game(screen, dirty_rects)
+        frame_ms = run(game)
+        print(f"{label:>12}: {frame_ms:7.3f} мс CPU/кадр")
+        if game.dirty_tracker:
+            stats = game.dirty_tracker.stats
+            print(f"{'':>12}  пропущено кадров: {stats['skipped']} из {stats['frames']}")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Бенчмарк создания объектов Tamagotchi из строк базы данных.
+
+Сравнивает скорость загрузки ROWS строк через Tamagotchi.from_row,
+Tamagotchi.from_dict и прежнюю модель со словарем экземпляра, а также
+память, занимаемую одним питомцем.
+
+Запуск из корня проекта:
+    python benchmarks/bench_model_hydration.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi, ROW_COLUMNS, TRACKED_FIELDS
+
+ROWS = 1000000
+
+
+class LegacyTamagotchi:
+    """Прежняя модель: атрибуты в __dict__, загрузка через значения по умолчанию."""
+
+    def __init__(self, id=None, name="Pou", created_at=None):
+        self.id = id
+        self.name = name
+        self.hunger = 50
+        self.happiness = 50
+        self.health = 100
+        self.cleanliness = 50
+        self.energy = 100
+        self.age = 0
+        self.coins = 100
+        self.created_at = created_at or datetime.now()
+        self.last_updated = datetime.now()
+        self.evolution_stage = 1
+        self.version = 0
+
+    def __setattr__(self, name, value):
+        if name in TRACKED_FIELDS:
+            state = self.__dict__
+            if name in state and state[name] == value:
+                return
+            state.setdefault('_dirty', set()).add(name)
+            state['version'] = state.get('version', 0) + 1
+        object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_dict(cls, data):
+        tamagotchi = cls()
+        for column in ROW_COLUMNS:
+            setattr(tamagotchi, column, data.get(column))
+        tamagotchi._dirty = set()
+        tamagotchi.version = 0
+        return tamagotchi
+
+
+def create_rows():
+    """Создает строки таблицы tamagotchis в порядке ROW_COLUMNS."""
+    created = datetime(2024, 1, 1)
+    return [(i, f"Питомец {i}", 50, 50, 100, 50, 100, 0, 100, 1, created, created)
+            for i in range(1, ROWS + 1)]
+
+
+def bench_hydration(load, rows):
+    """Возвращает скорость загрузки (строк/с) для функции load(row)."""
+    start = time.perf_counter()
+    pets = [load(row) for row in rows]
+    elapsed = time.perf_counter() - start
+    del pets
+    return len(rows) / elapsed
+
+
+def bench_memory(load, rows):
+    """Возвращает среднюю память одного питомца в байтах (без строки и дат)."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    pets = [load(row) for row in rows]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Список ссылок на питомцев не относится к самому объекту
+    size = after - before - sys.getsizeof(pets)
+    del pets
+    return size / len(rows)
+
+
+def main():
+    rows = create_rows()
+    dicts = [dict(zip(ROW_COLUMNS, row)) for row in rows]
+    from_dict_rows = iter(dicts)
+    legacy_rows = iter(dicts)
+
+    loaders = [
+        ("Tamagotchi.from_row", Tamagotchi.from_row),
+        ("Tamagotchi.from_dict", lambda row: Tamagotchi.from_dict(next(from_dict_rows))),
+        ("Прежняя модель (from_dict)", lambda row: LegacyTamagotchi.from_dict(next(legacy_rows))),
+    ]
+    print(f"Строк: {ROWS}")
+    for title, load in loaders:
+        print(f"{title + ':':30} {bench_hydration(load, rows) / 1000:8.0f} тыс. строк/с")
+
+    memory_rows = rows[:ROWS // 10]
+    memory_dicts = dicts[:ROWS // 10]
+    slots = bench_memory(Tamagotchi.from_row, memory_rows)
+    legacy_dicts = iter(memory_dicts)
+    legacy = bench_memory(lambda row: LegacyTamagotchi.from_dict(next(legacy_dicts)), memory_rows)
+    print(f"Память на питомца: __slots__ {slots:.0f} байт, прежняя модель {legacy:.0f} байт")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Бенчмарк пакетной симуляции питомцев.
+
+Сравнивает время одного шага симуляции для большой популяции при вызове
+PetSimulation.step() для каждого питомца и при векторизованном шаге
+PetPopulation.step(), а также прокрутку популяции с разнесёнными таймерами
+через PetSimulation.advance() и PetPopulation.advance().
+
+Запуск из корня проекта:
+    python benchmarks/bench_population.py
+"""
+import os
+import random
+import sys
+import time
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from game.simulation import PetSimulation, ManualClock
+from game.population import PetPopulation
+
+PETS = 10000
+STEPS = 50
+# Прокрутка питомцев с разнесёнными таймерами
+ADVANCE_PETS = 2000
+ADVANCE_MS = 60 * 60 * 1000
+
+
+def create_simulations():
+    """Создаёт симуляции питомцев с общими часами."""
+    clock = ManualClock()
+    return [PetSimulation(Tamagotchi(name=f"Питомец {i}"), clock) for i in range(PETS)]
+
+
+def bench_scalar():
+    """Возвращает среднее время шага при покомпонентном обновлении (мс)."""
+    simulations = create_simulations()
+    start = time.perf_counter()
+    for step in range(1, STEPS + 1):
+        now = step * 30001
+        for simulation in simulations:
+            simulation.step(now)
+    return (time.perf_counter() - start) * 1000 / STEPS
+
+
+def bench_batch():
+    """Возвращает среднее время векторизованного шага (мс)."""
+    population = PetPopulation.from_simulations(create_simulations())
+    start = time.perf_counter()
+    for step in range(1, STEPS + 1):
+        population.step(step * 30001)
+    return (time.perf_counter() - start) * 1000 / STEPS
+
+
+def create_staggered_simulations():
+    """Создаёт симуляции со случайно разнесёнными таймерами и частью спящих."""
+    rng = random.Random(42)
+    simulations = []
+    for i in range(ADVANCE_PETS):
+        # Свои часы у каждого питомца: advance() переводит часы симуляции
+        simulation = PetSimulation(Tamagotchi(name=f"Питомец {i}"), ManualClock(120000))
+        simulation.last_update_time = rng.randrange(90000, 120000)
+        simulation.last_passive_update = rng.randrange(0, 120000)
+        simulation.last_energy_regen = rng.randrange(90000, 120000)
+        if rng.random() < 0.3:
+            simulation.is_sleeping = True
+            simulation.data.energy = rng.randrange(0, 60)
+        simulations.append(simulation)
+    return simulations
+
+
+def bench_advance_scalar():
+    """Возвращает время прокрутки по одному питомцу (мс)."""
+    simulations = create_staggered_simulations()
+    start = time.perf_counter()
+    for simulation in simulations:
+        simulation.advance(ADVANCE_MS)
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_advance_batch():
+    """Возвращает время прокрутки популяции (мс) и число векторизованных шагов."""
+    population = PetPopulation.from_simulations(create_staggered_simulations())
+    start = time.perf_counter()
+    steps = population.advance(ADVANCE_MS)
+    return (time.perf_counter() - start) * 1000, steps
+
+
+def main():
+    scalar = bench_scalar()
+    batch = bench_batch()
+    print(f"Питомцев: {PETS}, шагов: {STEPS}")
+    print(f"PetSimulation.step по одному: {scalar:.2f} мс/шаг")
+    print(f"PetPopulation.step:           {batch:.2f} мс/шаг")
+    print(f"Ускорение: x{scalar / batch:.1f}")
+
+    scalar = bench_advance_scalar()
+    batch, steps = bench_advance_batch()
+    print(f"Питомцев с разнесёнными таймерами: {ADVANCE_PETS}, прокрутка: {ADVANCE_MS} мс")
+    print(f"PetSimulation.advance по одному: {scalar:.2f} мс")
+    print(f"PetPopulation.advance:           {batch:.2f} мс ({steps} шагов)")
+    print(f"Ускорение: x{scalar / batch:.1f}")
+
+
+if __name__ == '__main__':
+    main()
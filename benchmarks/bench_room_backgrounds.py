@@ -0,0 +1,101 @@
+"""
+Бенчмарк отрисовки фонов комнат.
+
+Сравнивает время кадра и количество вызовов pygame.transform.scale на кадр
+для старого поведения (масштабирование фона в каждом кадре) и для фона,
+запечённого в статический слой комнаты.
+
+Запуск из корня проекта:
+    python benchmarks/bench_room_backgrounds.py
+"""
+import os
+import sys
+import time
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Бенчмарк не требует настоящего окна и звука
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+FRAMES = 300
+
+
+class ScaleCounter:
+    """Обёртка над pygame.transform.scale, считающая вызовы (выделения поверхностей)."""
+
+    def __init__(self):
+        self.original = pygame.transform.scale
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.original(*args, **kwargs)
+
+    def __enter__(self):
+        pygame.transform.scale = self
+        return self
+
+    def __exit__(self, *exc):
+        pygame.transform.scale = self.original
+
+
+def create_rooms():
+    """Создаёт все комнаты с синтетическим фоновым изображением."""
+    from game.rooms.hall import Hall
+    from game.rooms.kitchen import Kitchen
+    from game.rooms.bedroom import Bedroom
+    from game.rooms.playroom import Playroom
+    from game.rooms.bathroom import Bathroom
+    from game.rooms.shop_room import ShopRoom
+
+    rooms = [Hall(), Kitchen(), Bedroom(), Playroom(), Bathroom(), ShopRoom()]
+    for room in rooms:
+        # Размер исходника отличается от экрана, как у настоящих jpg
+        room.background_image = pygame.Surface((1280, 960)).convert()
+    return rooms
+
+
+def run(rooms, screen, cached):
+    """Отрисовывает FRAMES кадров фона каждой комнаты.
+
+    Возвращает:
+        tuple: (среднее время кадра в мс, вызовов transform.scale на кадр)
+    """
+    for room in rooms:
+        room.invalidate_static_layer()
+    with ScaleCounter() as counter:
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            for room in rooms:
+                if cached:
+                    room.draw_static_layer(screen, (0, 0, 0))
+                else:
+                    # Эмулируем старое поведение: масштабирование в каждом кадре
+                    room.draw_background(screen, (0, 0, 0))
+        elapsed = time.perf_counter() - start
+
+    frames = FRAMES * len(rooms)
+    return elapsed * 1000 / frames, counter.calls / frames
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    rooms = create_rooms()
+
+    print(f"Кадров на комнату: {FRAMES}, комнат: {len(rooms)}")
+    for label, cached in (("без кэша", False), ("со слоем", True)):
+        frame_ms, scales = run(rooms, screen, cached)
+        print(f"{label:>10}: {frame_ms:7.3f} мс/кадр, transform.scale на кадр: {scales:.3f}")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
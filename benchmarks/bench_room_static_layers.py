@@ -0,0 +1,102 @@
+"""
+Бенчмарк статических слоёв комнат.
+
+Сравнивает время кадра и количество вызовов pygame.draw на кадр для
+процедурно нарисованных комнат (без фоновых изображений): со сбросом
+статического слоя в каждом кадре (старое поведение) и с запечённым слоем.
+
+Запуск из корня проекта:
+    python benchmarks/bench_room_static_layers.py
+"""
+import os
+import sys
+import time
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Бенчмарк не требует настоящего окна и звука
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from config import SCREEN_WIDTH, SCREEN_HEIGHT
+
+FRAMES = 300
+DRAW_FUNCTIONS = ('rect', 'circle', 'ellipse', 'line', 'polygon')
+
+
+class DrawCounter:
+    """Подменяет функции pygame.draw обёртками, считающими вызовы."""
+
+    def __init__(self):
+        self.originals = {name: getattr(pygame.draw, name) for name in DRAW_FUNCTIONS}
+        self.calls = 0
+
+    def wrap(self, original):
+        def counted(*args, **kwargs):
+            self.calls += 1
+            return original(*args, **kwargs)
+        return counted
+
+    def __enter__(self):
+        for name, original in self.originals.items():
+            setattr(pygame.draw, name, self.wrap(original))
+        return self
+
+    def __exit__(self, *exc):
+        for name, original in self.originals.items():
+            setattr(pygame.draw, name, original)
+
+
+def create_rooms():
+    """Создаёт комнаты с процедурным декором (без фоновых изображений)."""
+    from game.rooms.hall import Hall
+    from game.rooms.kitchen import Kitchen
+    from game.rooms.bedroom import Bedroom
+    from game.rooms.playroom import Playroom
+    from game.rooms.bathroom import Bathroom
+
+    rooms = [Hall(), Kitchen(), Bedroom(), Playroom(), Bathroom()]
+    for room in rooms:
+        room.background_image = None
+        room.invalidate_static_layer()
+    return rooms
+
+
+def run(rooms, screen, baked):
+    """Отрисовывает FRAMES кадров каждой комнаты без тамагочи.
+
+    Возвращает:
+        tuple: (среднее время кадра в мс, вызовов pygame.draw на кадр)
+    """
+    with DrawCounter() as counter:
+        start = time.perf_counter()
+        for _ in range(FRAMES):
+            for room in rooms:
+                if not baked:
+                    # Эмулируем старое поведение: декор рисуется каждый кадр
+                    room.invalidate_static_layer()
+                room.draw(screen, None)
+        elapsed = time.perf_counter() - start
+
+    frames = FRAMES * len(rooms)
+    return elapsed * 1000 / frames, counter.calls / frames
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    rooms = create_rooms()
+
+    print(f"Кадров на комнату: {FRAMES}, комнат: {len(rooms)}")
+    for label, baked in (("без слоя", False), ("со слоем", True)):
+        frame_ms, draws = run(rooms, screen, baked)
+        print(f"{label:>10}: {frame_ms:7.3f} мс/кадр, вызовов pygame.draw на кадр: {draws:.1f}")
+
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
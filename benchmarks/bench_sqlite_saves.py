@@ -0,0 +1,65 @@
+"""
+Бенчмарк сохранений SQLiteManager.
+
+Сравнивает количество сохранений в секунду с настройками SQLite по
+умолчанию (журнал DELETE, synchronous=FULL - так менеджер работал раньше)
+и с профилем производительности SQLITE_PRAGMAS (WAL, synchronous=NORMAL,
+mmap и увеличенный кэш страниц).
+
+Запуск из корня проекта:
+    python benchmarks/bench_sqlite_saves.py
+"""
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from database.sqlite_manager import SQLiteManager, SQLITE_PRAGMAS
+
+SAVES = 2000
+
+# Настройки SQLite по умолчанию
+BASELINE_PRAGMAS = {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+
+def bench(pragmas):
+    """Возвращает количество сохранений в секунду для заданных настроек."""
+    directory = tempfile.mkdtemp()
+    try:
+        # Менеджер печатает сообщение о каждом сохранении - не учитываем вывод
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = SQLiteManager(os.path.join(directory, 'bench.db'), pragmas=pragmas)
+            pet = Tamagotchi(name="Бенч")
+            manager.save_tamagotchi(pet)
+
+            start = time.perf_counter()
+            for index in range(SAVES):
+                pet.hunger = index % 100
+                pet.coins = index
+                manager.save_tamagotchi(pet)
+            elapsed = time.perf_counter() - start
+
+            manager.connection.close()
+        return SAVES / elapsed
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    baseline = bench(BASELINE_PRAGMAS)
+    tuned = bench(SQLITE_PRAGMAS)
+    print(f"Сохранений: {SAVES}")
+    print(f"DELETE + synchronous=FULL: {baseline:8.0f} сохранений/с")
+    print(f"WAL + synchronous=NORMAL:  {tuned:8.0f} сохранений/с")
+    print(f"Ускорение: x{tuned / baseline:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,25 @@
+import os
+
 # Game settings
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+# Сниженная частота кадров в простое и для свёрнутого окна / окна без фокуса
+IDLE_FPS = 10
+BACKGROUND_FPS = 1
+# Режим dirty rects: перерисовываются и выводятся только изменившиеся области
+# экрана (для маломощных устройств). По умолчанию экран обновляется целиком.
+DIRTY_RECTS = False
+
+# Database settings (SQLite)
+SQLITE_PATH = os.path.join("database", "tamagotchi.db")
+
+# Database settings (PostgreSQL); значения можно переопределить переменными окружения
+DB_HOST = os.environ.get("TAMAGOTCHI_DB_HOST", "localhost")
+DB_PORT = int(os.environ.get("TAMAGOTCHI_DB_PORT", "5432"))
+DB_NAME = os.environ.get("TAMAGOTCHI_DB_NAME", "tamagotchi")
+DB_USER = os.environ.get("TAMAGOTCHI_DB_USER", "postgres")
+DB_PASSWORD = os.environ.get("TAMAGOTCHI_DB_PASSWORD", "")
 
 # Colors
 WHITE = (255, 255, 255)
@@ -12,6 +30,7 @@ BLUE = (0, 0, 255)
 YELLOW = (255, 255, 0)
 PURPLE = (128, 0, 128)
 GRAY = (200, 200, 200)
+CYAN = (0, 255, 255)
 
 # Character settings
 MAX_HUNGER = 100
@@ -1,3 +1,9 @@
 from .sqlite_manager import SQLiteManager
+from .write_behind import WriteBehindQueue
+from .cache import CachedManager
+from .events import EventLog, PetEvent
+from .stat_history import StatHistory
+from .async_storage import (AsyncStorage, AsyncSQLiteStorage, AsyncMemoryStorage,
+                            AsyncStorageAdapter)
 
 DatabaseManager = SQLiteManager
\ No newline at end of file
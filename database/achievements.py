@@ -0,0 +1,6 @@
+"""
+Storage schema for per-pet achievement progress.
+"""
+
+# Столбцы таблицы pet_achievements: порядок значений в строках save_achievements
+ACHIEVEMENT_COLUMNS = ('pet_id', 'achievement', 'progress', 'completed_at')
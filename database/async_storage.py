@@ -0,0 +1,367 @@
+"""
+Async storage backends for embedding the pet engine in an asyncio service.
+"""
+
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from config import SQLITE_PATH
+from .memory_manager import MemoryManager
+from .sqlite_manager import SQLiteManager
+
+# Необязательные методы менеджеров: журнал событий, история показателей и
+# достижения. Хранилища и адаптер предоставляют их, только если их
+# поддерживает менеджер, поэтому проверка hasattr в GameCore остается верной
+OPTIONAL_METHODS = ('append_events', 'load_events', 'load_snapshot', 'last_event_seq',
+                    'save_stat_chunks', 'load_stat_chunks', 'delete_stat_chunks',
+                    'save_achievements', 'load_achievements')
+
+
+class AsyncStorage(ABC):
+    """Асинхронный интерфейс хранилища тамагочи.
+
+    Методы повторяют синхронные менеджеры из database/, но являются
+    корутинами: save, save_many, load, load_many, latest, list, delete, close.
+    Все методы, кроме close, абстрактные: хранилище без них нельзя создать.
+    Хранилище может также предоставлять корутины из OPTIONAL_METHODS.
+    """
+
+    @abstractmethod
+    async def save(self, tamagotchi):
+        """Сохраняет тамагочи.
+
+        Args:
+            tamagotchi: Объект Tamagotchi для сохранения.
+
+        Returns:
+            bool: True если сохранение прошло успешно.
+        """
+
+    @abstractmethod
+    async def save_many(self, tamagotchis):
+        """Сохраняет несколько тамагочи.
+
+        Args:
+            tamagotchis: Итерируемая коллекция объектов Tamagotchi.
+
+        Returns:
+            bool: True если все тамагочи сохранены.
+        """
+
+    @abstractmethod
+    async def load(self, tamagotchi_id):
+        """Загружает тамагочи по ID.
+
+        Args:
+            tamagotchi_id: Идентификатор тамагочи.
+
+        Returns:
+            Tamagotchi or None: Найденный тамагочи.
+        """
+
+    @abstractmethod
+    async def load_many(self, tamagotchi_ids):
+        """Загружает несколько тамагочи по списку ID.
+
+        Args:
+            tamagotchi_ids: Итерируемая коллекция идентификаторов.
+
+        Returns:
+            list: Найденные объекты Tamagotchi в порядке запрошенных ID.
+        """
+
+    @abstractmethod
+    async def latest(self):
+        """Возвращает последнего созданного тамагочи.
+
+        Returns:
+            Tamagotchi or None: Последний тамагочи или None.
+        """
+
+    @abstractmethod
+    async def list(self, newest_first=True):
+        """Возвращает всех тамагочи.
+
+        Args:
+            newest_first: Упорядочить от новых к старым.
+
+        Returns:
+            list: Объекты Tamagotchi.
+        """
+
+    @abstractmethod
+    async def delete(self, tamagotchi_id):
+        """Удаляет тамагочи по ID.
+
+        Args:
+            tamagotchi_id: Идентификатор тамагочи.
+
+        Returns:
+            bool: True если удаление прошло успешно.
+        """
+
+    async def close(self):
+        """Освобождает ресурсы хранилища."""
+
+
+class ExecutorStorage(AsyncStorage):
+    """Асинхронная обертка над блокирующим менеджером.
+
+    Все вызовы менеджера выполняются в одном выделенном потоке: соединение
+    с базой данных используется только из него, а цикл событий не ждет
+    ввода-вывода.
+    """
+
+    def __init__(self, manager_factory):
+        """Инициализирует хранилище.
+
+        Менеджер создается в выделенном потоке, поэтому подключение к базе
+        данных тоже не блокирует цикл событий.
+
+        Args:
+            manager_factory: Функция без аргументов, создающая менеджер.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tamagotchi-storage")
+        self._manager = self._executor.submit(manager_factory)
+
+    def __getattr__(self, name):
+        """Предоставляет необязательные методы менеджера (OPTIONAL_METHODS) как корутины."""
+        if name not in OPTIONAL_METHODS or not hasattr(self._manager.result(), name):
+            raise AttributeError(name)
+
+        async def method(*args, **kwargs):
+            return await self._run(name, *args, **kwargs)
+        return method
+
+    async def _run(self, method, *args, **kwargs):
+        """Вызывает метод менеджера в выделенном потоке.
+
+        Args:
+            method: Имя метода менеджера.
+            *args: Аргументы метода.
+            **kwargs: Именованные аргументы метода.
+
+        Returns:
+            Результат метода.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(self._call, method, args, kwargs))
+
+    def _call(self, method, args, kwargs=None):
+        """Выполняется в выделенном потоке: менеджер к этому моменту уже создан."""
+        return getattr(self._manager.result(), method)(*args, **(kwargs or {}))
+
+    async def save(self, tamagotchi):
+        """Сохраняет тамагочи. См. AsyncStorage.save."""
+        return await self._run('save_tamagotchi', tamagotchi)
+
+    async def save_many(self, tamagotchis):
+        """Сохраняет несколько тамагочи. См. AsyncStorage.save_many."""
+        return await self._run('save_many', list(tamagotchis))
+
+    async def load(self, tamagotchi_id):
+        """Загружает тамагочи по ID. См. AsyncStorage.load."""
+        return await self._run('load_tamagotchi', tamagotchi_id)
+
+    async def load_many(self, tamagotchi_ids):
+        """Загружает несколько тамагочи. См. AsyncStorage.load_many."""
+        return await self._run('load_many', list(tamagotchi_ids))
+
+    async def latest(self):
+        """Возвращает последнего созданного тамагочи. См. AsyncStorage.latest."""
+        return await self._run('get_latest_tamagotchi')
+
+    async def list(self, newest_first=True):
+        """Возвращает всех тамагочи. См. AsyncStorage.list."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._list, newest_first)
+
+    def _list(self, newest_first):
+        """Выполняется в выделенном потоке: читает строки порциями через iter_all."""
+        return [tamagotchi for tamagotchi in
+                self._manager.result().iter_all(newest_first=newest_first)]
+
+    async def delete(self, tamagotchi_id):
+        """Удаляет тамагочи по ID. См. AsyncStorage.delete."""
+        return await self._run('delete_tamagotchi', tamagotchi_id)
+
+    async def close(self):
+        """Закрывает соединение менеджера и останавливает выделенный поток."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._executor, self._close_manager)
+        self._executor.shutdown(wait=False)
+
+    def _close_manager(self):
+        """Выполняется в выделенном потоке: закрывает соединение менеджера."""
+        manager = self._manager.result()
+        if hasattr(manager, 'close'):
+            manager.close()
+
+
+class AsyncSQLiteStorage(ExecutorStorage):
+    """Асинхронное хранилище SQLite на выделенном потоке."""
+
+    def __init__(self, db_path=SQLITE_PATH, pragmas=None, offline_update=None):
+        """Инициализирует хранилище.
+
+        Args:
+            db_path: Путь к файлу базы данных (или ':memory:').
+            pragmas: Настройки PRAGMA. По умолчанию SQLITE_PRAGMAS.
+            offline_update: Снижение показателей при загрузке. См. SQLiteManager.
+        """
+        super().__init__(lambda: SQLiteManager(db_path=db_path, pragmas=pragmas,
+                                               offline_update=offline_update))
+
+
+class AsyncMemoryStorage(AsyncStorage):
+    """Асинхронное хранилище в оперативной памяти.
+
+    Операции MemoryManager не выполняют ввода-вывода, поэтому вызываются
+    прямо в цикле событий.
+    """
+
+    def __init__(self, manager=None):
+        """Инициализирует хранилище.
+
+        Args:
+            manager: MemoryManager (по умолчанию создается новый).
+        """
+        self.manager = manager if manager is not None else MemoryManager()
+
+    def __getattr__(self, name):
+        """Предоставляет необязательные методы менеджера (OPTIONAL_METHODS) как корутины."""
+        if name not in OPTIONAL_METHODS:
+            raise AttributeError(name)
+        function = getattr(self.manager, name)
+
+        async def method(*args, **kwargs):
+            return function(*args, **kwargs)
+        return method
+
+    async def save(self, tamagotchi):
+        """Сохраняет тамагочи. См. AsyncStorage.save."""
+        return self.manager.save_tamagotchi(tamagotchi)
+
+    async def save_many(self, tamagotchis):
+        """Сохраняет несколько тамагочи. См. AsyncStorage.save_many."""
+        return self.manager.save_many(tamagotchis)
+
+    async def load(self, tamagotchi_id):
+        """Загружает тамагочи по ID. См. AsyncStorage.load."""
+        return self.manager.load_tamagotchi(tamagotchi_id)
+
+    async def load_many(self, tamagotchi_ids):
+        """Загружает несколько тамагочи. См. AsyncStorage.load_many."""
+        return self.manager.load_many(tamagotchi_ids)
+
+    async def latest(self):
+        """Возвращает последнего созданного тамагочи. См. AsyncStorage.latest."""
+        return self.manager.get_latest_tamagotchi()
+
+    async def list(self, newest_first=True):
+        """Возвращает всех тамагочи. См. AsyncStorage.list."""
+        return [tamagotchi for tamagotchi in self.manager.iter_all(newest_first=newest_first)]
+
+    async def delete(self, tamagotchi_id):
+        """Удаляет тамагочи по ID. См. AsyncStorage.delete."""
+        return self.manager.delete_tamagotchi(tamagotchi_id)
+
+
+class AsyncStorageAdapter:
+    """Синхронный менеджер поверх асинхронного хранилища.
+
+    Позволяет GameCore и WriteBehindQueue работать с AsyncStorage: каждый
+    вызов отправляется в цикл событий хоста и ожидается в вызывающем
+    потоке. Игровой цикл при этом не блокируется - сохранения выполняет
+    фоновый поток WriteBehindQueue, а загрузка происходит один раз при
+    запуске.
+    """
+
+    def __init__(self, storage, loop=None, timeout=None):
+        """Инициализирует адаптер.
+
+        Args:
+            storage: Объект AsyncStorage.
+            loop: Цикл событий хоста. Если не указан, адаптер запускает
+                  собственный цикл в фоновом потоке.
+            timeout: Максимальное время ожидания вызова в секундах.
+        """
+        self.storage = storage
+        self.timeout = timeout
+        self._own_loop = loop is None
+        if self._own_loop:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="tamagotchi-storage-loop",
+                             daemon=True).start()
+        self.loop = loop
+
+    def _wait(self, coroutine):
+        """Выполняет корутину в цикле событий и ждет результат.
+
+        Args:
+            coroutine: Корутина хранилища.
+
+        Returns:
+            Результат корутины.
+
+        Raises:
+            RuntimeError: Если вызов сделан из потока самого цикла событий
+                          (ожидание привело бы к взаимной блокировке).
+        """
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self.loop:
+            coroutine.close()
+            raise RuntimeError("AsyncStorageAdapter cannot be used from its own event loop")
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(self.timeout)
+
+    def save_tamagotchi(self, tamagotchi):
+        """Сохраняет тамагочи. См. AsyncStorage.save."""
+        return self._wait(self.storage.save(tamagotchi))
+
+    def save_many(self, tamagotchis):
+        """Сохраняет несколько тамагочи. См. AsyncStorage.save_many."""
+        return self._wait(self.storage.save_many(tamagotchis))
+
+    def load_tamagotchi(self, tamagotchi_id):
+        """Загружает тамагочи по ID. См. AsyncStorage.load."""
+        return self._wait(self.storage.load(tamagotchi_id))
+
+    def load_many(self, tamagotchi_ids):
+        """Загружает несколько тамагочи. См. AsyncStorage.load_many."""
+        return self._wait(self.storage.load_many(tamagotchi_ids))
+
+    def get_latest_tamagotchi(self):
+        """Возвращает последнего созданного тамагочи. См. AsyncStorage.latest."""
+        return self._wait(self.storage.latest())
+
+    def get_all_tamagotchis(self):
+        """Возвращает всех тамагочи от новых к старым. См. AsyncStorage.list."""
+        return self._wait(self.storage.list(newest_first=True))
+
+    def delete_tamagotchi(self, tamagotchi_id):
+        """Удаляет тамагочи по ID. См. AsyncStorage.delete."""
+        return self._wait(self.storage.delete(tamagotchi_id))
+
+    def __getattr__(self, name):
+        """Предоставляет необязательные методы хранилища (OPTIONAL_METHODS) как обычные функции."""
+        if name not in OPTIONAL_METHODS:
+            raise AttributeError(name)
+        coroutine_function = getattr(self.storage, name)
+
+        def method(*args, **kwargs):
+            return self._wait(coroutine_function(*args, **kwargs))
+        return method
+
+    def close(self):
+        """Останавливает собственный цикл событий адаптера.
+
+        Хранилище, переданное хостом, остается открытым: его закрывает хост.
+        """
+        if self._own_loop:
+            self.loop.call_soon_threadsafe(self.loop.stop)
@@ -0,0 +1,267 @@
+"""
+Read-through LRU cache in front of the database managers.
+"""
+
+import inspect
+import threading
+from collections import OrderedDict
+
+# Максимальное количество тамагочи в кэше по умолчанию
+DEFAULT_PET_CACHE_SIZE = 256
+
+
+class CachedManager:
+    """Менеджер с кэшем загруженных тамагочи перед другим менеджером.
+
+    Загрузка по ID сначала ищет тамагочи в кэше и обращается к базе данных
+    только при промахе. Кэш ограничен по размеру и вытесняет давно не
+    использованные записи (LRU). Сохранение и удаление проходят в базу
+    данных сразу и удаляют запись из кэша, поэтому следующая загрузка
+    прочитает актуальную строку.
+
+    Кэш хранит собственные копии: каждая загрузка возвращает новый
+    независимый объект, как и обычный менеджер. Если менеджер применяет
+    снижение показателей за время без игры (SQLiteManager с offline_update),
+    в кэше хранится состояние строки без снижения, а снижение применяется
+    к каждой выданной копии - так флаг catch_up работает как у менеджера.
+
+    Остальные методы и атрибуты (iter_all, close, connection и т. д.)
+    передаются менеджеру без изменений.
+    """
+
+    def __init__(self, manager, max_size=DEFAULT_PET_CACHE_SIZE):
+        """Инициализирует кэш.
+
+        Args:
+            manager: Менеджер базы данных (SQLiteManager, PostgresManager,
+                     MemoryManager).
+            max_size: Максимальное количество тамагочи в кэше.
+        """
+        self.manager = manager
+        self.max_size = max_size
+        self._pets = OrderedDict()
+        self._lock = threading.Lock()
+        # Счетчик инвалидаций: загрузка, начатая до сохранения, не попадет в кэш
+        self._generation = 0
+        self._catch_up = 'catch_up' in inspect.signature(manager.load_tamagotchi).parameters
+        # Менеджер читает строки без снижения показателей: его применяет кэш
+        self._raw = {'catch_up': False} if self._catch_up else {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __getattr__(self, name):
+        """Передает менеджеру атрибуты, которых нет у кэша."""
+        if name == 'manager':
+            raise AttributeError(name)
+        return getattr(self.manager, name)
+
+    def load_tamagotchi(self, tamagotchi_id, catch_up=True):
+        """Загружает тамагочи по ID, обращаясь к базе данных только при промахе.
+
+        Args:
+            tamagotchi_id: Идентификатор тамагочи.
+            catch_up: Применить ли снижение показателей за время без игры
+                      (если менеджер это поддерживает).
+
+        Returns:
+            Tamagotchi or None: Новый объект Tamagotchi или None.
+        """
+        cached = self._get(tamagotchi_id, catch_up)
+        if cached is not None:
+            return cached
+
+        generation = self._generation
+        tamagotchi = self.manager.load_tamagotchi(tamagotchi_id, **self._raw)
+        if tamagotchi is not None:
+            self._put(tamagotchi, generation)
+            self._offline_update(tamagotchi, catch_up)
+        return tamagotchi
+
+    def load_many(self, tamagotchi_ids, catch_up=True):
+        """Загружает несколько тамагочи; из базы данных читаются только промахи.
+
+        Args:
+            tamagotchi_ids: Итерируемая коллекция идентификаторов.
+            catch_up: Применить ли снижение показателей за время без игры
+                      (если менеджер это поддерживает).
+
+        Returns:
+            list: Найденные объекты Tamagotchi в порядке запрошенных ID.
+        """
+        ids = list(tamagotchi_ids)
+        found = {}
+        for tamagotchi_id in ids:
+            cached = self._get(tamagotchi_id, catch_up)
+            if cached is not None:
+                found[tamagotchi_id] = cached
+
+        missing = [tamagotchi_id for tamagotchi_id in ids if tamagotchi_id not in found]
+        if missing:
+            generation = self._generation
+            for tamagotchi in self.manager.load_many(missing, **self._raw):
+                self._put(tamagotchi, generation)
+                self._offline_update(tamagotchi, catch_up)
+                found[tamagotchi.id] = tamagotchi
+        return [found[tamagotchi_id] for tamagotchi_id in ids if tamagotchi_id in found]
+
+    def get_latest_tamagotchi(self, catch_up=True):
+        """Возвращает последнего созданного тамагочи и запоминает его в кэше.
+
+        Args:
+            catch_up: Применить ли снижение показателей за время без игры
+                      (если менеджер это поддерживает).
+
+        Returns:
+            Tamagotchi or None: Последний тамагочи или None.
+        """
+        generation = self._generation
+        tamagotchi = self.manager.get_latest_tamagotchi(**self._raw)
+        if tamagotchi is not None:
+            self._put(tamagotchi, generation)
+            self._offline_update(tamagotchi, catch_up)
+        return tamagotchi
+
+    def save_tamagotchi(self, tamagotchi):
+        """Сохраняет тамагочи в базу данных и удаляет его из кэша.
+
+        Args:
+            tamagotchi: Объект Tamagotchi для сохранения.
+
+        Returns:
+            bool: Результат сохранения менеджером.
+        """
+        try:
+            return self.manager.save_tamagotchi(tamagotchi)
+        finally:
+            self.invalidate(tamagotchi.id)
+
+    def save_many(self, tamagotchis):
+        """Сохраняет несколько тамагочи и удаляет их из кэша.
+
+        Args:
+            tamagotchis: Итерируемая коллекция объектов Tamagotchi.
+
+        Returns:
+            bool: Результат сохранения менеджером.
+        """
+        tamagotchis = list(tamagotchis)
+        try:
+            return self.manager.save_many(tamagotchis)
+        finally:
+            for tamagotchi in tamagotchis:
+                self.invalidate(tamagotchi.id)
+
+    def delete_tamagotchi(self, tamagotchi_id):
+        """Удаляет тамагочи из базы данных и из кэша.
+
+        Args:
+            tamagotchi_id: Идентификатор тамагочи.
+
+        Returns:
+            bool: Результат удаления менеджером.
+        """
+        try:
+            return self.manager.delete_tamagotchi(tamagotchi_id)
+        finally:
+            self.invalidate(tamagotchi_id)
+
+    def invalidate(self, tamagotchi_id):
+        """Удаляет тамагочи из кэша.
+
+        Args:
+            tamagotchi_id: Идентификатор тамагочи (None игнорируется).
+        """
+        if tamagotchi_id is None:
+            return
+        with self._lock:
+            self._generation += 1
+            if self._pets.pop(tamagotchi_id, None) is not None:
+                self.invalidations += 1
+
+    def stats(self):
+        """Возвращает статистику кэша.
+
+        Returns:
+            dict: Размер, попадания, промахи, вытеснения, инвалидации и доля попаданий.
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._pets),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def clear(self):
+        """Удаляет все записи из кэша и сбрасывает счетчики."""
+        with self._lock:
+            self._generation += 1
+            self._pets.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.invalidations = 0
+
+    def __len__(self):
+        """Возвращает количество тамагочи в кэше."""
+        return len(self._pets)
+
+    def _get(self, tamagotchi_id, catch_up=True):
+        """Возвращает копию тамагочи из кэша или None при промахе.
+
+        Args:
+            tamagotchi_id: Идентификатор тамагочи.
+            catch_up: Применить ли к копии снижение показателей за время без игры.
+
+        Returns:
+            Tamagotchi or None: Новый объект Tamagotchi или None.
+        """
+        with self._lock:
+            cached = self._pets.get(tamagotchi_id)
+            if cached is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._pets.move_to_end(tamagotchi_id)
+            tamagotchi = cached.snapshot()
+
+        self._offline_update(tamagotchi, catch_up)
+        return tamagotchi
+
+    def _offline_update(self, tamagotchi, catch_up):
+        """Применяет к выданной копии снижение показателей за время без игры.
+
+        Снижение считается от last_updated строки, поэтому учитывается и
+        время, прошедшее с момента загрузки в кэш.
+
+        Args:
+            tamagotchi: Объект Tamagotchi, который получит вызывающий код.
+            catch_up: Запрошено ли снижение показателей.
+        """
+        offline_update = getattr(self.manager, 'offline_update', None)
+        if self._catch_up and catch_up and offline_update is not None:
+            offline_update(tamagotchi)
+
+    def _put(self, tamagotchi, generation):
+        """Запоминает копию загруженного тамагочи.
+
+        Args:
+            tamagotchi: Объект Tamagotchi, полученный от менеджера.
+            generation: Значение счетчика инвалидаций до обращения к базе данных.
+        """
+        copy = tamagotchi.snapshot()
+        with self._lock:
+            # Пока шла загрузка, тамагочи мог быть сохранен: прочитанная строка устарела
+            if generation != self._generation:
+                return
+            self._pets[tamagotchi.id] = copy
+            self._pets.move_to_end(tamagotchi.id)
+            if len(self._pets) > self.max_size:
+                self._pets.popitem(last=False)
+                self.evictions += 1
@@ -0,0 +1,357 @@
+"""
+Append-only event log of pet actions with periodic state snapshots.
+"""
+
+import json
+import threading
+
+from .models import Tamagotchi, TRACKED_FIELDS
+from .timestamps import parse_timestamp, utc_now
+
+# Снимок полного состояния записывается после каждого SNAPSHOT_EVERY-го
+# события: восстановление любого прошлого состояния проигрывает не больше
+# SNAPSHOT_EVERY событий
+SNAPSHOT_EVERY = 50
+
+# События копятся в памяти и записываются порциями по EVENT_BATCH_SIZE
+EVENT_BATCH_SIZE = 32
+
+# Размер страницы истории по умолчанию
+HISTORY_PAGE_SIZE = 20
+
+EVENT_COLUMNS = ('pet_id', 'seq', 'kind', 'created_at', 'changes', 'details')
+SNAPSHOT_COLUMNS = ('pet_id', 'seq', 'created_at', 'state')
+
+
+def _dump(value):
+    """Кодирует значение в JSON для столбцов changes, details и state."""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+class PetEvent:
+    """Одно событие из журнала действий питомца.
+
+    Событие хранит новые значения показателей, которые оно изменило, поэтому
+    последовательное применение событий к снимку дает точное состояние.
+
+    Атрибуты:
+        pet_id: ID тамагочи
+        seq: Номер события у этого тамагочи (начиная с 1)
+        kind: Тип события (feed, play, clean, decay и т. д.)
+        created_at: Время события (UTC)
+        changes: Словарь {показатель: новое значение}
+        details: Дополнительные данные события или None
+    """
+
+    __slots__ = EVENT_COLUMNS
+
+    def __init__(self, pet_id, seq, kind, created_at, changes, details=None):
+        """Инициализирует событие.
+
+        Args:
+            pet_id: ID тамагочи.
+            seq: Номер события.
+            kind: Тип события.
+            created_at: Время события.
+            changes: Словарь {показатель: новое значение}.
+            details: Дополнительные данные события.
+        """
+        self.pet_id = pet_id
+        self.seq = seq
+        self.kind = kind
+        self.created_at = created_at
+        self.changes = changes
+        self.details = details
+
+    def __repr__(self):
+        return f"PetEvent({self.pet_id}, {self.seq}, {self.kind!r}, {self.changes!r})"
+
+    def to_row(self):
+        """Возвращает значения столбцов pet_events в порядке EVENT_COLUMNS.
+
+        Returns:
+            tuple: Строка для вставки в таблицу.
+        """
+        return (self.pet_id, self.seq, self.kind, self.created_at.isoformat(' '),
+                _dump(self.changes), _dump(self.details) if self.details else None)
+
+    @classmethod
+    def from_row(cls, row):
+        """Создает событие из строки таблицы pet_events.
+
+        Args:
+            row: Значения в порядке EVENT_COLUMNS.
+
+        Returns:
+            PetEvent: Новое событие.
+        """
+        pet_id, seq, kind, created_at, changes, details = row
+        return cls(pet_id, seq, kind, parse_timestamp(created_at), json.loads(changes),
+                   json.loads(details) if details else None)
+
+
+def snapshot_row(pet_id, seq, created_at, state):
+    """Возвращает строку pet_snapshots в порядке SNAPSHOT_COLUMNS.
+
+    Args:
+        pet_id: ID тамагочи.
+        seq: Номер события, после которого сделан снимок.
+        created_at: Время снимка.
+        state: Словарь {показатель: значение} для всех TRACKED_FIELDS.
+
+    Returns:
+        tuple: Строка для вставки в таблицу.
+    """
+    return (pet_id, seq, created_at.isoformat(' '), _dump(state))
+
+
+def apply_event(tamagotchi, event):
+    """Применяет изменения события к тамагочи.
+
+    Args:
+        tamagotchi: Объект Tamagotchi.
+        event: Объект PetEvent.
+    """
+    for field, value in event.changes.items():
+        setattr(tamagotchi, field, value)
+    tamagotchi.last_updated = event.created_at
+
+
+class EventLog:
+    """Журнал событий питомцев с периодическими снимками состояния.
+
+    record() только добавляет событие в буфер: в базу данных события
+    записываются порциями по batch_size одной транзакцией. Запись выполняет
+    функция submit - по умолчанию сразу в вызывающем потоке, а в игре через
+    фоновый поток WriteBehindQueue, чтобы игровой цикл не ждал базу данных.
+
+    Хранилище (SQLiteManager, PostgresManager, MemoryManager) должно
+    поддерживать методы append_events, load_events, load_snapshot и
+    last_event_seq. Чтение истории учитывает и события, которые еще не
+    записаны. Номер последнего события тамагочи читается при его загрузке
+    (start), а страницы истории для игрового цикла - через request_page.
+    """
+
+    def __init__(self, store, snapshot_every=SNAPSHOT_EVERY, batch_size=EVENT_BATCH_SIZE,
+                 submit=None):
+        """Инициализирует журнал.
+
+        Args:
+            store: Менеджер базы данных с методами журнала событий.
+            snapshot_every: Через сколько событий сохраняется снимок состояния.
+            batch_size: Сколько событий копится в буфере до записи.
+            submit: Функция submit(function, *args), выполняющая запись
+                    (по умолчанию - сразу в вызывающем потоке).
+        """
+        self.store = store
+        self.snapshot_every = snapshot_every
+        self.batch_size = batch_size
+        self._submit = submit if submit is not None else (lambda function, *args: function(*args))
+        self._lock = threading.Lock()
+        # Последний номер события и последнее записанное состояние каждого тамагочи
+        self._seqs = {}
+        self._states = {}
+        # Буфер до отправки на запись и отправленные, но еще не записанные данные
+        self._buffer = []
+        self._buffer_snapshots = []
+        self._unwritten = []
+        self._unwritten_snapshots = []
+        self.stats = {"recorded": 0, "written": 0, "snapshots": 0, "failed": 0}
+
+    def record(self, tamagotchi, kind, details=None):
+        """Добавляет событие в журнал.
+
+        В событие попадают новые значения показателей, изменившихся с
+        предыдущего события. Первое событие тамагочи за сеанс хранит все
+        показатели: между сеансами они могли измениться (снижение за время
+        без игры).
+
+        Args:
+            tamagotchi: Объект Tamagotchi (должен иметь ID).
+            kind: Тип события.
+            details: Дополнительные данные события.
+
+        Returns:
+            PetEvent or None: Созданное событие или None, если у тамагочи нет ID.
+        """
+        pet_id = tamagotchi.id
+        if pet_id is None:
+            return None
+        if pet_id not in self._seqs:
+            # Тамагочи не прошел через start(): номер читается здесь, вне блокировки
+            self.start(tamagotchi)
+
+        state = tuple(getattr(tamagotchi, field) for field in TRACKED_FIELDS)
+        with self._lock:
+            seq = self._seqs[pet_id]
+            previous = self._states.get(pet_id)
+            if previous is None:
+                changes = dict(zip(TRACKED_FIELDS, state))
+            else:
+                changes = {field: value for field, value, old in zip(TRACKED_FIELDS, state, previous)
+                           if value != old}
+            seq += 1
+            event = PetEvent(pet_id, seq, kind, utc_now(), changes, details or None)
+            self._seqs[pet_id] = seq
+            self._states[pet_id] = state
+            self._buffer.append(event)
+            if seq % self.snapshot_every == 0:
+                self._buffer_snapshots.append(
+                    snapshot_row(pet_id, seq, event.created_at, dict(zip(TRACKED_FIELDS, state))))
+            self.stats["recorded"] += 1
+            full = len(self._buffer) >= self.batch_size
+
+        if full:
+            self.flush()
+        return event
+
+    def start(self, tamagotchi):
+        """Читает номер последнего события тамагочи из хранилища.
+
+        Вызывается при загрузке тамагочи (как AchievementTracker.start), чтобы
+        record() в игровом цикле не обращался к базе данных.
+
+        Args:
+            tamagotchi: Объект Tamagotchi (без ID ничего не делает).
+        """
+        pet_id = tamagotchi.id
+        if pet_id is None or pet_id in self._seqs:
+            return
+        seq = self.store.last_event_seq(pet_id)
+        with self._lock:
+            # События тамагочи могли появиться, пока шел запрос
+            self._seqs.setdefault(pet_id, seq)
+
+    def flush(self):
+        """Отправляет накопленные события на запись одной порцией."""
+        with self._lock:
+            if not self._buffer:
+                return
+            events, snapshots = self._buffer, self._buffer_snapshots
+            self._buffer, self._buffer_snapshots = [], []
+            self._unwritten.extend(events)
+            self._unwritten_snapshots.extend(snapshots)
+        self._submit(self._write, events, snapshots)
+
+    def _write(self, events, snapshots):
+        """Записывает порцию событий и снимков в хранилище.
+
+        Args:
+            events: Список PetEvent.
+            snapshots: Строки снимков в порядке SNAPSHOT_COLUMNS.
+        """
+        try:
+            written = self.store.append_events(events, snapshots)
+        except Exception as e:
+            print(f"❌ Error writing events: {e}")
+            written = False
+
+        with self._lock:
+            event_ids, snapshot_ids = set(map(id, events)), set(map(id, snapshots))
+            self._unwritten = [event for event in self._unwritten if id(event) not in event_ids]
+            self._unwritten_snapshots = [row for row in self._unwritten_snapshots
+                                         if id(row) not in snapshot_ids]
+            if written:
+                self.stats["written"] += len(events)
+                self.stats["snapshots"] += len(snapshots)
+            else:
+                # Порция записывается одной транзакцией: при ошибке она повторится
+                # со следующей порцией целиком
+                self.stats["failed"] += len(events)
+                self._buffer[:0] = events
+                self._buffer_snapshots[:0] = snapshots
+
+    def _pending(self, pet_id):
+        """Возвращает незаписанные события и снимки тамагочи (под блокировкой).
+
+        Args:
+            pet_id: ID тамагочи.
+
+        Returns:
+            tuple: (события по возрастанию seq, снимки по возрастанию seq).
+        """
+        with self._lock:
+            events = [event for event in self._unwritten + self._buffer if event.pet_id == pet_id]
+            snapshots = [row for row in self._unwritten_snapshots + self._buffer_snapshots
+                         if row[0] == pet_id]
+        events.sort(key=lambda event: event.seq)
+        snapshots.sort(key=lambda row: row[1])
+        return events, snapshots
+
+    def request_page(self, pet_id, callback, before_seq=None, limit=HISTORY_PAGE_SIZE):
+        """Загружает страницу истории через submit и передает ее в callback.
+
+        В игре страница читается фоновым потоком WriteBehindQueue, поэтому
+        игровой цикл не ждет базу данных; callback вызывается в этом потоке.
+
+        Args:
+            pet_id: ID тамагочи.
+            callback: Функция callback(events), получающая страницу (см. page).
+            before_seq: См. page.
+            limit: См. page.
+        """
+        self._submit(self._load_page, pet_id, callback, before_seq, limit)
+
+    def _load_page(self, pet_id, callback, before_seq, limit):
+        """Выполняется через submit: читает страницу истории и передает ее в callback."""
+        callback(self.page(pet_id, before_seq=before_seq, limit=limit))
+
+    def page(self, pet_id, before_seq=None, limit=HISTORY_PAGE_SIZE):
+        """Возвращает страницу истории от новых событий к старым.
+
+        Следующая страница запрашивается с before_seq, равным seq последнего
+        события предыдущей страницы (пагинация по ключу, без OFFSET).
+
+        Args:
+            pet_id: ID тамагочи.
+            before_seq: Вернуть события с seq меньше этого значения
+                        (None - начиная с самого нового).
+            limit: Максимальное количество событий.
+
+        Returns:
+            list: Объекты PetEvent, от новых к старым.
+        """
+        pending, _ = self._pending(pet_id)
+        events = [event for event in reversed(pending)
+                  if before_seq is None or event.seq < before_seq][:limit]
+        if len(events) < limit:
+            # Незаписанные события всегда новее записанных
+            before = events[-1].seq if events else before_seq
+            events += self.store.load_events(pet_id, before_seq=before,
+                                             limit=limit - len(events), newest_first=True)
+        return events
+
+    def state_at(self, pet_id, seq):
+        """Восстанавливает показатели тамагочи сразу после события seq.
+
+        Берется ближайший снимок не позже seq, после чего проигрываются
+        события между ним и seq - не больше snapshot_every событий.
+
+        Args:
+            pet_id: ID тамагочи.
+            seq: Номер события.
+
+        Returns:
+            Tamagotchi: Новый объект с показателями после события и
+                        last_updated, равным времени события.
+        """
+        pending, pending_snapshots = self._pending(pet_id)
+        snapshots = [row for row in pending_snapshots if row[1] <= seq]
+        if snapshots:
+            base_seq, state = snapshots[-1][1], json.loads(snapshots[-1][3])
+        else:
+            base_seq, state = self.store.load_snapshot(pet_id, max_seq=seq) or (0, {})
+
+        tamagotchi = Tamagotchi.from_dict(dict(state, id=pet_id))
+        replay = self.store.load_events(pet_id, after_seq=base_seq, before_seq=seq + 1)
+        seen = {event.seq for event in replay}
+        replay += [event for event in pending if base_seq < event.seq <= seq and event.seq not in seen]
+        replay.sort(key=lambda event: event.seq)
+        for event in replay:
+            apply_event(tamagotchi, event)
+        tamagotchi.mark_clean()
+        return tamagotchi
+
+    def close(self):
+        """Отправляет на запись оставшиеся события."""
+        self.flush()
@@ -2,8 +2,28 @@
 In-memory storage for when no database is available.
 """
 
+import bisect
+import json
 from datetime import datetime
 from .models import Tamagotchi
+from .timestamps import parse_timestamp
+
+
+def _created_key(tamagotchi):
+    """Возвращает ключ сортировки тамагочи по дате создания.
+    
+    Args:
+        tamagotchi: Объект Tamagotchi с ID.
+        
+    Returns:
+        tuple: (дата создания, ID); нераспознанная дата считается самой ранней.
+    """
+    return (parse_timestamp(tamagotchi.created_at) or datetime.min, tamagotchi.id)
+
+
+def _event_seq(event):
+    """Возвращает номер события - ключ сортировки журнала."""
+    return event.seq
 
 
 class MemoryManager:
@@ -11,23 +31,39 @@ class MemoryManager:
     
     Используется как запасной вариант при недоступности базы данных.
     Данные не сохраняются между запусками приложения.
+    
+    Тамагочи хранятся в словаре по ID, поэтому поиск, обновление и удаление
+    выполняются за O(1). Порядок по дате создания поддерживает отсортированный
+    список ключей (дата создания, ID): новые тамагочи добавляются в его конец,
+    а удаленные вычищаются из него лениво.
     """
     
     def __init__(self):
         """Инициализирует менеджер памяти.
         
-        Создает пустой список для хранения тамагочи и устанавливает
+        Создает пустой словарь для хранения тамагочи и устанавливает
         начальный идентификатор для новых записей.
         """
-        self.tamagotchis = []
+        self.tamagotchis = {}
         self.next_id = 1
+        # Ключ сортировки каждого тамагочи и отсортированный индекс по дате создания
+        self._created_keys = {}
+        self._created_order = []
+        # Журнал событий: списки PetEvent и снимков (seq, показатели) по ID тамагочи
+        self.events = {}
+        self.snapshots = {}
+        # История показателей: {ID: {ширина интервала: {chunk_start: строка блока}}}
+        self.stat_chunks = {}
+        # Прогресс достижений: {ID: {ключ: (прогресс, время выполнения)}}
+        self.achievements = {}
         print("Using in-memory storage (no persistence)")
 
     def save_tamagotchi(self, tamagotchi):
         """Сохраняет тамагочи в памяти.
         
         Если тамагочи не имеет ID, создает новую запись с новым ID.
-        Если ID существует, обновляет существующую запись.
+        Если ID существует, обновляет существующую запись; если изменений
+        нет, ничего не делает.
         
         Args:
             tamagotchi: Объект Tamagotchi для сохранения.
@@ -36,24 +72,36 @@ class MemoryManager:
             bool: True если сохранение прошло успешно, False в случае ошибки.
         """
         try:
+            if tamagotchi.id is not None and not tamagotchi.is_dirty:
+                return True
+
             if tamagotchi.id is None:
-                # Присваиваем новый ID и добавляем в список
+                # Присваиваем новый ID
                 tamagotchi.id = self.next_id
-                self.next_id += 1
-                self.tamagotchis.append(tamagotchi)
                 print(f"Tamagotchi created with ID: {tamagotchi.id}")
-            else:
-                # Обновляем существующий объект
-                for i, t in enumerate(self.tamagotchis):
-                    if t.id == tamagotchi.id:
-                        self.tamagotchis[i] = tamagotchi
-                        break
+            # Тамагочи с заранее известным ID (например, из кэша) тоже сохраняется
+            self.next_id = max(self.next_id, tamagotchi.id + 1)
+            self.tamagotchis[tamagotchi.id] = tamagotchi
+            self._index(tamagotchi)
 
+            tamagotchi.mark_clean()
             return True
         except Exception as e:
             print(f"Error saving tamagotchi: {e}")
             return False
 
+    def save_many(self, tamagotchis):
+        """Сохраняет несколько тамагочи.
+        
+        Args:
+            tamagotchis: Итерируемая коллекция объектов Tamagotchi.
+            
+        Returns:
+            bool: True если все тамагочи сохранены.
+        """
+        results = [self.save_tamagotchi(tamagotchi) for tamagotchi in tamagotchis]
+        return all(results)
+
     def load_tamagotchi(self, tamagotchi_id):
         """Загружает тамагочи из памяти по ID.
         
@@ -61,26 +109,61 @@ class MemoryManager:
             tamagotchi_id: Идентификатор тамагочи для загрузки.
             
         Returns:
-            Tamagotchi or None: Объект Tamagotchi если найден, None если не найден
-                                 или произошла ошибка.
+            Tamagotchi or None: Объект Tamagotchi если найден, None если не найден.
         """
-        try:
-            # Линейный поиск по ID
-            for t in self.tamagotchis:
-                if t.id == tamagotchi_id:
-                    return t
-            return None
-        except Exception as e:
-            print(f"Error loading tamagotchi: {e}")
-            return None
+        return self.tamagotchis.get(tamagotchi_id)
 
     def get_all_tamagotchis(self):
         """Получает все тамагочи из памяти.
         
         Returns:
-            list: Копия списка всех объектов Tamagotchi.
+            list: Новый список всех объектов Tamagotchi, от новых к старым.
+        """
+        return list(self.iter_all(newest_first=True))
+
+    def get_latest_tamagotchi(self):
+        """Возвращает последнего созданного тамагочи.
+        
+        Returns:
+            Tamagotchi or None: Тамагочи с наибольшей датой создания,
+                                 None если хранилище пусто.
+        """
+        return next(self._iter_created(reverse=True), None)
+
+    def load_many(self, tamagotchi_ids):
+        """Загружает несколько тамагочи по списку ID.
+        
+        Args:
+            tamagotchi_ids: Итерируемая коллекция идентификаторов.
+            
+        Returns:
+            list: Найденные объекты Tamagotchi в порядке запрошенных ID.
         """
-        return self.tamagotchis.copy()
+        loaded = (self.tamagotchis.get(tamagotchi_id) for tamagotchi_id in tamagotchi_ids)
+        return [tamagotchi for tamagotchi in loaded if tamagotchi is not None]
+
+    def iter_all(self, batch_size=100, newest_first=False):
+        """Перебирает все тамагочи порциями.
+        
+        Первые k тамагочи выдаются за O(k), без обхода всего хранилища.
+        
+        Args:
+            batch_size: Размер порции.
+            newest_first: Перебирать от новых к старым по дате создания
+                          (по умолчанию - в порядке добавления).
+            
+        Yields:
+            Tamagotchi: Объекты Tamagotchi.
+        """
+        if newest_first:
+            source = self._iter_created(reverse=True)
+        else:
+            source = iter(list(self.tamagotchis.values()))
+        while True:
+            batch = [tamagotchi for _, tamagotchi in zip(range(batch_size), source)]
+            if not batch:
+                return
+            yield from batch
 
     def delete_tamagotchi(self, tamagotchi_id):
         """Удаляет тамагочи из памяти по ID.
@@ -91,6 +174,191 @@ class MemoryManager:
         Returns:
             bool: Всегда возвращает True, так как удаление происходит в памяти.
         """
-        # Фильтруем список, оставляя только тамагочи с другим ID
-        self.tamagotchis = [t for t in self.tamagotchis if t.id != tamagotchi_id]
-        return True
\ No newline at end of file
+        if self.tamagotchis.pop(tamagotchi_id, None) is not None:
+            # Ключ в отсортированном индексе станет устаревшим и будет пропущен
+            del self._created_keys[tamagotchi_id]
+            self._compact()
+        self.events.pop(tamagotchi_id, None)
+        self.snapshots.pop(tamagotchi_id, None)
+        self.stat_chunks.pop(tamagotchi_id, None)
+        self.achievements.pop(tamagotchi_id, None)
+        return True
+
+    def append_events(self, events, snapshots=()):
+        """Добавляет порцию событий и снимков состояния.
+        
+        Args:
+            events: Итерируемая коллекция объектов PetEvent.
+            snapshots: Строки снимков в порядке SNAPSHOT_COLUMNS.
+            
+        Returns:
+            bool: Всегда True.
+        """
+        for event in events:
+            log = self.events.setdefault(event.pet_id, [])
+            # События приходят по возрастанию seq - обычно это добавление в конец
+            if not log or log[-1].seq < event.seq:
+                log.append(event)
+            else:
+                bisect.insort(log, event, key=_event_seq)
+        for pet_id, seq, _, state in snapshots:
+            snapshots_of_pet = self.snapshots.setdefault(pet_id, [])
+            snapshots_of_pet.append((seq, json.loads(state)))
+            snapshots_of_pet.sort(key=lambda snapshot: snapshot[0])
+        return True
+
+    def load_events(self, pet_id, after_seq=0, before_seq=None, limit=None, newest_first=False):
+        """Загружает события тамагочи из диапазона номеров.
+        
+        Args:
+            pet_id: ID тамагочи.
+            after_seq: Вернуть события с seq больше этого значения.
+            before_seq: Вернуть события с seq меньше этого значения (None - без ограничения).
+            limit: Максимальное количество событий (None - без ограничения).
+            newest_first: Упорядочить от новых к старым.
+            
+        Returns:
+            list: Объекты PetEvent.
+        """
+        log = self.events.get(pet_id, [])
+        start = bisect.bisect_right(log, after_seq, key=_event_seq)
+        end = len(log) if before_seq is None else bisect.bisect_left(log, before_seq, key=_event_seq)
+        selected = log[start:end]
+        if newest_first:
+            selected.reverse()
+        return selected if limit is None else selected[:limit]
+
+    def load_snapshot(self, pet_id, max_seq=None):
+        """Возвращает последний снимок состояния тамагочи не позже max_seq.
+        
+        Args:
+            pet_id: ID тамагочи.
+            max_seq: Максимальный номер события снимка (None - самый новый).
+            
+        Returns:
+            tuple or None: (seq, словарь показателей) или None, если снимка нет.
+        """
+        for seq, state in reversed(self.snapshots.get(pet_id, [])):
+            if max_seq is None or seq <= max_seq:
+                return seq, dict(state)
+        return None
+
+    def last_event_seq(self, pet_id):
+        """Возвращает номер последнего события тамагочи.
+        
+        Args:
+            pet_id: ID тамагочи.
+            
+        Returns:
+            int: Номер события (0, если событий нет).
+        """
+        log = self.events.get(pet_id)
+        return log[-1].seq if log else 0
+
+    def save_stat_chunks(self, rows):
+        """Сохраняет блоки истории показателей, заменяя блоки с тем же началом.
+        
+        Args:
+            rows: Строки в порядке STAT_CHUNK_COLUMNS.
+            
+        Returns:
+            bool: Всегда True.
+        """
+        for row in rows:
+            self.stat_chunks.setdefault(row[0], {}).setdefault(row[1], {})[row[2]] = row
+        return True
+
+    def load_stat_chunks(self, pet_id, resolution, start=None, end=None):
+        """Возвращает блоки истории показателей, пересекающие промежуток времени.
+        
+        Args:
+            pet_id: ID тамагочи.
+            resolution: Ширина интервала уровня в секундах (0 - сырые отсчеты).
+            start: Начало промежутка (None - без ограничения).
+            end: Конец промежутка (None - без ограничения).
+            
+        Returns:
+            list: Строки в порядке STAT_CHUNK_COLUMNS по возрастанию chunk_start.
+        """
+        chunks = self.stat_chunks.get(pet_id, {}).get(resolution, {})
+        return [chunks[chunk_start] for chunk_start in sorted(chunks)
+                if (end is None or chunk_start <= end)
+                and (start is None or chunks[chunk_start][3] >= start)]
+
+    def delete_stat_chunks(self, cutoffs):
+        """Удаляет устаревшие блоки истории показателей.
+        
+        Args:
+            cutoffs: Пары (resolution, before): удаляются блоки уровня,
+                     последний отсчет которых раньше before.
+            
+        Returns:
+            bool: Всегда True.
+        """
+        for resolution, before in cutoffs:
+            for levels in self.stat_chunks.values():
+                chunks = levels.get(resolution, {})
+                for chunk_start in [key for key, row in chunks.items() if row[3] < before]:
+                    del chunks[chunk_start]
+        return True
+
+    def save_achievements(self, rows):
+        """Сохраняет прогресс достижений.
+        
+        Args:
+            rows: Строки в порядке ACHIEVEMENT_COLUMNS.
+            
+        Returns:
+            bool: Всегда True.
+        """
+        for pet_id, key, progress, completed_at in rows:
+            self.achievements.setdefault(pet_id, {})[key] = (progress, completed_at)
+        return True
+
+    def load_achievements(self, pet_id):
+        """Возвращает прогресс достижений тамагочи.
+        
+        Args:
+            pet_id: ID тамагочи.
+            
+        Returns:
+            dict: {ключ достижения: (прогресс, время выполнения или None)}.
+        """
+        return dict(self.achievements.get(pet_id, {}))
+
+    def _index(self, tamagotchi):
+        """Добавляет тамагочи в индекс по дате создания.
+        
+        Args:
+            tamagotchi: Сохраняемый объект Tamagotchi.
+        """
+        key = _created_key(tamagotchi)
+        if self._created_keys.get(tamagotchi.id) == key:
+            return
+        self._created_keys[tamagotchi.id] = key
+        # Новые тамагочи обычно самые поздние - тогда это добавление в конец
+        if not self._created_order or self._created_order[-1] < key:
+            self._created_order.append(key)
+        else:
+            bisect.insort(self._created_order, key)
+        self._compact()
+
+    def _iter_created(self, reverse=False):
+        """Перебирает тамагочи по дате создания, пропуская устаревшие ключи.
+        
+        Args:
+            reverse: Перебирать от новых к старым.
+            
+        Yields:
+            Tamagotchi: Объекты Tamagotchi.
+        """
+        order = self._created_order
+        for key in (reversed(order) if reverse else order):
+            if self._created_keys.get(key[1]) == key:
+                yield self.tamagotchis[key[1]]
+
+    def _compact(self):
+        """Удаляет устаревшие ключи, когда их становится больше, чем живых."""
+        if len(self._created_order) > 2 * len(self._created_keys) + 16:
+            self._created_order = [key for key in self._created_order
+                                   if self._created_keys.get(key[1]) == key]
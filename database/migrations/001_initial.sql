@@ -23,11 +23,14 @@ CREATE TABLE IF NOT EXISTS items (
     effect_value INTEGER NOT NULL
 );
 
--- Insert default items
-INSERT INTO items (name, type, price, effect_value) VALUES
-('Apple', 'food', 10, 15),
-('Pizza', 'food', 30, 40),
-('Ball', 'toy', 20, 20),
-('Medicine', 'health', 50, 50),
-('Soap', 'clean', 15, 100)
-ON CONFLICT DO NOTHING;
\ No newline at end of file
+-- Insert default items (skipping ones that already exist in an older database)
+WITH defaults (name, type, price, effect_value) AS (VALUES
+    ('Apple', 'food', 10, 15),
+    ('Pizza', 'food', 30, 40),
+    ('Ball', 'toy', 20, 20),
+    ('Medicine', 'health', 50, 50),
+    ('Soap', 'clean', 15, 100)
+)
+INSERT INTO items (name, type, price, effect_value)
+SELECT name, type, price, effect_value FROM defaults
+WHERE NOT EXISTS (SELECT 1 FROM items WHERE items.name = defaults.name);
\ No newline at end of file
@@ -0,0 +1,36 @@
+-- Initial database setup (SQLite variant of 001_initial.sql)
+CREATE TABLE IF NOT EXISTS tamagotchis (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    hunger INTEGER DEFAULT 50,
+    happiness INTEGER DEFAULT 50,
+    health INTEGER DEFAULT 100,
+    cleanliness INTEGER DEFAULT 50,
+    energy INTEGER DEFAULT 100,
+    age INTEGER DEFAULT 0,
+    coins INTEGER DEFAULT 100,
+    evolution_stage INTEGER DEFAULT 1,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Items table for shop
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name VARCHAR(50) NOT NULL,
+    type VARCHAR(20) NOT NULL,
+    price INTEGER NOT NULL,
+    effect_value INTEGER NOT NULL
+);
+
+-- Insert default items (skipping ones that already exist in an older database)
+WITH defaults (name, type, price, effect_value) AS (VALUES
+    ('Apple', 'food', 10, 15),
+    ('Pizza', 'food', 30, 40),
+    ('Ball', 'toy', 20, 20),
+    ('Medicine', 'health', 50, 50),
+    ('Soap', 'clean', 15, 100)
+)
+INSERT INTO items (name, type, price, effect_value)
+SELECT name, type, price, effect_value FROM defaults
+WHERE NOT EXISTS (SELECT 1 FROM items WHERE items.name = defaults.name);
\ No newline at end of file
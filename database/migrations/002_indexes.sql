@@ -0,0 +1,9 @@
+-- Indexes for the hot query patterns
+
+-- Pet list and startup load: ORDER BY created_at DESC, id DESC [LIMIT 1]
+CREATE INDEX IF NOT EXISTS idx_tamagotchis_created_at
+    ON tamagotchis (created_at DESC, id DESC);
+
+-- Pets that have not been saved for a while: WHERE last_updated < ?
+CREATE INDEX IF NOT EXISTS idx_tamagotchis_last_updated
+    ON tamagotchis (last_updated);
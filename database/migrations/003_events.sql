@@ -0,0 +1,23 @@
+-- Append-only log of pet actions and periodic state snapshots
+
+-- One row per event; seq numbers each pet's events from 1.
+-- changes holds the new values of the stats the event changed (JSON)
+CREATE TABLE IF NOT EXISTS pet_events (
+    pet_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    kind VARCHAR(20) NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    changes TEXT NOT NULL,
+    details TEXT,
+    PRIMARY KEY (pet_id, seq)
+);
+
+-- Full stat values after event seq, written every few events so that any
+-- past state is rebuilt by replaying a bounded number of events
+CREATE TABLE IF NOT EXISTS pet_snapshots (
+    pet_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (pet_id, seq)
+);
@@ -0,0 +1,15 @@
+-- Per-pet stat history (SQLite only)
+
+-- Samples are stored in chunks: data holds delta-encoded arrays of sample
+-- times and stat values (see database/stat_history.py). resolution is the
+-- bucket width in seconds, 0 for raw samples. Rows are clustered by the
+-- primary key, so a time range of one pet is a single index range scan
+CREATE TABLE IF NOT EXISTS stat_samples (
+    pet_id INTEGER NOT NULL,
+    resolution INTEGER NOT NULL,
+    chunk_start INTEGER NOT NULL,
+    chunk_end INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (pet_id, resolution, chunk_start)
+) WITHOUT ROWID;
@@ -0,0 +1,12 @@
+-- Per-pet achievement progress
+
+-- progress is a counter, a stat value or a streak length in milliseconds,
+-- depending on the achievement (see game/achievements.py); completed_at is
+-- NULL until the achievement is unlocked
+CREATE TABLE IF NOT EXISTS pet_achievements (
+    pet_id INTEGER NOT NULL,
+    achievement VARCHAR(30) NOT NULL,
+    progress BIGINT NOT NULL DEFAULT 0,
+    completed_at TIMESTAMP,
+    PRIMARY KEY (pet_id, achievement)
+);
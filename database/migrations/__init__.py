@@ -1,5 +1,3 @@
-from .sqlite_manager import SQLiteManager
+from .runner import MigrationRunner, MIGRATIONS_DIR, discover_migrations
 
-DatabaseManager = SQLiteManager
-
-__all__ = ['DatabaseManager', 'SQLiteManager']
\ No newline at end of file
+__all__ = ['MigrationRunner', 'MIGRATIONS_DIR', 'discover_migrations']
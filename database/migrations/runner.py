@@ -0,0 +1,190 @@
+"""
+Schema migration runner for the SQLite and PostgreSQL backends.
+"""
+
+import os
+import re
+import sqlite3
+
+MIGRATIONS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 002_indexes.sql подходит обоим диалектам, 001_initial.sqlite.sql заменяет
+# 001_initial.sql только для SQLite
+MIGRATION_FILE = re.compile(r'^(\d+)_(\w+?)(?:\.(sqlite|postgres))?\.sql$')
+
+# Стиль параметров запросов в sqlite3 и psycopg2
+PLACEHOLDERS = {
+    'sqlite': '?',
+    'postgres': '%s',
+}
+
+CREATE_VERSIONS_SQL = '''
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+
+def discover_migrations(dialect, directory=MIGRATIONS_DIR):
+    """Находит файлы миграций для диалекта.
+
+    Для каждого номера берется файл этого диалекта, а если его нет -
+    общий файл без суффикса диалекта.
+
+    Args:
+        dialect: 'sqlite' или 'postgres'.
+        directory: Директория с файлами миграций.
+
+    Returns:
+        list: Кортежи (версия, имя, путь к файлу), отсортированные по версии.
+
+    Raises:
+        ValueError: Если диалект неизвестен или у двух миграций один номер.
+    """
+    if dialect not in PLACEHOLDERS:
+        raise ValueError(f"Unknown SQL dialect: {dialect}")
+
+    found = {}
+    for filename in sorted(os.listdir(directory)):
+        match = MIGRATION_FILE.match(filename)
+        if match is None:
+            continue
+        version, name, file_dialect = int(match.group(1)), match.group(2), match.group(3)
+        if file_dialect not in (None, dialect):
+            continue
+        previous = found.get(version)
+        if previous is not None:
+            if previous[1] != name:
+                raise ValueError(f"Duplicate migration version {version}: "
+                                 f"{previous[1]} and {name}")
+            # Файл диалекта важнее общего
+            if file_dialect is None:
+                continue
+        found[version] = (version, name, os.path.join(directory, filename))
+    return [found[version] for version in sorted(found)]
+
+
+def split_statements(sql):
+    """Разбивает SQL-скрипт на отдельные выражения.
+
+    Точка с запятой внутри строк и триггеров не разрывает выражение:
+    конец выражения определяет sqlite3.complete_statement.
+
+    Args:
+        sql: Текст скрипта.
+
+    Returns:
+        list: Тексты выражений.
+    """
+    statements = []
+    buffer = ''
+    for line in sql.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statements.append(buffer.strip())
+            buffer = ''
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return statements
+
+
+class MigrationRunner:
+    """Применяет пронумерованные SQL-миграции и хранит версию схемы.
+
+    Примененные миграции записываются в таблицу schema_migrations. Каждая
+    миграция выполняется в отдельной транзакции вместе с записью своей
+    версии, поэтому при ошибке схема остается на предыдущей версии.
+    """
+
+    def __init__(self, connection, dialect, directory=MIGRATIONS_DIR):
+        """Инициализирует раннер.
+
+        Args:
+            connection: Соединение sqlite3 или psycopg2.
+            dialect: 'sqlite' или 'postgres'.
+            directory: Директория с файлами миграций.
+        """
+        self.connection = connection
+        self.dialect = dialect
+        self.migrations = discover_migrations(dialect, directory)
+
+    def applied_versions(self):
+        """Возвращает номера уже примененных миграций.
+
+        Returns:
+            set: Номера версий.
+        """
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(CREATE_VERSIONS_SQL)
+            self.connection.commit()
+            cursor.execute('SELECT version FROM schema_migrations')
+            return {row[0] for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+    def current_version(self):
+        """Возвращает текущую версию схемы.
+
+        Returns:
+            int: Номер последней примененной миграции (0 для пустой базы).
+        """
+        return max(self.applied_versions(), default=0)
+
+    def pending(self):
+        """Возвращает миграции, которые еще не применены.
+
+        Returns:
+            list: Кортежи (версия, имя, путь к файлу).
+        """
+        applied = self.applied_versions()
+        return [migration for migration in self.migrations if migration[0] not in applied]
+
+    def migrate(self):
+        """Применяет все непримененные миграции по порядку.
+
+        Returns:
+            list: Номера примененных миграций.
+
+        Raises:
+            Exception: Ошибка базы данных; транзакция миграции откатывается.
+        """
+        applied = []
+        for version, name, path in self.pending():
+            with open(path, encoding='utf-8') as migration_file:
+                sql = migration_file.read()
+            self._apply(version, name, sql)
+            applied.append(version)
+            print(f"✅ Applied migration {version:03d}_{name}")
+        return applied
+
+    def _apply(self, version, name, sql):
+        """Выполняет одну миграцию в транзакции.
+
+        Args:
+            version: Номер миграции.
+            name: Имя миграции.
+            sql: Текст миграции.
+        """
+        placeholder = PLACEHOLDERS[self.dialect]
+        cursor = self.connection.cursor()
+        try:
+            if self.dialect == 'sqlite':
+                # sqlite3 не открывает транзакцию перед DDL сам
+                cursor.execute('BEGIN')
+                for statement in split_statements(sql):
+                    cursor.execute(statement)
+            else:
+                cursor.execute(sql)
+            cursor.execute(
+                f'INSERT INTO schema_migrations (version, name) '
+                f'VALUES ({placeholder}, {placeholder})',
+                (version, name))
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
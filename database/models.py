@@ -1,13 +1,32 @@
 from datetime import datetime
 
+# Поля, изменения которых отслеживаются и записываются в базу данных
+TRACKED_FIELDS = ('name', 'hunger', 'happiness', 'health', 'cleanliness',
+                  'energy', 'age', 'coins', 'evolution_stage')
+
+# Столбцы таблицы tamagotchis в порядке DDL: порядок значений для Tamagotchi.from_row
+ROW_COLUMNS = ('id', 'name', 'hunger', 'happiness', 'health', 'cleanliness', 'energy',
+               'age', 'coins', 'evolution_stage', 'created_at', 'last_updated')
+
 
 class Tamagotchi:
     """Класс, представляющий виртуального питомца Tamagotchi.
     
     Хранит все атрибуты состояния питомца и предоставляет методы
     для сериализации и десериализации.
+    
+    Отслеживает изменения: каждое присваивание нового значения полю из
+    TRACKED_FIELDS добавляет его в набор измененных полей и увеличивает
+    счетчик версий. Менеджеры баз данных записывают только измененные
+    поля и пропускают сохранение, если изменений нет.
+    
+    Атрибуты хранятся в __slots__ без словаря экземпляра: это уменьшает
+    память на каждого питомца, а from_row создает объект из строки базы
+    данных без промежуточного словаря и значений по умолчанию.
     """
     
+    __slots__ = ROW_COLUMNS + ('version', '_dirty')
+    
     def __init__(self, id=None, name="Pou", created_at=None):
         """Инициализирует нового тамагочи с заданными параметрами.
         
@@ -16,18 +35,91 @@ class Tamagotchi:
             name: Имя тамагочи. По умолчанию "Pou".
             created_at: Время создания тамагочи. Если None, используется текущее время.
         """
-        self.id = id
-        self.name = name
-        self.hunger = 50          # Уровень голода (0-100)
-        self.happiness = 50       # Уровень счастья (0-100)
-        self.health = 100         # Уровень здоровья (0-100)
-        self.cleanliness = 50     # Уровень чистоты (0-100)
-        self.energy = 100         # Уровень энергии (0-100)
-        self.age = 0              # Возраст в днях
-        self.coins = 100          # Количество монет
-        self.created_at = created_at or datetime.now()
-        self.last_updated = datetime.now()
-        self.evolution_stage = 1  # Стадия эволюции (1: ребенок, 2: подросток, 3: взрослый)
+        now = datetime.now()
+        # Новый объект еще не записан: все поля считаются измененными
+        _set_dirty(self, set(TRACKED_FIELDS))
+        _set_version(self, 0)     # Счетчик изменений отслеживаемых полей
+        _set_id(self, id)
+        _set_name(self, name)
+        _set_hunger(self, 50)          # Уровень голода (0-100)
+        _set_happiness(self, 50)       # Уровень счастья (0-100)
+        _set_health(self, 100)         # Уровень здоровья (0-100)
+        _set_cleanliness(self, 50)     # Уровень чистоты (0-100)
+        _set_energy(self, 100)         # Уровень энергии (0-100)
+        _set_age(self, 0)              # Возраст в днях
+        _set_coins(self, 100)          # Количество монет
+        _set_evolution_stage(self, 1)  # Стадия эволюции (1: ребенок, 2: подросток, 3: взрослый)
+        _set_created_at(self, created_at or now)
+        _set_last_updated(self, now)
+
+    def __setattr__(self, name, value):
+        """Присваивает атрибут, отмечая изменение отслеживаемого поля.
+        
+        Args:
+            name: Имя атрибута.
+            value: Новое значение.
+        """
+        if name in TRACKED_FIELDS:
+            if getattr(self, name, _MISSING) == value:
+                return
+            dirty = self._dirty
+            if dirty is _CLEAN:
+                _set_dirty(self, {name})
+            else:
+                dirty.add(name)
+            _set_version(self, self.version + 1)
+        object.__setattr__(self, name, value)
+
+    @property
+    def dirty_fields(self):
+        """Поля, измененные с последнего сохранения.
+        
+        Returns:
+            frozenset: Имена измененных полей.
+        """
+        return frozenset(self._dirty)
+
+    @property
+    def is_dirty(self):
+        """Есть ли несохраненные изменения.
+        
+        Returns:
+            bool: True если хотя бы одно поле изменено.
+        """
+        return bool(self._dirty)
+
+    def changed_columns(self):
+        """Возвращает измененные поля в порядке столбцов таблицы.
+        
+        Returns:
+            list: Имена измененных полей из TRACKED_FIELDS.
+        """
+        return [field for field in TRACKED_FIELDS if field in self._dirty]
+
+    def mark_clean(self):
+        """Отмечает все поля как сохраненные."""
+        _set_dirty(self, _CLEAN)
+
+    def mark_dirty(self, fields=TRACKED_FIELDS):
+        """Отмечает поля как измененные (например, после неудачного сохранения).
+        
+        Args:
+            fields: Имена полей. По умолчанию все отслеживаемые поля.
+        """
+        dirty = set(self._dirty)
+        dirty.update(fields)
+        _set_dirty(self, dirty)
+
+    def snapshot(self):
+        """Создает копию с теми же данными, измененными полями и версией.
+        
+        Returns:
+            Tamagotchi: Независимая копия объекта.
+        """
+        copy = Tamagotchi.from_row(self.to_row())
+        copy.mark_dirty(self._dirty)
+        _set_version(copy, self.version)
+        return copy
 
     def to_dict(self):
         """Конвертирует объект Tamagotchi в словарь для сериализации.
@@ -56,7 +148,8 @@ class Tamagotchi:
         """Создает объект Tamagotchi из словаря.
         
         Фабричный метод для десериализации данных из базы данных
-        или другого источника.
+        или другого источника. Созданный объект считается сохраненным
+        (без измененных полей).
         
         Args:
             data: Словарь с данными тамагочи. Может содержать не все поля.
@@ -64,17 +157,90 @@ class Tamagotchi:
         Returns:
             Tamagotchi: Новый объект Tamagotchi с данными из словаря.
         """
-        tamagotchi = cls()
-        tamagotchi.id = data.get('id')
-        tamagotchi.name = data.get('name', 'Pou')
-        tamagotchi.hunger = data.get('hunger', 50)
-        tamagotchi.happiness = data.get('happiness', 50)
-        tamagotchi.health = data.get('health', 100)
-        tamagotchi.cleanliness = data.get('cleanliness', 50)
-        tamagotchi.energy = data.get('energy', 100)
-        tamagotchi.age = data.get('age', 0)
-        tamagotchi.coins = data.get('coins', 100)
-        tamagotchi.created_at = data.get('created_at', datetime.now())
-        tamagotchi.last_updated = data.get('last_updated', datetime.now())
-        tamagotchi.evolution_stage = data.get('evolution_stage', 1)
-        return tamagotchi
\ No newline at end of file
+        now = None
+        if 'created_at' not in data or 'last_updated' not in data:
+            now = datetime.now()
+        return cls.from_row((
+            data.get('id'),
+            data.get('name', 'Pou'),
+            data.get('hunger', 50),
+            data.get('happiness', 50),
+            data.get('health', 100),
+            data.get('cleanliness', 50),
+            data.get('energy', 100),
+            data.get('age', 0),
+            data.get('coins', 100),
+            data.get('evolution_stage', 1),
+            data.get('created_at', now),
+            data.get('last_updated', now),
+        ))
+
+    @classmethod
+    def from_row(cls, row):
+        """Создает объект Tamagotchi из строки таблицы tamagotchis.
+        
+        Быстрый конструктор: значения записываются прямо в слоты, без
+        значений по умолчанию, отслеживания изменений и промежуточного
+        словаря. Созданный объект считается сохраненным.
+        
+        Args:
+            row: Последовательность значений в порядке ROW_COLUMNS
+                 (кортеж, sqlite3.Row или строка курсора psycopg2).
+                 
+        Returns:
+            Tamagotchi: Новый объект Tamagotchi.
+        """
+        (id, name, hunger, happiness, health, cleanliness, energy,
+         age, coins, evolution_stage, created_at, last_updated) = row
+        tamagotchi = _new(cls)
+        _set_id(tamagotchi, id)
+        _set_name(tamagotchi, name)
+        _set_hunger(tamagotchi, hunger)
+        _set_happiness(tamagotchi, happiness)
+        _set_health(tamagotchi, health)
+        _set_cleanliness(tamagotchi, cleanliness)
+        _set_energy(tamagotchi, energy)
+        _set_age(tamagotchi, age)
+        _set_coins(tamagotchi, coins)
+        _set_evolution_stage(tamagotchi, evolution_stage)
+        _set_created_at(tamagotchi, created_at)
+        _set_last_updated(tamagotchi, last_updated)
+        _set_version(tamagotchi, 0)
+        _set_dirty(tamagotchi, _CLEAN)
+        return tamagotchi
+
+    def to_row(self):
+        """Возвращает значения столбцов в порядке ROW_COLUMNS.
+        
+        Returns:
+            tuple: Значения для Tamagotchi.from_row.
+        """
+        return (self.id, self.name, self.hunger, self.happiness, self.health,
+                self.cleanliness, self.energy, self.age, self.coins,
+                self.evolution_stage, self.created_at, self.last_updated)
+
+
+# Маркер отсутствующего значения слота
+_MISSING = object()
+
+# Общий пустой набор измененных полей для сохраненных объектов: отдельное
+# множество создается только при первом изменении
+_CLEAN = frozenset()
+
+_new = object.__new__
+
+# Запись в слоты через дескрипторы напрямую, минуя __setattr__ с отслеживанием
+_set_id = Tamagotchi.id.__set__
+_set_name = Tamagotchi.name.__set__
+_set_hunger = Tamagotchi.hunger.__set__
+_set_happiness = Tamagotchi.happiness.__set__
+_set_health = Tamagotchi.health.__set__
+_set_cleanliness = Tamagotchi.cleanliness.__set__
+_set_energy = Tamagotchi.energy.__set__
+_set_age = Tamagotchi.age.__set__
+_set_coins = Tamagotchi.coins.__set__
+_set_evolution_stage = Tamagotchi.evolution_stage.__set__
+_set_created_at = Tamagotchi.created_at.__set__
+_set_last_updated = Tamagotchi.last_updated.__set__
+_set_version = Tamagotchi.version.__set__
+_set_dirty = Tamagotchi._dirty.__set__
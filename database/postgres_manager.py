@@ -1,87 +1,285 @@
+import itertools
+import json
+import threading
+import time
+from contextlib import contextmanager
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2 import extensions
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool, PoolError
 from config import DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD
-from .models import Tamagotchi
+from .models import Tamagotchi, ROW_COLUMNS
+from .migrations import MigrationRunner
+from .events import PetEvent, EVENT_COLUMNS, SNAPSHOT_COLUMNS
+from .achievements import ACHIEVEMENT_COLUMNS
+
+ORDER_BY_ID = 'ORDER BY id'
+ORDER_NEWEST_FIRST = 'ORDER BY created_at DESC, id DESC'
+
+# Столбцы перечисляются явно: строки-кортежи идут прямо в Tamagotchi.from_row
+SELECT_COLUMNS = ', '.join(ROW_COLUMNS)
+
+# Счетчик для уникальных имен серверных курсоров
+_cursor_ids = itertools.count(1)
+
+INSERT_COLUMNS = ('name', 'hunger', 'happiness', 'health', 'cleanliness',
+                  'energy', 'age', 'coins', 'evolution_stage')
+
+# Пул соединений: одно держится открытым, остальные открываются по требованию.
+# Одновременно работают не больше POOL_MAX_CONNECTIONS потоков, остальные ждут
+POOL_MIN_CONNECTIONS = 1
+POOL_MAX_CONNECTIONS = 4
+
+# Переподключение при потере соединения: пауза удваивается после каждой попытки
+RECONNECT_ATTEMPTS = 3
+RECONNECT_DELAY = 0.2
+RECONNECT_MAX_DELAY = 5.0
+
+# Ошибки, после которых соединение (и весь пул) считается потерянным
+CONNECTION_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+
+
+class CommitUnknownError(Exception):
+    """Соединение оборвалось во время COMMIT: неизвестно, зафиксирована ли транзакция."""
 
 
 class PostgresManager:
-    def __init__(self):
-        self.connection = None
+    def __init__(self, min_connections=POOL_MIN_CONNECTIONS, max_connections=POOL_MAX_CONNECTIONS,
+                 reconnect_attempts=RECONNECT_ATTEMPTS, reconnect_delay=RECONNECT_DELAY):
+        self.pool = None
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.reconnect_attempts = reconnect_attempts
+        self.reconnect_delay = reconnect_delay
+        self.schema_version = 0
+        self._pool_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_connections)
         self.connect()
 
     def connect(self):
         try:
-            self.connection = psycopg2.connect(
-                host=DB_HOST,
-                port=DB_PORT,
-                dbname=DB_NAME,
-                user=DB_USER,
-                password=DB_PASSWORD
-            )
-            self._create_tables()
+            self._ensure_pool()
+            with self._checkout() as connection:
+                self._create_tables(connection)
         except Exception as e:
             print(f"Database connection error: {e}")
 
-    def _create_tables(self):
-        cursor = self.connection.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tamagotchis (
-                id SERIAL PRIMARY KEY,
-                name VARCHAR(50) NOT NULL,
-                hunger INTEGER DEFAULT 50,
-                happiness INTEGER DEFAULT 50,
-                health INTEGER DEFAULT 100,
-                cleanliness INTEGER DEFAULT 50,
-                energy INTEGER DEFAULT 100,
-                age INTEGER DEFAULT 0,
-                coins INTEGER DEFAULT 100,
-                evolution_stage INTEGER DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        self.connection.commit()
+    def close(self):
+        with self._pool_lock:
+            if self.pool is not None and not self.pool.closed:
+                self.pool.closeall()
+            self.pool = None
+
+    def _create_tables(self, connection):
+        # Схема описана пронумерованными миграциями в database/migrations
+        runner = MigrationRunner(connection, 'postgres')
+        runner.migrate()
+        self.schema_version = runner.current_version()
+
+    def _ensure_pool(self):
+        with self._pool_lock:
+            if self.pool is None or self.pool.closed:
+                self.pool = ThreadedConnectionPool(
+                    self.min_connections,
+                    self.max_connections,
+                    host=DB_HOST,
+                    port=DB_PORT,
+                    dbname=DB_NAME,
+                    user=DB_USER,
+                    password=DB_PASSWORD
+                )
+            return self.pool
+
+    def _reset_pool(self, pool):
+        # Сервер перезапущен или сеть пропала: остальные соединения пула тоже
+        # мертвы, поэтому пул закрывается целиком и создается заново при следующем вызове
+        with self._pool_lock:
+            if self.pool is pool:
+                self.pool = None
+        try:
+            if not pool.closed:
+                pool.closeall()
+        except PoolError:
+            pass
+
+    @staticmethod
+    def _is_healthy(connection):
+        # Проверка без запроса к серверу: флаги закрытия и потери связи
+        return (not connection.closed and
+                connection.info.transaction_status != extensions.TRANSACTION_STATUS_UNKNOWN)
+
+    @contextmanager
+    def _checkout(self):
+        # Соединение выдается на один вызов и возвращается в пул после него
+        with self._slots:
+            pool = self._ensure_pool()
+            connection = pool.getconn()
+            if not self._is_healthy(connection):
+                pool.putconn(connection, close=True)
+                connection = pool.getconn()
+
+            lost = False
+            try:
+                yield connection
+            except CONNECTION_ERRORS + (CommitUnknownError,):
+                lost = True
+                raise
+            except Exception:
+                try:
+                    connection.rollback()
+                except CONNECTION_ERRORS:
+                    lost = True
+                raise
+            finally:
+                try:
+                    pool.putconn(connection, close=lost)
+                except PoolError:
+                    # Пул уже закрыт другим потоком
+                    connection.close()
+                if lost:
+                    self._reset_pool(pool)
+
+    def _run(self, operation, *args):
+        # Выполняет operation(connection, *args) на соединении из пула. При
+        # потере соединения до COMMIT транзакция не зафиксирована, поэтому вызов
+        # повторяется на новом соединении после паузы. Неповторяемые операции
+        # фиксируются через _commit_once и при обрыве во время COMMIT не повторяются
+        delay = self.reconnect_delay
+        for attempt in range(self.reconnect_attempts + 1):
+            try:
+                with self._checkout() as connection:
+                    return operation(connection, *args)
+            except CONNECTION_ERRORS as e:
+                if attempt == self.reconnect_attempts:
+                    raise
+                print(f"Database connection lost ({e}), reconnecting in {delay:.1f}s")
+                time.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    @staticmethod
+    def _commit_once(connection):
+        # Обрыв во время COMMIT мог случиться уже после фиксации на сервере:
+        # повторная вставка RETURNING id создала бы второго тамагочи
+        try:
+            connection.commit()
+        except CONNECTION_ERRORS as e:
+            raise CommitUnknownError(str(e)) from e
+
+    def ping(self):
+        try:
+            return self._run(self._ping)
+        except Exception as e:
+            print(f"Database health check failed: {e}")
+            return False
+
+    def _ping(self, connection):
+        cursor = connection.cursor()
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
         cursor.close()
+        connection.commit()
+        return True
 
     def save_tamagotchi(self, tamagotchi):
         try:
-            cursor = self.connection.cursor()
-            if tamagotchi.id is None:
-                cursor.execute('''
-                    INSERT INTO tamagotchis 
-                    (name, hunger, happiness, health, cleanliness, energy, age, coins, evolution_stage, last_updated)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-                    RETURNING id
-                ''', (tamagotchi.name, tamagotchi.hunger, tamagotchi.happiness,
-                      tamagotchi.health, tamagotchi.cleanliness, tamagotchi.energy,
-                      tamagotchi.age, tamagotchi.coins, tamagotchi.evolution_stage))
-                tamagotchi.id = cursor.fetchone()[0]
-            else:
-                cursor.execute('''
-                    UPDATE tamagotchis 
-                    SET name=%s, hunger=%s, happiness=%s, health=%s, cleanliness=%s,
-                        energy=%s, age=%s, coins=%s, evolution_stage=%s, last_updated=CURRENT_TIMESTAMP
-                    WHERE id=%s
-                ''', (tamagotchi.name, tamagotchi.hunger, tamagotchi.happiness,
-                      tamagotchi.health, tamagotchi.cleanliness, tamagotchi.energy,
-                      tamagotchi.age, tamagotchi.coins, tamagotchi.evolution_stage, tamagotchi.id))
-
-            self.connection.commit()
-            cursor.close()
+            # Сохранять нечего: запись в базе уже актуальна
+            if tamagotchi.id is not None and not tamagotchi.is_dirty:
+                return True
+
+            self._run(self._save, tamagotchi)
+            tamagotchi.mark_clean()
             return True
         except Exception as e:
             print(f"Error saving tamagotchi: {e}")
             return False
 
+    def _save(self, connection, tamagotchi):
+        cursor = connection.cursor()
+        if tamagotchi.id is None:
+            cursor.execute('''
+                INSERT INTO tamagotchis
+                (name, hunger, happiness, health, cleanliness, energy, age, coins, evolution_stage, last_updated)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
+                RETURNING id
+            ''', (tamagotchi.name, tamagotchi.hunger, tamagotchi.happiness,
+                  tamagotchi.health, tamagotchi.cleanliness, tamagotchi.energy,
+                  tamagotchi.age, tamagotchi.coins, tamagotchi.evolution_stage))
+            new_id = cursor.fetchone()[0]
+        else:
+            # Обновляем только измененные столбцы (имена берутся из TRACKED_FIELDS)
+            columns = tamagotchi.changed_columns()
+            assignments = ", ".join(f"{column}=%s" for column in columns)
+            cursor.execute(
+                f"UPDATE tamagotchis SET {assignments}, last_updated=CURRENT_TIMESTAMP WHERE id=%s",
+                [getattr(tamagotchi, column) for column in columns] + [tamagotchi.id])
+            new_id = tamagotchi.id
+
+        if tamagotchi.id is None:
+            self._commit_once(connection)
+        else:
+            # UPDATE записывает абсолютные значения, его повтор безопасен
+            connection.commit()
+        cursor.close()
+        # ID присваивается только после commit, чтобы повтор после обрыва не потерял вставку
+        tamagotchi.id = new_id
+
+    def save_many(self, tamagotchis):
+        new, updates = [], {}
+        for tamagotchi in tamagotchis:
+            if tamagotchi.id is None:
+                new.append(tamagotchi)
+            elif tamagotchi.is_dirty:
+                updates.setdefault(tuple(tamagotchi.changed_columns()), []).append(tamagotchi)
+
+        try:
+            new_ids = self._run(self._save_many, new, updates)
+        except Exception as e:
+            print(f"Error saving tamagotchis: {e}")
+            return False
+
+        for tamagotchi, row in zip(new, new_ids):
+            tamagotchi.id = row[0]
+        for tamagotchi in new + [t for group in updates.values() for t in group]:
+            tamagotchi.mark_clean()
+        return True
+
+    def _save_many(self, connection, new, updates):
+        cursor = connection.cursor()
+        new_ids = []
+        if new:
+            # Одна многострочная вставка; RETURNING возвращает ID в порядке строк VALUES
+            new_ids = execute_values(cursor, f'''
+                INSERT INTO tamagotchis ({", ".join(INSERT_COLUMNS)}, last_updated)
+                VALUES %s
+                RETURNING id
+            ''', [tuple(getattr(t, column) for column in INSERT_COLUMNS) for t in new],
+                template=f"({', '.join(['%s'] * len(INSERT_COLUMNS))}, CURRENT_TIMESTAMP)",
+                fetch=True)
+        for columns, group in updates.items():
+            # Обновление группы одним запросом UPDATE ... FROM (VALUES ...)
+            assignments = ", ".join(f"{column}=v.{column}" for column in columns)
+            execute_values(cursor, f'''
+                UPDATE tamagotchis AS t
+                SET {assignments}, last_updated=CURRENT_TIMESTAMP
+                FROM (VALUES %s) AS v(id, {", ".join(columns)})
+                WHERE t.id = v.id
+            ''', [(t.id,) + tuple(getattr(t, column) for column in columns) for t in group])
+
+        if new:
+            self._commit_once(connection)
+        else:
+            connection.commit()
+        cursor.close()
+        return new_ids
+
     def load_tamagotchi(self, tamagotchi_id):
         try:
-            cursor = self.connection.cursor(cursor_factory=RealDictCursor)
-            cursor.execute('SELECT * FROM tamagotchis WHERE id = %s', (tamagotchi_id,))
-            result = cursor.fetchone()
-            cursor.close()
+            rows = self._run(self._fetch_rows,
+                             f'SELECT {SELECT_COLUMNS} FROM tamagotchis WHERE id = %s',
+                             (tamagotchi_id,))
 
-            if result:
-                return Tamagotchi.from_dict(result)
+            if rows:
+                return Tamagotchi.from_row(rows[0])
             return None
         except Exception as e:
             print(f"Error loading tamagotchi: {e}")
@@ -89,12 +287,170 @@ class PostgresManager:
 
     def get_all_tamagotchis(self):
         try:
-            cursor = self.connection.cursor(cursor_factory=RealDictCursor)
-            cursor.execute('SELECT * FROM tamagotchis ORDER BY created_at DESC')
-            results = cursor.fetchall()
-            cursor.close()
+            return list(self.iter_all(newest_first=True))
+        except Exception as e:
+            print(f"Error loading tamagotchis: {e}")
+            return []
+
+    def get_latest_tamagotchi(self):
+        # Одна строка по индексу created_at вместо чтения всей таблицы
+        try:
+            rows = self._run(self._fetch_rows,
+                             f'SELECT {SELECT_COLUMNS} FROM tamagotchis {ORDER_NEWEST_FIRST} LIMIT 1')
 
-            return [Tamagotchi.from_dict(row) for row in results]
+            if rows:
+                return Tamagotchi.from_row(rows[0])
+            return None
+        except Exception as e:
+            print(f"Error loading latest tamagotchi: {e}")
+            return None
+
+    def load_many(self, tamagotchi_ids):
+        ids = list(tamagotchi_ids)
+        try:
+            rows = self._run(self._fetch_rows,
+                             f'SELECT {SELECT_COLUMNS} FROM tamagotchis WHERE id = ANY(%s)', (ids,))
+            rows = {row[0]: row for row in rows}
+
+            # Результат в порядке запрошенных ID, отсутствующие пропускаются
+            return [Tamagotchi.from_row(rows[i]) for i in ids if i in rows]
         except Exception as e:
             print(f"Error loading tamagotchis: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    def iter_all(self, batch_size=100, newest_first=False):
+        # Соединение занято, пока перебор не закончится. Обрыв посреди перебора
+        # не повторяется: часть строк уже отдана вызывающему коду
+        with self._checkout() as connection:
+            # Именованный (серверный) курсор: строки передаются порциями по batch_size
+            cursor = connection.cursor(name=f'tamagotchis_iter_{next(_cursor_ids)}')
+            cursor.itersize = batch_size
+            try:
+                order = ORDER_NEWEST_FIRST if newest_first else ORDER_BY_ID
+                cursor.execute(f'SELECT {SELECT_COLUMNS} FROM tamagotchis {order}')
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield Tamagotchi.from_row(row)
+            finally:
+                cursor.close()
+
+    def delete_tamagotchi(self, tamagotchi_id):
+        try:
+            self._run(self._delete, tamagotchi_id)
+            print(f"Deleted tamagotchi ID: {tamagotchi_id}")
+            return True
+        except Exception as e:
+            print(f"Error deleting tamagotchi: {e}")
+            return False
+
+    def _delete(self, connection, tamagotchi_id):
+        cursor = connection.cursor()
+        cursor.execute('DELETE FROM tamagotchis WHERE id = %s', (tamagotchi_id,))
+        # Журнал событий и достижения удаленного тамагочи удаляются в той же транзакции
+        cursor.execute('DELETE FROM pet_events WHERE pet_id = %s', (tamagotchi_id,))
+        cursor.execute('DELETE FROM pet_snapshots WHERE pet_id = %s', (tamagotchi_id,))
+        cursor.execute('DELETE FROM pet_achievements WHERE pet_id = %s', (tamagotchi_id,))
+        connection.commit()
+        cursor.close()
+
+    def append_events(self, events, snapshots=()):
+        try:
+            self._run(self._append_events, list(events), list(snapshots))
+            return True
+        except Exception as e:
+            print(f"Error writing events: {e}")
+            return False
+
+    def _append_events(self, connection, events, snapshots):
+        cursor = connection.cursor()
+        # Порция событий и снимков - одна транзакция из двух многострочных вставок
+        if events:
+            # Номер seq назначает клиент, поэтому повтор после обрыва во время
+            # COMMIT не дублирует события и не падает на первичном ключе
+            execute_values(cursor, f'''
+                INSERT INTO pet_events ({", ".join(EVENT_COLUMNS)}) VALUES %s
+                ON CONFLICT (pet_id, seq) DO NOTHING
+            ''', [event.to_row() for event in events])
+        if snapshots:
+            execute_values(cursor, f'''
+                INSERT INTO pet_snapshots ({", ".join(SNAPSHOT_COLUMNS)}) VALUES %s
+                ON CONFLICT (pet_id, seq) DO UPDATE SET state = EXCLUDED.state
+            ''', snapshots)
+        connection.commit()
+        cursor.close()
+
+    def _fetch_rows(self, connection, sql, params=None):
+        # Обычный курсор: строки-кортежи в порядке столбцов запроса
+        cursor = connection.cursor()
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        cursor.close()
+        # Завершаем читающую транзакцию, чтобы соединение вернулось в пул свободным
+        connection.commit()
+        return rows
+
+    def load_events(self, pet_id, after_seq=0, before_seq=None, limit=None, newest_first=False):
+        # Диапазон по первичному ключу (pet_id, seq): страница истории без OFFSET
+        sql = f'SELECT {", ".join(EVENT_COLUMNS)} FROM pet_events WHERE pet_id = %s AND seq > %s'
+        params = [pet_id, after_seq]
+        if before_seq is not None:
+            sql += ' AND seq < %s'
+            params.append(before_seq)
+        sql += ' ORDER BY seq DESC' if newest_first else ' ORDER BY seq'
+        if limit is not None:
+            sql += ' LIMIT %s'
+            params.append(limit)
+        try:
+            return [PetEvent.from_row(row) for row in self._run(self._fetch_rows, sql, params)]
+        except Exception as e:
+            print(f"Error loading events: {e}")
+            return []
+
+    def load_snapshot(self, pet_id, max_seq=None):
+        sql = 'SELECT seq, state FROM pet_snapshots WHERE pet_id = %s'
+        params = [pet_id]
+        if max_seq is not None:
+            sql += ' AND seq <= %s'
+            params.append(max_seq)
+        try:
+            rows = self._run(self._fetch_rows, sql + ' ORDER BY seq DESC LIMIT 1', params)
+            return (rows[0][0], json.loads(rows[0][1])) if rows else None
+        except Exception as e:
+            print(f"Error loading snapshot: {e}")
+            return None
+
+    def last_event_seq(self, pet_id):
+        rows = self._run(self._fetch_rows, 'SELECT MAX(seq) FROM pet_events WHERE pet_id = %s',
+                         (pet_id,))
+        return rows[0][0] or 0
+
+    def save_achievements(self, rows):
+        try:
+            self._run(self._save_achievements, list(rows))
+            return True
+        except Exception as e:
+            print(f"Error writing achievements: {e}")
+            return False
+
+    def _save_achievements(self, connection, rows):
+        cursor = connection.cursor()
+        execute_values(cursor, f'''
+            INSERT INTO pet_achievements ({", ".join(ACHIEVEMENT_COLUMNS)}) VALUES %s
+            ON CONFLICT (pet_id, achievement) DO UPDATE
+            SET progress = EXCLUDED.progress, completed_at = EXCLUDED.completed_at
+        ''', rows)
+        connection.commit()
+        cursor.close()
+
+    def load_achievements(self, pet_id):
+        try:
+            rows = self._run(self._fetch_rows,
+                             'SELECT achievement, progress, completed_at FROM pet_achievements '
+                             'WHERE pet_id = %s', (pet_id,))
+            return {row[0]: (row[1], row[2]) for row in rows}
+        except Exception as e:
+            print(f"Error loading achievements: {e}")
+            return {}
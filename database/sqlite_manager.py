@@ -1,7 +1,101 @@
+import json
 import sqlite3
 import os
+import threading
 from datetime import datetime
-from .models import Tamagotchi
+from functools import lru_cache, wraps
+from config import SQLITE_PATH
+from .models import Tamagotchi, ROW_COLUMNS
+from .migrations import MigrationRunner
+from .events import PetEvent, EVENT_COLUMNS, SNAPSHOT_COLUMNS
+from .stat_history import STAT_CHUNK_COLUMNS
+from .achievements import ACHIEVEMENT_COLUMNS
+
+# Профиль производительности: журнал WAL с synchronous=NORMAL делает
+# каждое сохранение дешевым (без fsync на каждый commit), а отображение
+# файла в память и больший кэш страниц ускоряют чтение
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -8000,        # 8 МБ (отрицательное значение - в килобайтах)
+    "mmap_size": 64 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+# Размер кэша подготовленных выражений соединения (у sqlite3 по умолчанию 128)
+CACHED_STATEMENTS = 256
+
+INSERT_SQL = '''
+    INSERT INTO tamagotchis 
+    (name, hunger, happiness, health, cleanliness, energy, age, coins, evolution_stage)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+# Явный список столбцов: порядок значений строки совпадает с Tamagotchi.from_row
+SELECT_COLUMNS = ', '.join(ROW_COLUMNS)
+SELECT_BY_ID_SQL = f'SELECT {SELECT_COLUMNS} FROM tamagotchis WHERE id = ?'
+
+# Порядок перебора: по ID или от новых к старым (как в списке питомцев)
+ORDER_BY_ID = 'ORDER BY id'
+ORDER_NEWEST_FIRST = 'ORDER BY created_at DESC, id DESC'
+
+INSERT_EVENT_SQL = (f'INSERT INTO pet_events ({", ".join(EVENT_COLUMNS)}) '
+                    f'VALUES ({", ".join("?" * len(EVENT_COLUMNS))})')
+INSERT_SNAPSHOT_SQL = (f'INSERT OR REPLACE INTO pet_snapshots ({", ".join(SNAPSHOT_COLUMNS)}) '
+                       f'VALUES ({", ".join("?" * len(SNAPSHOT_COLUMNS))})')
+
+SAVE_STAT_CHUNK_SQL = (f'INSERT OR REPLACE INTO stat_samples ({", ".join(STAT_CHUNK_COLUMNS)}) '
+                       f'VALUES ({", ".join("?" * len(STAT_CHUNK_COLUMNS))})')
+
+SAVE_ACHIEVEMENT_SQL = (f'INSERT OR REPLACE INTO pet_achievements ({", ".join(ACHIEVEMENT_COLUMNS)}) '
+                        f'VALUES ({", ".join("?" * len(ACHIEVEMENT_COLUMNS))})')
+
+# Максимальное число параметров в одном запросе (ограничение старых версий SQLite)
+MAX_VARIABLES = 900
+
+
+def _insert_params(tamagotchi):
+    """Возвращает параметры INSERT_SQL для тамагочи.
+    
+    Args:
+        tamagotchi: Объект Tamagotchi.
+        
+    Returns:
+        tuple: Значения столбцов в порядке INSERT_SQL.
+    """
+    return (tamagotchi.name, tamagotchi.hunger, tamagotchi.happiness,
+            tamagotchi.health, tamagotchi.cleanliness, tamagotchi.energy,
+            tamagotchi.age, tamagotchi.coins, tamagotchi.evolution_stage)
+
+
+@lru_cache(maxsize=None)
+def _update_sql(columns):
+    """Возвращает текст UPDATE для набора столбцов.
+    
+    Один и тот же набор столбцов всегда дает один и тот же текст запроса,
+    поэтому sqlite3 берет подготовленное выражение из кэша соединения.
+    
+    Args:
+        columns: Кортеж имен столбцов из TRACKED_FIELDS.
+        
+    Returns:
+        str: Текст запроса UPDATE.
+    """
+    assignments = ", ".join(f"{column}=?" for column in columns)
+    return f"UPDATE tamagotchis SET {assignments}, last_updated=CURRENT_TIMESTAMP WHERE id=?"
+
+
+def _locked(method):
+    """Выполняет метод менеджера под блокировкой его соединения.
+    
+    Соединение открыто с check_same_thread=False: его используют поток
+    отрисовки и фоновый поток записи, а объект sqlite3.Connection не
+    рассчитан на одновременные вызовы (и на чужой commit посреди транзакции).
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class SQLiteManager:
@@ -11,148 +105,316 @@ class SQLiteManager:
     CRUD операций над объектами Tamagotchi.
     """
     
-    def __init__(self):
-        """Инициализирует менеджер и устанавливает соединение с базой данных."""
+    def __init__(self, db_path=SQLITE_PATH, pragmas=None, offline_update=None):
+        """Инициализирует менеджер и устанавливает соединение с базой данных.
+        
+        Args:
+            db_path: Путь к файлу базы данных (или ':memory:').
+            pragmas: Настройки PRAGMA. По умолчанию SQLITE_PRAGMAS.
+            offline_update: Функция, применяющая к загруженному тамагочи
+                снижение показателей за время без игры и возвращающая число
+                шагов (например, game.catch_up.catch_up_since_last_update).
+                None - показатели загружаются как есть.
+        """
+        self.db_path = db_path
+        self.pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+        self.offline_update = offline_update
         self.connection = None
+        self.schema_version = 0
+        # Общая блокировка соединения для всех потоков (см. _locked)
+        self._lock = threading.RLock()
         self.connect()
 
+    @_locked
     def connect(self):
         """Устанавливает соединение с SQLite базой данных.
         
         Создает директорию для базы данных если она не существует,
-        подключается к файлу базы данных и создает необходимые таблицы.
+        подключается к файлу базы данных, применяет настройки PRAGMA
+        и создает необходимые таблицы.
         
         Raises:
             Exception: Если не удается установить соединение с базой данных.
         """
         try:
             # Создаем директорию для базы данных если она не существует
-            os.makedirs('database', exist_ok=True)
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
             self.connection = sqlite3.connect(
-                'database/tamagotchi.db', 
-                check_same_thread=False
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=CACHED_STATEMENTS
             )
             self.connection.row_factory = sqlite3.Row
+            self._apply_pragmas()
             self._create_tables()
             print("✅ SQLite database connected successfully!")
         except Exception as e:
             print(f"❌ SQLite connection error: {e}")
 
+    @_locked
+    def close(self):
+        """Закрывает соединение с базой данных."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def _apply_pragmas(self):
+        """Применяет настройки PRAGMA к соединению."""
+        for name, value in self.pragmas.items():
+            self.connection.execute(f"PRAGMA {name}={value}")
+
     def _create_tables(self):
-        """Создает таблицы в базе данных если они не существуют.
-        
-        Создает основную таблицу 'tamagotchis' со всеми необходимыми полями
-        для хранения состояния тамагочи.
-        """
-        cursor = self.connection.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tamagotchis (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                hunger INTEGER DEFAULT 50,
-                happiness INTEGER DEFAULT 50,
-                health INTEGER DEFAULT 100,
-                cleanliness INTEGER DEFAULT 50,
-                energy INTEGER DEFAULT 100,
-                age INTEGER DEFAULT 0,
-                coins INTEGER DEFAULT 100,
-                evolution_stage INTEGER DEFAULT 1,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        self.connection.commit()
-        cursor.close()
+        """Приводит схему базы данных к последней версии.
+        
+        Применяет непримененные миграции из database/migrations: таблицу
+        'tamagotchis' со всеми необходимыми полями и индексы для частых
+        запросов. Версия схемы сохраняется в self.schema_version.
+        """
+        runner = MigrationRunner(self.connection, 'sqlite')
+        runner.migrate()
+        self.schema_version = runner.current_version()
 
+    @_locked
     def save_tamagotchi(self, tamagotchi):
         """Сохраняет объект Tamagotchi в базу данных.
         
         Если у тамагочи нет ID, создает новую запись. Если ID существует,
-        обновляет существующую запись.
+        обновляет только измененные поля; если изменений нет, запись
+        пропускается.
         
         Args:
             tamagotchi: Объект Tamagotchi для сохранения.
             
         Returns:
-            bool: True если сохранение прошло успешно, False в случае ошибки.
+            bool: True если сохранение прошло успешно (или не требовалось),
+                  False в случае ошибки.
         """
         try:
-            cursor = self.connection.cursor()
+            if tamagotchi.id is not None and not tamagotchi.is_dirty:
+                return True
+
             if tamagotchi.id is None:
                 # Создаем новую запись
-                cursor.execute('''
-                    INSERT INTO tamagotchis 
-                    (name, hunger, happiness, health, cleanliness, energy, age, coins, evolution_stage)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (tamagotchi.name, tamagotchi.hunger, tamagotchi.happiness,
-                      tamagotchi.health, tamagotchi.cleanliness, tamagotchi.energy,
-                      tamagotchi.age, tamagotchi.coins, tamagotchi.evolution_stage))
+                cursor = self.connection.execute(INSERT_SQL, _insert_params(tamagotchi))
                 tamagotchi.id = cursor.lastrowid
                 print(f"✅ New tamagotchi created! ID: {tamagotchi.id}")
             else:
-                # Обновляем существующую запись
-                cursor.execute('''
-                    UPDATE tamagotchis 
-                    SET name=?, hunger=?, happiness=?, health=?, cleanliness=?,
-                        energy=?, age=?, coins=?, evolution_stage=?, last_updated=CURRENT_TIMESTAMP
-                    WHERE id=?
-                ''', (tamagotchi.name, tamagotchi.hunger, tamagotchi.happiness,
-                      tamagotchi.health, tamagotchi.cleanliness, tamagotchi.energy,
-                      tamagotchi.age, tamagotchi.coins, tamagotchi.evolution_stage, tamagotchi.id))
-                print(f"✅ Tamagotchi updated! ID: {tamagotchi.id}")
+                # Обновляем только измененные столбцы (имена берутся из TRACKED_FIELDS)
+                columns = tuple(tamagotchi.changed_columns())
+                self.connection.execute(
+                    _update_sql(columns),
+                    [getattr(tamagotchi, column) for column in columns] + [tamagotchi.id])
+                print(f"✅ Tamagotchi updated! ID: {tamagotchi.id} ({', '.join(columns)})")
 
             self.connection.commit()
-            cursor.close()
+            tamagotchi.mark_clean()
             return True
         except Exception as e:
             print(f"❌ Error saving tamagotchi: {e}")
             return False
 
-    def load_tamagotchi(self, tamagotchi_id):
+    @_locked
+    def save_many(self, tamagotchis):
+        """Сохраняет несколько тамагочи в одной транзакции.
+        
+        Новые тамагочи вставляются по одному (чтобы получить их ID), а
+        обновления группируются по набору измененных столбцов и выполняются
+        через executemany. Тамагочи без изменений пропускаются. При ошибке
+        транзакция откатывается целиком.
+        
+        Args:
+            tamagotchis: Итерируемая коллекция объектов Tamagotchi.
+            
+        Returns:
+            bool: True если все тамагочи сохранены, False в случае ошибки.
+        """
+        new, updates, saved = [], {}, []
+        for tamagotchi in tamagotchis:
+            if tamagotchi.id is None:
+                new.append(tamagotchi)
+            elif tamagotchi.is_dirty:
+                columns = tuple(tamagotchi.changed_columns())
+                updates.setdefault(columns, []).append(tamagotchi)
+        try:
+            with self.connection:
+                for tamagotchi in new:
+                    cursor = self.connection.execute(INSERT_SQL, _insert_params(tamagotchi))
+                    saved.append((tamagotchi, cursor.lastrowid))
+                for columns, group in updates.items():
+                    self.connection.executemany(_update_sql(columns), [
+                        [getattr(tamagotchi, column) for column in columns] + [tamagotchi.id]
+                        for tamagotchi in group])
+        except Exception as e:
+            print(f"❌ Error saving tamagotchis: {e}")
+            return False
+
+        # ID присваиваются только после успешной фиксации транзакции
+        for tamagotchi, new_id in saved:
+            tamagotchi.id = new_id
+        for tamagotchi in new:
+            tamagotchi.mark_clean()
+        for group in updates.values():
+            for tamagotchi in group:
+                tamagotchi.mark_clean()
+        print(f"✅ Saved {len(new)} new and {sum(map(len, updates.values()))} updated tamagotchi(s)")
+        return True
+
+    def _row_to_tamagotchi(self, row, catch_up):
+        """Создает объект Tamagotchi из строки таблицы.
+        
+        Args:
+            row: Строка результата запроса в порядке ROW_COLUMNS.
+            catch_up: Применить ли снижение показателей за время с last_updated.
+            
+        Returns:
+            Tamagotchi: Объект Tamagotchi.
+        """
+        tamagotchi = Tamagotchi.from_row(row)
+        if catch_up and self.offline_update is not None:
+            ticks = self.offline_update(tamagotchi)
+            if ticks:
+                print(f"⏳ {tamagotchi.name}: applied {ticks} offline update(s)")
+        return tamagotchi
+
+    @_locked
+    def load_tamagotchi(self, tamagotchi_id, catch_up=True):
         """Загружает тамагочи из базы данных по ID.
         
+        По умолчанию к загруженному тамагочи применяется снижение показателей
+        за время, прошедшее с последнего сохранения (если менеджер создан
+        с offline_update).
+        
         Args:
             tamagotchi_id: Идентификатор тамагочи для загрузки.
+            catch_up: Применить ли снижение показателей за время без игры.
             
         Returns:
             Tamagotchi or None: Объект Tamagotchi если найден, None если не найден
                                  или произошла ошибка.
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('SELECT * FROM tamagotchis WHERE id = ?', (tamagotchi_id,))
-            result = cursor.fetchone()
-            cursor.close()
+            result = self.connection.execute(SELECT_BY_ID_SQL, (tamagotchi_id,)).fetchone()
 
             if result:
                 print(f"✅ Loaded tamagotchi ID: {tamagotchi_id}")
-                return Tamagotchi.from_dict(dict(result))
+                return self._row_to_tamagotchi(result, catch_up)
             print(f"❌ No tamagotchi found with ID: {tamagotchi_id}")
             return None
         except Exception as e:
             print(f"❌ Error loading tamagotchi: {e}")
             return None
 
-    def get_all_tamagotchis(self):
+    def get_all_tamagotchis(self, catch_up=True):
         """Получает все тамагочи из базы данных.
         
+        Материализует весь список; для обхода большого числа тамагочи
+        используйте iter_all(), а для загрузки последнего -
+        get_latest_tamagotchi().
+        
+        Args:
+            catch_up: Применить ли снижение показателей за время без игры.
+            
         Returns:
             list: Список объектов Tamagotchi, отсортированных по дате создания
                   (от новых к старым). Возвращает пустой список в случае ошибки.
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('SELECT * FROM tamagotchis ORDER BY created_at DESC')
-            results = cursor.fetchall()
-            cursor.close()
-
-            tamagotchis = [Tamagotchi.from_dict(dict(row)) for row in results]
+            tamagotchis = list(self.iter_all(catch_up=catch_up, newest_first=True))
             print(f"✅ Loaded {len(tamagotchis)} tamagotchi(s)")
             return tamagotchis
         except Exception as e:
             print(f"❌ Error loading tamagotchis: {e}")
             return []
 
+    @_locked
+    def get_latest_tamagotchi(self, catch_up=True):
+        """Загружает последнего созданного тамагочи.
+        
+        Читает одну строку (LIMIT 1) по индексу created_at, поэтому время
+        запуска игры не зависит от количества сохраненных тамагочи.
+        
+        Args:
+            catch_up: Применить ли снижение показателей за время без игры.
+            
+        Returns:
+            Tamagotchi or None: Последний созданный тамагочи, None если база пуста
+                                 или произошла ошибка.
+        """
+        try:
+            result = self.connection.execute(
+                f'SELECT {SELECT_COLUMNS} FROM tamagotchis {ORDER_NEWEST_FIRST} LIMIT 1').fetchone()
+            if result:
+                print(f"✅ Loaded latest tamagotchi ID: {result['id']}")
+                return self._row_to_tamagotchi(result, catch_up)
+            return None
+        except Exception as e:
+            print(f"❌ Error loading latest tamagotchi: {e}")
+            return None
+
+    @_locked
+    def load_many(self, tamagotchi_ids, catch_up=True):
+        """Загружает несколько тамагочи по списку ID.
+        
+        Args:
+            tamagotchi_ids: Итерируемая коллекция идентификаторов.
+            catch_up: Применить ли снижение показателей за время без игры.
+            
+        Returns:
+            list: Найденные объекты Tamagotchi в порядке запрошенных ID
+                  (отсутствующие ID пропускаются). Пустой список в случае ошибки.
+        """
+        ids = list(tamagotchi_ids)
+        try:
+            rows = {}
+            for start in range(0, len(ids), MAX_VARIABLES):
+                chunk = ids[start:start + MAX_VARIABLES]
+                placeholders = ", ".join("?" * len(chunk))
+                for row in self.connection.execute(
+                        f'SELECT {SELECT_COLUMNS} FROM tamagotchis WHERE id IN ({placeholders})', chunk):
+                    rows[row[0]] = row
+            return [self._row_to_tamagotchi(rows[tamagotchi_id], catch_up)
+                    for tamagotchi_id in ids if tamagotchi_id in rows]
+        except Exception as e:
+            print(f"❌ Error loading tamagotchis: {e}")
+            return []
+
+    def iter_all(self, batch_size=100, catch_up=True, newest_first=False):
+        """Перебирает все тамагочи, читая их из базы порциями.
+        
+        В памяти одновременно находится не больше batch_size строк, поэтому
+        так можно обойти популяцию любого размера.
+        
+        Args:
+            batch_size: Количество строк, читаемых за один запрос к курсору.
+            catch_up: Применить ли снижение показателей за время без игры.
+            newest_first: Перебирать от новых к старым вместо порядка ID.
+            
+        Yields:
+            Tamagotchi: Объекты Tamagotchi в выбранном порядке.
+        """
+        order = ORDER_NEWEST_FIRST if newest_first else ORDER_BY_ID
+        # Блокировка берется на каждую порцию, а не на весь перебор: пока
+        # вызывающий код обрабатывает строки, соединение доступно другим потокам
+        with self._lock:
+            cursor = self.connection.cursor()
+            # Обычные кортежи вместо sqlite3.Row: строки сразу передаются в from_row
+            cursor.row_factory = None
+            cursor.execute(f'SELECT {SELECT_COLUMNS} FROM tamagotchis {order}')
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield self._row_to_tamagotchi(row, catch_up)
+        finally:
+            with self._lock:
+                cursor.close()
+
+    @_locked
     def delete_tamagotchi(self, tamagotchi_id):
         """Удаляет тамагочи из базы данных по ID.
         
@@ -163,12 +425,212 @@ class SQLiteManager:
             bool: True если удаление прошло успешно, False в случае ошибки.
         """
         try:
-            cursor = self.connection.cursor()
-            cursor.execute('DELETE FROM tamagotchis WHERE id = ?', (tamagotchi_id,))
-            self.connection.commit()
-            cursor.close()
+            with self.connection:
+                self.connection.execute('DELETE FROM tamagotchis WHERE id = ?', (tamagotchi_id,))
+                # Журнал событий, история и достижения удаленного тамагочи больше не нужны
+                self.connection.execute('DELETE FROM pet_events WHERE pet_id = ?', (tamagotchi_id,))
+                self.connection.execute('DELETE FROM pet_snapshots WHERE pet_id = ?', (tamagotchi_id,))
+                self.connection.execute('DELETE FROM stat_samples WHERE pet_id = ?', (tamagotchi_id,))
+                self.connection.execute('DELETE FROM pet_achievements WHERE pet_id = ?', (tamagotchi_id,))
             print(f"✅ Deleted tamagotchi ID: {tamagotchi_id}")
             return True
         except Exception as e:
             print(f"❌ Error deleting tamagotchi: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    @_locked
+    def append_events(self, events, snapshots=()):
+        """Добавляет порцию событий и снимков состояния одной транзакцией.
+        
+        Args:
+            events: Итерируемая коллекция объектов PetEvent.
+            snapshots: Строки снимков в порядке SNAPSHOT_COLUMNS.
+            
+        Returns:
+            bool: True если порция записана, False в случае ошибки.
+        """
+        try:
+            with self.connection:
+                self.connection.executemany(INSERT_EVENT_SQL, [event.to_row() for event in events])
+                self.connection.executemany(INSERT_SNAPSHOT_SQL, list(snapshots))
+            return True
+        except Exception as e:
+            print(f"❌ Error writing events: {e}")
+            return False
+
+    @_locked
+    def load_events(self, pet_id, after_seq=0, before_seq=None, limit=None, newest_first=False):
+        """Загружает события тамагочи из диапазона номеров.
+        
+        Запрос идет по первичному ключу (pet_id, seq), поэтому страница
+        читается за время, не зависящее от длины журнала.
+        
+        Args:
+            pet_id: ID тамагочи.
+            after_seq: Вернуть события с seq больше этого значения.
+            before_seq: Вернуть события с seq меньше этого значения (None - без ограничения).
+            limit: Максимальное количество событий (None - без ограничения).
+            newest_first: Упорядочить от новых к старым.
+            
+        Returns:
+            list: Объекты PetEvent. Пустой список в случае ошибки.
+        """
+        sql = f'SELECT {", ".join(EVENT_COLUMNS)} FROM pet_events WHERE pet_id = ? AND seq > ?'
+        params = [pet_id, after_seq]
+        if before_seq is not None:
+            sql += ' AND seq < ?'
+            params.append(before_seq)
+        sql += ' ORDER BY seq DESC' if newest_first else ' ORDER BY seq'
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        try:
+            return [PetEvent.from_row(row) for row in self.connection.execute(sql, params)]
+        except Exception as e:
+            print(f"❌ Error loading events: {e}")
+            return []
+
+    @_locked
+    def load_snapshot(self, pet_id, max_seq=None):
+        """Загружает последний снимок состояния тамагочи не позже max_seq.
+        
+        Args:
+            pet_id: ID тамагочи.
+            max_seq: Максимальный номер события снимка (None - самый новый).
+            
+        Returns:
+            tuple or None: (seq, словарь показателей) или None, если снимка нет.
+        """
+        sql = 'SELECT seq, state FROM pet_snapshots WHERE pet_id = ?'
+        params = [pet_id]
+        if max_seq is not None:
+            sql += ' AND seq <= ?'
+            params.append(max_seq)
+        try:
+            row = self.connection.execute(sql + ' ORDER BY seq DESC LIMIT 1', params).fetchone()
+            return (row[0], json.loads(row[1])) if row else None
+        except Exception as e:
+            print(f"❌ Error loading snapshot: {e}")
+            return None
+
+    @_locked
+    def last_event_seq(self, pet_id):
+        """Возвращает номер последнего записанного события тамагочи.
+        
+        Args:
+            pet_id: ID тамагочи.
+            
+        Returns:
+            int: Номер события (0, если событий нет).
+        """
+        row = self.connection.execute(
+            'SELECT MAX(seq) FROM pet_events WHERE pet_id = ?', (pet_id,)).fetchone()
+        return row[0] or 0
+
+    @_locked
+    def save_stat_chunks(self, rows):
+        """Записывает блоки истории показателей одной транзакцией.
+        
+        Блок с тем же (pet_id, resolution, chunk_start) заменяется: открытый
+        блок перезаписывается по мере заполнения.
+        
+        Args:
+            rows: Строки в порядке STAT_CHUNK_COLUMNS.
+            
+        Returns:
+            bool: True если блоки записаны, False в случае ошибки.
+        """
+        try:
+            with self.connection:
+                self.connection.executemany(SAVE_STAT_CHUNK_SQL, list(rows))
+            return True
+        except Exception as e:
+            print(f"❌ Error writing stat history: {e}")
+            return False
+
+    @_locked
+    def load_stat_chunks(self, pet_id, resolution, start=None, end=None):
+        """Загружает блоки истории показателей, пересекающие промежуток времени.
+        
+        Args:
+            pet_id: ID тамагочи.
+            resolution: Ширина интервала уровня в секундах (0 - сырые отсчеты).
+            start: Начало промежутка (None - без ограничения).
+            end: Конец промежутка (None - без ограничения).
+            
+        Returns:
+            list: Строки в порядке STAT_CHUNK_COLUMNS по возрастанию chunk_start.
+                  Пустой список в случае ошибки.
+        """
+        sql = (f'SELECT {", ".join(STAT_CHUNK_COLUMNS)} FROM stat_samples '
+               'WHERE pet_id = ? AND resolution = ?')
+        params = [pet_id, resolution]
+        if end is not None:
+            sql += ' AND chunk_start <= ?'
+            params.append(end)
+        if start is not None:
+            sql += ' AND chunk_end >= ?'
+            params.append(start)
+        try:
+            return self.connection.execute(sql + ' ORDER BY chunk_start', params).fetchall()
+        except Exception as e:
+            print(f"❌ Error loading stat history: {e}")
+            return []
+
+    @_locked
+    def delete_stat_chunks(self, cutoffs):
+        """Удаляет устаревшие блоки истории показателей.
+        
+        Args:
+            cutoffs: Пары (resolution, before): удаляются блоки уровня,
+                     последний отсчет которых раньше before.
+            
+        Returns:
+            bool: True если удаление прошло успешно, False в случае ошибки.
+        """
+        try:
+            with self.connection:
+                self.connection.executemany(
+                    'DELETE FROM stat_samples WHERE resolution = ? AND chunk_end < ?', list(cutoffs))
+            return True
+        except Exception as e:
+            print(f"❌ Error deleting stat history: {e}")
+            return False
+
+    @_locked
+    def save_achievements(self, rows):
+        """Записывает прогресс достижений одной транзакцией.
+        
+        Args:
+            rows: Строки в порядке ACHIEVEMENT_COLUMNS.
+            
+        Returns:
+            bool: True если прогресс записан, False в случае ошибки.
+        """
+        try:
+            with self.connection:
+                self.connection.executemany(SAVE_ACHIEVEMENT_SQL, list(rows))
+            return True
+        except Exception as e:
+            print(f"❌ Error writing achievements: {e}")
+            return False
+
+    @_locked
+    def load_achievements(self, pet_id):
+        """Загружает прогресс достижений тамагочи.
+        
+        Args:
+            pet_id: ID тамагочи.
+            
+        Returns:
+            dict: {ключ достижения: (прогресс, время выполнения или None)}.
+                  Пустой словарь в случае ошибки.
+        """
+        try:
+            rows = self.connection.execute(
+                'SELECT achievement, progress, completed_at FROM pet_achievements WHERE pet_id = ?',
+                (pet_id,)).fetchall()
+            return {row[0]: (row[1], row[2]) for row in rows}
+        except Exception as e:
+            print(f"❌ Error loading achievements: {e}")
+            return {}
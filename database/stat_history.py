@@ -0,0 +1,470 @@
+"""
+Compact time-series store of per-pet stat samples with rollups and retention.
+"""
+
+import threading
+import time
+from array import array
+
+# Показатели, история которых записывается (порядок значений в отсчете)
+STAT_FIELDS = ('hunger', 'happiness', 'health', 'cleanliness', 'energy')
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# Уровни хранения: (ширина интервала в секундах, срок хранения в секундах).
+# 0 - сырые отсчеты. Каждый уровень сворачивается в следующий средними
+# значениями за интервал, а устаревшие данные уровня удаляются
+STAT_LEVELS = (
+    (0, 6 * HOUR),
+    (MINUTE, 7 * DAY),
+    (HOUR, 90 * DAY),
+)
+
+# Интервал между сырыми отсчетами в игре (секунды)
+STAT_SAMPLE_INTERVAL = 30
+
+STAT_CHUNK_COLUMNS = ('pet_id', 'resolution', 'chunk_start', 'chunk_end', 'count', 'data')
+
+# Отсчетов в одном блоке; блок - одна строка таблицы stat_samples
+CHUNK_SAMPLES = 256
+
+# Время хранится разностями с предыдущим отсчетом в беззнаковых 16 битах:
+# при большем перерыве начинается новый блок
+MAX_TIME_DELTA = 0xFFFF
+
+# Устаревшие блоки удаляются не чаще одного раза за RETENTION_INTERVAL секунд
+RETENTION_INTERVAL = HOUR
+
+
+class StatChunk:
+    """Блок отсчетов одного уровня одного тамагочи.
+
+    Отсчеты хранятся в массивах array с дельта-кодированием: время -
+    разностями с предыдущим отсчетом ('H', 2 байта), каждый показатель -
+    разностями с предыдущим значением ('b', 1 байт; показатели лежат в
+    диапазоне 0-100). Отсчет занимает 2 + len(STAT_FIELDS) байт.
+
+    Атрибуты:
+        pet_id: ID тамагочи
+        resolution: Ширина интервала уровня в секундах (0 - сырые отсчеты)
+        start: Время первого отсчета (секунды Unix)
+        end: Время последнего отсчета
+        count: Количество отсчетов
+    """
+
+    def __init__(self, pet_id, resolution, start):
+        """Создает пустой блок.
+
+        Args:
+            pet_id: ID тамагочи.
+            resolution: Ширина интервала уровня в секундах.
+            start: Время первого отсчета.
+        """
+        self.pet_id = pet_id
+        self.resolution = resolution
+        self.start = start
+        self.end = start
+        self.count = 0
+        self._times = array('H')
+        self._values = [array('b') for _ in STAT_FIELDS]
+        self._last = None
+
+    def append(self, timestamp, values):
+        """Добавляет отсчет в конец блока.
+
+        Args:
+            timestamp: Время отсчета (не раньше последнего).
+            values: Значения показателей в порядке STAT_FIELDS (0-100).
+
+        Returns:
+            bool: False, если блок заполнен или перерыв слишком велик для
+                  разности времени - тогда нужен новый блок.
+        """
+        delta = timestamp - self.end
+        if self.count >= CHUNK_SAMPLES or delta > MAX_TIME_DELTA:
+            return False
+        self._times.append(delta if self.count else 0)
+        last = self._last or (0,) * len(STAT_FIELDS)
+        for column, value, previous in zip(self._values, values, last):
+            column.append(value - previous)
+        self._last = tuple(values)
+        self.end = timestamp
+        self.count += 1
+        return True
+
+    def samples(self):
+        """Декодирует отсчеты блока.
+
+        Returns:
+            list: Пары (время, кортеж значений) по возрастанию времени.
+        """
+        result = []
+        timestamp = self.start
+        current = [0] * len(STAT_FIELDS)
+        for i, delta in enumerate(self._times):
+            timestamp += delta
+            for j, column in enumerate(self._values):
+                current[j] += column[i]
+            result.append((timestamp, tuple(current)))
+        return result
+
+    def to_row(self):
+        """Возвращает строку таблицы stat_samples.
+
+        Returns:
+            tuple: Значения в порядке STAT_CHUNK_COLUMNS.
+        """
+        data = self._times.tobytes() + b''.join(column.tobytes() for column in self._values)
+        return (self.pet_id, self.resolution, self.start, self.end, self.count, data)
+
+    @classmethod
+    def from_row(cls, row):
+        """Восстанавливает блок из строки таблицы stat_samples.
+
+        Args:
+            row: Значения в порядке STAT_CHUNK_COLUMNS.
+
+        Returns:
+            StatChunk: Блок с отсчетами строки.
+        """
+        pet_id, resolution, start, end, count, data = row
+        chunk = cls(pet_id, resolution, start)
+        data = bytes(data)
+        times_size = count * chunk._times.itemsize
+        chunk._times.frombytes(data[:times_size])
+        for i, column in enumerate(chunk._values):
+            offset = times_size + i * count
+            column.frombytes(data[offset:offset + count])
+        chunk.end = end
+        chunk.count = count
+        if count:
+            chunk._last = chunk.samples()[-1][1]
+        return chunk
+
+
+def sample_values(tamagotchi):
+    """Возвращает значения показателей тамагочи для отсчета.
+
+    Args:
+        tamagotchi: Объект Tamagotchi.
+
+    Returns:
+        tuple: Целые значения 0-100 в порядке STAT_FIELDS.
+    """
+    return tuple(max(0, min(100, int(round(getattr(tamagotchi, field))))) for field in STAT_FIELDS)
+
+
+class StatHistory:
+    """История показателей тамагочи для графиков.
+
+    Сырые отсчеты записываются через record() и копятся в открытом блоке.
+    flush() сворачивает завершенные интервалы в следующий уровень (сырые
+    отсчеты -> средние за минуту -> средние за час), отправляет измененные
+    блоки на запись и удаляет данные старше срока хранения уровня. Поэтому
+    месяц истории тамагочи занимает несколько десятков килобайт, а запрос
+    диапазона читает несколько блоков по первичному ключу.
+
+    Хранилище (SQLiteManager, MemoryManager) должно поддерживать методы
+    save_stat_chunks, load_stat_chunks и delete_stat_chunks. Как и в
+    EventLog, чтение и запись выполняет функция submit: в игре record() и
+    request_query() вызываются из игрового цикла и не ждут базу данных.
+    """
+
+    def __init__(self, store, levels=STAT_LEVELS, submit=None, clock=time.time):
+        """Инициализирует историю.
+
+        Args:
+            store: Менеджер базы данных с методами истории показателей.
+            levels: Уровни хранения (ширина интервала, срок хранения).
+            submit: Функция submit(function, *args), выполняющая чтение и запись
+                    (по умолчанию - сразу в вызывающем потоке).
+            clock: Функция, возвращающая текущее время в секундах Unix.
+        """
+        self.store = store
+        self.levels = levels
+        self.clock = clock
+        self._submit = submit if submit is not None else (lambda function, *args: function(*args))
+        self._lock = threading.Lock()
+        # Открытые блоки по (ID, ширина интервала) и ключи измененных блоков
+        self._open = {}
+        self._changed = {}
+        # Блоки, отправленные на запись, но еще не записанные
+        self._unwritten = {}
+        # Отсчеты уровня, еще не свернутые в следующий уровень
+        self._unrolled = {}
+        # Тамагочи, несвернутые отсчеты прошлого сеанса которых еще читаются
+        self._loading = set()
+        self._last_retention = None
+
+    def start(self, tamagotchi):
+        """Заранее запрашивает несвернутые отсчеты прошлого сеанса тамагочи.
+
+        Вызывается при выборе тамагочи, чтобы первое чтение из хранилища
+        ушло в submit до первого отсчета.
+
+        Args:
+            tamagotchi: Объект Tamagotchi (без ID ничего не делает).
+        """
+        if tamagotchi.id is None:
+            return
+        with self._lock:
+            load = self._begin_load(tamagotchi.id)
+        if load:
+            self._submit(self._load, tamagotchi.id)
+
+    def record(self, tamagotchi, timestamp=None):
+        """Добавляет сырой отсчет показателей тамагочи.
+
+        Args:
+            tamagotchi: Объект Tamagotchi (должен иметь ID).
+            timestamp: Время отсчета в секундах Unix (по умолчанию - сейчас).
+
+        Returns:
+            bool: False, если у тамагочи нет ID.
+        """
+        if tamagotchi.id is None:
+            return False
+        timestamp = int(self.clock() if timestamp is None else timestamp)
+        with self._lock:
+            load = self._begin_load(tamagotchi.id)
+            self._append(tamagotchi.id, 0, timestamp, sample_values(tamagotchi))
+        if load:
+            self._submit(self._load, tamagotchi.id)
+        return True
+
+    def _append(self, pet_id, level, timestamp, values):
+        """Добавляет отсчет в открытый блок уровня (под блокировкой).
+
+        Args:
+            pet_id: ID тамагочи.
+            level: Номер уровня в self.levels.
+            timestamp: Время отсчета.
+            values: Значения показателей.
+        """
+        resolution = self.levels[level][0]
+        key = (pet_id, resolution)
+        chunk = self._open.get(key)
+        if chunk is not None and timestamp < chunk.end:
+            # Часы отстали (перевод времени) - отсчет не может идти раньше последнего
+            return
+        if chunk is None or not chunk.append(timestamp, values):
+            chunk = StatChunk(pet_id, resolution, timestamp)
+            chunk.append(timestamp, values)
+            self._open[key] = chunk
+        self._changed[(key, chunk.start)] = chunk
+        if level + 1 < len(self.levels):
+            self._unrolled[key].append((timestamp, values))
+
+    def _begin_load(self, pet_id):
+        """Готовит свертку уровней тамагочи при первом обращении (под блокировкой).
+
+        Новые отсчеты сразу копятся в пустых списках, а отсчеты прошлого
+        сеанса дочитывает _load; до этого уровни тамагочи не сворачиваются.
+
+        Args:
+            pet_id: ID тамагочи.
+
+        Returns:
+            bool: True, если нужно отправить _load в submit.
+        """
+        if (pet_id, self.levels[0][0]) in self._unrolled:
+            return False
+        for resolution, _ in self.levels:
+            self._unrolled[(pet_id, resolution)] = []
+        self._loading.add(pet_id)
+        return True
+
+    def _load(self, pet_id):
+        """Выполняется через submit: читает еще не свернутые отсчеты прошлого сеанса.
+
+        Граница свертки - конец последнего интервала следующего уровня.
+        Прочитанные отсчеты старше уже накопленных и ставятся перед ними.
+
+        Args:
+            pet_id: ID тамагочи.
+        """
+        now = int(self.clock())
+        loaded = {}
+        try:
+            for level in range(len(self.levels) - 1):
+                resolution, retention = self.levels[level]
+                width = self.levels[level + 1][0]
+                # Данные уровня старше срока хранения уже не понадобятся
+                since = now - retention
+                rolled = self.store.load_stat_chunks(pet_id, width, start=since)
+                rolled_until = since
+                if rolled:
+                    rolled_until = max(since, StatChunk.from_row(rolled[-1]).end + width)
+                loaded[resolution] = [
+                    sample for row in self.store.load_stat_chunks(pet_id, resolution, start=rolled_until)
+                    for sample in StatChunk.from_row(row).samples()
+                    if sample[0] >= rolled_until]
+        except Exception as e:
+            print(f"❌ Error loading stat history: {e}")
+            loaded = {}
+
+        with self._lock:
+            for resolution, samples in loaded.items():
+                key = (pet_id, resolution)
+                current = self._unrolled.get(key, [])
+                first = current[0][0] if current else None
+                self._unrolled[key] = [sample for sample in samples
+                                       if first is None or sample[0] < first] + current
+            self._loading.discard(pet_id)
+
+    def _roll_up(self, now):
+        """Сворачивает завершенные интервалы каждого уровня в следующий (под блокировкой).
+
+        Args:
+            now: Текущее время в секундах Unix.
+        """
+        for level in range(len(self.levels) - 1):
+            resolution = self.levels[level][0]
+            width = self.levels[level + 1][0]
+            # Интервал завершен, когда наступил его конец
+            complete = now - now % width
+            for key, samples in self._unrolled.items():
+                # Отсчеты прошлого сеанса еще читаются - интервал пока неполный
+                if key[1] != resolution or not samples or key[0] in self._loading:
+                    continue
+                ready = [sample for sample in samples if sample[0] < complete]
+                if not ready:
+                    continue
+                self._unrolled[key] = [sample for sample in samples if sample[0] >= complete]
+                buckets = {}
+                for timestamp, values in ready:
+                    buckets.setdefault(timestamp - timestamp % width, []).append(values)
+                for bucket in sorted(buckets):
+                    group = buckets[bucket]
+                    average = tuple(int(round(sum(column) / len(group))) for column in zip(*group))
+                    self._append(key[0], level + 1, bucket, average)
+
+    def flush(self, now=None):
+        """Сворачивает завершенные интервалы, отправляет блоки на запись и удаляет устаревшие данные.
+
+        Args:
+            now: Текущее время в секундах Unix (по умолчанию - из часов).
+        """
+        now = int(self.clock() if now is None else now)
+        with self._lock:
+            self._roll_up(now)
+            changed, self._changed = self._changed, {}
+            self._unwritten.update(changed)
+            rows = [chunk.to_row() for chunk in changed.values()]
+            retention = None
+            if self._last_retention is None or now - self._last_retention >= RETENTION_INTERVAL:
+                self._last_retention = now
+                retention = [(resolution, now - keep) for resolution, keep in self.levels]
+        if rows:
+            self._submit(self._write, changed, rows)
+        if retention:
+            self._submit(self.store.delete_stat_chunks, retention)
+
+    def _write(self, changed, rows):
+        """Записывает блоки в хранилище.
+
+        При ошибке блоки снова отмечаются измененными и записываются при
+        следующем flush: закрытый блок больше не меняется, и без этого он
+        был бы потерян.
+
+        Args:
+            changed: Записываемые блоки по ключам self._changed.
+            rows: Строки этих блоков в порядке STAT_CHUNK_COLUMNS.
+        """
+        try:
+            written = self.store.save_stat_chunks(rows)
+        except Exception as e:
+            print(f"❌ Error writing stat history: {e}")
+            written = False
+
+        with self._lock:
+            for key, chunk in changed.items():
+                if self._unwritten.get(key) is chunk:
+                    del self._unwritten[key]
+                if not written:
+                    self._changed.setdefault(key, chunk)
+
+    def request_query(self, pet_id, start, callback, end=None, max_points=None):
+        """Читает историю через submit и передает ее в callback.
+
+        Как EventLog.request_page: в игре отсчеты читаются фоновым потоком
+        WriteBehindQueue, callback вызывается в этом потоке.
+
+        Args:
+            pet_id: ID тамагочи.
+            start: См. query.
+            callback: Функция callback(samples), получающая результат query.
+            end: См. query.
+            max_points: См. query.
+        """
+        self._submit(self._load_query, pet_id, start, callback, end, max_points)
+
+    def _load_query(self, pet_id, start, callback, end, max_points):
+        """Выполняется через submit: читает историю и передает ее в callback."""
+        callback(self.query(pet_id, start, end, max_points=max_points))
+
+    def query(self, pet_id, start, end=None, max_points=None):
+        """Возвращает историю показателей тамагочи за промежуток времени.
+
+        Выбирается самый подробный уровень, который еще хранит начало
+        промежутка и дает не больше max_points отсчетов. Последние данные,
+        еще не свернутые в этот уровень, добавляются из более подробных уровней.
+
+        Args:
+            pet_id: ID тамагочи.
+            start: Начало промежутка (секунды Unix).
+            end: Конец промежутка (по умолчанию - сейчас).
+            max_points: Желаемое максимальное количество отсчетов.
+
+        Returns:
+            list: Пары (время, кортеж значений в порядке STAT_FIELDS) по возрастанию времени.
+        """
+        now = int(self.clock())
+        end = now if end is None else end
+        span = max(1, end - start)
+        chosen = len(self.levels) - 1
+        for level, (resolution, retention) in enumerate(self.levels):
+            points = span / max(resolution, STAT_SAMPLE_INTERVAL)
+            if start >= now - retention and (max_points is None or points <= max_points):
+                chosen = level
+                break
+
+        result = []
+        for level in range(chosen, -1, -1):
+            resolution = self.levels[level][0]
+            # Более подробный уровень дополняет только время после уже найденного
+            since = start if not result else result[-1][0] + self.levels[level + 1][0]
+            result.extend(sample for sample in self._level_samples(pet_id, resolution, since, end)
+                          if since <= sample[0] <= end)
+        return result
+
+    def _level_samples(self, pet_id, resolution, start, end):
+        """Возвращает отсчеты уровня из хранилища и незаписанных блоков.
+
+        Args:
+            pet_id: ID тамагочи.
+            resolution: Ширина интервала уровня.
+            start: Начало промежутка.
+            end: Конец промежутка.
+
+        Returns:
+            list: Пары (время, значения) по возрастанию времени.
+        """
+        with self._lock:
+            pending = {chunk.start: chunk.to_row()
+                       for (key, _), chunk in list(self._unwritten.items()) + list(self._changed.items())
+                       if key == (pet_id, resolution)}
+            open_chunk = self._open.get((pet_id, resolution))
+            if open_chunk is not None:
+                pending[open_chunk.start] = open_chunk.to_row()
+        rows = {row[2]: row for row in self.store.load_stat_chunks(pet_id, resolution, start, end)}
+        rows.update((chunk_start, row) for chunk_start, row in pending.items()
+                    if row[3] >= start and chunk_start <= end)
+        return [sample for chunk_start in sorted(rows)
+                for sample in StatChunk.from_row(rows[chunk_start]).samples()]
+
+    def close(self):
+        """Отправляет на запись все накопленные отсчеты."""
+        self.flush()
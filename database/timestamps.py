@@ -0,0 +1,29 @@
+"""
+Timestamp helpers shared by the storage backends.
+"""
+
+from datetime import datetime, timezone
+
+
+def parse_timestamp(value):
+    """Преобразует отметку времени из базы данных в datetime.
+
+    Аргументы:
+        value: datetime или строка в формате ISO ('YYYY-MM-DD HH:MM:SS')
+
+    Возвращает:
+        datetime или None: None, если значение не распознано
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return None
+
+
+def utc_now():
+    """Возвращает текущее время UTC без часового пояса (как CURRENT_TIMESTAMP в SQLite)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
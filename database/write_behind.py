@@ -0,0 +1,236 @@
+"""
+Write-behind queue for saving tamagotchis off the render thread.
+"""
+
+import threading
+
+from .models import Tamagotchi
+
+
+class WriteBehindQueue:
+    """Очередь отложенного сохранения тамагочи в фоновом потоке.
+
+    Игровой цикл только ставит снимок состояния в очередь и никогда не ждет
+    ввода-вывода базы данных. Очередь объединяет запросы: для каждого
+    тамагочи хранится только последний снимок, поэтому серия автосохранений
+    (например, при перетаскивании мыла в ванной) превращается в одну запись.
+    """
+
+    def __init__(self, db):
+        """Инициализирует очередь. Фоновый поток запускается при первом сохранении.
+
+        Args:
+            db: Менеджер базы данных с методом save_tamagotchi.
+        """
+        self.db = db
+        self._pending = {}
+        # Неудачно записанные тамагочи: id объекта -> (объект, поля для повтора)
+        self._retry = {}
+        self._tasks = []
+        self._condition = threading.Condition()
+        self._writing = False
+        self._closed = False
+        self._thread = None
+        self.stats = {"enqueued": 0, "coalesced": 0, "skipped": 0, "saved": 0, "failed": 0}
+
+    def enqueue(self, tamagotchi):
+        """Ставит текущее состояние тамагочи в очередь на сохранение.
+
+        Состояние копируется сразу вместе с набором измененных полей, после
+        чего исходный объект отмечается сохраненным. Поэтому дальнейшие
+        изменения объекта в игровом цикле не влияют на записываемые данные.
+        Если изменений нет, сохранение пропускается.
+
+        Args:
+            tamagotchi: Объект Tamagotchi для сохранения.
+
+        Returns:
+            bool: True если снимок поставлен в очередь (или сохранять нечего),
+                  False если очередь закрыта.
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            key = id(tamagotchi)
+            previous = self._pending.get(key)
+            _, retry_fields = self._retry.pop(key, (None, ()))
+            if tamagotchi.id is not None and not tamagotchi.is_dirty \
+                    and previous is None and not retry_fields:
+                self.stats["skipped"] += 1
+                return True
+
+            snapshot = tamagotchi.snapshot()
+            tamagotchi.mark_clean()
+            # Изменения из предыдущего, еще не записанного снимка не должны потеряться
+            snapshot.mark_dirty(retry_fields)
+            if previous is not None:
+                snapshot.mark_dirty(previous[1].dirty_fields)
+                self.stats["coalesced"] += 1
+            self._pending[key] = (tamagotchi, snapshot)
+            self.stats["enqueued"] += 1
+            self._start()
+            self._condition.notify_all()
+        return True
+
+    def submit(self, function, *args):
+        """Ставит в очередь произвольную запись в базу данных.
+
+        Задача выполняется в том же фоновом потоке, что и сохранения, поэтому
+        соединение с базой данных по-прежнему использует один поток записи.
+        Задачи выполняются в порядке постановки, после сохранений своей порции.
+
+        Args:
+            function: Функция, выполняющая запись.
+            *args: Аргументы функции.
+
+        Returns:
+            bool: True если задача поставлена в очередь, False если очередь закрыта.
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            self._tasks.append((function, args))
+            self._start()
+            self._condition.notify_all()
+        return True
+
+    def pending_count(self):
+        """Возвращает количество тамагочи, ожидающих записи.
+
+        Returns:
+            int: Размер очереди.
+        """
+        with self._condition:
+            return len(self._pending)
+
+    def flush(self, timeout=None):
+        """Ждет, пока все поставленные в очередь снимки будут записаны.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах (None - без ограничения).
+
+        Returns:
+            bool: True если очередь опустела, False если истек таймаут.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._tasks and not self._writing, timeout)
+
+    def close(self, timeout=None):
+        """Записывает оставшиеся снимки и останавливает фоновый поток.
+
+        Тамагочи, запись которых не удалась, перед закрытием ставятся в
+        очередь еще раз: после закрытия следующего enqueue уже не будет.
+
+        Args:
+            timeout: Максимальное время ожидания в секундах (None - без ограничения).
+
+        Returns:
+            bool: True если все снимки записаны, False если что-то осталось
+                  незаписанным.
+        """
+        flushed = self.flush(timeout)
+        with self._condition:
+            retry = [tamagotchi for tamagotchi, _ in self._retry.values()]
+        if retry:
+            for tamagotchi in retry:
+                self.enqueue(tamagotchi)
+            flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            unwritten = bool(self._pending or self._retry)
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return flushed and not unwritten
+
+    def _start(self):
+        """Запускает фоновый поток записи, если он еще не запущен."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="tamagotchi-writer",
+                                            daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        """Цикл фонового потока: забирает накопившиеся снимки и записывает их."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._tasks or self._closed)
+                if not self._pending and not self._tasks:
+                    return
+                batch = list(self._pending.values())
+                self._pending.clear()
+                tasks, self._tasks = self._tasks, []
+                self._writing = True
+
+            if batch:
+                self._write(batch)
+            for function, args in tasks:
+                self._run_task(function, args)
+
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+    def _write(self, batch):
+        """Записывает накопившиеся снимки в базу данных.
+
+        Если менеджер поддерживает save_many, вся порция записывается одной
+        транзакцией; иначе снимки сохраняются по одному.
+
+        Args:
+            batch: Список пар (исходный объект Tamagotchi, снимок его состояния).
+        """
+        dirty = []
+        for tamagotchi, snapshot in batch:
+            # Снимок мог быть сделан до того, как первая запись получила ID
+            if snapshot.id is None:
+                snapshot.id = tamagotchi.id
+            dirty.append(snapshot.dirty_fields)
+
+        if len(batch) > 1 and hasattr(self.db, 'save_many'):
+            saved = self._call(self.db.save_many, [snapshot for _, snapshot in batch])
+            results = [saved] * len(batch)
+        else:
+            results = [self._call(self.db.save_tamagotchi, snapshot) for _, snapshot in batch]
+
+        for (tamagotchi, snapshot), fields, saved in zip(batch, dirty, results):
+            if saved:
+                self.stats["saved"] += 1
+                # Новая запись получила ID - передаем его исходному объекту
+                if tamagotchi.id is None:
+                    tamagotchi.id = snapshot.id
+            else:
+                self.stats["failed"] += 1
+                # Неудачно записанные поля добавятся к следующему снимку
+                with self._condition:
+                    _, retry_fields = self._retry.get(id(tamagotchi), (None, frozenset()))
+                    self._retry[id(tamagotchi)] = (tamagotchi, retry_fields | fields)
+
+    def _run_task(self, function, args):
+        """Выполняет задачу из submit, не давая ошибке остановить поток.
+
+        Args:
+            function: Функция, выполняющая запись.
+            args: Аргументы функции.
+        """
+        try:
+            function(*args)
+        except Exception as e:
+            print(f"❌ Background task error: {e}")
+
+    def _call(self, method, argument):
+        """Вызывает метод менеджера, превращая исключение в неудачу.
+
+        Args:
+            method: Метод сохранения менеджера.
+            argument: Аргумент метода.
+
+        Returns:
+            bool: Результат сохранения.
+        """
+        try:
+            return method(argument)
+        except Exception as e:
+            print(f"❌ Background save error: {e}")
+            return False
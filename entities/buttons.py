@@ -1,5 +1,7 @@
 import pygame
 from config import *
+from utils.fonts import get_font
+from utils.text_cache import render_text
 
 
 class Button:
@@ -28,7 +30,7 @@ class Button:
         self.hover_color = hover_color
         self.text_color = text_color
         self.is_hovered = False
-        self.font = pygame.font.Font(None, 32)
+        self.font = get_font(32)
         self.clicked = False
 
     def draw(self, screen):
@@ -58,10 +60,20 @@ class Button:
         pygame.draw.rect(screen, BLACK, self.rect, 2, border_radius=10)
 
         # Отрисовка текста
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.font, self.text, True, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
 
+    def report_dirty(self, tracker):
+        """Сообщает трекеру изменившихся областей текущее состояние кнопки.
+        
+        Args:
+            tracker: Объект DirtyRectTracker.
+        """
+        # Тень нажатой кнопки смещена на 2 пикселя, поэтому область чуть шире
+        state = (self.text, self.is_hovered, self.clicked, self.color, self.text_color)
+        tracker.track(('button', id(self)), self.rect.inflate(4, 4), state)
+
     def check_hover(self, pos):
         """Проверяет, находится ли курсор над кнопкой.
         
@@ -151,4 +163,4 @@ class TabButton(Button):
         """
         super().__init__(x, y, width, height, text, GRAY, (200, 200, 200), BLACK)
         # Используем меньший шрифт для вкладок, чтобы текст помещался
-        self.font = pygame.font.Font(None, 28)
\ No newline at end of file
+        self.font = get_font(28)
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pygame
 from config import *
+from utils.fonts import get_font
 
 
 class FoodItem:
@@ -52,7 +53,7 @@ class FoodItem:
         pygame.draw.circle(screen, self.color, (x, y), self.size)
 
         # Отрисовка названия еды
-        font = pygame.font.Font(None, 20)
+        font = get_font(20)
         text = font.render(self.name, True, BLACK)
         text_rect = text.get_rect(center=(x, y + self.size + 15))
         screen.blit(text, text_rect)
@@ -153,7 +154,7 @@ class Inventory:
         pygame.draw.rect(screen, BLACK, inventory_rect, 2, border_radius=10)
 
         # Отрисовка заголовка инвентаря
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         title = font.render("Инвентарь (Перетащите еду к тамагочи)", True, BLACK)
         screen.blit(title, (inventory_rect.x + 10, inventory_rect.y + 10))
 
@@ -1,82 +1,64 @@
 import pygame
 from config import *
+from utils.fonts import get_font
+from game.simulation import PetSimulation
+
+
+def _simulation_attribute(name):
+    """Создаёт свойство, читающее и записывающее атрибут симуляции.
+    
+    Args:
+        name: Имя атрибута PetSimulation.
+        
+    Returns:
+        property: Свойство для класса сущности.
+    """
+    return property(lambda self: getattr(self.simulation, name),
+                    lambda self, value: setattr(self.simulation, name, value))
 
 
 class TamagotchiEntity:
     """Графическая и игровая сущность тамагочи.
     
-    Управляет состоянием, логикой и отрисовкой виртуального питомца.
-    Обрабатывает взаимодействия, анимации и игровую механику.
+    Тонкая обёртка над PetSimulation: игровая логика живёт в симуляции,
+    а сущность отвечает за отрисовку, анимации и берёт время из PyGame.
     """
     
-    def __init__(self, tamagotchi_data):
+    def __init__(self, tamagotchi_data, clock=None):
         """Инициализирует графическую сущность тамагочи.
         
         Args:
             tamagotchi_data: Объект Tamagotchi с данными состояния питомца.
+            clock: Функция, возвращающая время в мс (по умолчанию
+                pygame.time.get_ticks).
         """
         self.data = tamagotchi_data
-        self.last_update_time = pygame.time.get_ticks()
-        # Пороги эволюции в днях: ребенок (0+), подросток (7+), взрослый (14+)
-        self.evolution_thresholds = [0, 7, 14]
+        # Часы читаются при каждом вызове, чтобы их можно было подменить в тестах
+        self.clock = clock if clock is not None else (lambda: pygame.time.get_ticks())
+        self.simulation = PetSimulation(tamagotchi_data, self.clock)
         # Цвета для каждой стадии эволюции
         self.evolution_colors = [GREEN, BLUE, PURPLE]
-        self.is_sleeping = False
-        self.sleep_start_time = 0
-        self.last_energy_regen = pygame.time.get_ticks()
 
         # Инициализация шрифтов для отображения текста
-        self.small_font = pygame.font.Font(None, 24)
+        self.small_font = get_font(24)
+
+        # Область последней отрисовки (для режима dirty rects)
+        self.draw_rect = None
+
+    # Состояние таймеров хранится в симуляции
+    last_update_time = _simulation_attribute('last_update_time')
+    last_energy_regen = _simulation_attribute('last_energy_regen')
+    last_passive_update = _simulation_attribute('last_passive_update')
+    sleep_start_time = _simulation_attribute('sleep_start_time')
+    is_sleeping = _simulation_attribute('is_sleeping')
+    evolution_thresholds = _simulation_attribute('evolution_thresholds')
 
     def update_stats(self):
         """Обновляет статистику тамагочи на основе прошедшего времени.
         
         Реализует постепенную деградацию характеристик и другие временные эффекты.
         """
-        current_time = pygame.time.get_ticks()
-
-        # Постепенное снижение характеристик (каждые 30 секунд)
-        if current_time - self.last_update_time > 30000:
-            self.data.hunger = max(0, self.data.hunger - 5)
-            self.data.happiness = max(0, self.data.happiness - 3)
-            self.data.cleanliness = max(0, self.data.cleanliness - 2)
-            # Энергия не должна снижаться во время сна
-            if not self.is_sleeping:
-                self.data.energy = max(0, self.data.energy - 4)
-
-            # Прогрессия возраста (1 день = 5 минут игрового времени)
-            if current_time - self.last_update_time > 300000:  # 5 минут
-                self.data.age += 1
-                self.check_evolution()
-
-            # Снижение здоровья на основе низких характеристик
-            health_penalty = 0
-            if self.data.hunger < 20:
-                health_penalty += 2
-            if self.data.happiness < 20:
-                health_penalty += 2
-            if self.data.cleanliness < 20:
-                health_penalty += 1
-            if self.data.energy < 10:
-                health_penalty += 1
-
-            self.data.health = max(0, self.data.health - health_penalty)
-
-            self.last_update_time = current_time
-
-        # Постепенная регенерация энергии во время сна (каждые 10 секунд)
-        if self.is_sleeping and current_time - self.last_energy_regen > 10000:
-            if self.data.energy < 100:
-                self.data.energy = min(100, self.data.energy + 15)  # +15 энергии каждые 10 секунд
-                self.last_energy_regen = current_time
-
-                # Небольшой бонус к счастью от хорошего сна
-                if current_time - self.sleep_start_time > 30000:  # После 30 секунд сна
-                    self.data.happiness = min(100, self.data.happiness + 2)
-
-        # Автоматическое пробуждение при полной энергии
-        if self.is_sleeping and self.data.energy >= 100:
-            self.is_sleeping = False
+        self.simulation.update_stats()
 
     def check_evolution(self):
         """Проверяет, достиг ли тамагочи порога для эволюции.
@@ -84,13 +66,7 @@ class TamagotchiEntity:
         Returns:
             bool: True если произошла эволюция, False в противном случае.
         """
-        current_stage = self.data.evolution_stage
-        if current_stage < len(self.evolution_thresholds):
-            if self.data.age >= self.evolution_thresholds[current_stage]:
-                self.data.evolution_stage += 1
-                print(f"🎉 {self.data.name} evolved to stage {self.data.evolution_stage}!")
-                return True
-        return False
+        return self.simulation.check_evolution()
 
     def feed(self, food_value=20):
         """Кормит тамагочи, увеличивая голод и другие характеристики.
@@ -101,22 +77,7 @@ class TamagotchiEntity:
         Returns:
             bool: True если кормление успешно, False если голод уже максимален.
         """
-        if self.data.hunger < 100:
-            old_hunger = self.data.hunger
-            self.data.hunger = min(100, self.data.hunger + food_value)
-
-            # Увеличение счастья при кормлении голодного тамагочи
-            if old_hunger < 50:
-                self.data.happiness = min(100, self.data.happiness + 5)
-
-            # Небольшой бонус энергии от еды
-            if food_value >= 30:  # Существенная пища дает больше энергии
-                self.data.energy = min(100, self.data.energy + 5)
-            else:
-                self.data.energy = min(100, self.data.energy + 2)
-
-            return True
-        return False
+        return self.simulation.feed(food_value)
 
     def play(self, happiness_boost=15, energy_cost=10):
         """Играет с тамагочи, увеличивая счастье за счет энергии.
@@ -128,20 +89,7 @@ class TamagotchiEntity:
         Returns:
             bool: True если игра успешна, False если недостаточно энергии.
         """
-        if self.data.happiness < 100 and self.data.energy > energy_cost:
-            old_happiness = self.data.happiness
-            self.data.happiness = min(100, self.data.happiness + happiness_boost)
-            self.data.energy = max(0, self.data.energy - energy_cost)
-
-            # Увеличение голода от игры
-            self.data.hunger = max(0, self.data.hunger - 3)
-
-            # Больший бонус счастья если энергия была высокой
-            if self.data.energy > 70:
-                self.data.happiness = min(100, self.data.happiness + 5)
-
-            return True
-        return False
+        return self.simulation.play(happiness_boost, energy_cost)
 
     def clean(self):
         """Чистит тамагочи, восстанавливая чистоту до максимума.
@@ -149,20 +97,7 @@ class TamagotchiEntity:
         Returns:
             bool: True если чистка успешна, False если уже чисто.
         """
-        if self.data.cleanliness < 100:
-            old_cleanliness = self.data.cleanliness
-            self.data.cleanliness = 100
-
-            # Бонус счастья от чистоты
-            cleanliness_improvement = 100 - old_cleanliness
-            happiness_boost = min(15, cleanliness_improvement // 10)
-            self.data.happiness = min(100, self.data.happiness + happiness_boost)
-
-            # Небольшая трата энергии на чистку
-            self.data.energy = max(0, self.data.energy - 5)
-
-            return True
-        return False
+        return self.simulation.clean()
 
     def sleep(self):
         """Отправляет тамагочи спать для восстановления энергии.
@@ -170,15 +105,7 @@ class TamagotchiEntity:
         Returns:
             bool: True если успешно уснул, False если уже спит или энергия полная.
         """
-        if not self.is_sleeping and self.data.energy < 100:
-            self.is_sleeping = True
-            self.sleep_start_time = pygame.time.get_ticks()
-            self.last_energy_regen = pygame.time.get_ticks()
-
-            # Начальный бонус комфорта при начале сна
-            self.data.happiness = min(100, self.data.happiness + 5)
-            return True
-        return False
+        return self.simulation.sleep()
 
     def wake_up(self):
         """Будит тамагочи ото сна.
@@ -186,14 +113,7 @@ class TamagotchiEntity:
         Returns:
             bool: True если успешно проснулся, False если не спал.
         """
-        if self.is_sleeping:
-            self.is_sleeping = False
-            # Небольшой штраф к счастью если разбудить слишком рано
-            sleep_duration = (pygame.time.get_ticks() - self.sleep_start_time) // 1000
-            if sleep_duration < 60:  # Меньше 1 минуты
-                self.data.happiness = max(0, self.data.happiness - 10)
-            return True
-        return False
+        return self.simulation.wake_up()
 
     def heal(self, health_boost=30):
         """Лечит тамагочи, восстанавливая здоровье.
@@ -204,19 +124,7 @@ class TamagotchiEntity:
         Returns:
             bool: True если лечение успешно, False если здоровье уже полное.
         """
-        if self.data.health < 100:
-            old_health = self.data.health
-            self.data.health = min(100, self.data.health + health_boost)
-
-            # Бонус счастья от улучшения самочувствия
-            health_improvement = self.data.health - old_health
-            self.data.happiness = min(100, self.data.happiness + (health_improvement // 5))
-
-            # Небольшая трата энергии на процесс исцеления
-            self.data.energy = max(0, self.data.energy - 8)
-
-            return True
-        return False
+        return self.simulation.heal(health_boost)
 
     def check_food_collision(self, food_pos, food_size):
         """Проверяет, достаточно ли близко еда для поедания.
@@ -242,34 +150,32 @@ class TamagotchiEntity:
         Returns:
             bool: True если еда успешно съедена.
         """
-        old_hunger = self.data.hunger
-        old_happiness = self.data.happiness
-        old_energy = self.data.energy
-
-        # Применение эффектов еды
-        self.data.hunger = min(100, self.data.hunger + food_item.hunger_value)
-        self.data.happiness = min(100, self.data.happiness + food_item.happiness_boost)
-        self.data.energy = min(100, self.data.energy + food_item.energy_boost)
-
-        # Дополнительное счастье если очень голоден
-        if old_hunger < 30:
-            self.data.happiness = min(100, self.data.happiness + 10)
+        self.simulation.eat(food_item.hunger_value, food_item.happiness_boost,
+                            food_item.energy_boost)
 
         # Создание анимации поедания
         self.eating_animation = True
-        self.eating_timer = pygame.time.get_ticks()
+        self.eating_timer = self.clock()
 
         return True
 
     def update_animations(self):
         """Обновляет анимации (поедание и другие)."""
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock()
 
         # Анимация поедания
         if hasattr(self, 'eating_animation') and self.eating_animation:
             if current_time - self.eating_timer > 1000:  # 1 секунда анимации
                 self.eating_animation = False
 
+    def is_animating(self):
+        """Проверяет, проигрывается ли анимация поедания.
+        
+        Returns:
+            bool: True во время анимации поедания.
+        """
+        return getattr(self, 'eating_animation', False)
+
     def draw_eating_effect(self, screen, x, y):
         """Отрисовывает анимацию поедания.
         
@@ -293,24 +199,22 @@ class TamagotchiEntity:
 
     def update_passive_stats(self):
         """Обновляет пассивные характеристики, симулируя взаимодействия между ними."""
-        current_time = pygame.time.get_ticks()
-
-        # Высокая чистота медленно увеличивает счастье (каждые 2 минуты)
-        if current_time - getattr(self, 'last_passive_update', 0) > 120000:
-            if self.data.cleanliness > 80:
-                self.data.happiness = min(100, self.data.happiness + 2)
-            elif self.data.cleanliness < 30:
-                self.data.happiness = max(0, self.data.happiness - 1)
-
-            # Низкий голод быстрее снижает энергию (но не во время сна)
-            if self.data.hunger < 20 and not self.is_sleeping:
-                self.data.energy = max(0, self.data.energy - 2)
-
-            # Высокое счастье дает небольшую регенерацию энергии
-            if self.data.happiness > 80 and self.data.energy < 100:
-                self.data.energy = min(100, self.data.energy + 1)
+        self.simulation.update_passive_stats()
 
-            self.last_passive_update = current_time
+    def report_dirty(self, tracker):
+        """Сообщает трекеру изменившихся областей состояние тамагочи.
+        
+        Используется область последней отрисовки: в пределах комнаты
+        тамагочи не перемещается.
+        
+        Args:
+            tracker: Объект DirtyRectTracker.
+        """
+        if self.draw_rect is None:
+            return
+        state = (self.data.evolution_stage, self.data.happiness, self.is_sleeping,
+                 getattr(self, 'eating_animation', False))
+        tracker.track(('tamagotchi', id(self)), self.draw_rect, state)
 
     def draw(self, screen, x, y):
         """Отрисовывает тамагочи на экране.
@@ -320,6 +224,9 @@ class TamagotchiEntity:
             x: X-координата для отрисовки.
             y: Y-координата для отрисовки.
         """
+        # Область, которую занимают тело, индикатор сна и анимация поедания
+        self.draw_rect = pygame.Rect(x - 60, y - 60, 160, 110)
+
         # Получение цвета на основе стадии эволюции
         stage_index = min(self.data.evolution_stage - 1, len(self.evolution_colors) - 1)
         color = self.evolution_colors[stage_index]
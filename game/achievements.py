@@ -0,0 +1,375 @@
+"""
+Модуль достижений питомца с инкрементальным подсчетом прогресса.
+
+AchievementTracker не перебирает условия в каждом кадре: прогресс
+обновляется только на событиях (действия игрока, снижение показателей,
+награды мини-игр) и при периодических отсчетах показателей. Счетчики
+событий увеличиваются по индексу "тип события -> достижения", условия на
+показатели проверяются только для изменившихся показателей, а выполненные
+достижения из индексов удаляются. Окно статистики читает готовый список
+состояний, не вычисляя ничего при отрисовке.
+
+Прогресс хранится в базе данных (таблица pet_achievements), поэтому
+серии ("держать голод выше 80 в течение 5 дней") и счетчики переживают
+перезапуск игры.
+"""
+
+import threading
+import time
+
+from game.simulation import AGING_GAP, EVENT_MINIGAME_REWARD
+from database.achievements import ACHIEVEMENT_COLUMNS
+from database.timestamps import parse_timestamp, utc_now
+
+# Виды условий достижений
+KIND_THRESHOLD = "threshold"  # Показатель достиг значения goal
+KIND_STREAK = "streak"        # Показатель не ниже minimum в течение goal мс
+KIND_COUNTER = "counter"      # Событие типа event произошло goal раз
+
+# Игровой день: возраст растет на 1 каждые AGING_GAP мс игры
+GAME_DAY = AGING_GAP
+
+
+class Achievement:
+    """Описание достижения.
+
+    Атрибуты:
+        key: Ключ достижения в базе данных
+        name: Название
+        description: Описание условия
+        icon: Значок
+        kind: Вид условия (KIND_*)
+        goal: Цель прогресса (значение показателя, длительность в мс или число событий)
+        field: Показатель тамагочи (для KIND_THRESHOLD и KIND_STREAK)
+        minimum: Минимальное значение показателя для серии (KIND_STREAK)
+        event: Тип события (KIND_COUNTER)
+    """
+
+    __slots__ = ('key', 'name', 'description', 'icon', 'kind', 'goal', 'field', 'minimum', 'event')
+
+    def __init__(self, key, name, description, icon, kind, goal, field=None, minimum=None, event=None):
+        self.key = key
+        self.name = name
+        self.description = description
+        self.icon = icon
+        self.kind = kind
+        self.goal = goal
+        self.field = field
+        self.minimum = minimum
+        self.event = event
+
+    def format_progress(self, progress):
+        """Возвращает прогресс в виде текста для окна статистики.
+
+        Аргументы:
+            progress: Текущий прогресс
+
+        Возвращает:
+            str: Например "3/10" или "1.5/5 дн."
+        """
+        if self.kind == KIND_STREAK:
+            return f"{progress / GAME_DAY:.1f}/{self.goal / GAME_DAY:g} дн."
+        return f"{min(progress, self.goal)}/{self.goal}"
+
+
+ACHIEVEMENTS = (
+    # Цель 0: выполняется, как только тамагочи появился
+    Achievement("first_friend", "Первый друг", "Создать своего первого тамагочи", "👶",
+                KIND_THRESHOLD, 0, field="age"),
+    Achievement("well_fed", "Сытый и довольный", "Держать голод выше 80 в течение 5 дней", "🍎",
+                KIND_STREAK, 5 * GAME_DAY, field="hunger", minimum=81),
+    Achievement("lucky", "Счастливчик", "Держать счастье выше 90 в течение 3 дней", "😊",
+                KIND_STREAK, 3 * GAME_DAY, field="happiness", minimum=91),
+    # Игровые сутки: 24 часа жизни питомца
+    Achievement("clean_freak", "Чистюля", "Поддерживать чистоту 100 в течение 24 часов", "🧼",
+                KIND_STREAK, GAME_DAY, field="cleanliness", minimum=100),
+    Achievement("energizer", "Энерджайзер", "Пройти 10 мини-игр", "⚡",
+                KIND_COUNTER, 10, event=EVENT_MINIGAME_REWARD),
+    Achievement("evolution_master", "Мастер эволюции", "Достичь 3 стадии эволюции", "🌟",
+                KIND_THRESHOLD, 3, field="evolution_stage"),
+    Achievement("rich", "Богач", "Накопить 1000 монет", "💰",
+                KIND_THRESHOLD, 1000, field="coins"),
+    Achievement("veteran", "Ветеран", "Прожить 30 дней", "🎖️",
+                KIND_THRESHOLD, 30, field="age"),
+)
+
+
+def _monotonic_ms():
+    """Возвращает монотонное время в мс (часы трекера по умолчанию)."""
+    return int(time.monotonic() * 1000)
+
+
+class AchievementTracker:
+    """Прогресс достижений текущего тамагочи.
+
+    Хранилище (SQLiteManager, PostgresManager, MemoryManager) должно
+    поддерживать методы load_achievements и save_achievements; без
+    хранилища прогресс живет только в памяти. Как и в EventLog, чтение
+    сохраненного прогресса и запись выполняет функция submit.
+
+    Атрибуты:
+        pet: Объект Tamagotchi, прогресс которого отслеживается
+        rows: Состояния достижений в порядке definitions - кортежи
+            (Achievement, прогресс, выполнено ли)
+        version: Номер версии rows, растет при каждом изменении прогресса
+        loading: Сохраненный прогресс тамагочи еще не загружен
+    """
+
+    def __init__(self, store=None, definitions=ACHIEVEMENTS, clock=_monotonic_ms, submit=None):
+        """Инициализирует трекер.
+
+        Аргументы:
+            store: Менеджер базы данных с методами достижений или None
+            definitions: Описания достижений
+            clock: Функция, возвращающая время в мс (для серий)
+            submit: Функция submit(function, *args), выполняющая загрузку и
+                запись (по умолчанию - сразу в вызывающем потоке)
+        """
+        self.store = store
+        self.definitions = definitions
+        self.clock = clock
+        self._submit = submit if submit is not None else (lambda function, *args: function(*args))
+        self._lock = threading.Lock()
+        self._positions = {achievement.key: i for i, achievement in enumerate(definitions)}
+        self.pet = None
+        self.rows = []
+        self.version = 0
+        self.loading = False
+        # Номер вызова start: загрузка прогресса прежнего тамагочи отбрасывается
+        self._generation = 0
+        # События, случившиеся до загрузки прогресса, по типу события
+        self._pending_events = {}
+        self._completed_at = {}
+        self._changed = set()
+        # Строки, запись которых не удалась, по (ID тамагочи, ключ): повторяются при flush
+        self._unwritten = {}
+        # Невыполненные достижения по типу события и по показателю
+        self._by_event = {}
+        self._by_field = {}
+        # Последние увиденные значения показателей и серии, условие которых выполняется
+        self._seen = {}
+        self._holding = set()
+        self._last_observed = None
+
+    @property
+    def pet_id(self):
+        """ID отслеживаемого тамагочи или None."""
+        return self.pet.id if self.pet is not None else None
+
+    def start(self, tamagotchi):
+        """Начинает отслеживать тамагочи и запрашивает его сохраненный прогресс.
+
+        Накопленный прогресс предыдущего тамагочи сначала отправляется на запись.
+        Прогресс читается через submit и применяется, когда загрузка
+        завершится; до этого достижения показываются с нулевым прогрессом, а
+        события тамагочи накапливаются и учитываются после загрузки.
+
+        Аргументы:
+            tamagotchi: Объект Tamagotchi
+        """
+        if self.pet is not None:
+            self.flush()
+
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self.pet = tamagotchi
+            self.rows = [(achievement, 0, False) for achievement in self.definitions]
+            self._reset()
+            self.loading = True
+            self.version += 1
+
+        if self.store is not None and tamagotchi.id is not None:
+            self._submit(self._load, tamagotchi, generation)
+        else:
+            self._apply(tamagotchi, generation, {})
+
+    def _reset(self):
+        """Сбрасывает индексы и состояние серий (под блокировкой)."""
+        self._completed_at = {}
+        self._changed = set()
+        self._by_event = {}
+        self._by_field = {}
+        self._seen = {}
+        self._holding = set()
+        self._last_observed = None
+        self._pending_events = {}
+
+    def _load(self, tamagotchi, generation):
+        """Читает сохраненный прогресс тамагочи и применяет его.
+
+        Аргументы:
+            tamagotchi: Объект Tamagotchi
+            generation: Номер вызова start, запросившего загрузку
+        """
+        try:
+            saved = self.store.load_achievements(tamagotchi.id)
+        except Exception as e:
+            print(f"❌ Error loading achievements: {e}")
+            saved = {}
+        self._apply(tamagotchi, generation, saved)
+
+    def _apply(self, tamagotchi, generation, saved):
+        """Строит состояния и индексы достижений из сохраненного прогресса.
+
+        Аргументы:
+            tamagotchi: Объект Tamagotchi
+            generation: Номер вызова start, запросившего загрузку
+            saved: {ключ достижения: (прогресс, время выполнения или None)}
+        """
+        with self._lock:
+            # Пока прогресс читался, начато отслеживание другого тамагочи
+            if generation != self._generation:
+                return
+            pending = self._pending_events
+            self.rows = []
+            self._reset()
+            for achievement in self.definitions:
+                progress, completed_at = saved.get(achievement.key, (0, None))
+                self.rows.append((achievement, progress, completed_at is not None))
+                if completed_at is not None:
+                    self._completed_at[achievement.key] = parse_timestamp(completed_at)
+                elif achievement.kind == KIND_COUNTER:
+                    self._by_event.setdefault(achievement.event, []).append(achievement)
+                else:
+                    self._by_field.setdefault(achievement.field, []).append(achievement)
+            self.loading = False
+            self.version += 1
+            # События, пришедшие во время загрузки
+            for kind, count in pending.items():
+                for achievement in list(self._by_event.get(kind, ())):
+                    self._set_progress(achievement,
+                                       self.rows[self._positions[achievement.key]][1] + count)
+        self.observe(tamagotchi)
+
+    def on_event(self, kind, tamagotchi):
+        """Учитывает событие тамагочи: счетчики событий и изменившиеся показатели.
+
+        Аргументы:
+            kind: Тип события (EVENT_* из game.simulation)
+            tamagotchi: Объект Tamagotchi после события
+        """
+        if tamagotchi is not self.pet:
+            return
+        with self._lock:
+            if self.loading:
+                self._pending_events[kind] = self._pending_events.get(kind, 0) + 1
+                return
+            for achievement in list(self._by_event.get(kind, ())):
+                self._set_progress(achievement, self.rows[self._positions[achievement.key]][1] + 1)
+        self.observe(tamagotchi)
+
+    def observe(self, tamagotchi):
+        """Учитывает текущие показатели тамагочи.
+
+        Активным сериям добавляется время с предыдущего наблюдения, а
+        условия проверяются только для изменившихся показателей.
+
+        Аргументы:
+            tamagotchi: Объект Tamagotchi
+        """
+        if tamagotchi is not self.pet:
+            return
+        now = self.clock()
+        with self._lock:
+            elapsed = 0 if self._last_observed is None else max(0, now - self._last_observed)
+            self._last_observed = now
+            if elapsed:
+                for achievement in list(self._holding):
+                    self._set_progress(achievement,
+                                       self.rows[self._positions[achievement.key]][1] + elapsed)
+
+            for field, achievements in list(self._by_field.items()):
+                value = getattr(tamagotchi, field)
+                if self._seen.get(field) == value:
+                    continue
+                self._seen[field] = value
+                for achievement in list(achievements):
+                    if achievement.kind == KIND_THRESHOLD:
+                        self._set_progress(achievement, value)
+                    elif value >= achievement.minimum:
+                        self._holding.add(achievement)
+                    else:
+                        # Серия прервалась - отсчет начинается заново
+                        self._holding.discard(achievement)
+                        self._set_progress(achievement, 0)
+
+    def _set_progress(self, achievement, progress):
+        """Обновляет прогресс достижения и отмечает выполнение (под блокировкой).
+
+        Аргументы:
+            achievement: Объект Achievement
+            progress: Новый прогресс
+        """
+        position = self._positions[achievement.key]
+        completed = progress >= achievement.goal
+        if self.rows[position][1] == progress and not completed:
+            return
+        self.rows[position] = (achievement, progress, completed)
+        self._changed.add(achievement.key)
+        self.version += 1
+        if not completed:
+            return
+
+        # Выполненное достижение больше не проверяется
+        self._completed_at[achievement.key] = utc_now()
+        self._holding.discard(achievement)
+        index = self._by_event if achievement.kind == KIND_COUNTER else self._by_field
+        group = achievement.event if achievement.kind == KIND_COUNTER else achievement.field
+        index[group].remove(achievement)
+        if not index[group]:
+            del index[group]
+
+    def completed_count(self):
+        """Возвращает количество выполненных достижений.
+
+        Возвращает:
+            int: Количество выполненных достижений
+        """
+        return len(self._completed_at)
+
+    def flush(self):
+        """Отправляет на запись изменившийся прогресс и строки, запись которых не удалась."""
+        with self._lock:
+            if self.store is None:
+                return
+            # Строки в порядке ACHIEVEMENT_COLUMNS; свежий прогресс заменяет неудачно записанный
+            rows, self._unwritten = self._unwritten, {}
+            if self.pet_id is not None:
+                for key in sorted(self._changed):
+                    _, progress, _ = self.rows[self._positions[key]]
+                    completed_at = self._completed_at.get(key)
+                    rows[(self.pet_id, key)] = (
+                        self.pet_id, key, int(progress),
+                        completed_at.isoformat(' ') if completed_at is not None else None)
+            self._changed = set()
+        if rows:
+            self._submit(self._write, list(rows.values()))
+
+    def _write(self, rows):
+        """Записывает строки прогресса в хранилище.
+
+        При ошибке строки остаются в трекере и повторяются при следующем
+        flush: выполненное достижение больше не меняет прогресс, и без этого
+        время его выполнения не попало бы в базу данных.
+
+        Аргументы:
+            rows: Строки в порядке ACHIEVEMENT_COLUMNS
+        """
+        try:
+            written = self.store.save_achievements(rows)
+        except Exception as e:
+            print(f"❌ Error writing achievements: {e}")
+            written = False
+
+        with self._lock:
+            for row in rows:
+                # Записи выполняются по порядку: эта строка новее прежней неудачной
+                if written:
+                    self._unwritten.pop((row[0], row[1]), None)
+                else:
+                    self._unwritten[(row[0], row[1])] = row
+
+    def close(self):
+        """Отправляет на запись оставшийся прогресс."""
+        self.flush()
@@ -0,0 +1,92 @@
+"""
+Модуль догоняющего обновления питомца за время, пока игра была закрыта.
+
+Во время игры PetSimulation снижает показатели каждые 30 секунд. Вместо
+того чтобы повторять эти шаги для многочасового или многонедельного
+перерыва, catch_up() вычисляет результат в замкнутой форме: каждый
+показатель убывает линейно до нуля, а штраф к здоровью зависит только от
+того, с какого шага показатель опустился ниже порога. Время работы не
+зависит от длины перерыва.
+
+Пока игра закрыта, питомец бодрствует (сон не сохраняется), поэтому
+энергия тоже убывает. Пассивные эффекты и взросление вне игры не
+применяются.
+"""
+
+import math
+from datetime import timedelta
+
+from database.timestamps import parse_timestamp, utc_now
+from game.simulation import DECAY_INTERVAL, DECAY_AMOUNTS, HEALTH_PENALTIES
+
+
+def first_tick_below(value, amount, threshold):
+    """Возвращает номер шага снижения, на котором показатель станет ниже порога.
+
+    Аргументы:
+        value: Начальное значение показателя
+        amount: Снижение за один шаг
+        threshold: Порог (больше нуля)
+
+    Возвращает:
+        int: Номер шага, начиная с 1
+    """
+    # После k шагов значение равно max(0, value - amount * k)
+    return max(1, math.floor((value - threshold) / amount) + 1)
+
+
+def catch_up(tamagotchi, elapsed_ms):
+    """Применяет к питомцу снижение показателей за прошедшее время.
+
+    Результат совпадает с последовательными вызовами
+    PetSimulation.update_stats() для бодрствующего питомца.
+
+    Аргументы:
+        tamagotchi: Объект Tamagotchi
+        elapsed_ms: Прошедшее время в миллисекундах
+
+    Возвращает:
+        int: Количество применённых шагов снижения
+    """
+    ticks = int(elapsed_ms // DECAY_INTERVAL)
+    if ticks <= 0:
+        return 0
+
+    start = {field: getattr(tamagotchi, field) for field, _ in DECAY_AMOUNTS}
+    amounts = dict(DECAY_AMOUNTS)
+
+    # Каждый штраф начисляется на всех шагах, начиная с пересечения порога
+    health_penalty = 0
+    for field, threshold, penalty in HEALTH_PENALTIES:
+        first = first_tick_below(start[field], amounts[field], threshold)
+        health_penalty += penalty * max(0, ticks - first + 1)
+
+    for field, amount in DECAY_AMOUNTS:
+        setattr(tamagotchi, field, max(0, start[field] - amount * ticks))
+    tamagotchi.health = max(0, tamagotchi.health - health_penalty)
+
+    return ticks
+
+
+def catch_up_since_last_update(tamagotchi, now=None):
+    """Догоняет питомца с момента last_updated до now.
+
+    last_updated сдвигается на время применённых шагов, чтобы повторный
+    вызов не применил то же время дважды, а остаток меньше шага не потерялся.
+
+    Аргументы:
+        tamagotchi: Объект Tamagotchi
+        now: Текущее время (по умолчанию - utc_now())
+
+    Возвращает:
+        int: Количество применённых шагов снижения
+    """
+    now = now or utc_now()
+    last_updated = parse_timestamp(tamagotchi.last_updated)
+    if last_updated is None:
+        return 0
+
+    elapsed_ms = (now - last_updated).total_seconds() * 1000
+    ticks = catch_up(tamagotchi, elapsed_ms)
+    tamagotchi.last_updated = last_updated + timedelta(milliseconds=ticks * DECAY_INTERVAL)
+    return ticks
@@ -8,10 +8,19 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 from config import *
+from utils.fonts import FONT_REGISTRY, get_font
+from utils.text_cache import TEXT_CACHE, render_text
+from game.dirty_rects import DirtyRectTracker
+from game.frame_pacer import FramePacer
 from entities.buttons import Button
 from entities.tamagotchi import TamagotchiEntity
 from entities.items import Inventory
-from database import DatabaseManager
+from game.simulation import EVENT_PURCHASE, EVENT_MINIGAME_REWARD
+from game.achievements import AchievementTracker
+from game.catch_up import catch_up_since_last_update
+from database import (DatabaseManager, WriteBehindQueue, AsyncStorage, AsyncStorageAdapter, EventLog,
+                      StatHistory)
+from database.stat_history import STAT_SAMPLE_INTERVAL
 
 
 # Определяем заглушку для мини-игры (fallback)
@@ -75,7 +84,7 @@ except ImportError as e:
         def draw(self, screen, coins, inventory):
             """Отрисовывает сообщение о недоступности магазина."""
             screen.fill(WHITE)
-            font = pygame.font.Font(None, 48)
+            font = get_font(48)
             text = font.render("Магазин недоступен", True, RED)
             screen.blit(text, (300, 300))
 
@@ -133,7 +142,7 @@ except ImportError as e:
         def draw(self, screen, tamagotchi):
             """Отрисовывает сообщение о недоступности комнат."""
             screen.fill(WHITE)
-            font = pygame.font.Font(None, 36)
+            font = get_font(36)
             text = font.render("Комнаты недоступны", True, BLACK)
             screen.blit(text, (300, 300))
 
@@ -170,6 +179,9 @@ class GameCore:
         clock: Таймер для управления FPS
         running: Флаг работы игрового цикла
         db: Менеджер базы данных
+        event_log: Журнал событий питомца (None, если хранилище его не поддерживает)
+        stat_history: История показателей для графиков (None, если хранилище ее не поддерживает)
+        achievements: Трекер достижений текущего тамагочи
         current_tamagotchi: Текущий тамагочи
         current_room: Текущая комната
         rooms: Словарь комнат
@@ -180,19 +192,58 @@ class GameCore:
         message: Текущее сообщение для игрока
     """
     
-    def __init__(self, screen):
+    def __init__(self, screen, dirty_rects=DIRTY_RECTS, storage=None):
         """Инициализирует игровое ядро.
         
         Аргументы:
             screen: Поверхность PyGame для отрисовки
+            dirty_rects: Включить режим обновления только изменившихся областей
+            storage: Хранилище тамагочи - синхронный менеджер или AsyncStorage
+                (по умолчанию - DatabaseManager)
         """
         self.screen = screen
         self.clock = pygame.time.Clock()
         self.running = True
-        self.db = DatabaseManager()
+
+        # Режим dirty rects (по умолчанию выключен)
+        self.screen_rect = pygame.Rect(0, 0, screen.get_width(), screen.get_height())
+        self.dirty_tracker = DirtyRectTracker(self.screen_rect) if dirty_rects else None
+
+        # Адаптивный темп кадров: полный, сниженный в простое и фоновый
+        self.frame_pacer = FramePacer()
+        if storage is None:
+            # Показатели загруженного тамагочи снижаются за время без игры
+            storage = DatabaseManager(offline_update=catch_up_since_last_update)
+        elif isinstance(storage, AsyncStorage):
+            # Асинхронное хранилище хоста: вызовы идут в его цикл событий
+            storage = AsyncStorageAdapter(storage)
+        self.db = storage
+        # Сохранения выполняются в фоновом потоке, игровой цикл не ждет базу данных
+        self.save_queue = WriteBehindQueue(self.db)
+        # Журнал событий пишется порциями тем же фоновым потоком
+        self.event_log = None
+        if hasattr(self.db, 'append_events'):
+            self.event_log = EventLog(self.db, submit=self.save_queue.submit)
+        else:
+            print("⚠️ Хранилище не поддерживает журнал событий - история недоступна")
+        # История показателей тоже записывается фоновым потоком
+        self.stat_history = None
+        if hasattr(self.db, 'save_stat_chunks'):
+            self.stat_history = StatHistory(self.db, submit=self.save_queue.submit)
+        else:
+            print("⚠️ Хранилище не поддерживает историю показателей - графики недоступны")
+        # Прогресс достижений считается по событиям и хранится в базе, если она это умеет
+        achievement_store = self.db if hasattr(self.db, 'load_achievements') else None
+        if achievement_store is None:
+            print("⚠️ Хранилище не поддерживает достижения - прогресс не сохраняется")
+        self.achievements = AchievementTracker(
+            achievement_store, clock=pygame.time.get_ticks, submit=self.save_queue.submit)
         self.current_tamagotchi = None
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 28)
+
+        # Создаём все шрифты интерфейса один раз при запуске
+        FONT_REGISTRY.preload()
+        self.font = get_font(36)
+        self.small_font = get_font(28)
 
         # Система комнат
         if ROOMS_AVAILABLE:
@@ -217,11 +268,15 @@ class GameCore:
         self.current_minigame = None
         self.shop = Shop()  # Старый магазин для совместимости
         self.stats_window = StatsWindow()
+        self.stats_window.event_log = self.event_log
+        self.stats_window.stat_history = self.stat_history
+        self.stats_window.achievements = self.achievements
         self.in_shop = False
         self.message = ""
         self.message_timer = 0
         self.dragging_food = None
         self.last_auto_save = pygame.time.get_ticks()
+        self.last_stat_sample = None
 
         # Система запросов мини-игр
         self.request_minigame_menu = False
@@ -265,9 +320,10 @@ class GameCore:
     def ensure_tamagotchi_exists(self):
         """Создаёт тамагочи по умолчанию, если не существует."""
         try:
-            all_pets = self.db.get_all_tamagotchis()
-            if all_pets:
-                self.current_tamagotchi = TamagotchiEntity(all_pets[0])
+            # Нужен только последний тамагочи - не загружаем весь список
+            latest = self.db.get_latest_tamagotchi()
+            if latest:
+                self.current_tamagotchi = self.create_entity(latest)
                 print(f"✅ Загружен тамагочи: {self.current_tamagotchi.data.name}")
             else:
                 self.create_new_tamagotchi("Мой Пушок")
@@ -288,7 +344,7 @@ class GameCore:
             from database.models import Tamagotchi
             tamagotchi_data = Tamagotchi(name=name)
             if self.db.save_tamagotchi(tamagotchi_data):
-                self.current_tamagotchi = TamagotchiEntity(tamagotchi_data)
+                self.current_tamagotchi = self.create_entity(tamagotchi_data)
                 print(f"✅ Создан новый тамагочи: {name}")
                 return True
             return False
@@ -296,13 +352,86 @@ class GameCore:
             print(f"❌ Ошибка создания тамагочи: {e}")
             return False
 
-    def handle_events(self):
-        """Обрабатывает все события игры."""
-        for event in pygame.event.get():
+    def create_entity(self, tamagotchi_data):
+        """Создаёт сущность тамагочи, события которой попадают в журнал и достижения.
+        
+        Аргументы:
+            tamagotchi_data: Объект Tamagotchi
+            
+        Возвращает:
+            TamagotchiEntity: Новая сущность
+        """
+        entity = TamagotchiEntity(tamagotchi_data)
+        entity.simulation.listener = self.record_event
+        if self.event_log is not None:
+            try:
+                # Номер последнего события читается сейчас, а не при первом действии в игре
+                self.event_log.start(tamagotchi_data)
+            except Exception as e:
+                print(f"❌ Ошибка загрузки журнала событий: {e}")
+        if self.stat_history is not None:
+            # Несвернутые отсчеты прошлого сеанса читаются в очереди записи
+            self.stat_history.start(tamagotchi_data)
+        try:
+            self.achievements.start(tamagotchi_data)
+        except Exception as e:
+            print(f"❌ Ошибка загрузки достижений: {e}")
+        return entity
+
+    def record_event(self, kind, details=None):
+        """Записывает событие текущего тамагочи в журнал событий и учитывает его в достижениях.
+        
+        Ошибка журнала не должна прерывать игру, поэтому она только выводится.
+        
+        Аргументы:
+            kind: Тип события (EVENT_* из game.simulation)
+            details: Словарь дополнительных данных события
+        """
+        if not self.current_tamagotchi:
+            return
+        tamagotchi = self.current_tamagotchi.data
+        if self.event_log is not None:
+            try:
+                self.event_log.record(tamagotchi, kind, details)
+            except Exception as e:
+                print(f"❌ Ошибка журнала событий: {e}")
+        self.achievements.on_event(kind, tamagotchi)
+
+    def record_stats(self):
+        """Добавляет отсчет показателей текущего тамагочи в историю показателей.
+        
+        Показатели меняются и без событий (сон, пассивные эффекты), поэтому
+        отсчет заодно обновляет серии достижений. Как и в record_event,
+        ошибка истории только выводится.
+        """
+        if not self.current_tamagotchi:
+            return
+        tamagotchi = self.current_tamagotchi.data
+        self.achievements.observe(tamagotchi)
+        if self.stat_history is None:
+            return
+        try:
+            self.stat_history.record(tamagotchi)
+        except Exception as e:
+            print(f"❌ Ошибка истории показателей: {e}")
+
+    def handle_events(self, events=None):
+        """Обрабатывает все события игры.
+        
+        Аргументы:
+            events: Уже полученные события (по умолчанию берутся из очереди)
+        """
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return
 
+            # Окно было перекрыто или восстановлено - выводим его заново целиком
+            if self.dirty_tracker and event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.dirty_tracker.mark_all()
+
             # Обработка клавиши ESC
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
@@ -439,6 +568,7 @@ class GameCore:
         if success is not None:
             if success:
                 self.show_message(message)
+                self.record_event(EVENT_PURCHASE)
                 self.auto_save()
             else:
                 self.show_message(message)
@@ -462,6 +592,7 @@ class GameCore:
                 if hunger_cost > 0:
                     message += f" Потеряно {hunger_cost} сытости."
                 self.show_message(message)
+                self.record_event(EVENT_MINIGAME_REWARD, {"coins": coins, "happiness": happiness})
                 self.auto_save()
             self.current_minigame = None
             
@@ -479,9 +610,20 @@ class GameCore:
         self.message_timer = pygame.time.get_ticks()
 
     def auto_save(self):
-        """Автосохранение игры."""
+        """Автосохранение игры.
+        
+        Состояние ставится в очередь фоновой записи; частые автосохранения
+        одного тамагочи объединяются в одну запись. Накопленные события
+        журнала, отсчеты истории показателей и прогресс достижений
+        записываются той же очередью.
+        """
         if self.current_tamagotchi:
-            self.db.save_tamagotchi(self.current_tamagotchi.data)
+            self.save_queue.enqueue(self.current_tamagotchi.data)
+            if self.event_log is not None:
+                self.event_log.flush()
+            if self.stat_history is not None:
+                self.stat_history.flush()
+            self.achievements.flush()
             print("💾 Игра автосохранена")
 
     def draw_minigame_menu(self, mouse_pos):
@@ -501,10 +643,10 @@ class GameCore:
         pygame.draw.rect(self.screen, BLACK, menu_rect, 3, border_radius=15)
 
         # Заголовок
-        title = self.font.render("Мини-Игры", True, BLACK)
+        title = render_text(self.font, "Мини-Игры", True, BLACK)
         self.screen.blit(title, (menu_rect.centerx - title.get_width() // 2, 180))
 
-        instructions = self.small_font.render("Выберите игру!", True, BLACK)
+        instructions = render_text(self.small_font, "Выберите игру!", True, BLACK)
         self.screen.blit(instructions, (menu_rect.centerx - instructions.get_width() // 2, 220))
 
         # Прямоугольники кнопок
@@ -528,18 +670,18 @@ class GameCore:
 
             # Отрисовка текста
             text_color = WHITE if button["available"] else (150, 150, 150)
-            text = self.font.render(button["text"], True, text_color)
+            text = render_text(self.font, button["text"], True, text_color)
             text_rect = text.get_rect(center=button["rect"].center)
             self.screen.blit(text, text_rect)
 
             # Отрисовка текста "Недоступно"
             if not button["available"]:
-                unavailable_text = self.small_font.render("(Недоступно)", True, RED)
+                unavailable_text = render_text(self.small_font, "(Недоступно)", True, RED)
                 self.screen.blit(unavailable_text, (button["rect"].centerx - unavailable_text.get_width() // 2,
                                                     button["rect"].bottom + 5))
 
         # Подсказка
-        hint = self.small_font.render("Нажмите ESC для закрытия меню", True, WHITE)
+        hint = render_text(self.small_font, "Нажмите ESC для закрытия меню", True, WHITE)
         self.screen.blit(hint, (menu_rect.centerx - hint.get_width() // 2, 500))
 
     def draw(self):
@@ -576,7 +718,7 @@ class GameCore:
 
                 # Подсказка по навигации для зала
                 if self.current_room == "hall":
-                    hint_font = pygame.font.Font(None, 24)
+                    hint_font = get_font(24)
                     hint_text = hint_font.render("← Используйте стрелки для навигации по комнатам →", True, WHITE)
                     hint_x = self.screen.get_width() // 2 - hint_text.get_width() // 2
                     self.screen.blit(hint_text, (hint_x, SCREEN_HEIGHT - 40))
@@ -621,6 +763,76 @@ class GameCore:
         if hasattr(self, 'stats_window'):
             self.stats_window.draw(self.screen, self.current_tamagotchi)
 
+    def is_animating(self):
+        """Проверяет, нужна ли сейчас полная частота кадров.
+        
+        Возвращает:
+            bool: True во время мини-игр, перетаскивания и анимаций
+        """
+        if self.in_minigame_menu or (self.current_minigame and self.current_minigame.running):
+            return True
+        if self.dragging_food:
+            return True
+        if self.current_tamagotchi and hasattr(self.current_tamagotchi, 'is_animating'):
+            if self.current_tamagotchi.is_animating():
+                return True
+        if ROOMS_AVAILABLE and self.current_room in self.rooms:
+            room = self.rooms[self.current_room]
+            return hasattr(room, 'is_animating') and room.is_animating()
+        return False
+
+    def collect_dirty_rects(self):
+        """Опрашивает компоненты и возвращает изменившиеся области экрана.
+        
+        Возвращает:
+            list: Список pygame.Rect (пустой, если кадр не изменился)
+        """
+        tracker = self.dirty_tracker
+        in_room = (ROOMS_AVAILABLE and self.current_room in self.rooms
+                   and not self.in_minigame_menu
+                   and not (self.current_minigame and self.current_minigame.running))
+
+        # Смена сцены перерисовывает экран целиком
+        scene = (self.current_room, self.in_minigame_menu, bool(self.current_minigame), in_room)
+        tracker.track(('scene',), self.screen_rect, scene)
+
+        if not in_room:
+            # Меню и мини-игры анимированы и не сообщают об изменениях
+            tracker.mark_all()
+        else:
+            room = self.rooms[self.current_room]
+            if hasattr(room, 'report_dirty'):
+                room.report_dirty(tracker, self.screen_rect, self.current_tamagotchi)
+            else:
+                tracker.mark_all()
+
+            # Строка сообщения и подсказка по навигации
+            if self.message and pygame.time.get_ticks() - self.message_timer < 3000:
+                tracker.track(('message',), (0, 0, self.screen_rect.width, 40), self.message)
+                if self.current_room == "hall":
+                    tracker.track(('message_hint',), (0, SCREEN_HEIGHT - 40, self.screen_rect.width, 40), True)
+
+        if hasattr(self, 'stats_window') and hasattr(self.stats_window, 'report_dirty'):
+            self.stats_window.report_dirty(tracker)
+
+        return tracker.collect()
+
+    def present_dirty(self):
+        """Перерисовывает и выводит на экран только изменившиеся области."""
+        rects = self.collect_dirty_rects()
+        if not rects:
+            # Ничего не изменилось - кадр пропускается целиком
+            return rects
+
+        # Рисование ограничено изменившимися областями, остальное не трогаем
+        self.screen.set_clip(rects[0].unionall(rects[1:]))
+        try:
+            self.draw()
+        finally:
+            self.screen.set_clip(None)
+        pygame.display.update(rects)
+        return rects
+
     def update(self):
         """Обновляет состояние игры."""
         # Проверяем, был ли запрос меню мини-игр из игровой комнаты
@@ -652,8 +864,15 @@ class GameCore:
                 if hasattr(self.rooms[self.current_room], 'update'):
                     self.rooms[self.current_room].update(self.current_tamagotchi)
 
-            # Автосохранение каждые 2 минуты
             current_time = pygame.time.get_ticks()
+
+            # Отсчет истории показателей каждые STAT_SAMPLE_INTERVAL секунд
+            if (self.last_stat_sample is None
+                    or current_time - self.last_stat_sample >= STAT_SAMPLE_INTERVAL * 1000):
+                self.record_stats()
+                self.last_stat_sample = current_time
+
+            # Автосохранение каждые 2 минуты
             if current_time - self.last_auto_save > 120000:  # 2 минуты
                 self.auto_save()
                 self.last_auto_save = current_time
@@ -670,15 +889,43 @@ class GameCore:
             print("⎋ Нажмите ESC для возврата в Главный зал")
 
         while self.running:
-            self.clock.tick(FPS)
-            self.handle_events()
+            # Спим до следующего кадра; ввод будит цикл сразу
+            events = self.frame_pacer.wait(self.is_animating())
+            self.handle_events(events)
             self.update()
-            self.draw()
-            pygame.display.flip()
+            if self.dirty_tracker:
+                self.present_dirty()
+            else:
+                self.draw()
+                pygame.display.flip()
 
-        # Сохраняем перед выходом
+        # Сохраняем перед выходом и дожидаемся записи всей очереди
         if self.current_tamagotchi:
-            self.db.save_tamagotchi(self.current_tamagotchi.data)
+            self.save_queue.enqueue(self.current_tamagotchi.data)
+        if self.event_log is not None:
+            self.event_log.close()
+        if self.stat_history is not None:
+            self.stat_history.close()
+        self.achievements.close()
+        saved = self.save_queue.close()
+        # Очередь остановлена - хранилище больше не нужно (адаптер останавливает свой цикл событий)
+        if hasattr(self.db, 'close'):
+            self.db.close()
+        if not saved:
+            print("❌ Не удалось сохранить игру перед выходом.")
+        elif self.current_tamagotchi:
             print("💾 Игра сохранена перед выходом.")
+        save_stats = self.save_queue.stats
+        print(f"💾 Фоновые сохранения: записано {save_stats['saved']}, "
+              f"объединено {save_stats['coalesced']}, ошибок {save_stats['failed']}")
+
+        if self.dirty_tracker:
+            dirty_stats = self.dirty_tracker.stats
+            print(f"🖼️ Dirty rects: кадров {dirty_stats['frames']}, пропущено {dirty_stats['skipped']}, "
+                  f"полных {dirty_stats['full']}")
+
+        text_stats = TEXT_CACHE.stats()
+        print(f"🔤 Кэш текста: попаданий {text_stats['hits']}, промахов {text_stats['misses']} "
+              f"({text_stats['hit_rate']:.0%})")
 
         pygame.quit()
\ No newline at end of file
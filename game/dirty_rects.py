@@ -0,0 +1,130 @@
+"""
+Модуль отслеживания изменившихся областей экрана (dirty rects).
+
+В режиме dirty rects GameCore не перерисовывает и не выводит весь экран
+каждый кадр. Комнаты, тамагочи, кнопки и строка сообщений сообщают трекеру
+свои области и состояние; область считается изменившейся, если состояние
+отличается от прошлого кадра. Затем ядро перерисовывает кадр только внутри
+этих областей и вызывает pygame.display.update(rects). Если ничего не
+изменилось, кадр пропускается целиком.
+"""
+
+import pygame
+
+# Если изменившиеся области занимают больше этой доли экрана,
+# дешевле обновить экран целиком одним прямоугольником
+FULL_SCREEN_RATIO = 0.5
+
+
+class DirtyRectTracker:
+    """Собирает изменившиеся за кадр области экрана.
+
+    Атрибуты:
+        screen_rect: Прямоугольник всего экрана
+        full_screen_ratio: Доля экрана, начиная с которой обновляется весь экран
+        stats: Счётчики кадров, пропущенных кадров и обновлённых пикселей
+    """
+
+    def __init__(self, screen_rect, full_screen_ratio=FULL_SCREEN_RATIO):
+        """Инициализирует трекер.
+
+        Аргументы:
+            screen_rect: Прямоугольник всего экрана
+            full_screen_ratio: Доля экрана, начиная с которой обновляется весь экран
+        """
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.full_screen_ratio = full_screen_ratio
+        self._states = {}
+        self._seen = set()
+        self._rects = []
+        self._full = True  # Первый кадр всегда рисуется целиком
+        self.stats = {"frames": 0, "skipped": 0, "full": 0, "pixels": 0}
+
+    def mark(self, rect):
+        """Помечает область экрана как изменившуюся.
+
+        Аргументы:
+            rect: Прямоугольник области
+        """
+        rect = pygame.Rect(rect).clip(self.screen_rect)
+        if rect.width and rect.height:
+            self._rects.append(rect)
+
+    def mark_all(self):
+        """Помечает весь экран как изменившийся (смена сцены, меню, мини-игра)."""
+        self._full = True
+
+    def track(self, key, rect, state):
+        """Сравнивает состояние компонента с прошлым кадром.
+
+        Если состояние изменилось или область сдвинулась, помечаются и старая,
+        и новая области (чтобы стереть прежнее изображение).
+
+        Аргументы:
+            key: Уникальный ключ компонента
+            rect: Область экрана, которую занимает компонент
+            state: Хешируемое описание всего, что влияет на отрисовку компонента
+        """
+        rect = pygame.Rect(rect)
+        self._seen.add(key)
+        previous = self._states.get(key)
+        if previous is None:
+            self.mark(rect)
+        elif previous[1] != state or previous[0] != rect:
+            self.mark(previous[0])
+            self.mark(rect)
+        self._states[key] = (rect, state)
+
+    def collect(self):
+        """Возвращает изменившиеся области кадра и начинает новый кадр.
+
+        Возвращает:
+            list: Список pygame.Rect (пустой, если кадр можно пропустить)
+        """
+        # Компоненты, которые перестали сообщать о себе, исчезли с экрана
+        for key in [key for key in self._states if key not in self._seen]:
+            self.mark(self._states.pop(key)[0])
+        self._seen = set()
+
+        rects = merge_rects(self._rects)
+        screen_area = self.screen_rect.width * self.screen_rect.height
+        if self._full or sum(r.width * r.height for r in rects) > screen_area * self.full_screen_ratio:
+            rects = [self.screen_rect.copy()]
+            self.stats["full"] += 1
+
+        self._rects = []
+        self._full = False
+        self.stats["frames"] += 1
+        if not rects:
+            self.stats["skipped"] += 1
+        self.stats["pixels"] += sum(r.width * r.height for r in rects)
+        return rects
+
+    def reset(self):
+        """Забывает все состояния; следующий кадр будет нарисован целиком."""
+        self._states.clear()
+        self._seen = set()
+        self._rects = []
+        self._full = True
+
+
+def merge_rects(rects):
+    """Объединяет пересекающиеся прямоугольники.
+
+    Аргументы:
+        rects: Список pygame.Rect
+
+    Возвращает:
+        list: Список непересекающихся pygame.Rect
+    """
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        # Поглощаем все пересекающиеся прямоугольники, пока такие есть
+        while True:
+            index = rect.collidelist(merged)
+            if index == -1:
+                break
+            rect.union_ip(merged.pop(index))
+        merged.append(rect)
+    return merged
@@ -0,0 +1,119 @@
+"""
+Модуль адаптивного темпа кадров для игры Tamagotchi Pou.
+
+Вместо постоянных clock.tick(FPS) игровой цикл выбирает одну из трёх частот:
+- полную (FPS) - во время перетаскивания и анимаций;
+- сниженную (IDLE_FPS) - когда меняются только показатели по таймеру;
+- фоновую (BACKGROUND_FPS) - когда окно свёрнуто или не в фокусе.
+
+Между кадрами процесс спит в pygame.event.wait с таймаутом, поэтому
+пользовательский ввод будит его сразу, а в простое процессор не занят.
+"""
+
+import pygame
+
+from config import FPS, IDLE_FPS, BACKGROUND_FPS
+
+# Режимы темпа кадров
+ACTIVE = "active"
+IDLE = "idle"
+BACKGROUND = "background"
+
+# События окна, по которым отслеживаются фокус и сворачивание
+_FOCUS_LOST = {pygame.WINDOWFOCUSLOST}
+_FOCUS_GAINED = {pygame.WINDOWFOCUSGAINED}
+_HIDDEN = {pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN}
+_SHOWN = {pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED, pygame.WINDOWSHOWN}
+
+
+class FramePacer:
+    """Планировщик кадров с тремя частотами.
+
+    Атрибуты:
+        rates: Частота кадров для каждого режима
+        focused: Находится ли окно в фокусе
+        minimized: Свёрнуто ли окно
+        mode: Режим последнего кадра
+        stats: Количество кадров в каждом режиме
+    """
+
+    def __init__(self, active_fps=FPS, idle_fps=IDLE_FPS, background_fps=BACKGROUND_FPS):
+        """Инициализирует планировщик.
+
+        Аргументы:
+            active_fps: Частота кадров во время анимаций
+            idle_fps: Частота кадров в простое
+            background_fps: Частота кадров для свёрнутого окна или окна без фокуса
+        """
+        self.rates = {ACTIVE: active_fps, IDLE: idle_fps, BACKGROUND: background_fps}
+        self.focused = True
+        self.minimized = False
+        self.mode = ACTIVE
+        self.stats = {ACTIVE: 0, IDLE: 0, BACKGROUND: 0}
+        self._last_frame = pygame.time.get_ticks()
+
+    def observe(self, event):
+        """Учитывает события окна (фокус, сворачивание).
+
+        Аргументы:
+            event: Событие PyGame
+        """
+        if event.type in _FOCUS_LOST:
+            self.focused = False
+        elif event.type in _FOCUS_GAINED:
+            self.focused = True
+        elif event.type in _HIDDEN:
+            self.minimized = True
+        elif event.type in _SHOWN:
+            self.minimized = False
+
+    def select_mode(self, animating):
+        """Выбирает режим следующего кадра.
+
+        Аргументы:
+            animating: Идёт ли сейчас анимация или перетаскивание
+
+        Возвращает:
+            str: ACTIVE, IDLE или BACKGROUND
+        """
+        if self.minimized or not self.focused:
+            return BACKGROUND
+        return ACTIVE if animating else IDLE
+
+    def wait(self, animating):
+        """Спит до следующего кадра или до первого события и возвращает события.
+
+        При полной частоте работает как clock.tick(FPS). При сниженной
+        частоте процесс спит в pygame.event.wait, но любое событие (ввод,
+        фокус окна) будит его раньше - но не чаще полной частоты.
+
+        Аргументы:
+            animating: Идёт ли сейчас анимация или перетаскивание
+
+        Возвращает:
+            list: События, накопившиеся к началу кадра, в порядке поступления
+        """
+        self.mode = self.select_mode(animating)
+        self.stats[self.mode] += 1
+
+        now = pygame.time.get_ticks()
+        remaining = self._last_frame + 1000 / self.rates[self.mode] - now
+
+        events = []
+        if remaining > 0:
+            event = pygame.event.wait(int(remaining))
+            if event.type != pygame.NOEVENT:
+                events.append(event)
+
+        # Даже разбуженный событием кадр не начинается раньше, чем позволяет полная частота
+        min_frame = 1000 / self.rates[ACTIVE]
+        since_last = pygame.time.get_ticks() - self._last_frame
+        if since_last < min_frame:
+            pygame.time.wait(int(min_frame - since_last))
+
+        events.extend(pygame.event.get())
+        for event in events:
+            self.observe(event)
+
+        self._last_frame = pygame.time.get_ticks()
+        return events
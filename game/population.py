@@ -0,0 +1,268 @@
+"""
+Модуль пакетной симуляции большого числа питомцев на NumPy.
+
+PetPopulation хранит показатели и таймеры всех питомцев в виде отдельных
+массивов (struct of arrays) и применяет правила PetSimulation ко всей
+популяции за один векторизованный шаг. Результаты совпадают с покомпонентным
+вызовом PetSimulation.step() бит в бит:
+
+    population = PetPopulation.from_simulations(simulations)
+    population.advance(60 * 60 * 1000)
+    population.write_back(simulations)
+
+NumPy - необязательная зависимость: без неё модуль импортируется, но
+создать PetPopulation нельзя (NUMPY_AVAILABLE = False).
+"""
+
+from game.simulation import (
+    DECAY_INTERVAL, AGING_GAP, ENERGY_REGEN_INTERVAL, SLEEP_BONUS_AFTER,
+    PASSIVE_INTERVAL, EVOLUTION_THRESHOLDS, DECAY_AMOUNTS, HEALTH_PENALTIES,
+)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Показатели в диапазоне 0-100. Хранятся как float64: целые значения в нём
+# точны, а дробная чистота (например, после ванной) сохраняется без потерь
+STAT_FIELDS = ("hunger", "happiness", "health", "cleanliness", "energy")
+# Целочисленные поля
+COUNTER_FIELDS = ("age", "evolution_stage")
+# Таймеры симуляции в миллисекундах
+TIMER_FIELDS = ("last_update_time", "last_energy_regen", "sleep_start_time",
+                "last_passive_update")
+
+
+def _to_python(value):
+    """Преобразует показатель из массива обратно в число Python.
+
+    Аргументы:
+        value: Элемент массива float64
+
+    Возвращает:
+        int или float: Целое число, если значение целое
+    """
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+class PetPopulation:
+    """Популяция питомцев в виде массивов NumPy.
+
+    Атрибуты:
+        hunger, happiness, health, cleanliness, energy: Показатели (float64)
+        age, evolution_stage: Возраст и стадия эволюции (int64)
+        is_sleeping: Спит ли питомец (bool)
+        last_update_time, last_energy_regen, sleep_start_time,
+        last_passive_update: Таймеры, как в PetSimulation (int64)
+        evolution_thresholds: Пороги эволюции в днях
+    """
+
+    def __init__(self, pets, now=0):
+        """Создаёт популяцию из объектов Tamagotchi с новыми таймерами.
+
+        Таймеры инициализируются так же, как в новом PetSimulation,
+        созданном в момент now.
+
+        Аргументы:
+            pets: Список объектов Tamagotchi
+            now: Текущее время в мс
+
+        Исключения:
+            ImportError: Если NumPy не установлен
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("Для пакетной симуляции нужен NumPy")
+
+        pets = list(pets)
+        for field in STAT_FIELDS:
+            setattr(self, field, np.array([getattr(pet, field) for pet in pets], dtype=np.float64))
+        for field in COUNTER_FIELDS:
+            setattr(self, field, np.array([getattr(pet, field) for pet in pets], dtype=np.int64))
+
+        size = len(pets)
+        self.is_sleeping = np.zeros(size, dtype=bool)
+        self.last_update_time = np.full(size, now, dtype=np.int64)
+        self.last_energy_regen = np.full(size, now, dtype=np.int64)
+        self.sleep_start_time = np.zeros(size, dtype=np.int64)
+        self.last_passive_update = np.zeros(size, dtype=np.int64)
+        self.evolution_thresholds = np.array(EVOLUTION_THRESHOLDS, dtype=np.int64)
+        self.now = now
+
+    @classmethod
+    def from_simulations(cls, simulations, now=None):
+        """Создаёт популяцию из симуляций, сохраняя их таймеры и сон.
+
+        Аргументы:
+            simulations: Список объектов PetSimulation
+            now: Текущее время в мс (по умолчанию - по часам первой симуляции)
+
+        Возвращает:
+            PetPopulation: Новая популяция
+        """
+        simulations = list(simulations)
+        population = cls([simulation.data for simulation in simulations])
+        population.is_sleeping = np.array([s.is_sleeping for s in simulations], dtype=bool)
+        for field in TIMER_FIELDS:
+            values = [getattr(simulation, field) for simulation in simulations]
+            setattr(population, field, np.array(values, dtype=np.int64))
+        if now is None:
+            now = simulations[0].clock() if simulations else 0
+        population.now = now
+        return population
+
+    def __len__(self):
+        """Возвращает количество питомцев в популяции."""
+        return len(self.hunger)
+
+    def write_back(self, targets):
+        """Записывает состояние популяции обратно в питомцев.
+
+        Аргументы:
+            targets: Список объектов Tamagotchi или PetSimulation в том же
+                порядке, в котором создавалась популяция
+        """
+        for index, target in enumerate(targets):
+            pet = getattr(target, 'data', target)
+            for field in STAT_FIELDS:
+                setattr(pet, field, _to_python(getattr(self, field)[index]))
+            for field in COUNTER_FIELDS:
+                setattr(pet, field, int(getattr(self, field)[index]))
+            # Таймеры есть только у симуляций
+            if pet is not target:
+                target.is_sleeping = bool(self.is_sleeping[index])
+                for field in TIMER_FIELDS:
+                    setattr(target, field, int(getattr(self, field)[index]))
+
+    def next_event_times(self):
+        """Возвращает для каждого питомца ближайший момент срабатывания таймера.
+
+        Возвращает:
+            numpy.ndarray: Время в мс (int64)
+        """
+        times = np.minimum(self.last_update_time + DECAY_INTERVAL + 1,
+                           self.last_passive_update + PASSIVE_INTERVAL + 1)
+        regen = self.last_energy_regen + ENERGY_REGEN_INTERVAL + 1
+        return np.where(self.is_sleeping, np.minimum(times, regen), times)
+
+    def step(self, now, mask=None):
+        """Выполняет один шаг симуляции для всей популяции.
+
+        Эквивалентен вызову PetSimulation.step(now) для каждого питомца.
+
+        Аргументы:
+            now: Текущее время в мс
+            mask: Булев массив питомцев, к которым применяется шаг
+                (по умолчанию - ко всем)
+
+        Возвращает:
+            numpy.ndarray: Индексы питомцев, эволюционировавших на этом шаге
+        """
+        active = np.ones(len(self), dtype=bool) if mask is None else mask
+        self.now = now
+        evolved = self._update_stats(now, active)
+        self._update_passive_stats(now, active)
+        return evolved
+
+    def advance(self, dt_ms):
+        """Прокручивает всю популяцию вперёд, как непрерывный игровой цикл.
+
+        Как и PetSimulation.advance(), переходит от одного срабатывания
+        таймера к следующему. Питомцы независимы, поэтому за один
+        векторизованный шаг каждый питомец переходит к своему ближайшему
+        срабатыванию (время шага - массив по питомцам). Число шагов
+        ограничено числом срабатываний самого активного питомца, а не
+        количеством различных моментов срабатывания во всей популяции.
+
+        Аргументы:
+            dt_ms: Время в миллисекундах
+
+        Возвращает:
+            int: Количество выполненных векторизованных шагов
+        """
+        target = self.now + dt_ms
+        steps = 0
+        while len(self):
+            event_times = self.next_event_times()
+            active = event_times <= target
+            if not active.any():
+                break
+            self._update_stats(event_times, active)
+            self._update_passive_stats(event_times, active)
+            steps += 1
+        self.now = target
+        return steps
+
+    def _update_stats(self, now, active):
+        """Векторизованная версия PetSimulation.update_stats().
+
+        Аргументы:
+            now: Текущее время в мс (число или массив int64 по питомцам)
+            active: Булев массив питомцев, к которым применяется шаг
+
+        Возвращает:
+            numpy.ndarray: Индексы эволюционировавших питомцев
+        """
+        elapsed = now - self.last_update_time
+        due = active & (elapsed > DECAY_INTERVAL)
+
+        # Постепенное снижение характеристик (энергия - только без сна)
+        awake_due = due & ~self.is_sleeping
+        for field, amount in DECAY_AMOUNTS:
+            mask = awake_due if field == "energy" else due
+            values = getattr(self, field)
+            setattr(self, field, np.where(mask, np.maximum(0, values - amount), values))
+
+        # Прогрессия возраста и эволюция
+        aging = due & (elapsed > AGING_GAP)
+        self.age = self.age + aging
+        thresholds = self.evolution_thresholds
+        stage_index = np.minimum(self.evolution_stage, len(thresholds) - 1)
+        evolving = (aging & (self.evolution_stage < len(thresholds))
+                    & (self.age >= thresholds[stage_index]))
+        self.evolution_stage = self.evolution_stage + evolving
+
+        # Снижение здоровья на основе низких характеристик
+        penalty = sum(amount * (getattr(self, field) < threshold)
+                      for field, threshold, amount in HEALTH_PENALTIES)
+        self.health = np.where(due, np.maximum(0, self.health - penalty), self.health)
+        self.last_update_time = np.where(due, now, self.last_update_time)
+
+        # Регенерация энергии во время сна
+        regen = (active & self.is_sleeping & (now - self.last_energy_regen > ENERGY_REGEN_INTERVAL)
+                 & (self.energy < 100))
+        self.energy = np.where(regen, np.minimum(100, self.energy + 15), self.energy)
+        self.last_energy_regen = np.where(regen, now, self.last_energy_regen)
+        bonus = regen & (now - self.sleep_start_time > SLEEP_BONUS_AFTER)
+        self.happiness = np.where(bonus, np.minimum(100, self.happiness + 2), self.happiness)
+
+        # Автоматическое пробуждение при полной энергии
+        self.is_sleeping = self.is_sleeping & ~(active & (self.energy >= 100))
+
+        return np.flatnonzero(evolving)
+
+    def _update_passive_stats(self, now, active):
+        """Векторизованная версия PetSimulation.update_passive_stats().
+
+        Аргументы:
+            now: Текущее время в мс (число или массив int64 по питомцам)
+            active: Булев массив питомцев, к которым применяется шаг
+        """
+        due = active & (now - self.last_passive_update > PASSIVE_INTERVAL)
+
+        self.happiness = np.where(due & (self.cleanliness > 80),
+                                  np.minimum(100, self.happiness + 2),
+                                  np.where(due & (self.cleanliness < 30),
+                                           np.maximum(0, self.happiness - 1),
+                                           self.happiness))
+
+        hungry = due & (self.hunger < 20) & ~self.is_sleeping
+        self.energy = np.where(hungry, np.maximum(0, self.energy - 2), self.energy)
+
+        cheerful = due & (self.happiness > 80) & (self.energy < 100)
+        self.energy = np.where(cheerful, np.minimum(100, self.energy + 1), self.energy)
+
+        self.last_passive_update = np.where(due, now, self.last_passive_update)
@@ -2,6 +2,8 @@ import pygame
 import os
 from entities.buttons import Button
 from config import *
+from utils.fonts import get_font
+from utils.text_cache import render_text
 
 
 class BaseRoom:
@@ -23,6 +25,9 @@ class BaseRoom:
         music_playing: Флаг воспроизведения музыки
         current_music_file: Путь к текущему файлу музыки
     """
+
+    # Количество пересборок статических слоёв всех комнат
+    static_layer_stats = {"builds": 0}
     
     def __init__(self, name, background_color):
         """Инициализирует базовые свойства комнаты.
@@ -35,8 +40,8 @@ class BaseRoom:
         self.background_color = background_color
         self.buttons = []  # Кнопки для взаимодействия в комнате
         self.objects = []  # Объекты декора в комнате
-        self.font = pygame.font.Font(None, 36)      # Основной шрифт
-        self.small_font = pygame.font.Font(None, 28)  # Мелкий шрифт
+        self.font = get_font(36)      # Основной шрифт
+        self.small_font = get_font(28)  # Мелкий шрифт
 
         # Свойства навигации между комнатами
         self.left_room = None   # Левая соседняя комната
@@ -49,6 +54,10 @@ class BaseRoom:
         # Свойства для управления музыкой
         self.music_playing = False      # Флаг воспроизведения музыки
         self.current_music_file = None  # Текущий файл музыки
+
+        # Статический слой: фон и неподвижный декор, запечённые в одну поверхность
+        self._static_layer = None
+        self._static_layer_key = None
         
         # Инициализация микшера PyGame, если еще не инициализирован
         if not pygame.mixer.get_init():
@@ -98,19 +107,14 @@ class BaseRoom:
             tamagotchi: Объект тамагочи для отображения в комнате
             
         Порядок отрисовки:
-        1. Фон комнаты
-        2. Заголовок комнаты
-        3. Объекты комнаты (фон)
-        4. Тамагочи (передний план)
-        5. Кнопки взаимодействия
-        6. Стрелки навигации
+        1. Статический слой: фон, заголовок и декор комнаты
+        2. Объекты комнаты (фон)
+        3. Тамагочи (передний план)
+        4. Кнопки взаимодействия
+        5. Стрелки навигации
         """
-        # Заливаем фон комнаты
-        screen.fill(self.background_color)
-
-        # Отрисовываем заголовок комнаты
-        title = self.font.render(f"{self.name}", True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
+        # Фон, заголовок и декор комнаты (статический слой)
+        self.draw_static_layer(screen, self.background_color)
 
         # Отрисовываем объекты комнаты (позади тамагочи)
         for obj in self.objects:
@@ -127,6 +131,158 @@ class BaseRoom:
         # Отрисовываем стрелки навигации
         self.draw_navigation_arrows(screen)
 
+    def get_scaled_background(self, size):
+        """Возвращает фоновое изображение комнаты, отмасштабированное под размер.
+        
+        Отдельно отмасштабированный фон не хранится: он запекается в
+        статический слой, и масштабирование повторяется только при его пересборке.
+        
+        Аргументы:
+            size: Целевой размер (ширина, высота)
+            
+        Возвращает:
+            pygame.Surface или None: Отмасштабированный фон или None, если у комнаты нет изображения
+        """
+        image = getattr(self, 'background_image', None)
+        if image is None:
+            return None
+        return pygame.transform.scale(image, tuple(size))
+
+    def draw_background(self, screen, fallback_color):
+        """Отрисовывает фон комнаты: отмасштабированное изображение или заливку цветом.
+        
+        Аргументы:
+            screen: Поверхность PyGame для отрисовки
+            fallback_color: Цвет заливки, если нет ни изображения, ни цвета фона
+        """
+        scaled_bg = self.get_scaled_background(screen.get_size())
+        if scaled_bg is not None:
+            screen.blit(scaled_bg, (0, 0))
+        elif getattr(self, 'background_color', None):
+            # Используем цветной фон
+            screen.fill(self.background_color)
+        else:
+            # Запасной вариант
+            screen.fill(fallback_color)
+
+    def draw_title(self, surface):
+        """Рисует название комнаты по центру верхней части экрана.
+        
+        Аргументы:
+            surface: Поверхность для отрисовки
+        """
+        title = render_text(self.font, f"{self.name}", True, WHITE)
+        surface.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
+
+    def draw_static_decor(self, surface):
+        """Рисует неподвижный декор комнаты на статический слой.
+        
+        Аргументы:
+            surface: Поверхность статического слоя
+            
+        Примечание:
+            Переопределяется в дочерних классах. Вызывается только при
+            пересборке слоя, поэтому здесь нельзя рисовать то, что зависит
+            от времени или состояния тамагочи.
+        """
+        pass
+
+    def get_static_layer(self, size, fallback_color):
+        """Возвращает статический слой комнаты, собирая его при необходимости.
+        
+        Слой содержит фон, заголовок и неподвижный декор и пересобирается
+        только при изменении размера экрана или фона.
+        
+        Аргументы:
+            size: Размер экрана (ширина, высота)
+            fallback_color: Цвет заливки, если нет ни изображения, ни цвета фона
+            
+        Возвращает:
+            pygame.Surface: Поверхность с фоном и статическим декором
+        """
+        size = tuple(size)
+        key = (size, getattr(self, 'background_image', None),
+               getattr(self, 'background_color', None), fallback_color)
+        if self._static_layer is None or self._static_layer_key != key:
+            layer = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                # Формат экрана ускоряет blit
+                layer = layer.convert()
+            self.draw_background(layer, fallback_color)
+            self.draw_title(layer)
+            self.draw_static_decor(layer)
+            self._static_layer = layer
+            self._static_layer_key = key
+            BaseRoom.static_layer_stats["builds"] += 1
+        return self._static_layer
+
+    def draw_static_layer(self, screen, fallback_color):
+        """Отрисовывает фон, заголовок и статический декор комнаты одним blit.
+        
+        Аргументы:
+            screen: Поверхность PyGame для отрисовки
+            fallback_color: Цвет заливки, если нет ни изображения, ни цвета фона
+        """
+        screen.blit(self.get_static_layer(screen.get_size(), fallback_color), (0, 0))
+
+    def invalidate_static_layer(self):
+        """Сбрасывает статический слой (например, после смены декора)."""
+        self._static_layer = None
+        self._static_layer_key = None
+
+    def is_animating(self):
+        """Проверяет, идёт ли в комнате анимация или перетаскивание.
+        
+        Возвращает:
+            bool: True, если комнате нужна полная частота кадров
+            
+        Примечание:
+            Переопределяется в комнатах с анимациями.
+        """
+        return False
+
+    def get_dirty_state(self, tamagotchi):
+        """Возвращает состояние, от которого зависит вся комната целиком.
+        
+        Панели комнат выводят показатели тамагочи, поэтому при их изменении
+        комната перерисовывается полностью. Дочерние классы могут дополнять
+        состояние своими полями.
+        
+        Аргументы:
+            tamagotchi: Объект тамагочи или None
+            
+        Возвращает:
+            tuple: Хешируемое описание состояния
+        """
+        if not tamagotchi:
+            return None
+        data = tamagotchi.data
+        return (data.hunger, data.happiness, data.energy, data.cleanliness,
+                data.health, data.coins, data.evolution_stage, tamagotchi.is_sleeping)
+
+    def report_dirty(self, tracker, screen_rect, tamagotchi):
+        """Сообщает трекеру изменившихся областей состояние комнаты.
+        
+        Аргументы:
+            tracker: Объект DirtyRectTracker
+            screen_rect: Прямоугольник всего экрана
+            tamagotchi: Объект тамагочи или None
+        """
+        tracker.track(('room', id(self)), screen_rect, self.get_dirty_state(tamagotchi))
+
+        for button in self.buttons:
+            button.report_dirty(tracker)
+
+        # Стрелки вместе с областью подсказки над ними
+        for side, arrow in (('left', self.left_arrow), ('right', self.right_arrow)):
+            if arrow:
+                rect = arrow['rect']
+                hint_area = pygame.Rect(rect.centerx - 120, rect.top - 45, 240, rect.height + 47)
+                tracker.track(('arrow', id(self), side), hint_area, arrow.get('hovered', False))
+
+        if tamagotchi and hasattr(tamagotchi, 'report_dirty'):
+            tamagotchi.report_dirty(tracker)
+
     def draw_navigation_arrows(self, screen):
         """Отрисовывает левую и правую стрелки навигации.
         
@@ -153,15 +309,15 @@ class BaseRoom:
             pygame.draw.rect(screen, BLACK, arrow['rect'], 2, border_radius=10)
 
             # Отрисовка символа стрелки "←"
-            arrow_font = pygame.font.Font(None, 48)
-            arrow_text = arrow_font.render("←", True, BLACK)
+            arrow_font = get_font(48)
+            arrow_text = render_text(arrow_font, "←", True, BLACK)
             text_rect = arrow_text.get_rect(center=arrow['rect'].center)
             screen.blit(arrow_text, text_rect)
 
             # Отрисовка подсказки с названием комнаты при наведении
             if arrow.get('hovered', False) and self.left_room:
-                hint_font = pygame.font.Font(None, 24)
-                hint_text = hint_font.render(self.left_room.name, True, WHITE)
+                hint_font = get_font(24)
+                hint_text = render_text(hint_font, self.left_room.name, True, WHITE)
                 hint_rect = hint_text.get_rect(
                     midbottom=(arrow['rect'].centerx, arrow['rect'].top - 8)
                 )
@@ -183,14 +339,14 @@ class BaseRoom:
 
             pygame.draw.rect(screen, BLACK, arrow['rect'], 2, border_radius=10)
 
-            arrow_font = pygame.font.Font(None, 48)
-            arrow_text = arrow_font.render("→", True, BLACK)
+            arrow_font = get_font(48)
+            arrow_text = render_text(arrow_font, "→", True, BLACK)
             text_rect = arrow_text.get_rect(center=arrow['rect'].center)
             screen.blit(arrow_text, text_rect)
 
             if arrow.get('hovered', False) and self.right_room:
-                hint_font = pygame.font.Font(None, 24)
-                hint_text = hint_font.render(self.right_room.name, True, WHITE)
+                hint_font = get_font(24)
+                hint_text = render_text(hint_font, self.right_room.name, True, WHITE)
                 hint_rect = hint_text.get_rect(
                     midbottom=(arrow['rect'].centerx, arrow['rect'].top - 8)
                 )
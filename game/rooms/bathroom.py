@@ -3,6 +3,8 @@ import os
 from .base_room import BaseRoom
 from entities.buttons import Button
 from config import *
+from utils.fonts import get_font
+from game.simulation import EVENT_CLEAN
 
 
 class Bathroom(BaseRoom):
@@ -40,8 +42,8 @@ class Bathroom(BaseRoom):
         
         # Инициализируем атрибуты ванной комнаты
         self.objects = [] if not hasattr(self, 'objects') else self.objects
-        self.font = pygame.font.Font(None, 36) if not hasattr(self, 'font') else self.font
-        self.small_font = pygame.font.Font(None, 24) if not hasattr(self, 'small_font') else self.small_font
+        self.font = get_font(36) if not hasattr(self, 'font') else self.font
+        self.small_font = get_font(24) if not hasattr(self, 'small_font') else self.small_font
         
         # Механика мытья
         self.holding_soap = False
@@ -64,30 +66,13 @@ class Bathroom(BaseRoom):
 
     def draw(self, screen, tamagotchi):
         """Отрисовывает ванную комнату."""
-        # Рисуем фон
-        if self.background_image:
-            # Масштабируем изображение под размер экрана
-            scaled_bg = pygame.transform.scale(self.background_image, screen.get_size())
-            screen.blit(scaled_bg, (0, 0))
-        elif hasattr(self, 'background_color') and self.background_color:
-            # Используем цветной фон
-            screen.fill(self.background_color)
-        else:
-            # Запасной вариант
-            screen.fill((150, 200, 220))
+        # Рисуем статический слой (фон, заголовок и декор запекаются в поверхность один раз)
+        self.draw_static_layer(screen, (150, 200, 220))
         
-        # Заголовок комнаты
-        title = self.font.render(f"{self.name}", True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
-
         # Отрисовываем объекты комнаты
         if hasattr(self, 'objects'):
             for obj in self.objects:
                 obj.draw(screen)
-
-        # Если нет фонового изображения, рисуем сантехнику
-        if not self.background_image:
-            self.draw_bathroom_fixtures(screen)
         
         # Отрисовываем интерактивные элементы
         self.draw_interactive_elements(screen)
@@ -124,6 +109,11 @@ class Bathroom(BaseRoom):
         # Отрисовываем стрелки навигации
         self.draw_navigation_arrows(screen)
 
+    def draw_static_decor(self, surface):
+        """Запекает сантехнику в статический слой (если нет фонового изображения)."""
+        if not self.background_image:
+            self.draw_bathroom_fixtures(surface)
+
     def draw_bathroom_fixtures(self, screen):
         """Рисует сантехнику ванной комнаты (используется если нет фонового изображения)."""
         # Ванна
@@ -202,6 +192,39 @@ class Bathroom(BaseRoom):
                 pygame.draw.rect(screen, tile_color, (x, y, 60, 50))
                 pygame.draw.rect(screen, (140, 160, 180), (x, y, 60, 50), 1)
 
+    def is_animating(self):
+        """Мыло или вода перетаскиваются, либо на тамагочи тает пена."""
+        return self.holding_soap or self.holding_water or bool(self.foam_particles)
+
+    def report_dirty(self, tracker, screen_rect, tamagotchi):
+        """Сообщает трекеру изменившихся областей мыло, воду и пену."""
+        super().report_dirty(tracker, screen_rect, tamagotchi)
+
+        # Падающая капля меняется в первой половине каждой секунды
+        drop_time = pygame.time.get_ticks() % 1000 / 1000
+        drop_state = int(drop_time * 10) if drop_time < 0.5 else None
+
+        # Взятые вода и мыло следуют за курсором (пока курсор не сдвинулся, их не видно)
+        water_pos = self.water_pos if self.holding_water else self.sink_pos
+        if water_pos:
+            water_x, water_y = water_pos
+            tracker.track(('water', id(self)), self.drop_rect(water_x, water_y), (water_x, water_y, drop_state))
+
+        soap_pos = self.soap_pos if self.holding_soap else self.soap_original_pos
+        if soap_pos:
+            soap_x, soap_y = soap_pos
+            tracker.track(('soap', id(self)), pygame.Rect(soap_x - 14, soap_y - 10, 28, 26), soap_pos)
+
+        # Пена живёт вокруг тамагочи и тает каждый кадр
+        if self.foam_particles:
+            foam_area = pygame.Rect(SCREEN_WIDTH // 2 - 50, SCREEN_HEIGHT // 2 - 50, 100, 100)
+            foam_state = tuple(tuple(foam) for foam in self.foam_particles)
+            tracker.track(('foam', id(self)), foam_area, foam_state)
+
+    def drop_rect(self, x, y):
+        """Возвращает область, которую занимает капля воды с анимацией падения."""
+        return pygame.Rect(int(x) - 9, int(y) - 9, 18, 28)
+
     def draw_interactive_elements(self, screen):
         """Рисует интерактивные элементы (мыло, воду)."""
         # Отрисовываем каплю воды на раковине, если вода не взята
@@ -338,6 +361,9 @@ class Bathroom(BaseRoom):
                     # Увеличение чистоты
                     if tamagotchi.data.cleanliness < 100:
                         tamagotchi.data.cleanliness = min(100, tamagotchi.data.cleanliness + 0.5)
+                        # Мытьё закончено - событие для журнала
+                        if tamagotchi.data.cleanliness >= 100 and hasattr(game_core, 'record_event'):
+                            game_core.record_event(EVENT_CLEAN)
                         # Автосохранение при мытье
                         if int(tamagotchi.data.cleanliness) % 20 == 0:
                             if hasattr(game_core, 'auto_save'):
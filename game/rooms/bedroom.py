@@ -3,6 +3,7 @@ import os
 from .base_room import BaseRoom
 from entities.buttons import Button
 from config import *
+from utils.fonts import get_font
 
 
 class Bedroom(BaseRoom):
@@ -39,8 +40,8 @@ class Bedroom(BaseRoom):
         
         # Инициализируем атрибуты спальни
         self.objects = [] if not hasattr(self, 'objects') else self.objects
-        self.font = pygame.font.Font(None, 36) if not hasattr(self, 'font') else self.font
-        self.small_font = pygame.font.Font(None, 24) if not hasattr(self, 'small_font') else self.small_font
+        self.font = get_font(36) if not hasattr(self, 'font') else self.font
+        self.small_font = get_font(24) if not hasattr(self, 'small_font') else self.small_font
         
         # Настраиваем комнату
         self.setup()
@@ -54,30 +55,17 @@ class Bedroom(BaseRoom):
 
     def draw(self, screen, tamagotchi):
         """Отрисовывает спальню."""
-        # Рисуем фон
-        if self.background_image:
-            # Масштабируем изображение под размер экрана
-            scaled_bg = pygame.transform.scale(self.background_image, screen.get_size())
-            screen.blit(scaled_bg, (0, 0))
-        elif hasattr(self, 'background_color') and self.background_color:
-            # Используем цветной фон
-            screen.fill(self.background_color)
-        else:
-            # Запасной вариант
-            screen.fill((100, 100, 150))
-        
-        # Заголовок комнаты
-        title = self.font.render(f"{self.name}", True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
+        # Рисуем статический слой (фон, заголовок и декор запекаются в поверхность один раз)
+        self.draw_static_layer(screen, (100, 100, 150))
         
         # Отрисовываем объекты комнаты
         if hasattr(self, 'objects'):
             for obj in self.objects:
                 obj.draw(screen)
 
-        # Если нет фонового изображения, рисуем мебель
+        # Если нет фонового изображения, рисуем стрелки часов и вид из окна
         if not self.background_image:
-            self.draw_bedroom_furniture(screen, tamagotchi)
+            self.draw_bedroom_dynamic(screen, tamagotchi)
         
         # Отрисовываем статус энергии
         if tamagotchi:
@@ -94,8 +82,17 @@ class Bedroom(BaseRoom):
         # Отрисовываем стрелки навигации
         self.draw_navigation_arrows(screen)
 
-    def draw_bedroom_furniture(self, screen, tamagotchi):
-        """Рисует мебель спальни (используется если нет фонового изображения)."""
+    def draw_static_decor(self, surface):
+        """Запекает мебель спальни в статический слой (если нет фонового изображения)."""
+        if not self.background_image:
+            self.draw_bedroom_furniture(surface)
+
+    def draw_bedroom_furniture(self, screen):
+        """Рисует неподвижную мебель спальни (используется если нет фонового изображения).
+
+        Стрелки часов и вид из окна зависят от сна тамагочи и рисуются
+        в draw_bedroom_dynamic.
+        """
         # Кровать
         pygame.draw.rect(screen, (139, 69, 19), (200, 200, 300, 150), border_radius=10)
         pygame.draw.rect(screen, (255, 255, 255), (210, 210, 280, 130), border_radius=10)
@@ -122,6 +119,35 @@ class Bedroom(BaseRoom):
             y = 280 + 15 * pygame.math.Vector2(1, 0).rotate(i * 30).y
             pygame.draw.circle(screen, BLACK, (int(x), int(y)), 1)
         
+        # Окно
+        pygame.draw.rect(screen, (50, 50, 100), (500, 150, 150, 100))
+        pygame.draw.rect(screen, (100, 100, 150), (500, 150, 150, 100), 5)
+        pygame.draw.line(screen, (100, 100, 150), (575, 150), (575, 250), 3)
+        pygame.draw.line(screen, (100, 100, 150), (500, 200), (650, 200), 3)
+
+        # Коврик рядом с кроватью
+        pygame.draw.ellipse(screen, (150, 100, 50), (350, 350, 100, 60))
+        pygame.draw.ellipse(screen, (170, 120, 70), (350, 350, 100, 60), 3)
+        
+        # Узор на коврике
+        pygame.draw.circle(screen, (130, 80, 40), (375, 375), 8)
+        pygame.draw.circle(screen, (130, 80, 40), (425, 375), 8)
+
+        # Шкаф
+        pygame.draw.rect(screen, (120, 80, 40), (650, 200, 100, 150))
+        pygame.draw.rect(screen, (100, 60, 20), (650, 200, 100, 150), 3)
+        
+        # Ручки шкафа
+        pygame.draw.circle(screen, (200, 200, 200), (700, 250), 5)
+        pygame.draw.circle(screen, (200, 200, 200), (700, 300), 5)
+
+    def draw_bedroom_dynamic(self, screen, tamagotchi):
+        """Рисует стрелки часов и вид из окна поверх статического слоя.
+        
+        Аргументы:
+            screen: Поверхность PyGame для отрисовки
+            tamagotchi: Объект тамагочи (день или ночь зависит от сна)
+        """
         # Стрелки часов
         if tamagotchi:
             # Время зависит от состояния тамагочи
@@ -144,12 +170,6 @@ class Bedroom(BaseRoom):
             minute_y = 280 + 12 * pygame.math.Vector2(1, 0).rotate(minute_angle).y
             pygame.draw.line(screen, BLACK, (180, 280), (minute_x, minute_y), 2)
 
-        # Окно
-        pygame.draw.rect(screen, (50, 50, 100), (500, 150, 150, 100))
-        pygame.draw.rect(screen, (100, 100, 150), (500, 150, 150, 100), 5)
-        pygame.draw.line(screen, (100, 100, 150), (575, 150), (575, 250), 3)
-        pygame.draw.line(screen, (100, 100, 150), (500, 200), (650, 200), 3)
-
         # Вид из окна
         if tamagotchi and tamagotchi.is_sleeping:
             # Ночной вид
@@ -171,22 +191,6 @@ class Bedroom(BaseRoom):
             pygame.draw.ellipse(screen, WHITE, (540, 165, 35, 25))
             pygame.draw.ellipse(screen, WHITE, (560, 175, 45, 18))
 
-        # Коврик рядом с кроватью
-        pygame.draw.ellipse(screen, (150, 100, 50), (350, 350, 100, 60))
-        pygame.draw.ellipse(screen, (170, 120, 70), (350, 350, 100, 60), 3)
-        
-        # Узор на коврике
-        pygame.draw.circle(screen, (130, 80, 40), (375, 375), 8)
-        pygame.draw.circle(screen, (130, 80, 40), (425, 375), 8)
-
-        # Шкаф
-        pygame.draw.rect(screen, (120, 80, 40), (650, 200, 100, 150))
-        pygame.draw.rect(screen, (100, 60, 20), (650, 200, 100, 150), 3)
-        
-        # Ручки шкафа
-        pygame.draw.circle(screen, (200, 200, 200), (700, 250), 5)
-        pygame.draw.circle(screen, (200, 200, 200), (700, 300), 5)
-
     def draw_energy_status(self, screen, tamagotchi):
         """Рисует информацию об энергии тамагочи."""
         # Фон для статуса
@@ -3,6 +3,7 @@ import os
 from .base_room import BaseRoom
 from entities.buttons import Button
 from config import *
+from utils.fonts import get_font
 
 
 class Hall(BaseRoom):
@@ -40,8 +41,8 @@ class Hall(BaseRoom):
         
         # Инициализируем атрибуты главного зала
         self.objects = [] if not hasattr(self, 'objects') else self.objects
-        self.font = pygame.font.Font(None, 36) if not hasattr(self, 'font') else self.font
-        self.small_font = pygame.font.Font(None, 24) if not hasattr(self, 'small_font') else self.small_font
+        self.font = get_font(36) if not hasattr(self, 'font') else self.font
+        self.small_font = get_font(24) if not hasattr(self, 'small_font') else self.small_font
         
         # Настраиваем комнату
         self.setup()
@@ -58,30 +59,13 @@ class Hall(BaseRoom):
 
     def draw(self, screen, tamagotchi):
         """Отрисовывает главный зал."""
-        # Рисуем фон
-        if self.background_image:
-            # Масштабируем изображение под размер экрана
-            scaled_bg = pygame.transform.scale(self.background_image, screen.get_size())
-            screen.blit(scaled_bg, (0, 0))
-        elif hasattr(self, 'background_color') and self.background_color:
-            # Используем цветной фон
-            screen.fill(self.background_color)
-        else:
-            # Запасной вариант
-            screen.fill((180, 160, 140))
+        # Рисуем статический слой (фон, заголовок и декор запекаются в поверхность один раз)
+        self.draw_static_layer(screen, (180, 160, 140))
         
-        # Заголовок комнаты
-        title = self.font.render(f"{self.name}", True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
-
         # Отрисовываем объекты комнаты
         if hasattr(self, 'objects'):
             for obj in self.objects:
                 obj.draw(screen)
-
-        # Если нет фонового изображения, рисуем декоративные элементы
-        if not self.background_image:
-            self.draw_hall_decorations(screen)
         
         # Информационные тексты
         
@@ -97,6 +81,11 @@ class Hall(BaseRoom):
         # Отрисовываем стрелки навигации
         self.draw_navigation_arrows(screen)
 
+    def draw_static_decor(self, surface):
+        """Запекает декоративные элементы зала в статический слой (если нет фонового изображения)."""
+        if not self.background_image:
+            self.draw_hall_decorations(surface)
+
     def draw_hall_decorations(self, screen):
         """Рисует декоративные элементы главного зала (используется если нет фонового изображения)."""
         # Мраморный пол с узором
@@ -197,7 +186,7 @@ class Hall(BaseRoom):
     def draw_info_texts(self, screen):
         """Рисует информационные тексты в главном зале."""
         # Приветственное сообщение
-        welcome_font = pygame.font.Font(None, 32)
+        welcome_font = get_font(32)
         welcome_text = welcome_font.render("Добро пожаловать в дом Тамагочи!", True, WHITE)
         
         # Фон для текста
@@ -209,7 +198,7 @@ class Hall(BaseRoom):
         screen.blit(welcome_text, (SCREEN_WIDTH // 2 - welcome_text.get_width() // 2, 400))
 
         # Подсказка по навигации
-        hint_font = pygame.font.Font(None, 24)
+        hint_font = get_font(24)
         hint_text = hint_font.render("Используйте стрелки по бокам для навигации по комнатам", True, WHITE)
         
         # Фон для подсказки
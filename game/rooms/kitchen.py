@@ -3,6 +3,7 @@ import os
 from .base_room import BaseRoom
 from entities.buttons import Button
 from config import *
+from utils.fonts import get_font
 
 
 class Kitchen(BaseRoom):
@@ -40,8 +41,8 @@ class Kitchen(BaseRoom):
         
         # Инициализируем атрибуты кухни
         self.objects = [] if not hasattr(self, 'objects') else self.objects
-        self.font = pygame.font.Font(None, 36) if not hasattr(self, 'font') else self.font
-        self.small_font = pygame.font.Font(None, 24) if not hasattr(self, 'small_font') else self.small_font
+        self.font = get_font(36) if not hasattr(self, 'font') else self.font
+        self.small_font = get_font(24) if not hasattr(self, 'small_font') else self.small_font
         
         # Флаги для обучающих текстов и шкалы голода
         self.show_hunger_text = True
@@ -69,30 +70,13 @@ class Kitchen(BaseRoom):
 
     def draw(self, screen, tamagotchi):
         """Отрисовывает кухню."""
-        # Рисуем фон
-        if self.background_image:
-            # Масштабируем изображение под размер экрана
-            scaled_bg = pygame.transform.scale(self.background_image, screen.get_size())
-            screen.blit(scaled_bg, (0, 0))
-        elif hasattr(self, 'background_color') and self.background_color:
-            # Используем цветной фон
-            screen.fill(self.background_color)
-        else:
-            # Запасной вариант
-            screen.fill((200, 180, 150))
+        # Рисуем статический слой (фон, заголовок и декор запекаются в поверхность один раз)
+        self.draw_static_layer(screen, (200, 180, 150))
         
-        # Заголовок комнаты
-        title = self.font.render(f"{self.name}", True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
-
         # Отрисовываем объекты комнаты
         if hasattr(self, 'objects'):
             for obj in self.objects:
                 obj.draw(screen)
-
-        # Если нет фонового изображения, рисуем кухонную мебель
-        if not self.background_image:
-            self.draw_kitchen_furniture(screen)
         
         # Отрисовываем предметы еды
         self.draw_food_items(screen)
@@ -112,6 +96,19 @@ class Kitchen(BaseRoom):
         # Отрисовываем стрелки навигации
         self.draw_navigation_arrows(screen)
 
+    def draw_static_decor(self, surface):
+        """Запекает кухонную мебель в статический слой (если нет фонового изображения)."""
+        if not self.background_image:
+            self.draw_kitchen_furniture(surface)
+
+    def report_dirty(self, tracker, screen_rect, tamagotchi):
+        """Сообщает трекеру изменившихся областей временную шкалу голода."""
+        super().report_dirty(tracker, screen_rect, tamagotchi)
+
+        bar_visible = bool(self.hunger_bar_timer) and \
+            pygame.time.get_ticks() - self.hunger_bar_timer < self.hunger_bar_duration
+        tracker.track(('hunger_bar', id(self)), pygame.Rect(0, 265, 360, 35), bar_visible)
+
     def draw_kitchen_furniture(self, screen):
         """Рисует кухонную мебель (используется если нет фонового изображения)."""
         # Кухонный гарнитур
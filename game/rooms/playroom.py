@@ -3,6 +3,7 @@ import os
 from .base_room import BaseRoom
 from entities.buttons import Button
 from config import *
+from utils.fonts import get_font
 
 
 class Playroom(BaseRoom):
@@ -40,8 +41,8 @@ class Playroom(BaseRoom):
         
         # Инициализируем атрибуты игровой комнаты
         self.objects = [] if not hasattr(self, 'objects') else self.objects
-        self.font = pygame.font.Font(None, 36) if not hasattr(self, 'font') else self.font
-        self.small_font = pygame.font.Font(None, 24) if not hasattr(self, 'small_font') else self.small_font
+        self.font = get_font(36) if not hasattr(self, 'font') else self.font
+        self.small_font = get_font(24) if not hasattr(self, 'small_font') else self.small_font
         
         # Настраиваем комнату
         self.setup()
@@ -56,30 +57,13 @@ class Playroom(BaseRoom):
 
     def draw(self, screen, tamagotchi):
         """Отрисовывает игровую комнату."""
-        # Рисуем фон
-        if self.background_image:
-            # Масштабируем изображение под размер экрана
-            scaled_bg = pygame.transform.scale(self.background_image, screen.get_size())
-            screen.blit(scaled_bg, (0, 0))
-        elif hasattr(self, 'background_color') and self.background_color:
-            # Используем цветной фон
-            screen.fill(self.background_color)
-        else:
-            # Запасной вариант
-            screen.fill((150, 200, 100))
-        
-        # Заголовок комнаты
-        title = self.font.render(f"{self.name}", True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
+        # Рисуем статический слой (фон, заголовок и декор запекаются в поверхность один раз)
+        self.draw_static_layer(screen, (150, 200, 100))
         
         # Отрисовываем объекты комнаты
         if hasattr(self, 'objects'):
             for obj in self.objects:
                 obj.draw(screen)
-
-        # Если нет фонового изображения, рисуем игровые предметы
-        if not self.background_image:
-            self.draw_playroom_objects(screen)
         
         # Отрисовываем статус счастья
         if tamagotchi:
@@ -96,6 +80,11 @@ class Playroom(BaseRoom):
         # Отрисовываем стрелки навигации
         self.draw_navigation_arrows(screen)
 
+    def draw_static_decor(self, surface):
+        """Запекает игровые предметы в статический слой (если нет фонового изображения)."""
+        if not self.background_image:
+            self.draw_playroom_objects(surface)
+
     def draw_playroom_objects(self, screen):
         """Рисует игровые предметы (используется если нет фонового изображения)."""
         # Ящик с игрушками
@@ -4,6 +4,8 @@ import math
 from .base_room import BaseRoom
 from entities.buttons import Button
 from config import *
+from utils.fonts import get_font
+from game.simulation import EVENT_PURCHASE
 
 
 class ShopRoom(BaseRoom):
@@ -70,8 +72,8 @@ class ShopRoom(BaseRoom):
         self.buttons = []
         self.selected_item = None
         self.objects = [] if not hasattr(self, 'objects') else self.objects
-        self.font = pygame.font.Font(None, 36) if not hasattr(self, 'font') else self.font
-        self.small_font = pygame.font.Font(None, 24) if not hasattr(self, 'small_font') else self.small_font
+        self.font = get_font(36) if not hasattr(self, 'font') else self.font
+        self.small_font = get_font(24) if not hasattr(self, 'small_font') else self.small_font
         
         # Параметры для продавца
         self.seller_x = 150
@@ -142,30 +144,14 @@ class ShopRoom(BaseRoom):
         if not hasattr(self, 'selected_item'):
             self.selected_item = None
         
-        # Рисуем фон
-        if self.background_image:
-            # Масштабируем изображение под размер экрана
-            scaled_bg = pygame.transform.scale(self.background_image, screen.get_size())
-            screen.blit(scaled_bg, (0, 0))
-        elif hasattr(self, 'background_color') and self.background_color:
-            # Используем цветной фон
-            screen.fill(self.background_color)
-        else:
-            # Запасной вариант - черный фон
-            screen.fill((0, 0, 0))
-        
-        # Заголовок комнаты
-        title = self.font.render(f"{self.name}", True, WHITE)
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
+        # Рисуем статический слой (фон, заголовок и полки запекаются в поверхность один раз)
+        self.draw_static_layer(screen, (0, 0, 0))
         
         # Отрисовываем объекты комнаты
         if hasattr(self, 'objects'):
             for obj in self.objects:
                 obj.draw(screen)
 
-        # Отрисовываем полки магазина
-        self.draw_shelves(screen)
-        
         # Отрисовываем товары на полках
         self.draw_items(screen)
         
@@ -193,6 +179,44 @@ class ShopRoom(BaseRoom):
         # Отрисовываем стрелки навигации
         self.draw_navigation_arrows(screen)
 
+    def update(self, tamagotchi):
+        """Обновляет таймер смены реплик продавца.
+        
+        Таймер считается по тикам игрового цикла, а не по кадрам отрисовки:
+        в режиме dirty rects комната рисуется не каждый тик.
+        """
+        self.speech_timer += 1
+        if self.speech_timer > 180:  # Меняем реплику каждые 3 секунды (при 60 FPS)
+            self.speech_timer = 0
+            self.current_speech = (self.current_speech + 1) % len(self.speeches)
+
+    def is_animating(self):
+        """Продавец в магазине постоянно "дышит"."""
+        return True
+
+    def get_dirty_state(self, tamagotchi):
+        """Дополняет состояние комнаты выбранным товаром."""
+        return (super().get_dirty_state(tamagotchi), self.selected_item and self.selected_item["name"])
+
+    def report_dirty(self, tracker, screen_rect, tamagotchi):
+        """Сообщает трекеру изменившихся областей продавца и облачко речи."""
+        super().report_dirty(tracker, screen_rect, tamagotchi)
+
+        # Продавец постоянно "дышит", поэтому его область обновляется почти каждый кадр
+        y_offset = math.sin(pygame.time.get_ticks() * 0.003) * 2
+        seller_area = pygame.Rect(self.seller_x - max(self.seller_width // 2, 30) - 2,
+                                  self.seller_y - max(self.seller_height // 2, 45) - 4,
+                                  max(self.seller_width, 60) + 4,
+                                  max(self.seller_height, 90) + 40)
+        tracker.track(('seller', id(self)), seller_area, y_offset)
+
+        bubble_area = pygame.Rect(self.seller_x + 48, self.seller_y - 52, 204, 64)
+        tracker.track(('speech', id(self)), bubble_area, self.current_speech)
+
+    def draw_static_decor(self, surface):
+        """Запекает полки магазина в статический слой."""
+        self.draw_shelves(surface)
+
     def draw_shelves(self, screen):
         """Рисует полки магазина."""
         # Основная полка
@@ -236,11 +260,12 @@ class ShopRoom(BaseRoom):
         """Отрисовывает продавца из PNG изображения."""
         
         if self.seller_image is not None:
-            # Масштабируем изображение если нужно
-            scaled_seller = pygame.transform.scale(
-                self.seller_image, 
-                (self.seller_width, self.seller_height)
-            )
+            # Масштабируем изображение один раз и переиспользуем результат
+            seller_size = (self.seller_width, self.seller_height)
+            if getattr(self, '_scaled_seller_key', None) != (self.seller_image, seller_size):
+                self._scaled_seller = pygame.transform.scale(self.seller_image, seller_size)
+                self._scaled_seller_key = (self.seller_image, seller_size)
+            scaled_seller = self._scaled_seller
             
             # Позиционируем продавца с легкой анимацией дыхания
             y_offset = math.sin(pygame.time.get_ticks() * 0.003) * 2
@@ -273,12 +298,6 @@ class ShopRoom(BaseRoom):
 
     def draw_speech_bubble(self, screen):
         """Рисует облачко с репликой продавца."""
-        # Обновляем таймер для смены реплик
-        self.speech_timer += 1
-        if self.speech_timer > 180:  # Меняем реплику каждые 3 секунды (при 60 FPS)
-            self.speech_timer = 0
-            self.current_speech = (self.current_speech + 1) % len(self.speeches)
-        
         # Позиция облачка
         bubble_x = self.seller_x + 60  # Смещаем влево
         bubble_y = self.seller_y - 50 
@@ -298,7 +317,7 @@ class ShopRoom(BaseRoom):
         pygame.draw.polygon(screen, (100, 100, 100), tail_points, 2)  # Серая обводка
         
         # Текст реплики
-        speech_font = pygame.font.Font(None, 20)
+        speech_font = get_font(20)
         speech_text = speech_font.render(self.speeches[self.current_speech], True, (0, 0, 0))
         text_rect = speech_text.get_rect(center=(bubble_x + 90, bubble_y + 30))
         screen.blit(speech_text, text_rect)
@@ -316,7 +335,7 @@ class ShopRoom(BaseRoom):
         # Иконка монеты
         pygame.draw.circle(screen, (255, 215, 0), (60, 65), 12)  # Золотой
         pygame.draw.circle(screen, (255, 255, 0), (60, 65), 12, 2)  # Желтая обводка
-        coin_font = pygame.font.Font(None, 18)
+        coin_font = get_font(18)
         coin_symbol = coin_font.render("$", True, BLACK)
         screen.blit(coin_symbol, (56, 59))
 
@@ -390,6 +409,8 @@ class ShopRoom(BaseRoom):
                             tamagotchi.data.energy = min(100, tamagotchi.data.energy + effect)
 
                         game_core.show_message(f"Куплено: {self.selected_item['name']}!")
+                        game_core.record_event(EVENT_PURCHASE, {"item": self.selected_item["name"],
+                                                                "price": self.selected_item["price"]})
                         game_core.auto_save()  # Автосохранение после покупки
                         self.selected_item = None  # Сброс выбранного товара
                     else:
@@ -2,6 +2,7 @@ import pygame
 from entities.buttons import Button
 from entities.items import FoodItem
 from config import *
+from utils.fonts import get_font
 
 
 class Shop:
@@ -62,24 +63,24 @@ class Shop:
         pygame.draw.rect(screen, GOLD, sign_rect, 3, border_radius=10)
         
         # Заголовок магазина
-        font = pygame.font.Font(None, 48)
+        font = get_font(48)
         title = font.render("МАГАЗИН ЕДЫ", True, WHITE)
         screen.blit(title, (sign_rect.centerx - title.get_width() // 2, 
                            sign_rect.centery - title.get_height() // 2))
 
         # Отображение количества монет
-        coins_font = pygame.font.Font(None, 36)
+        coins_font = get_font(36)
         coins_text = coins_font.render(f"Монеты: {coins}", True, YELLOW)
         screen.blit(coins_text, (600, 50))
         
         # Иконка монет
         pygame.draw.circle(screen, GOLD, (580, 65), 15)
-        coin_font = pygame.font.Font(None, 24)
+        coin_font = get_font(24)
         coin_symbol = coin_font.render("$", True, BLACK)
         screen.blit(coin_symbol, (575, 55))
 
         # Информация о свободном месте в инвентаре
-        space_font = pygame.font.Font(None, 32)
+        space_font = get_font(32)
         space_text = space_font.render(
             f"Место в инвентаре: {len(inventory.food_items)}/{inventory.max_items}", 
             True, DARK_GREEN
@@ -105,7 +106,7 @@ class Shop:
             fill_color = RED
         pygame.draw.rect(screen, fill_color, (bar_x, bar_y, fill_width, bar_height))
 
-        small_font = pygame.font.Font(None, 28)
+        small_font = get_font(28)
 
         # Отрисовка товаров и кнопок
         for i, (button, item) in enumerate(self.buttons):
@@ -142,7 +143,7 @@ class Shop:
             screen.blit(afford_text, (afford_bg.x + 5, afford_bg.y))
         
         # Инструкция для игрока
-        instruction_font = pygame.font.Font(None, 24)
+        instruction_font = get_font(24)
         instruction = instruction_font.render("Нажмите на товар, чтобы купить его", True, DARK_GRAY)
         screen.blit(instruction, (SCREEN_WIDTH // 2 - instruction.get_width() // 2, SCREEN_HEIGHT - 40))
         
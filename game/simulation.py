@@ -0,0 +1,434 @@
+"""
+Модуль симуляции жизни тамагочи без pygame.
+
+PetSimulation содержит всю игровую логику питомца: снижение показателей
+со временем, сон и восстановление энергии, пассивные эффекты, эволюцию и
+действия игрока. Время берётся из внедряемых часов (функция, возвращающая
+миллисекунды), поэтому симуляцию можно запускать без дисплея и быстрее
+реального времени:
+
+    clock = ManualClock()
+    simulation = PetSimulation(Tamagotchi(name="Пушок"), clock)
+    simulation.advance(24 * 60 * 60 * 1000)  # сутки жизни за миллисекунды
+
+TamagotchiEntity - тонкая обёртка над симуляцией, которая отвечает
+только за отрисовку и берёт время из pygame.time.get_ticks().
+"""
+
+# Интервалы игровых таймеров (мс). Таймер срабатывает, когда с прошлого
+# срабатывания прошло строго больше интервала.
+DECAY_INTERVAL = 30000           # Снижение показателей
+AGING_GAP = 300000               # Взросление (разрыв между обновлениями)
+ENERGY_REGEN_INTERVAL = 10000    # Восстановление энергии во сне
+SLEEP_BONUS_AFTER = 30000        # Бонус счастья после этого времени сна
+PASSIVE_INTERVAL = 120000        # Пассивные эффекты
+
+# Снижение показателей за одно срабатывание таймера (энергия - только без сна)
+DECAY_AMOUNTS = (("hunger", 5), ("happiness", 3), ("cleanliness", 2), ("energy", 4))
+
+# Штрафы к здоровью: (показатель, порог, штраф, если показатель ниже порога)
+HEALTH_PENALTIES = (("hunger", 20, 2), ("happiness", 20, 2),
+                    ("cleanliness", 20, 1), ("energy", 10, 1))
+
+# Пороги эволюции в днях: ребенок (0+), подросток (7+), взрослый (14+)
+EVOLUTION_THRESHOLDS = [0, 7, 14]
+
+# Типы событий, о которых симуляция и игра сообщают слушателю (журналу событий)
+EVENT_FEED = "feed"
+EVENT_PLAY = "play"
+EVENT_CLEAN = "clean"
+EVENT_SLEEP = "sleep"
+EVENT_WAKE = "wake"
+EVENT_HEAL = "heal"
+EVENT_EVOLVE = "evolve"
+EVENT_DECAY = "decay"
+EVENT_PURCHASE = "purchase"
+EVENT_MINIGAME_REWARD = "minigame_reward"
+
+
+class ManualClock:
+    """Часы, которые идут только по команде (для тестов и ускоренной симуляции).
+
+    Атрибуты:
+        now: Текущее время в миллисекундах
+    """
+
+    def __init__(self, start_ms=0):
+        """Инициализирует часы.
+
+        Аргументы:
+            start_ms: Начальное время в миллисекундах
+        """
+        self.now = start_ms
+
+    def __call__(self):
+        """Возвращает текущее время в миллисекундах."""
+        return self.now
+
+    def advance(self, dt_ms):
+        """Сдвигает часы вперёд.
+
+        Аргументы:
+            dt_ms: Сдвиг в миллисекундах
+        """
+        self.now += dt_ms
+
+    def set(self, now_ms):
+        """Устанавливает текущее время.
+
+        Аргументы:
+            now_ms: Новое время в миллисекундах
+        """
+        self.now = now_ms
+
+
+class PetSimulation:
+    """Игровая логика тамагочи, не зависящая от pygame.
+
+    Атрибуты:
+        data: Объект Tamagotchi с показателями питомца
+        clock: Функция без аргументов, возвращающая время в мс
+        is_sleeping: Спит ли питомец
+        sleep_start_time: Время засыпания
+        last_update_time: Время последнего снижения показателей
+        last_energy_regen: Время последнего восстановления энергии
+        last_passive_update: Время последнего применения пассивных эффектов
+        evolution_thresholds: Пороги эволюции в днях
+        listener: Функция listener(kind, details), вызываемая после каждого
+            события (действия игрока, снижения показателей, эволюции), или None
+    """
+
+    def __init__(self, data, clock=None):
+        """Инициализирует симуляцию.
+
+        Аргументы:
+            data: Объект Tamagotchi с показателями питомца
+            clock: Функция, возвращающая время в мс (по умолчанию ManualClock)
+        """
+        self.data = data
+        self.clock = clock if clock is not None else ManualClock()
+        now = self.clock()
+        self.last_update_time = now
+        self.evolution_thresholds = list(EVOLUTION_THRESHOLDS)
+        self.is_sleeping = False
+        self.sleep_start_time = 0
+        self.last_energy_regen = now
+        self.last_passive_update = 0
+        self.listener = None
+
+    def emit(self, kind, **details):
+        """Сообщает слушателю о событии, уже применённом к показателям.
+
+        Аргументы:
+            kind: Тип события (EVENT_*)
+            **details: Дополнительные данные события
+        """
+        if self.listener is not None:
+            self.listener(kind, details)
+
+    # ------------------------------------------------------------------
+    # Течение времени
+    # ------------------------------------------------------------------
+
+    def update_stats(self, now=None):
+        """Обновляет показатели на основе прошедшего времени.
+
+        Аргументы:
+            now: Текущее время в мс (по умолчанию берётся из часов)
+        """
+        current_time = self.clock() if now is None else now
+        data = self.data
+
+        # Постепенное снижение характеристик (каждые 30 секунд)
+        if current_time - self.last_update_time > DECAY_INTERVAL:
+            for field, amount in DECAY_AMOUNTS:
+                # Энергия не должна снижаться во время сна
+                if field == "energy" and self.is_sleeping:
+                    continue
+                setattr(data, field, max(0, getattr(data, field) - amount))
+
+            # Прогрессия возраста (1 день = 5 минут игрового времени)
+            if current_time - self.last_update_time > AGING_GAP:
+                data.age += 1
+                self.check_evolution()
+
+            # Снижение здоровья на основе низких характеристик
+            health_penalty = sum(penalty for field, threshold, penalty in HEALTH_PENALTIES
+                                 if getattr(data, field) < threshold)
+
+            data.health = max(0, data.health - health_penalty)
+
+            self.last_update_time = current_time
+            self.emit(EVENT_DECAY)
+
+        # Постепенная регенерация энергии во время сна (каждые 10 секунд)
+        if self.is_sleeping and current_time - self.last_energy_regen > ENERGY_REGEN_INTERVAL:
+            if data.energy < 100:
+                data.energy = min(100, data.energy + 15)
+                self.last_energy_regen = current_time
+
+                # Небольшой бонус к счастью от хорошего сна
+                if current_time - self.sleep_start_time > SLEEP_BONUS_AFTER:
+                    data.happiness = min(100, data.happiness + 2)
+
+        # Автоматическое пробуждение при полной энергии
+        if self.is_sleeping and data.energy >= 100:
+            self.is_sleeping = False
+            self.emit(EVENT_WAKE)
+
+    def update_passive_stats(self, now=None):
+        """Применяет пассивные взаимодействия показателей (каждые 2 минуты).
+
+        Аргументы:
+            now: Текущее время в мс (по умолчанию берётся из часов)
+        """
+        current_time = self.clock() if now is None else now
+        data = self.data
+
+        if current_time - self.last_passive_update > PASSIVE_INTERVAL:
+            # Высокая чистота медленно увеличивает счастье
+            if data.cleanliness > 80:
+                data.happiness = min(100, data.happiness + 2)
+            elif data.cleanliness < 30:
+                data.happiness = max(0, data.happiness - 1)
+
+            # Низкий голод быстрее снижает энергию (но не во время сна)
+            if data.hunger < 20 and not self.is_sleeping:
+                data.energy = max(0, data.energy - 2)
+
+            # Высокое счастье дает небольшую регенерацию энергии
+            if data.happiness > 80 and data.energy < 100:
+                data.energy = min(100, data.energy + 1)
+
+            self.last_passive_update = current_time
+
+    def step(self, now=None):
+        """Выполняет один шаг симуляции - то же, что один кадр игрового цикла.
+
+        Аргументы:
+            now: Текущее время в мс (по умолчанию берётся из часов)
+        """
+        current_time = self.clock() if now is None else now
+        self.update_stats(current_time)
+        self.update_passive_stats(current_time)
+
+    def next_event_time(self):
+        """Возвращает ближайший момент, когда сработает какой-либо таймер.
+
+        Возвращает:
+            int: Время в мс
+        """
+        # Таймеры сравниваются строго, поэтому срабатывают через интервал + 1 мс
+        times = [self.last_update_time + DECAY_INTERVAL + 1,
+                 self.last_passive_update + PASSIVE_INTERVAL + 1]
+        if self.is_sleeping:
+            times.append(self.last_energy_regen + ENERGY_REGEN_INTERVAL + 1)
+        return min(times)
+
+    def advance(self, dt_ms):
+        """Прокручивает симуляцию вперёд, как если бы игра работала без перерыва.
+
+        Вместо покадрового цикла симуляция переходит от одного срабатывания
+        таймера к следующему, поэтому дни жизни питомца считаются за
+        миллисекунды. Результат совпадает с непрерывным игровым циклом.
+
+        Аргументы:
+            dt_ms: Время в миллисекундах
+
+        Исключения:
+            TypeError: Если часы симуляции нельзя переводить (не ManualClock)
+        """
+        if not hasattr(self.clock, 'set'):
+            raise TypeError("advance() требует управляемые часы (ManualClock)")
+
+        target = self.clock() + dt_ms
+        event_time = self.next_event_time()
+        while event_time <= target:
+            self.clock.set(event_time)
+            self.step(event_time)
+            event_time = self.next_event_time()
+        self.clock.set(target)
+
+    # ------------------------------------------------------------------
+    # Эволюция
+    # ------------------------------------------------------------------
+
+    def check_evolution(self):
+        """Проверяет, достиг ли тамагочи порога для эволюции.
+
+        Возвращает:
+            bool: True если произошла эволюция
+        """
+        current_stage = self.data.evolution_stage
+        if current_stage < len(self.evolution_thresholds):
+            if self.data.age >= self.evolution_thresholds[current_stage]:
+                self.data.evolution_stage += 1
+                print(f"🎉 {self.data.name} evolved to stage {self.data.evolution_stage}!")
+                self.emit(EVENT_EVOLVE, stage=self.data.evolution_stage)
+                return True
+        return False
+
+    # ------------------------------------------------------------------
+    # Действия игрока
+    # ------------------------------------------------------------------
+
+    def feed(self, food_value=20):
+        """Кормит тамагочи.
+
+        Аргументы:
+            food_value: Количество, на которое увеличивается голод
+
+        Возвращает:
+            bool: True если кормление успешно, False если голод уже максимален
+        """
+        data = self.data
+        if data.hunger < 100:
+            old_hunger = data.hunger
+            data.hunger = min(100, data.hunger + food_value)
+
+            # Увеличение счастья при кормлении голодного тамагочи
+            if old_hunger < 50:
+                data.happiness = min(100, data.happiness + 5)
+
+            # Небольшой бонус энергии от еды (существенная пища дает больше)
+            if food_value >= 30:
+                data.energy = min(100, data.energy + 5)
+            else:
+                data.energy = min(100, data.energy + 2)
+
+            self.emit(EVENT_FEED)
+            return True
+        return False
+
+    def play(self, happiness_boost=15, energy_cost=10):
+        """Играет с тамагочи, увеличивая счастье за счет энергии.
+
+        Аргументы:
+            happiness_boost: Бонус к счастью от игры
+            energy_cost: Стоимость энергии за игру
+
+        Возвращает:
+            bool: True если игра успешна, False если недостаточно энергии
+        """
+        data = self.data
+        if data.happiness < 100 and data.energy > energy_cost:
+            data.happiness = min(100, data.happiness + happiness_boost)
+            data.energy = max(0, data.energy - energy_cost)
+
+            # Увеличение голода от игры
+            data.hunger = max(0, data.hunger - 3)
+
+            # Больший бонус счастья если энергия была высокой
+            if data.energy > 70:
+                data.happiness = min(100, data.happiness + 5)
+
+            self.emit(EVENT_PLAY)
+            return True
+        return False
+
+    def clean(self):
+        """Чистит тамагочи, восстанавливая чистоту до максимума.
+
+        Возвращает:
+            bool: True если чистка успешна, False если уже чисто
+        """
+        data = self.data
+        if data.cleanliness < 100:
+            old_cleanliness = data.cleanliness
+            data.cleanliness = 100
+
+            # Бонус счастья от чистоты
+            cleanliness_improvement = 100 - old_cleanliness
+            happiness_boost = min(15, cleanliness_improvement // 10)
+            data.happiness = min(100, data.happiness + happiness_boost)
+
+            # Небольшая трата энергии на чистку
+            data.energy = max(0, data.energy - 5)
+
+            self.emit(EVENT_CLEAN)
+            return True
+        return False
+
+    def sleep(self):
+        """Отправляет тамагочи спать.
+
+        Возвращает:
+            bool: True если успешно уснул, False если уже спит или энергия полная
+        """
+        if not self.is_sleeping and self.data.energy < 100:
+            now = self.clock()
+            self.is_sleeping = True
+            self.sleep_start_time = now
+            self.last_energy_regen = now
+
+            # Начальный бонус комфорта при начале сна
+            self.data.happiness = min(100, self.data.happiness + 5)
+            self.emit(EVENT_SLEEP)
+            return True
+        return False
+
+    def wake_up(self):
+        """Будит тамагочи ото сна.
+
+        Возвращает:
+            bool: True если успешно проснулся, False если не спал
+        """
+        if self.is_sleeping:
+            self.is_sleeping = False
+            # Небольшой штраф к счастью если разбудить слишком рано (меньше минуты)
+            sleep_duration = (self.clock() - self.sleep_start_time) // 1000
+            if sleep_duration < 60:
+                self.data.happiness = max(0, self.data.happiness - 10)
+            self.emit(EVENT_WAKE)
+            return True
+        return False
+
+    def heal(self, health_boost=30):
+        """Лечит тамагочи, восстанавливая здоровье.
+
+        Аргументы:
+            health_boost: Количество восстанавливаемого здоровья
+
+        Возвращает:
+            bool: True если лечение успешно, False если здоровье уже полное
+        """
+        data = self.data
+        if data.health < 100:
+            old_health = data.health
+            data.health = min(100, data.health + health_boost)
+
+            # Бонус счастья от улучшения самочувствия
+            health_improvement = data.health - old_health
+            data.happiness = min(100, data.happiness + (health_improvement // 5))
+
+            # Небольшая трата энергии на процесс исцеления
+            data.energy = max(0, data.energy - 8)
+
+            self.emit(EVENT_HEAL)
+            return True
+        return False
+
+    def eat(self, hunger_value, happiness_boost, energy_boost):
+        """Применяет эффекты съеденной еды.
+
+        Аргументы:
+            hunger_value: Прибавка к сытости
+            happiness_boost: Прибавка к счастью
+            energy_boost: Прибавка к энергии
+
+        Возвращает:
+            bool: Всегда True
+        """
+        data = self.data
+        old_hunger = data.hunger
+
+        data.hunger = min(100, data.hunger + hunger_value)
+        data.happiness = min(100, data.happiness + happiness_boost)
+        data.energy = min(100, data.energy + energy_boost)
+
+        # Дополнительное счастье если очень голоден
+        if old_hunger < 30:
+            data.happiness = min(100, data.happiness + 10)
+
+        self.emit(EVENT_FEED)
+        return True
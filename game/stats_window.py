@@ -1,6 +1,64 @@
+import time
+from collections import deque
 import pygame
 from entities.buttons import Button, CloseButton, TabButton
 from config import *
+from utils.fonts import get_font
+from utils.text_cache import render_text
+from utils.scroll_surface import ScrollSurface
+from game.simulation import (EVENT_FEED, EVENT_PLAY, EVENT_CLEAN, EVENT_SLEEP, EVENT_WAKE,
+                             EVENT_HEAL, EVENT_EVOLVE, EVENT_DECAY, EVENT_PURCHASE,
+                             EVENT_MINIGAME_REWARD)
+from database.events import HISTORY_PAGE_SIZE
+from database.stat_history import DAY
+from game.achievements import AchievementTracker
+
+# Подписи событий журнала на вкладке истории
+EVENT_LABELS = {
+    EVENT_FEED: "Покормлен",
+    EVENT_PLAY: "Поиграли вместе",
+    EVENT_CLEAN: "Помыли",
+    EVENT_SLEEP: "Уснул",
+    EVENT_WAKE: "Проснулся",
+    EVENT_HEAL: "Вылечен",
+    EVENT_EVOLVE: "Эволюция",
+    EVENT_DECAY: "Прошло время",
+    EVENT_PURCHASE: "Покупка",
+    EVENT_MINIGAME_REWARD: "Награда за мини-игру",
+}
+
+HISTORY_LINE_HEIGHT = 35
+# История рисуется плитками по странице строк: длинный список не рисуется целиком
+HISTORY_TILE_HEIGHT = HISTORY_PAGE_SIZE * HISTORY_LINE_HEIGHT
+# Отступ первой строки истории от начала вкладки (под заголовком)
+HISTORY_TOP = 70
+
+# Полезные советы в конце вкладки истории
+HISTORY_TIPS = (
+    "Кормите тамагочи, когда голод низкий",
+    "Играйте в мини-игры, чтобы заработать монеты",
+    "Поддерживайте чистоту для бонуса к счастью",
+    "Сон постепенно восстанавливает энергию",
+    "Покупайте еду в магазине для лучших эффектов",
+    "Регулярно проверяйте статистику тамагочи",
+    "Разные виды еды имеют разные эффекты",
+)
+
+# График динамики показателей: за сколько дней, сколько отсчетов запрашивать
+# и как часто (в секундах) перечитывать историю
+STAT_CHART_DAYS = 3
+STAT_CHART_POINTS = 200
+STAT_CHART_REFRESH = 60
+STAT_CHART_HEIGHT = 150
+
+# Подписи и цвета линий графика в порядке STAT_FIELDS
+STAT_CHART_LINES = (
+    ("Голод", RED),
+    ("Счастье", (230, 180, 0)),
+    ("Здоровье", GREEN),
+    ("Чистота", BLUE),
+    ("Энергия", PURPLE),
+)
 
 
 class StatsWindow:
@@ -17,6 +75,10 @@ class StatsWindow:
         tab_buttons: Кнопки переключения вкладок
         scroll_offsets: Смещения прокрутки для каждой вкладка
         max_scrolls: Максимальные значения прокрутки для каждой вкладки
+        event_log: Журнал событий (EventLog) для вкладки истории или None
+        history: Загруженные события истории, от новых к старым
+        stat_history: История показателей (StatHistory) для графика или None
+        achievements: Трекер достижений (AchievementTracker); без игры создается свой
     """
     
     def __init__(self):
@@ -34,10 +96,10 @@ class StatsWindow:
         ]
 
         # Шрифты
-        self.title_font = pygame.font.Font(None, 48)
-        self.header_font = pygame.font.Font(None, 36)
-        self.text_font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 24)
+        self.title_font = get_font(48)
+        self.header_font = get_font(36)
+        self.text_font = get_font(28)
+        self.small_font = get_font(24)
 
         # Состояние прокрутки для каждой вкладки
         self.scroll_offsets = {
@@ -53,9 +115,205 @@ class StatsWindow:
         self.scroll_speed = 30
         self.scroll_margin = 20
 
+        # История загружается из журнала событий постранично по мере прокрутки
+        self.event_log = None
+        self.history = None
+        self.history_pet_id = None
+        self.history_complete = False
+        # Страница читается в потоке записи; готовые страницы ждут отрисовки в очереди
+        self.history_loading = False
+        self.loaded_pages = deque()
+
+        # Отсчеты графика показателей перечитываются не чаще раза в STAT_CHART_REFRESH.
+        # Как и страницы истории, они читаются в потоке записи и ждут отрисовки в очереди
+        self.stat_history = None
+        self.stat_chart = []
+        self.stat_chart_key = None
+        self.stat_chart_requested = None
+        self.loaded_charts = deque()
+
+        self.achievements = None
+
+        # Содержимое каждой вкладки нарисовано заранее (ScrollSurface) и
+        # перерисовывается только при изменении ключа вкладки
+        self.tab_surfaces = {}
+        self.tab_keys = {}
+        # Номер загрузки истории и число нарисованных строк истории
+        self.history_generation = 0
+        self.history_rows = 0
+        self.status_messages = []
+        self.status_messages_key = None
+
     def toggle(self):
         """Переключает видимость окна."""
         self.visible = not self.visible
+        self.reset_history()
+        self.stat_chart_requested = None
+
+    def reset_history(self):
+        """Сбрасывает загруженную историю: при следующей отрисовке она загрузится заново."""
+        self.history = None
+        self.history_complete = False
+        self.history_loading = False
+        self.history_generation += 1
+
+    def load_history_page(self, pet_id):
+        """Запрашивает следующую страницу истории из журнала событий.
+        
+        Страница запрашивается по номеру последнего загруженного события,
+        поэтому стоимость запроса не зависит от длины истории. Чтение идет
+        через EventLog.request_page, а результат добавляется в историю при
+        следующей отрисовке (receive_history_pages), поэтому кадр не ждет
+        базу данных.
+        
+        Аргументы:
+            pet_id: ID тамагочи
+        """
+        if self.history is None or self.history_pet_id != pet_id:
+            self.history = []
+            self.history_pet_id = pet_id
+            self.history_complete = False
+            self.history_loading = False
+            self.history_generation += 1
+        if self.history_complete or self.history_loading:
+            return
+        self.history_loading = True
+        before = self.history[-1].seq if self.history else None
+        generation = self.history_generation
+        self.event_log.request_page(
+            pet_id, lambda page: self.loaded_pages.append((generation, page)),
+            before_seq=before, limit=HISTORY_PAGE_SIZE)
+
+    def receive_history_pages(self):
+        """Добавляет в историю страницы, загруженные после прошлой отрисовки.
+        
+        Страницы, запрошенные до сброса истории, отбрасываются.
+        """
+        while self.loaded_pages:
+            generation, page = self.loaded_pages.popleft()
+            if generation != self.history_generation or self.history is None:
+                continue
+            self.history.extend(page)
+            self.history_complete = len(page) < HISTORY_PAGE_SIZE
+            self.history_loading = False
+
+    def describe_event(self, event):
+        """Возвращает строку истории для события журнала.
+        
+        Аргументы:
+            event: Объект PetEvent
+            
+        Возвращает:
+            str: Время и описание события
+        """
+        label = EVENT_LABELS.get(event.kind, event.kind)
+        details = event.details or {}
+        if event.kind == EVENT_PURCHASE and "item" in details:
+            label += f": {details['item']}"
+        elif event.kind == EVENT_MINIGAME_REWARD and "coins" in details:
+            label += f": +{details['coins']} монет"
+        elif event.kind == EVENT_EVOLVE and "stage" in details:
+            label += f": стадия {details['stage']}"
+        if hasattr(event.created_at, 'strftime'):
+            return f"{event.created_at.strftime('%d.%m %H:%M')} {label}"
+        return label
+
+    def stat_chart_points(self, pet_id):
+        """Возвращает отсчеты графика показателей за последние STAT_CHART_DAYS дней.
+        
+        Запрос к истории выполняется только при смене тамагочи или раз в
+        STAT_CHART_REFRESH секунд, а не в каждом кадре. Чтение идет через
+        StatHistory.request_query, а результат подставляется при следующей
+        отрисовке (receive_stat_charts); до этого выводятся прежние отсчеты.
+        
+        Аргументы:
+            pet_id: ID тамагочи
+            
+        Возвращает:
+            list: Пары (время, значения в порядке STAT_FIELDS)
+        """
+        if self.stat_history is None or pet_id is None:
+            return []
+        if self.stat_chart_key is not None and self.stat_chart_key[0] != pet_id:
+            # График прежнего тамагочи не показывается
+            self.stat_chart = []
+            self.stat_chart_key = None
+        now = int(time.time())
+        key = (pet_id, now // STAT_CHART_REFRESH)
+        if key != self.stat_chart_requested:
+            self.stat_chart_requested = key
+            self.stat_history.request_query(
+                pet_id, now - STAT_CHART_DAYS * DAY,
+                lambda points: self.loaded_charts.append((key, points)),
+                end=now, max_points=STAT_CHART_POINTS)
+        self.receive_stat_charts()
+        return self.stat_chart
+
+    def receive_stat_charts(self):
+        """Подставляет отсчеты графика, загруженные после прошлой отрисовки.
+        
+        Результаты устаревших запросов отбрасываются.
+        """
+        while self.loaded_charts:
+            key, points = self.loaded_charts.popleft()
+            if key != self.stat_chart_requested:
+                continue
+            self.stat_chart = points
+            self.stat_chart_key = key
+
+    def draw_stat_chart(self, screen, chart_rect, points):
+        """Рисует линии показателей на графике.
+        
+        Аргументы:
+            screen: Поверхность PyGame для отрисовки
+            chart_rect: Прямоугольник графика
+            points: Пары (время, значения) по возрастанию времени
+        """
+        pygame.draw.rect(screen, (245, 245, 245), chart_rect)
+        for level in (25, 50, 75):
+            line_y = chart_rect.bottom - chart_rect.height * level // 100
+            pygame.draw.line(screen, GRAY, (chart_rect.x, line_y), (chart_rect.right, line_y))
+        pygame.draw.rect(screen, BLACK, chart_rect, 2)
+
+        if not points:
+            text = render_text(self.small_font, "Данных пока нет", True, (100, 100, 100))
+            screen.blit(text, text.get_rect(center=chart_rect.center))
+            return
+
+        end = max(points[-1][0], int(time.time()))
+        start = end - STAT_CHART_DAYS * DAY
+        scale_x = (chart_rect.width - 4) / (end - start)
+        xs = [chart_rect.x + 2 + int((timestamp - start) * scale_x) for timestamp, _ in points]
+        for i, (_, color) in enumerate(STAT_CHART_LINES):
+            line = [(x, chart_rect.bottom - 2 - (chart_rect.height - 4) * values[i] // 100)
+                    for x, (_, values) in zip(xs, points)]
+            if len(line) > 1:
+                pygame.draw.lines(screen, color, False, line, 2)
+            else:
+                pygame.draw.circle(screen, color, line[0], 2)
+
+    def report_dirty(self, tracker):
+        """Сообщает трекеру изменившихся областей состояние окна.
+        
+        Закрытое окно ничего не сообщает: трекер сам перерисует область,
+        которую оно занимало.
+        
+        Аргументы:
+            tracker: Объект DirtyRectTracker
+        """
+        if not self.visible:
+            return
+        # Окно вместе с тенью
+        area = pygame.Rect(self.window_rect.x, self.window_rect.y,
+                           self.window_rect.width + 5, self.window_rect.height + 5)
+        # Загруженные в потоке записи страницы истории и отсчеты графика ждут отрисовки
+        state = (self.current_tab, self.scroll_offsets.get(self.current_tab, 0),
+                 bool(self.loaded_pages or self.loaded_charts))
+        tracker.track(('stats_window', id(self)), area, state)
+
+        self.close_button.report_dirty(tracker)
+        for button in self.tab_buttons:
+            button.report_dirty(tracker)
 
     def draw(self, screen, tamagotchi):
         """Отрисовывает окно статистики.
@@ -76,7 +334,7 @@ class StatsWindow:
         pygame.draw.rect(screen, BLACK, self.window_rect, 3, border_radius=15)
 
         # Заголовок окна
-        title = self.title_font.render(f"Статистика {tamagotchi.data.name}", True, PURPLE)
+        title = render_text(self.title_font, f"Статистика {tamagotchi.data.name}", True, PURPLE)
         screen.blit(title, (self.window_rect.centerx - title.get_width() // 2, self.window_rect.y + 15))
 
         # Кнопка закрытия
@@ -143,111 +401,212 @@ class StatsWindow:
             pygame.draw.rect(screen, (80, 80, 80), (scrollbar_x, thumb_y, scrollbar_width, thumb_height), border_radius=5)
             
             # Подсказка
-            hint = self.small_font.render("Используйте колёсико мыши для прокрутки", True, (100, 100, 100))
+            hint = render_text(self.small_font, "Используйте колёсико мыши для прокрутки", True, (100, 100, 100))
             screen.blit(hint, (content_rect.x, content_rect.bottom + 15))
 
     def draw_stats_tab(self, screen, rect, tamagotchi, offset):
         """Отрисовывает вкладку со статистикой.
         
+        Содержимое вкладки рисуется один раз на отдельной поверхности во всю
+        высоту и перерисовывается только при изменении показателей тамагочи
+        (счетчик версий модели), сна или данных графика. В каждом кадре и при
+        прокрутке выводится только видимая часть поверхности.
+        
         Аргументы:
             screen: Поверхность PyGame для отрисовки
             rect: Прямоугольник области контента
             tamagotchi: Объект тамагочи
             offset: Смещение прокрутки
         """
-        # Отрисовка детальной статистики
-        stats_y = rect.y + 20 - offset
-
-        # Раздел базовой информации
-        header = self.header_font.render("Основная информация", True, BLACK)
-        if rect.y <= stats_y <= rect.bottom:
-            screen.blit(header, (rect.x + 10, stats_y))
-        stats_y += 40
+        data = tamagotchi.data
+        chart = self.stat_chart_points(data.id)
+        key = (data, data.version, tamagotchi.is_sleeping, data.created_at, data.last_updated,
+               self.stat_chart_key, rect.size)
+        self.draw_tab_surface(screen, rect, "stats", key, offset,
+                              lambda: self.build_stats_surface(tamagotchi, rect.width, chart))
+
+    def draw_tab_surface(self, screen, rect, tab, key, offset, build):
+        """Выводит заранее нарисованное содержимое вкладки, перестраивая его при смене ключа.
+        
+        Максимальная прокрутка вычисляется из высоты содержимого только при
+        перестроении, а не в каждом кадре.
+        
+        Аргументы:
+            screen: Поверхность PyGame для отрисовки
+            rect: Прямоугольник области контента
+            tab: Имя вкладки
+            key: Хешируемое описание всего, что влияет на содержимое вкладки
+            offset: Смещение прокрутки
+            build: Функция без аргументов, возвращающая новый ScrollSurface
+        """
+        if key != self.tab_keys.get(tab):
+            self.tab_surfaces[tab] = build()
+            self.tab_keys[tab] = key
+            self.update_max_scroll(tab, rect)
+        self.tab_surfaces[tab].blit(screen, rect, offset)
+
+    def update_max_scroll(self, tab, rect):
+        """Пересчитывает максимальную прокрутку вкладки по высоте ее содержимого.
+        
+        Аргументы:
+            tab: Имя вкладки
+            rect: Прямоугольник области контента
+        """
+        height = self.tab_surfaces[tab].height
+        self.max_scrolls[tab] = max(0, height - rect.height - self.scroll_margin)
 
+    def build_stats_surface(self, tamagotchi, width, chart):
+        """Создает содержимое вкладки статистики.
+        
+        Аргументы:
+            tamagotchi: Объект тамагочи
+            width: Ширина области контента
+            chart: Отсчеты графика показателей (см. stat_chart_points)
+            
+        Возвращает:
+            ScrollSurface: Содержимое вкладки на одной поверхности
+        """
+        data = tamagotchi.data
         basic_info = [
-            f"Имя: {tamagotchi.data.name}",
-            f"Возраст: {tamagotchi.data.age} дней",
-            f"Стадия эволюции: {tamagotchi.data.evolution_stage}",
-            f"Монеты: {tamagotchi.data.coins}",
-            f"Создан: {tamagotchi.data.created_at.strftime('%Y-%m-%d %H:%M') if hasattr(tamagotchi.data.created_at, 'strftime') else 'Неизвестно'}",
-            f"Последнее обновление: {tamagotchi.data.last_updated.strftime('%Y-%m-%d %H:%M') if hasattr(tamagotchi.data.last_updated, 'strftime') else 'Неизвестно'}"
+            f"Имя: {data.name}",
+            f"Возраст: {data.age} дней",
+            f"Стадия эволюции: {data.evolution_stage}",
+            f"Монеты: {data.coins}",
+            f"Создан: {data.created_at.strftime('%Y-%m-%d %H:%M') if hasattr(data.created_at, 'strftime') else 'Неизвестно'}",
+            f"Последнее обновление: {data.last_updated.strftime('%Y-%m-%d %H:%M') if hasattr(data.last_updated, 'strftime') else 'Неизвестно'}"
+        ]
+
+        # Определяем показатели с цветами
+        stats = [
+            ("Голод", data.hunger, RED if data.hunger < 30 else GREEN),
+            ("Счастье", data.happiness, RED if data.happiness < 30 else YELLOW),
+            ("Здоровье", data.health, RED if data.health < 30 else GREEN),
+            ("Чистота", data.cleanliness, RED if data.cleanliness < 30 else BLUE),
+            ("Энергия", data.energy, RED if data.energy < 30 else PURPLE)
         ]
 
+        status_messages = self.get_status_messages(tamagotchi)
+
+        # Высота содержимого: заголовки разделов по 40, строки по 30 и 40
+        basic_info_height = len(basic_info) * 30
+        stats_height = len(stats) * 40
+        messages_height = len(status_messages) * 30
+        chart_height = 0
+        if self.stat_history is not None:
+            # Отступ, заголовок, график и легенда
+            chart_height = 40 + 40 + STAT_CHART_HEIGHT + 10 + 80
+        content_height = (20 + basic_info_height + 40 + 40 + stats_height + 40 + 40 + messages_height
+                          + chart_height)
+
+        return ScrollSurface(width, content_height, lambda surface, top: self.render_stats_content(
+            surface, top, basic_info, stats, status_messages, chart))
+
+    def render_stats_content(self, surface, top, basic_info, stats, status_messages, chart):
+        """Рисует содержимое вкладки статистики.
+        
+        Аргументы:
+            surface: Поверхность плитки
+            top: Координата содержимого у верхнего края плитки
+            basic_info: Строки основной информации
+            stats: Кортежи (название, значение, цвет) для полос показателей
+            status_messages: Сообщения о состоянии
+            chart: Отсчеты графика показателей
+        """
+        width = surface.get_width()
+        stats_y = 20 - top
+
+        # Раздел базовой информации
+        header = render_text(self.header_font, "Основная информация", True, BLACK)
+        surface.blit(header, (10, stats_y))
+        stats_y += 40
+
         for i, info in enumerate(basic_info):
-            line_y = stats_y + i * 30
-            if rect.y <= line_y <= rect.bottom:
-                text = self.text_font.render(info, True, BLACK)
-                screen.blit(text, (rect.x + 20, line_y))
+            text = render_text(self.text_font, info, True, BLACK)
+            surface.blit(text, (20, stats_y + i * 30))
 
         # Раздел статусных полос
         stats_y += len(basic_info) * 30 + 40
 
-        header = self.header_font.render("Показатели", True, BLACK)
-        if rect.y <= stats_y <= rect.bottom:
-            screen.blit(header, (rect.x + 10, stats_y))
+        header = render_text(self.header_font, "Показатели", True, BLACK)
+        surface.blit(header, (10, stats_y))
         stats_y += 40
 
-        # Определяем показатели с цветами
-        stats = [
-            ("Голод", tamagotchi.data.hunger, RED if tamagotchi.data.hunger < 30 else GREEN),
-            ("Счастье", tamagotchi.data.happiness, RED if tamagotchi.data.happiness < 30 else YELLOW),
-            ("Здоровье", tamagotchi.data.health, RED if tamagotchi.data.health < 30 else GREEN),
-            ("Чистота", tamagotchi.data.cleanliness, RED if tamagotchi.data.cleanliness < 30 else BLUE),
-            ("Энергия", tamagotchi.data.energy, RED if tamagotchi.data.energy < 30 else PURPLE)
-        ]
-
         bar_width = 300
         bar_height = 25
+        bar_x = 200
 
         for i, (name, value, color) in enumerate(stats):
-            line_y = stats_y + i * 40
-            bar_x = rect.x + 200
-            bar_y = line_y
+            bar_y = stats_y + i * 40
 
-            if rect.y - bar_height <= line_y <= rect.bottom:
-                # Метка
-                label = self.text_font.render(f"{name}: {value}/100", True, BLACK)
-                screen.blit(label, (rect.x + 20, line_y))
+            # Метка
+            label = render_text(self.text_font, f"{name}: {value}/100", True, BLACK)
+            surface.blit(label, (20, bar_y))
 
-                # Фон полосы
-                pygame.draw.rect(screen, GRAY, (bar_x, bar_y, bar_width, bar_height))
+            # Фон полосы
+            pygame.draw.rect(surface, GRAY, (bar_x, bar_y, bar_width, bar_height))
 
-                # Заливка полосы
-                fill_width = int((value / 100) * bar_width)
-                pygame.draw.rect(screen, color, (bar_x, bar_y, fill_width, bar_height))
+            # Заливка полосы
+            fill_width = int((value / 100) * bar_width)
+            pygame.draw.rect(surface, color, (bar_x, bar_y, fill_width, bar_height))
 
-                # Рамка полосы
-                pygame.draw.rect(screen, BLACK, (bar_x, bar_y, bar_width, bar_height), 2)
+            # Рамка полосы
+            pygame.draw.rect(surface, BLACK, (bar_x, bar_y, bar_width, bar_height), 2)
 
-                # Процент
-                percent_text = self.small_font.render(f"{value}%", True, BLACK)
-                screen.blit(percent_text, (bar_x + bar_width + 10, bar_y))
+            # Процент
+            percent_text = render_text(self.small_font, f"{value}%", True, BLACK)
+            surface.blit(percent_text, (bar_x + bar_width + 10, bar_y))
 
         # Сообщения о статусе
         stats_y += len(stats) * 40 + 40
 
-        status_header = self.header_font.render("Текущее состояние", True, BLACK)
-        if rect.y <= stats_y <= rect.bottom:
-            screen.blit(status_header, (rect.x + 10, stats_y))
+        status_header = render_text(self.header_font, "Текущее состояние", True, BLACK)
+        surface.blit(status_header, (10, stats_y))
         stats_y += 40
 
-        status_messages = self.get_status_messages(tamagotchi)
         for i, message in enumerate(status_messages):
-            line_y = stats_y + i * 30
-            if rect.y <= line_y <= rect.bottom:
-                text = self.text_font.render(f"• {message}", True, BLACK)
-                screen.blit(text, (rect.x + 20, line_y))
+            text = render_text(self.text_font, f"• {message}", True, BLACK)
+            surface.blit(text, (20, stats_y + i * 30))
 
-        # Обновляем максимальную прокрутку для этой вкладки
-        basic_info_height = len(basic_info) * 30
-        stats_height = len(stats) * 40
-        messages_height = len(status_messages) * 30
-        content_height = 20 + basic_info_height + 40 + 40 + stats_height + 40 + 40 + messages_height
-        self.max_scrolls["stats"] = max(0, content_height - rect.height - self.scroll_margin)
+        # График динамики показателей из истории
+        if self.stat_history is not None:
+            stats_y += len(status_messages) * 30 + 40
+
+            header = render_text(self.header_font, f"Динамика за {STAT_CHART_DAYS} дня", True, BLACK)
+            surface.blit(header, (10, stats_y))
+            stats_y += 40
+
+            chart_rect = pygame.Rect(10, stats_y, width - 40, STAT_CHART_HEIGHT)
+            self.draw_stat_chart(surface, chart_rect, chart)
+            stats_y += STAT_CHART_HEIGHT + 10
+
+            legend_x = 10
+            for name, color in STAT_CHART_LINES:
+                pygame.draw.rect(surface, color, (legend_x, stats_y + 6, 12, 12))
+                text = render_text(self.small_font, name, True, BLACK)
+                surface.blit(text, (legend_x + 16, stats_y))
+                legend_x += 16 + text.get_width() + 14
 
     def get_status_messages(self, tamagotchi):
         """Возвращает сообщения о текущем состоянии тамагочи.
         
+        Сообщения пересчитываются только при изменении показателей
+        (счетчика версий модели) или сна.
+        
+        Аргументы:
+            tamagotchi: Объект тамагочи
+            
+        Возвращает:
+            list: Список сообщений о состоянии
+        """
+        key = (tamagotchi.data, tamagotchi.data.version, tamagotchi.is_sleeping)
+        if key != self.status_messages_key:
+            self.status_messages = self.evaluate_status_messages(tamagotchi)
+            self.status_messages_key = key
+        return self.status_messages
+
+    def evaluate_status_messages(self, tamagotchi):
+        """Вычисляет сообщения о текущем состоянии тамагочи.
+        
         Аргументы:
             tamagotchi: Объект тамагочи
             
@@ -299,157 +658,170 @@ class StatsWindow:
     def draw_achievements_tab(self, screen, rect, tamagotchi, offset):
         """Отрисовывает вкладку с достижениями.
         
+        Содержимое перерисовывается только при изменении прогресса (версия
+        состояний трекера достижений).
+        
         Аргументы:
             screen: Поверхность PyGame для отрисовки
             rect: Прямоугольник области контента
             tamagotchi: Объект тамагочи
             offset: Смещение прокрутки
         """
+        # Прогресс считается трекером по событиям - здесь только готовые состояния
+        tracker = self.achievements
+        if tracker is None:
+            tracker = self.achievements = AchievementTracker()
+        if tracker.pet is not tamagotchi.data:
+            tracker.start(tamagotchi.data)
+
+        key = (tracker, tracker.pet, tracker.version, rect.size)
+        self.draw_tab_surface(screen, rect, "achievements", key, offset,
+                              lambda: self.build_achievements_surface(tracker.rows, rect.width))
+
+    def build_achievements_surface(self, rows, width):
+        """Создает содержимое вкладки достижений.
+        
+        Аргументы:
+            rows: Кортежи (Achievement, прогресс, выполнено ли)
+            width: Ширина области контента
+            
+        Возвращает:
+            ScrollSurface: Содержимое вкладки на одной поверхности
+        """
+        # Состояния копируются: трекер заменяет строки при изменении прогресса
+        rows = list(rows)
+        return ScrollSurface(width, 70 + len(rows) * 70,
+                             lambda surface, top: self.render_achievements(surface, top, rows))
+
+    def render_achievements(self, surface, top, rows):
+        """Рисует содержимое вкладки достижений.
+        
+        Аргументы:
+            surface: Поверхность плитки
+            top: Координата содержимого у верхнего края плитки
+            rows: Кортежи (Achievement, прогресс, выполнено ли)
+        """
+        width = surface.get_width()
+
         # Заголовок достижений
-        header_y = rect.y + 20 - offset
-        header = self.header_font.render("Достижения", True, BLACK)
-        if rect.y <= header_y <= rect.bottom:
-            screen.blit(header, (rect.x + 10, header_y))
-
-        # Определяем достижения
-        achievements = [
-            {
-                "name": "Первый друг",
-                "description": "Создать своего первого тамагочи",
-                "completed": tamagotchi.data.age > 0,
-                "icon": "👶"
-            },
-            {
-                "name": "Сытый и довольный",
-                "description": "Держать голод выше 80 в течение 5 дней",
-                "completed": tamagotchi.data.age >= 5,
-                "icon": "🍎"
-            },
-            {
-                "name": "Счастливчик",
-                "description": "Держать счастье выше 90 в течение 3 дней",
-                "completed": tamagotchi.data.age >= 3,
-                "icon": "😊"
-            },
-            {
-                "name": "Чистюля",
-                "description": "Поддерживать чистоту 100 в течение 24 часов",
-                "completed": tamagotchi.data.age >= 1,
-                "icon": "🧼"
-            },
-            {
-                "name": "Энерджайзер",
-                "description": "Пройти 10 мини-игр",
-                "completed": False,  # Можно отслеживать в базе данных
-                "icon": "⚡"
-            },
-            {
-                "name": "Мастер эволюции",
-                "description": "Достичь 3 стадии эволюции",
-                "completed": tamagotchi.data.evolution_stage >= 3,
-                "icon": "🌟"
-            },
-            {
-                "name": "Богач",
-                "description": "Накопить 1000 монет",
-                "completed": tamagotchi.data.coins >= 1000,
-                "icon": "💰"
-            },
-            {
-                "name": "Ветеран",
-                "description": "Прожить 30 дней",
-                "completed": tamagotchi.data.age >= 30,
-                "icon": "🎖️"
-            }
-        ]
+        header = render_text(self.header_font, "Достижения", True, BLACK)
+        surface.blit(header, (10, 20 - top))
 
-        y_offset = rect.y + 70 - offset
-        for i, achievement in enumerate(achievements):
-            line_y = y_offset + i * 70
-            if rect.y - 40 <= line_y <= rect.bottom:
-                # Иконка и название достижения
-                icon_text = self.header_font.render(achievement["icon"], True, BLACK)
-                screen.blit(icon_text, (rect.x + 20, line_y))
+        for i, (achievement, progress, completed) in enumerate(rows):
+            line_y = 70 + i * 70 - top
 
-                # Статус достижения
-                status_color = GREEN if achievement["completed"] else GRAY
-                status_text = "✓ Выполнено" if achievement["completed"] else "○ Заблокировано"
+            # Иконка и название достижения
+            icon_text = render_text(self.header_font, achievement.icon, True, BLACK)
+            surface.blit(icon_text, (20, line_y))
 
-                name_text = self.text_font.render(achievement["name"], True, status_color)
-                screen.blit(name_text, (rect.x + 60, line_y))
+            # Статус достижения
+            status_color = GREEN if completed else GRAY
+            status_text = "✓ Выполнено" if completed else "○ Заблокировано"
 
-                desc_text = self.small_font.render(achievement["description"], True, BLACK)
-                screen.blit(desc_text, (rect.x + 60, line_y + 25))
+            name_text = render_text(self.text_font, achievement.name, True, status_color)
+            surface.blit(name_text, (60, line_y))
 
-                status_label = self.small_font.render(status_text, True, status_color)
-                screen.blit(status_label, (rect.x + rect.width - 120, line_y))
+            desc_text = render_text(self.small_font, achievement.description, True, BLACK)
+            surface.blit(desc_text, (60, line_y + 25))
 
-        # Подсчитываем высоту контента
-        content_height = len(achievements) * 70
-        self.max_scrolls["achievements"] = max(0, content_height - rect.height - self.scroll_margin)
+            status_label = render_text(self.small_font, status_text, True, status_color)
+            # Статус выравнивается по правому краю, левее полосы прокрутки
+            surface.blit(status_label, (width - status_label.get_width() - 20, line_y))
+
+            if not completed:
+                progress_label = render_text(self.small_font, achievement.format_progress(progress),
+                                             True, (100, 100, 100))
+                surface.blit(progress_label, (width - progress_label.get_width() - 20, line_y + 45))
 
     def draw_history_tab(self, screen, rect, tamagotchi, offset):
         """Отрисовывает вкладку с историей.
         
+        История может содержать тысячи событий, поэтому содержимое рисуется
+        плитками по HISTORY_TILE_HEIGHT: рисуются только плитки, попавшие в
+        видимую область. Догруженная страница событий перерисовывает лишь
+        плитки после последней прежней строки.
+        
         Аргументы:
             screen: Поверхность PyGame для отрисовки
             rect: Прямоугольник области контента
             tamagotchi: Объект тамагочи
             offset: Смещение прокрутки
         """
-        # Заголовок истории
-        header_y = rect.y + 20 - offset
-        header = self.header_font.render("История активности", True, BLACK)
-        if rect.y <= header_y <= rect.bottom:
-            screen.blit(header, (rect.x + 10, header_y))
-
-        # Пример истории (можно расширить реальными логами из базы данных)
-        history_items = [
-            f"День {tamagotchi.data.age}: {tamagotchi.data.name} создан!",
-            f"День {max(0, tamagotchi.data.age - 1)}: Покормлен",
-            f"День {max(0, tamagotchi.data.age - 2)}: Поиграли вместе",
-            f"День {max(0, tamagotchi.data.age - 3)}: Помыли",
-            f"Эволюция: Достигнута стадия {tamagotchi.data.evolution_stage}",
-            f"Текущие монеты: {tamagotchi.data.coins}",
-            f"Общий возраст: {tamagotchi.data.age} дней"
-        ]
+        # Реальная история из журнала событий, страница за страницей
+        pet_id = tamagotchi.data.id
+        if self.event_log is not None and pet_id is not None:
+            if self.history is None or self.history_pet_id != pet_id:
+                self.load_history_page(pet_id)
+            self.receive_history_pages()
+            # Догружаем следующую страницу, когда до конца списка меньше экрана
+            loaded_bottom = HISTORY_TOP + len(self.history) * HISTORY_LINE_HEIGHT
+            if not self.history_complete and offset + 2 * rect.height >= loaded_bottom:
+                self.load_history_page(pet_id)
+                self.receive_history_pages()
+            events = self.history
+        else:
+            events = []
+
+        key = (pet_id, self.history_generation, rect.size)
+        if key == self.tab_keys.get("history") and len(events) != self.history_rows:
+            # Новая страница добавилась в конец: прежние строки остаются нарисованными
+            self.tab_surfaces["history"].resize(self.history_height(events),
+                                                HISTORY_TOP + self.history_rows * HISTORY_LINE_HEIGHT)
+            self.update_max_scroll("history", rect)
+        self.history_rows = len(events)
+        self.draw_tab_surface(screen, rect, "history", key, offset,
+                              lambda: ScrollSurface(rect.width, self.history_height(events),
+                                                    lambda surface, top: self.render_history(
+                                                        surface, top, events),
+                                                    tile_height=HISTORY_TILE_HEIGHT))
+
+    def history_height(self, events):
+        """Возвращает высоту содержимого вкладки истории.
+        
+        Аргументы:
+            events: Загруженные события истории
+            
+        Возвращает:
+            int: Высота в пикселях
+        """
+        # Пустая история занимает одну строку с сообщением
+        line_count = max(1, len(events))
+        return HISTORY_TOP + line_count * HISTORY_LINE_HEIGHT + 40 + 40 + len(HISTORY_TIPS) * 30
 
-        y_offset = rect.y + 70 - offset
-        for i, item in enumerate(history_items):
-            line_y = y_offset + i * 35
-            if rect.y <= line_y <= rect.bottom:
-                text = self.text_font.render(f"• {item}", True, BLACK)
-                screen.blit(text, (rect.x + 20, line_y))
+    def render_history(self, surface, top, events):
+        """Рисует плитку вкладки истории: только строки, которые на нее попадают.
+        
+        Аргументы:
+            surface: Поверхность плитки
+            top: Координата содержимого у верхнего края плитки
+            events: Загруженные события истории, от новых к старым
+        """
+        bottom = top + surface.get_height()
 
-        # Полезные советы
-        y_offset += len(history_items) * 35 + 40
-        tips_header_y = y_offset
-        tips_header = self.header_font.render("Полезные советы", True, BLUE)
-        if rect.y <= tips_header_y <= rect.bottom:
-            screen.blit(tips_header, (rect.x + 10, tips_header_y))
-        y_offset += 40
-
-        tips = [
-            "Кормите тамагочи, когда голод низкий",
-            "Играйте в мини-игры, чтобы заработать монеты",
-            "Поддерживайте чистоту для бонуса к счастью",
-            "Сон постепенно восстанавливает энергию",
-            "Покупайте еду в магазине для лучших эффектов",
-            "Регулярно проверяйте статистику тамагочи",
-            "Разные виды еды имеют разные эффекты"
-        ]
+        # Заголовок истории
+        if top < HISTORY_TOP:
+            header = render_text(self.header_font, "История активности", True, BLACK)
+            surface.blit(header, (10, 20 - top))
+
+        line_count = max(1, len(events))
+        first = max(0, (top - HISTORY_TOP) // HISTORY_LINE_HEIGHT)
+        last = min(line_count, (bottom - HISTORY_TOP) // HISTORY_LINE_HEIGHT + 1)
+        for i in range(first, last):
+            item = self.describe_event(events[i]) if events else "История пока пуста"
+            text = render_text(self.text_font, f"• {item}", True, BLACK)
+            surface.blit(text, (20, HISTORY_TOP + i * HISTORY_LINE_HEIGHT - top))
 
-        for i, tip in enumerate(tips):
-            line_y = y_offset + i * 30
-            if rect.y <= line_y <= rect.bottom:
-                text = self.text_font.render(f"💡 {tip}", True, (0, 100, 0))
-                screen.blit(text, (rect.x + 20, line_y))
+        # Полезные советы
+        tips_y = HISTORY_TOP + line_count * HISTORY_LINE_HEIGHT + 40
+        if bottom <= tips_y:
+            return
+        tips_header = render_text(self.header_font, "Полезные советы", True, BLUE)
+        surface.blit(tips_header, (10, tips_y - top))
+        tips_y += 40
 
-        # Подсчитываем высоту контента
-        history_items_height = len(history_items) * 35
-        tips_height = len(tips) * 30
-        content_height = 20 + history_items_height + 40 + 40 + tips_height
-        self.max_scrolls["history"] = max(0, content_height - rect.height - self.scroll_margin)
+        for i, tip in enumerate(HISTORY_TIPS):
+            text = render_text(self.text_font, f"💡 {tip}", True, (0, 100, 0))
+            surface.blit(text, (20, tips_y + i * 30 - top))
 
     def handle_events(self, event, mouse_pos):
         """Обрабатывает события окна статистики.
@@ -481,6 +853,7 @@ class StatsWindow:
                 elif button.text == "История":
                     self.current_tab = "history"
                     self.scroll_offsets["history"] = 0
+                    self.reset_history()
                 return True
 
         # Прокрутка колёсиком мыши, когда курсор над окном
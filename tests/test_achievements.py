@@ -0,0 +1,241 @@
+"""
+Тесты для модуля game.achievements
+"""
+import unittest
+import tempfile
+import shutil
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from database.memory_manager import MemoryManager
+from game.simulation import ManualClock, EVENT_MINIGAME_REWARD, EVENT_FEED, EVENT_DECAY
+from game.achievements import AchievementTracker, ACHIEVEMENTS, GAME_DAY
+
+
+def row(tracker, key):
+    """Возвращает (прогресс, выполнено ли) достижения."""
+    for achievement, progress, completed in tracker.rows:
+        if achievement.key == key:
+            return progress, completed
+    raise KeyError(key)
+
+
+class TestAchievementTracker(unittest.TestCase):
+    """Тесты для класса AchievementTracker"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.store = MemoryManager()
+        self.clock = ManualClock()
+        self.tracker = AchievementTracker(self.store, clock=self.clock)
+        self.pet = Tamagotchi(name="Отличник")
+        self.store.save_tamagotchi(self.pet)
+        self.tracker.start(self.pet)
+
+    def test_rows_follow_definitions(self):
+        """Тест: состояния идут в порядке описаний, первое выполнено сразу"""
+        self.assertEqual([achievement for achievement, _, _ in self.tracker.rows], list(ACHIEVEMENTS))
+        self.assertEqual(row(self.tracker, "first_friend"), (0, True))
+        self.assertEqual(self.tracker.completed_count(), 1)
+
+    def test_threshold(self):
+        """Тест: порог показателя проверяется при изменении показателя"""
+        self.pet.coins = 400
+        self.tracker.on_event(EVENT_FEED, self.pet)
+        self.assertEqual(row(self.tracker, "rich"), (400, False))
+
+        self.pet.coins = 1200
+        self.tracker.on_event(EVENT_FEED, self.pet)
+        self.assertEqual(row(self.tracker, "rich"), (1200, True))
+
+        # Выполненное достижение больше не пересчитывается
+        self.pet.coins = 10
+        self.tracker.on_event(EVENT_FEED, self.pet)
+        self.assertEqual(row(self.tracker, "rich"), (1200, True))
+
+    def test_counter(self):
+        """Тест: счетчик событий растет только на своем типе события"""
+        for _ in range(9):
+            self.tracker.on_event(EVENT_MINIGAME_REWARD, self.pet)
+        self.tracker.on_event(EVENT_DECAY, self.pet)
+        self.assertEqual(row(self.tracker, "energizer"), (9, False))
+
+        self.tracker.on_event(EVENT_MINIGAME_REWARD, self.pet)
+        self.assertEqual(row(self.tracker, "energizer"), (10, True))
+
+    def test_streak(self):
+        """Тест: серия копит время, пока условие выполняется, и сбрасывается при нарушении"""
+        self.pet.hunger = 90
+        self.tracker.observe(self.pet)
+        self.clock.advance(2 * GAME_DAY)
+        self.tracker.observe(self.pet)
+        self.assertEqual(row(self.tracker, "well_fed"), (2 * GAME_DAY, False))
+
+        self.pet.hunger = 50
+        self.clock.advance(GAME_DAY)
+        self.tracker.observe(self.pet)
+        self.assertEqual(row(self.tracker, "well_fed"), (0, False))
+
+        self.pet.hunger = 95
+        self.tracker.observe(self.pet)
+        self.clock.advance(5 * GAME_DAY)
+        self.tracker.observe(self.pet)
+        self.assertEqual(row(self.tracker, "well_fed"), (5 * GAME_DAY, True))
+
+    def test_unchanged_state_keeps_version(self):
+        """Тест: наблюдение без изменений не меняет версию состояний"""
+        self.tracker.observe(self.pet)
+        version = self.tracker.version
+
+        self.tracker.observe(self.pet)
+        self.tracker.on_event(EVENT_FEED, self.pet)
+
+        self.assertEqual(self.tracker.version, version)
+
+    def test_other_pet_ignored(self):
+        """Тест: события другого тамагочи не учитываются"""
+        other = Tamagotchi(name="Чужой")
+        other.coins = 5000
+
+        self.tracker.on_event(EVENT_MINIGAME_REWARD, other)
+
+        self.assertEqual(row(self.tracker, "energizer"), (0, False))
+        self.assertEqual(row(self.tracker, "rich"), (self.pet.coins, False))
+
+    def test_progress_persisted(self):
+        """Тест: прогресс и выполненные достижения переживают перезапуск"""
+        for _ in range(3):
+            self.tracker.on_event(EVENT_MINIGAME_REWARD, self.pet)
+        self.pet.coins = 1000
+        self.tracker.observe(self.pet)
+        self.tracker.close()
+
+        tracker = AchievementTracker(self.store, clock=self.clock)
+        tracker.start(self.pet)
+
+        self.assertEqual(row(tracker, "energizer"), (3, False))
+        self.assertEqual(row(tracker, "rich"), (1000, True))
+        self.assertEqual(tracker.completed_count(), 2)
+
+    def test_progress_loaded_through_submit(self):
+        """Тест: сохраненный прогресс читается через submit и применяется по готовности"""
+        self.tracker.on_event(EVENT_MINIGAME_REWARD, self.pet)
+        self.tracker.close()
+        queued = []
+        tracker = AchievementTracker(self.store, clock=self.clock,
+                                     submit=lambda function, *args: queued.append((function, args)))
+
+        tracker.start(self.pet)
+
+        self.assertTrue(tracker.loading)
+        self.assertEqual(row(tracker, "energizer"), (0, False))
+        # Событие во время загрузки учитывается после нее
+        tracker.on_event(EVENT_MINIGAME_REWARD, self.pet)
+
+        function, args = queued.pop(0)
+        function(*args)
+
+        self.assertFalse(tracker.loading)
+        self.assertEqual(row(tracker, "energizer"), (2, False))
+        self.assertTrue(row(tracker, "first_friend")[1])
+
+    def test_stale_load_ignored(self):
+        """Тест: прогресс прежнего тамагочи, загруженный после смены, отбрасывается"""
+        queued = []
+        tracker = AchievementTracker(self.store, clock=self.clock,
+                                     submit=lambda function, *args: queued.append((function, args)))
+        other = Tamagotchi(name="Следующий")
+        self.store.save_tamagotchi(other)
+
+        tracker.start(self.pet)
+        tracker.start(other)
+        for function, args in queued:
+            function(*args)
+
+        self.assertIs(tracker.pet, other)
+        self.assertFalse(tracker.loading)
+        self.assertEqual(tracker.completed_count(), 1)
+
+    def test_flush_writes_changes_only(self):
+        """Тест: на запись уходит только изменившийся прогресс"""
+        writes = []
+        # Загрузка прогресса выполняется сразу, записи запоминаются
+        tracker = AchievementTracker(
+            self.store, clock=self.clock,
+            submit=lambda function, *args: (writes.append(args[0]) if function == tracker._write
+                                            else function(*args)))
+        tracker.start(self.pet)
+        tracker.flush()
+        writes.clear()
+
+        tracker.on_event(EVENT_MINIGAME_REWARD, self.pet)
+        tracker.flush()
+        tracker.flush()
+
+        self.assertEqual(writes, [[(self.pet.id, "energizer", 1, None)]])
+
+    def test_failed_write_is_retried(self):
+        """Тест: выполненное достижение, запись которого не удалась, записывается при следующем flush"""
+        self.tracker.flush()
+        save = self.store.save_achievements
+        self.store.save_achievements = lambda rows: False
+        self.pet.coins = 1000
+        self.tracker.observe(self.pet)
+        self.tracker.flush()
+
+        self.store.save_achievements = save
+        self.tracker.flush()
+
+        progress, completed_at = self.store.load_achievements(self.pet.id)["rich"]
+        self.assertEqual(progress, 1000)
+        self.assertIsNotNone(completed_at)
+
+    def test_delete_removes_progress(self):
+        """Тест: удаление тамагочи удаляет его достижения"""
+        self.tracker.close()
+
+        self.store.delete_tamagotchi(self.pet.id)
+
+        self.assertEqual(self.store.load_achievements(self.pet.id), {})
+
+
+class TestAchievementsSQLite(unittest.TestCase):
+    """Тесты хранения достижений в SQLiteManager"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        from database.sqlite_manager import SQLiteManager
+
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        self.store = SQLiteManager(db_path=os.path.join(self.test_dir, 'achievements.db'))
+        self.addCleanup(self.store.close)
+
+    def test_round_trip(self):
+        """Тест: прогресс читается из базы и обновляется на месте"""
+        pet = Tamagotchi(name="Хранитель")
+        self.store.save_tamagotchi(pet)
+        tracker = AchievementTracker(self.store, clock=ManualClock())
+        tracker.start(pet)
+        tracker.on_event(EVENT_MINIGAME_REWARD, pet)
+        tracker.flush()
+        tracker.on_event(EVENT_MINIGAME_REWARD, pet)
+        tracker.flush()
+
+        saved = self.store.load_achievements(pet.id)
+
+        self.assertEqual(saved["energizer"], (2, None))
+        self.assertIsNotNone(saved["first_friend"][1])
+
+        restored = AchievementTracker(self.store)
+        restored.start(pet)
+        self.assertEqual(row(restored, "energizer"), (2, False))
+        self.assertTrue(row(restored, "first_friend")[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
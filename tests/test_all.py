@@ -26,6 +26,23 @@ def load_tests():
         'tests.test_animation',
         'tests.test_game_core',
         'tests.test_postgres_manager',
+        'tests.test_base_room',
+        'tests.test_fonts',
+        'tests.test_text_cache',
+        'tests.test_dirty_rects',
+        'tests.test_frame_pacer',
+        'tests.test_simulation',
+        'tests.test_population',
+        'tests.test_catch_up',
+        'tests.test_write_behind',
+        'tests.test_migrations',
+        'tests.test_async_storage',
+        'tests.test_cache',
+        'tests.test_events',
+        'tests.test_stat_history',
+        'tests.test_achievements',
+        'tests.test_stats_window',
+        'tests.test_scroll_surface',
     ]
     
     # Загружаем тесты из каждого модуля
@@ -0,0 +1,202 @@
+"""
+Тесты для модуля database.async_storage
+"""
+import unittest
+import asyncio
+import threading
+import tempfile
+import shutil
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from database.memory_manager import MemoryManager
+from database.async_storage import (AsyncStorage, ExecutorStorage, AsyncSQLiteStorage,
+                                    AsyncMemoryStorage, AsyncStorageAdapter)
+
+
+class SlowManager(MemoryManager):
+    """MemoryManager, сохранение в который ждёт разрешения теста и запоминает поток."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.threads = set()
+
+    def save_tamagotchi(self, tamagotchi):
+        self.threads.add(threading.current_thread().name)
+        self.release.wait(5)
+        return super().save_tamagotchi(tamagotchi)
+
+
+class TestAsyncStorage(unittest.TestCase):
+    """Тесты для интерфейса AsyncStorage"""
+
+    def test_incomplete_backend_rejected(self):
+        """Тест: хранилище без всех методов нельзя создать"""
+        class SaveOnly(AsyncStorage):
+            async def save(self, tamagotchi):
+                return True
+
+        with self.assertRaises(TypeError):
+            SaveOnly()
+
+
+class TestAsyncMemoryStorage(unittest.TestCase):
+    """Тесты для AsyncMemoryStorage"""
+
+    def test_round_trip(self):
+        """Тест сохранения, загрузки, перебора и удаления"""
+        async def scenario():
+            storage = AsyncMemoryStorage()
+            first, second = Tamagotchi(name="Первый"), Tamagotchi(name="Второй")
+            self.assertTrue(await storage.save_many([first, second]))
+            self.assertEqual((await storage.load(first.id)).name, "Первый")
+            self.assertEqual((await storage.latest()).name, "Второй")
+            self.assertEqual([t.name for t in await storage.list()], ["Второй", "Первый"])
+            self.assertTrue(await storage.delete(first.id))
+            return await storage.load_many([first.id, second.id])
+
+        remaining = asyncio.run(scenario())
+
+        self.assertEqual([t.name for t in remaining], ["Второй"])
+
+
+class TestAsyncSQLiteStorage(unittest.TestCase):
+    """Тесты для AsyncSQLiteStorage"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+
+    def test_round_trip(self):
+        """Тест сохранения и загрузки через выделенный поток"""
+        async def scenario():
+            storage = AsyncSQLiteStorage(db_path=os.path.join(self.test_dir, 'async.db'))
+            tamagotchi = Tamagotchi(name="Асинхронный")
+            self.assertTrue(await storage.save(tamagotchi))
+            loaded = await storage.load(tamagotchi.id)
+            latest = await storage.latest()
+            listed = await storage.list()
+            self.assertTrue(await storage.delete(tamagotchi.id))
+            missing = await storage.load(tamagotchi.id)
+            await storage.close()
+            return loaded, latest, listed, missing
+
+        loaded, latest, listed, missing = asyncio.run(scenario())
+
+        self.assertEqual(loaded.name, "Асинхронный")
+        self.assertEqual(latest.id, loaded.id)
+        self.assertEqual([t.id for t in listed], [loaded.id])
+        self.assertIsNone(missing)
+
+
+    def test_optional_methods(self):
+        """Тест: методы журнала событий менеджера доступны как корутины"""
+        async def scenario():
+            storage = AsyncSQLiteStorage(db_path=os.path.join(self.test_dir, 'events.db'))
+            tamagotchi = Tamagotchi(name="Летописец")
+            await storage.save(tamagotchi)
+            events = await storage.load_events(tamagotchi.id, newest_first=True)
+            seq = await storage.last_event_seq(tamagotchi.id)
+            await storage.close()
+            return events, seq
+
+        self.assertEqual(asyncio.run(scenario()), ([], 0))
+
+    def test_missing_optional_method(self):
+        """Тест: метода, которого нет у менеджера, нет и у хранилища"""
+        storage = ExecutorStorage(object)
+        self.addCleanup(storage._executor.shutdown)
+
+        self.assertFalse(hasattr(storage, 'append_events'))
+        self.assertFalse(hasattr(storage, 'vacuum'))
+
+class TestExecutorStorage(unittest.TestCase):
+    """Тесты выполнения блокирующего менеджера в выделенном потоке"""
+
+    def test_event_loop_not_blocked(self):
+        """Тест: пока менеджер пишет, цикл событий продолжает работать"""
+        manager = SlowManager()
+        storage = ExecutorStorage(lambda: manager)
+
+        async def scenario():
+            save = asyncio.ensure_future(storage.save(Tamagotchi(name="Медленный")))
+            ticks = 0
+            while ticks < 10:
+                await asyncio.sleep(0)
+                ticks += 1
+            self.assertFalse(save.done())
+            manager.release.set()
+            result = await save
+            await storage.close()
+            return ticks, result
+
+        ticks, result = asyncio.run(scenario())
+
+        self.assertEqual(ticks, 10)
+        self.assertTrue(result)
+        self.assertEqual(len(manager.threads), 1)
+        self.assertTrue(next(iter(manager.threads)).startswith("tamagotchi-storage"))
+
+
+class TestAsyncStorageAdapter(unittest.TestCase):
+    """Тесты для AsyncStorageAdapter"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.storage = AsyncMemoryStorage()
+        self.adapter = AsyncStorageAdapter(self.storage, timeout=5)
+        self.addCleanup(self.adapter.close)
+
+    def test_sync_interface(self):
+        """Тест: адаптер предоставляет интерфейс синхронного менеджера"""
+        tamagotchi = Tamagotchi(name="Адаптер")
+
+        self.assertTrue(self.adapter.save_tamagotchi(tamagotchi))
+        self.assertEqual(self.adapter.load_tamagotchi(tamagotchi.id).name, "Адаптер")
+        self.assertIs(self.adapter.get_latest_tamagotchi(), tamagotchi)
+        self.assertEqual(len(self.adapter.get_all_tamagotchis()), 1)
+        self.assertTrue(self.adapter.delete_tamagotchi(tamagotchi.id))
+        self.assertIsNone(self.adapter.get_latest_tamagotchi())
+
+    def test_optional_methods(self):
+        """Тест: журнал событий, история и достижения доступны через адаптер"""
+        tamagotchi = Tamagotchi(name="Достижения")
+        self.adapter.save_tamagotchi(tamagotchi)
+
+        self.assertTrue(self.adapter.save_achievements([(tamagotchi.id, "rich", 5, None)]))
+        self.assertEqual(self.adapter.load_achievements(tamagotchi.id), {"rich": (5, None)})
+        self.assertEqual(self.adapter.load_events(tamagotchi.id, after_seq=0), [])
+        self.assertTrue(hasattr(self.adapter, 'save_stat_chunks'))
+        self.assertFalse(hasattr(AsyncStorageAdapter(object(), loop=object()), 'append_events'))
+
+    def test_host_loop(self):
+        """Тест: вызовы выполняются в цикле событий хоста"""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        self.addCleanup(loop.close)
+        self.addCleanup(thread.join, 5)
+        self.addCleanup(loop.call_soon_threadsafe, loop.stop)
+        adapter = AsyncStorageAdapter(self.storage, loop=loop, timeout=5)
+
+        self.assertTrue(adapter.save_tamagotchi(Tamagotchi(name="Хост")))
+        self.assertEqual(self.storage.manager.get_latest_tamagotchi().name, "Хост")
+
+    def test_call_from_own_loop(self):
+        """Тест: вызов из потока цикла событий отклоняется, а не зависает"""
+        async def call_inside():
+            adapter = AsyncStorageAdapter(self.storage, loop=asyncio.get_running_loop())
+            adapter.get_latest_tamagotchi()
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(call_inside())
+
+
+if __name__ == '__main__':
+    unittest.main()
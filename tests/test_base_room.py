@@ -0,0 +1,159 @@
+"""
+Тесты для модуля game.rooms.base_room
+"""
+import unittest
+import sys
+import os
+from unittest.mock import Mock, patch
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Комнаты инициализируют микшер, поэтому используем фиктивные драйверы
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+pygame.init()
+
+from game.rooms.base_room import BaseRoom
+from game.rooms.hall import Hall
+from game.rooms.kitchen import Kitchen
+from game.rooms.bedroom import Bedroom
+
+
+class TestBackgroundScaling(unittest.TestCase):
+    """Тесты масштабирования фонов BaseRoom"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.image = pygame.Surface((1024, 768))
+        self.screen = pygame.Surface((800, 600))
+        self.room = Hall()
+        self.room.background_image = self.image
+        self.room.invalidate_static_layer()
+
+    def test_scaled_once_for_many_frames(self):
+        """Тест: фон масштабируется только при сборке статического слоя"""
+        with patch('pygame.transform.scale', wraps=pygame.transform.scale) as mock_scale:
+            for _ in range(5):
+                self.room.draw_static_layer(self.screen, (0, 0, 0))
+
+        self.assertEqual(mock_scale.call_count, 1)
+
+    def test_scaled_surface_matches_screen_size(self):
+        """Тест размера отмасштабированного фона"""
+        scaled = self.room.get_scaled_background(self.screen.get_size())
+        self.assertEqual(scaled.get_size(), (800, 600))
+
+    def test_background_not_stored_outside_layer(self):
+        """Тест: отмасштабированный фон хранится только в статическом слое"""
+        self.room.draw_static_layer(self.screen, (0, 0, 0))
+
+        surfaces = [value for value in vars(self.room).values()
+                    if isinstance(value, pygame.Surface) and value.get_size() == (800, 600)]
+        self.assertEqual(surfaces, [self.room.get_static_layer((800, 600), (0, 0, 0))])
+
+    def test_rescaled_on_resize(self):
+        """Тест повторного масштабирования при изменении размера экрана"""
+        with patch('pygame.transform.scale', wraps=pygame.transform.scale) as mock_scale:
+            self.room.get_static_layer((800, 600), (0, 0, 0))
+            resized = self.room.get_static_layer((1024, 768), (0, 0, 0))
+
+        self.assertEqual(resized.get_size(), (1024, 768))
+        self.assertEqual(mock_scale.call_count, 2)
+
+    def test_color_background_without_image(self):
+        """Тест заливки цветом, если у комнаты нет изображения"""
+        self.room.background_image = None
+        self.room.background_color = (10, 20, 30)
+
+        with patch('pygame.transform.scale') as mock_scale:
+            self.room.draw_background(self.screen, (0, 0, 0))
+
+        self.assertEqual(self.screen.get_at((5, 5))[:3], (10, 20, 30))
+        mock_scale.assert_not_called()
+
+
+class TestStaticLayer(unittest.TestCase):
+    """Тесты для статического слоя комнат"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.screen = pygame.display.set_mode((800, 600))
+        BaseRoom.static_layer_stats["builds"] = 0
+
+    def make_room(self, room_class):
+        """Создаёт комнату без фонового изображения (с процедурным декором)."""
+        room = room_class()
+        room.background_image = None
+        room.background_color = None
+        room.invalidate_static_layer()
+        return room
+
+    def test_decor_drawn_once_for_many_frames(self):
+        """Тест: декор зала рисуется только при сборке слоя"""
+        room = self.make_room(Hall)
+
+        with patch.object(room, 'draw_hall_decorations',
+                          wraps=room.draw_hall_decorations) as mock_decor:
+            for _ in range(5):
+                room.draw(self.screen, None)
+
+        self.assertEqual(mock_decor.call_count, 1)
+        self.assertEqual(BaseRoom.static_layer_stats["builds"], 1)
+
+    def test_layer_matches_direct_drawing(self):
+        """Тест: запечённый слой совпадает с прямой отрисовкой декора"""
+        room = self.make_room(Hall)
+        direct = pygame.Surface((800, 600))
+        room.draw_background(direct, (180, 160, 140))
+        room.draw_title(direct)
+        room.draw_hall_decorations(direct)
+
+        layer = room.get_static_layer((800, 600), (180, 160, 140))
+
+        for point in [(130, 130), (400, 80), (400, 40), (700, 350), (320, 370)]:
+            self.assertEqual(layer.get_at(point), direct.get_at(point))
+
+    def test_layer_rebuilt_on_resize(self):
+        """Тест пересборки слоя при изменении размера экрана"""
+        room = self.make_room(Kitchen)
+        room.get_static_layer((800, 600), (0, 0, 0))
+        room.get_static_layer((800, 600), (0, 0, 0))
+        resized = room.get_static_layer((1024, 768), (0, 0, 0))
+
+        self.assertEqual(resized.get_size(), (1024, 768))
+        self.assertEqual(BaseRoom.static_layer_stats["builds"], 2)
+
+    def test_invalidate_static_layer(self):
+        """Тест сброса статического слоя"""
+        room = self.make_room(Kitchen)
+        room.get_static_layer((800, 600), (0, 0, 0))
+        room.invalidate_static_layer()
+        room.get_static_layer((800, 600), (0, 0, 0))
+
+        self.assertEqual(BaseRoom.static_layer_stats["builds"], 2)
+
+    def test_bedroom_clock_and_window_stay_dynamic(self):
+        """Тест: стрелки часов и вид из окна спальни рисуются каждый кадр"""
+        room = self.make_room(Bedroom)
+        tamagotchi = Mock()
+        tamagotchi.is_sleeping = False
+        tamagotchi.data.energy = 50
+
+        room.draw(self.screen, tamagotchi)
+        day_sky = self.screen.get_at((510, 240))
+
+        tamagotchi.is_sleeping = True
+        room.draw(self.screen, tamagotchi)
+        night_sky = self.screen.get_at((510, 240))
+
+        self.assertEqual(day_sky[:3], (135, 206, 235))
+        self.assertEqual(night_sky[:3], (30, 30, 50))
+        # Смена дня и ночи не пересобирает статический слой
+        self.assertEqual(BaseRoom.static_layer_stats["builds"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Тесты для модуля database.cache
+"""
+import unittest
+import tempfile
+import shutil
+import sys
+import os
+from datetime import timedelta
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from database.memory_manager import MemoryManager
+from database.cache import CachedManager
+from database.timestamps import parse_timestamp
+
+
+class CountingManager(MemoryManager):
+    """MemoryManager, считающий обращения к хранилищу."""
+
+    def __init__(self):
+        super().__init__()
+        self.loads = []
+        self.on_load = None
+
+    def load_tamagotchi(self, tamagotchi_id):
+        self.loads.append(tamagotchi_id)
+        if self.on_load:
+            self.on_load()
+        return super().load_tamagotchi(tamagotchi_id)
+
+    def load_many(self, tamagotchi_ids):
+        tamagotchi_ids = list(tamagotchi_ids)
+        self.loads.append(tamagotchi_ids)
+        return super().load_many(tamagotchi_ids)
+
+
+class TestCachedManager(unittest.TestCase):
+    """Тесты для CachedManager"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.manager = CountingManager()
+        self.cache = CachedManager(self.manager, max_size=2)
+        self.pets = [Tamagotchi(name=f"Питомец {i}") for i in range(3)]
+        self.manager.save_many(self.pets)
+
+    def test_second_load_is_a_hit(self):
+        """Тест: повторная загрузка не обращается к менеджеру"""
+        first = self.cache.load_tamagotchi(1)
+        second = self.cache.load_tamagotchi(1)
+
+        self.assertEqual(self.manager.loads, [1])
+        self.assertEqual(second.name, first.name)
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_hits_return_independent_copies(self):
+        """Тест: изменение загруженного объекта не портит кэш"""
+        self.cache.load_tamagotchi(1)
+        copy = self.cache.load_tamagotchi(1)
+        copy.hunger = 1
+
+        self.assertEqual(self.cache.load_tamagotchi(1).hunger, 50)
+        self.assertFalse(self.cache.load_tamagotchi(1).is_dirty)
+
+    def test_lru_eviction(self):
+        """Тест: вытесняется давно не использованный тамагочи"""
+        self.cache.load_tamagotchi(1)
+        self.cache.load_tamagotchi(2)
+        self.cache.load_tamagotchi(1)
+        self.cache.load_tamagotchi(3)
+
+        self.cache.load_tamagotchi(1)
+        self.cache.load_tamagotchi(2)
+
+        self.assertEqual(self.manager.loads, [1, 2, 3, 2])
+        self.assertEqual(self.cache.stats()["evictions"], 2)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_save_invalidates(self):
+        """Тест: после сохранения загружается актуальное состояние"""
+        pet = self.cache.load_tamagotchi(1)
+        pet.hunger = 5
+
+        self.assertTrue(self.cache.save_tamagotchi(pet))
+
+        self.assertEqual(self.cache.load_tamagotchi(1).hunger, 5)
+        self.assertEqual(self.manager.loads, [1, 1])
+        self.assertEqual(self.cache.stats()["invalidations"], 1)
+
+    def test_delete_invalidates(self):
+        """Тест: удалённый тамагочи не возвращается из кэша"""
+        self.cache.load_tamagotchi(1)
+
+        self.assertTrue(self.cache.delete_tamagotchi(1))
+
+        self.assertIsNone(self.cache.load_tamagotchi(1))
+
+    def test_load_many_reads_only_misses(self):
+        """Тест: load_many обращается к менеджеру только за отсутствующими в кэше"""
+        self.cache.load_tamagotchi(2)
+
+        pets = self.cache.load_many([3, 2, 99, 1])
+
+        self.assertEqual([t.id for t in pets], [3, 2, 1])
+        self.assertEqual(self.manager.loads, [2, [3, 99, 1]])
+
+    def test_concurrent_save_not_cached(self):
+        """Тест: строка, прочитанная до сохранения, не попадает в кэш"""
+        self.manager.on_load = lambda: self.cache.invalidate(1)
+
+        self.cache.load_tamagotchi(1)
+        self.manager.on_load = None
+        self.cache.load_tamagotchi(1)
+
+        self.assertEqual(self.manager.loads, [1, 1])
+
+    def test_passthrough(self):
+        """Тест: остальные методы менеджера доступны через кэш"""
+        self.assertEqual(len(self.cache.get_all_tamagotchis()), 3)
+        self.assertEqual(self.cache.next_id, 4)
+
+
+class TestCachedSQLiteManager(unittest.TestCase):
+    """Тесты кэша перед SQLiteManager"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        from database.sqlite_manager import SQLiteManager
+        from game.catch_up import catch_up_since_last_update
+
+        self.test_dir = tempfile.mkdtemp()
+        self.manager = SQLiteManager(db_path=os.path.join(self.test_dir, 'cache.db'),
+                                     offline_update=catch_up_since_last_update)
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        self.addCleanup(self.manager.close)
+        self.cache = CachedManager(self.manager)
+
+    def test_offline_catch_up_applied_to_hits(self):
+        """Тест: время, прошедшее после попадания в кэш, тоже снижает показатели"""
+        pet = Tamagotchi(name="Кэшированный")
+        self.cache.save_tamagotchi(pet)
+        self.cache.load_tamagotchi(pet.id)
+
+        # Имитируем две минуты с момента загрузки в кэш
+        cached = self.cache._pets[pet.id]
+        cached.last_updated = parse_timestamp(cached.last_updated) - timedelta(minutes=2)
+        later = self.cache.load_tamagotchi(pet.id)
+
+        self.assertEqual(later.hunger, 50 - 4 * 5)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+
+    def test_catch_up_flag_respected_on_hits(self):
+        """Тест: попадание с catch_up=False возвращает строку без снижения"""
+        pet = Tamagotchi(name="Флаг")
+        self.cache.save_tamagotchi(pet)
+        self.manager.connection.execute(
+            "UPDATE tamagotchis SET last_updated = datetime('now', '-2 minutes') WHERE id = ?", (pet.id,))
+
+        caught_up = self.cache.load_tamagotchi(pet.id)
+        raw = self.cache.load_tamagotchi(pet.id, catch_up=False)
+
+        self.assertEqual(caught_up.hunger, 50 - 4 * 5)
+        self.assertEqual(raw.hunger, 50)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Тесты для модуля game.catch_up
+"""
+import unittest
+import random
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from game.simulation import PetSimulation, ManualClock, DECAY_INTERVAL
+from database.timestamps import parse_timestamp
+from game.catch_up import catch_up, catch_up_since_last_update
+
+FIELDS = ("hunger", "happiness", "health", "cleanliness", "energy", "age")
+
+
+def make_pet(rng):
+    """Создаёт питомца со случайными показателями."""
+    pet = Tamagotchi(name="Догоняшка")
+    for field in ("hunger", "happiness", "health", "cleanliness", "energy"):
+        setattr(pet, field, rng.randint(0, 100))
+    return pet
+
+
+class TestCatchUp(unittest.TestCase):
+    """Тесты для функции catch_up"""
+
+    def test_matches_step_by_step_updates(self):
+        """Тест: замкнутая форма совпадает с пошаговыми обновлениями"""
+        rng = random.Random(11)
+        for _ in range(100):
+            state = rng.getstate()
+            expected = make_pet(rng)
+            rng.setstate(state)
+            actual = make_pet(rng)
+            ticks = rng.randint(0, 60)
+
+            simulation = PetSimulation(expected, ManualClock())
+            for tick in range(1, ticks + 1):
+                simulation.update_stats(tick * (DECAY_INTERVAL + 1))
+
+            self.assertEqual(catch_up(actual, ticks * DECAY_INTERVAL), ticks)
+            self.assertEqual([getattr(actual, f) for f in FIELDS],
+                             [getattr(expected, f) for f in FIELDS])
+
+    def test_short_gap_changes_nothing(self):
+        """Тест: перерыв короче шага ничего не меняет"""
+        pet = Tamagotchi(name="Быстрый")
+        self.assertEqual(catch_up(pet, DECAY_INTERVAL - 1), 0)
+        self.assertEqual(pet.hunger, 50)
+
+    def test_long_gap_clamps_to_zero(self):
+        """Тест: за несколько недель показатели опускаются до нуля, но не ниже"""
+        pet = Tamagotchi(name="Забытый")
+        catch_up(pet, 21 * 24 * 60 * 60 * 1000)
+
+        self.assertEqual((pet.hunger, pet.happiness, pet.energy, pet.health), (0, 0, 0, 0))
+
+    def test_health_penalty_thresholds(self):
+        """Тест: штраф к здоровью начисляется только после пересечения порога"""
+        pet = Tamagotchi(name="Порог")
+        pet.hunger = 25       # ниже 20 с 2-го шага
+        pet.happiness = 100   # не опускается ниже 20 за 3 шага
+        pet.cleanliness = 100
+        pet.energy = 100
+
+        catch_up(pet, 3 * DECAY_INTERVAL)
+
+        self.assertEqual(pet.hunger, 10)
+        self.assertEqual(pet.health, 100 - 2 * 2)
+
+
+class TestCatchUpSinceLastUpdate(unittest.TestCase):
+    """Тесты догоняющего обновления по отметке времени"""
+
+    def test_sqlite_timestamp(self):
+        """Тест: строка из SQLite распознаётся, остаток времени сохраняется"""
+        pet = Tamagotchi(name="Строка")
+        pet.last_updated = "2024-01-01 12:00:00"
+        now = datetime(2024, 1, 1, 12, 1, 10)
+
+        self.assertEqual(catch_up_since_last_update(pet, now), 2)
+        self.assertEqual(pet.hunger, 40)
+        self.assertEqual(pet.last_updated, datetime(2024, 1, 1, 12, 1, 0))
+        # Повторный вызов не применяет то же время дважды
+        self.assertEqual(catch_up_since_last_update(pet, now), 0)
+
+    def test_future_timestamp(self):
+        """Тест: отметка из будущего ничего не меняет"""
+        pet = Tamagotchi(name="Будущее")
+        now = datetime(2024, 1, 1)
+        pet.last_updated = now + timedelta(hours=1)
+
+        self.assertEqual(catch_up_since_last_update(pet, now), 0)
+        self.assertEqual(pet.hunger, 50)
+
+    def test_parse_timestamp(self):
+        """Тест распознавания отметок времени"""
+        self.assertEqual(parse_timestamp("2024-05-06 07:08:09"), datetime(2024, 5, 6, 7, 8, 9))
+        self.assertIsNone(parse_timestamp("вчера"))
+        self.assertIsNone(parse_timestamp(None))
+
+
+if __name__ == '__main__':
+    unittest.main()
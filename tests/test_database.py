@@ -5,7 +5,9 @@ import unittest
 import os
 import sys
 import tempfile
+import threading
 import shutil
+from datetime import datetime, timedelta
 
 # Добавляем корневую директорию проекта в путь
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -62,8 +64,8 @@ class TestMemoryManager(unittest.TestCase):
         self.assertTrue(result)
         self.assertEqual(t.id, original_id)
         self.assertEqual(len(self.manager.tamagotchis), 1)
-        self.assertEqual(self.manager.tamagotchis[0].name, "Обновленный")
-        self.assertEqual(self.manager.tamagotchis[0].hunger, 75)
+        self.assertEqual(self.manager.tamagotchis[original_id].name, "Обновленный")
+        self.assertEqual(self.manager.tamagotchis[original_id].hunger, 75)
     
     def test_load_tamagotchi(self):
         """Тест загрузки тамагочи по ID"""
@@ -112,7 +114,7 @@ class TestMemoryManager(unittest.TestCase):
         
         self.assertTrue(result)
         self.assertEqual(len(self.manager.tamagotchis), 1)
-        self.assertEqual(self.manager.tamagotchis[0].id, t2.id)
+        self.assertEqual(list(self.manager.tamagotchis), [t2.id])
         self.assertIsNone(self.manager.load_tamagotchi(t1.id))
     
     def test_delete_nonexistent_tamagotchi(self):
@@ -120,6 +122,80 @@ class TestMemoryManager(unittest.TestCase):
         result = self.manager.delete_tamagotchi(999)
         self.assertTrue(result)  # MemoryManager всегда возвращает True
 
+    
+    def test_bulk_operations(self):
+        """Тест пакетного сохранения, загрузки и перебора"""
+        pets = [Tamagotchi(name=f"Питомец {i}") for i in range(5)]
+        
+        self.assertTrue(self.manager.save_many(pets))
+        
+        self.assertEqual([t.id for t in pets], [1, 2, 3, 4, 5])
+        self.assertEqual([t.id for t in self.manager.load_many([4, 99, 2])], [4, 2])
+        self.assertEqual([t.id for t in self.manager.iter_all(batch_size=2)], [1, 2, 3, 4, 5])
+    
+    def test_get_latest_tamagotchi(self):
+        """Тест получения последнего созданного тамагочи"""
+        self.assertIsNone(self.manager.get_latest_tamagotchi())
+        
+        self.manager.save_tamagotchi(Tamagotchi(name="Первый"))
+        self.manager.save_tamagotchi(Tamagotchi(name="Второй"))
+        
+        self.assertEqual(self.manager.get_latest_tamagotchi().name, "Второй")
+    
+    def test_newest_first_order(self):
+        """Тест: список упорядочен по дате создания, а не по порядку добавления"""
+        start = datetime(2024, 1, 1)
+        for name, days in (("Средний", 1), ("Старый", 0), ("Новый", 2)):
+            self.manager.save_tamagotchi(Tamagotchi(name=name, created_at=start + timedelta(days=days)))
+        
+        names = [t.name for t in self.manager.get_all_tamagotchis()]
+        
+        self.assertEqual(names, ["Новый", "Средний", "Старый"])
+        self.assertEqual([t.name for t in self.manager.iter_all()], ["Средний", "Старый", "Новый"])
+    
+    def test_delete_updates_order(self):
+        """Тест: удалённый тамагочи пропадает из списка и из выборки последнего"""
+        pets = [Tamagotchi(name=f"Питомец {i}") for i in range(3)]
+        self.manager.save_many(pets)
+        
+        self.manager.delete_tamagotchi(pets[2].id)
+        
+        self.assertEqual(self.manager.get_latest_tamagotchi().id, pets[1].id)
+        self.assertEqual([t.id for t in self.manager.get_all_tamagotchis()], [2, 1])
+    
+    def test_changed_created_at_reindexed(self):
+        """Тест: изменение даты создания переставляет тамагочи в списке"""
+        old = Tamagotchi(name="Старый", created_at=datetime(2024, 1, 1))
+        new = Tamagotchi(name="Новый", created_at=datetime(2024, 1, 2))
+        self.manager.save_many([old, new])
+        
+        old.created_at = datetime(2024, 1, 3)
+        old.hunger = 40
+        self.manager.save_tamagotchi(old)
+        
+        self.assertEqual([t.name for t in self.manager.get_all_tamagotchis()], ["Старый", "Новый"])
+    
+    def test_save_with_known_id(self):
+        """Тест: тамагочи с заранее известным ID сохраняется, а новые ID его не повторяют"""
+        cached = Tamagotchi(id=10, name="Из кэша")
+        self.manager.save_tamagotchi(cached)
+        fresh = Tamagotchi(name="Новый")
+        self.manager.save_tamagotchi(fresh)
+        
+        self.assertIs(self.manager.load_tamagotchi(10), cached)
+        self.assertEqual(fresh.id, 11)
+    
+    def test_many_deletes_compact_index(self):
+        """Тест: после массового удаления индекс не растёт бесконечно"""
+        pets = [Tamagotchi(name=f"Питомец {i}") for i in range(1000)]
+        self.manager.save_many(pets)
+        
+        for pet in pets[:990]:
+            self.manager.delete_tamagotchi(pet.id)
+        
+        self.assertLess(len(self.manager._created_order), 100)
+        self.assertEqual([t.id for t in self.manager.get_all_tamagotchis()],
+                         list(range(1000, 990, -1)))
 
 class TestSQLiteManager(unittest.TestCase):
     """Тесты для SQLiteManager"""
@@ -130,26 +206,10 @@ class TestSQLiteManager(unittest.TestCase):
         self.test_dir = tempfile.mkdtemp()
         self.test_db_path = os.path.join(self.test_dir, 'test_tamagotchi.db')
         
-        # Модифицируем путь к БД для тестов
-        import database.sqlite_manager as sqlite_module
-        test_db_path = self.test_db_path
-        test_dir = self.test_dir
-        
-        def test_connect(manager_self):
-            import sqlite3
-            os.makedirs(test_dir, exist_ok=True)
-            manager_self.connection = sqlite3.connect(
-                test_db_path,
-                check_same_thread=False
-            )
-            manager_self.connection.row_factory = sqlite3.Row
-            manager_self._create_tables()
-        
-        # Временно заменяем метод connect
-        sqlite_module.SQLiteManager.connect = test_connect
-        
         from database.sqlite_manager import SQLiteManager
-        self.manager = SQLiteManager()
+        from game.catch_up import catch_up_since_last_update
+        self.manager = SQLiteManager(db_path=self.test_db_path,
+                                     offline_update=catch_up_since_last_update)
         self.manager.test_db_path = self.test_db_path
     
     def tearDown(self):
@@ -237,6 +297,224 @@ class TestSQLiteManager(unittest.TestCase):
         loaded = self.manager.load_tamagotchi(99999)
         self.assertIsNone(loaded)
 
+    def test_load_applies_offline_catch_up(self):
+        """Тест: при загрузке применяется снижение показателей за время без игры"""
+        t = Tamagotchi(name="Оставленный")
+        self.manager.save_tamagotchi(t)
+        self.manager.connection.execute(
+            "UPDATE tamagotchis SET last_updated = datetime('now', '-1 hour') WHERE id = ?", (t.id,))
+
+        loaded = self.manager.load_tamagotchi(t.id)
+        raw = self.manager.load_tamagotchi(t.id, catch_up=False)
+
+        self.assertEqual(loaded.hunger, 0)
+        self.assertLess(loaded.health, 100)
+        self.assertEqual(raw.hunger, 50)
+
+    def test_load_without_offline_update_is_raw(self):
+        """Тест: без offline_update показатели загружаются как есть"""
+        self.manager.offline_update = None
+        t = Tamagotchi(name="Без догонялки")
+        self.manager.save_tamagotchi(t)
+        self.manager.connection.execute(
+            "UPDATE tamagotchis SET last_updated = datetime('now', '-1 hour') WHERE id = ?", (t.id,))
+
+        self.assertEqual(self.manager.load_tamagotchi(t.id).hunger, 50)
+
+    def test_fresh_save_has_no_catch_up(self):
+        """Тест: только что сохранённый тамагочи загружается без изменений"""
+        t = Tamagotchi(name="Свежий")
+        self.manager.save_tamagotchi(t)
+
+        loaded = self.manager.get_all_tamagotchis()[0]
+
+        self.assertEqual(loaded.hunger, 50)
+        self.assertEqual(loaded.health, 100)
+
+    
+    def trace_updates(self):
+        """Возвращает список, в который записываются выполняемые UPDATE."""
+        statements = []
+        self.manager.connection.set_trace_callback(
+            lambda sql: statements.append(sql) if sql.lstrip().startswith('UPDATE') else None)
+        return statements
+    
+    def test_clean_tamagotchi_is_not_written(self):
+        """Тест: сохранение без изменений не обращается к базе"""
+        t = Tamagotchi(name="Неизменный")
+        self.manager.save_tamagotchi(t)
+        statements = self.trace_updates()
+        
+        self.assertTrue(self.manager.save_tamagotchi(t))
+        self.assertTrue(self.manager.save_tamagotchi(self.manager.load_tamagotchi(t.id)))
+        self.assertEqual(statements, [])
+    
+    def test_update_writes_only_changed_columns(self):
+        """Тест: UPDATE содержит только изменённые столбцы"""
+        t = Tamagotchi(name="Частичный")
+        self.manager.save_tamagotchi(t)
+        statements = self.trace_updates()
+        
+        t.coins = 500
+        self.manager.save_tamagotchi(t)
+        
+        self.assertEqual(len(statements), 1)
+        self.assertIn('coins=', statements[0])
+        self.assertNotIn('hunger=', statements[0])
+        self.assertFalse(t.is_dirty)
+        self.assertEqual(self.manager.load_tamagotchi(t.id).coins, 500)
+
+
+    
+    def test_save_many_inserts_and_updates(self):
+        """Тест: save_many вставляет новых и обновляет изменённых в одной транзакции"""
+        existing = Tamagotchi(name="Старый")
+        self.manager.save_tamagotchi(existing)
+        existing.hunger = 5
+        new = [Tamagotchi(name=f"Новый {i}") for i in range(3)]
+        commits = []
+        self.manager.connection.set_trace_callback(
+            lambda sql: commits.append(sql) if sql.startswith('COMMIT') else None)
+        
+        self.assertTrue(self.manager.save_many(new + [existing]))
+        
+        self.assertEqual(len(commits), 1)
+        self.assertTrue(all(t.id is not None and not t.is_dirty for t in new))
+        self.assertEqual(self.manager.load_tamagotchi(existing.id).hunger, 5)
+        self.assertEqual(len(self.manager.get_all_tamagotchis()), 4)
+    
+    def test_save_many_rolls_back_on_error(self):
+        """Тест: ошибка в одной записи отменяет всю пачку"""
+        good = Tamagotchi(name="Хороший")
+        bad = Tamagotchi(name="Плохой")
+        bad.name = None  # Нарушает NOT NULL
+        
+        self.assertFalse(self.manager.save_many([good, bad]))
+        
+        self.assertIsNone(good.id)
+        self.assertTrue(good.is_dirty)
+        self.assertEqual(self.manager.get_all_tamagotchis(), [])
+    
+    def test_load_many(self):
+        """Тест загрузки нескольких тамагочи в порядке запрошенных ID"""
+        pets = [Tamagotchi(name=f"Питомец {i}") for i in range(3)]
+        self.manager.save_many(pets)
+        
+        loaded = self.manager.load_many([pets[2].id, 12345, pets[0].id])
+        
+        self.assertEqual([t.name for t in loaded], ["Питомец 2", "Питомец 0"])
+    
+    def test_iter_all_streams_in_batches(self):
+        """Тест потокового перебора всех тамагочи"""
+        pets = [Tamagotchi(name=f"Питомец {i}") for i in range(7)]
+        self.manager.save_many(pets)
+        
+        iterator = self.manager.iter_all(batch_size=3)
+        first = next(iterator)
+        
+        self.assertEqual(first.id, pets[0].id)
+        self.assertEqual([t.id for t in iterator], [t.id for t in pets[1:]])
+    
+    def test_calls_from_other_threads_wait_for_connection_lock(self):
+        """Тест: вызов из другого потока ждёт, пока соединение занято"""
+        tamagotchi = Tamagotchi(name="Общий")
+        self.manager.save_tamagotchi(tamagotchi)
+        loaded = []
+        
+        with self.manager._lock:
+            reader = threading.Thread(
+                target=lambda: loaded.append(self.manager.load_tamagotchi(tamagotchi.id)))
+            reader.start()
+            reader.join(0.2)
+            # Пока блокировка удерживается, чтение не начинается
+            self.assertTrue(reader.is_alive())
+            self.assertEqual(loaded, [])
+        reader.join(5)
+        
+        self.assertEqual(loaded[0].name, "Общий")
+    
+    def test_iter_all_releases_lock_between_batches(self):
+        """Тест: перебор не держит соединение, пока вызывающий код обрабатывает строки"""
+        pets = [Tamagotchi(name=f"Питомец {i}") for i in range(4)]
+        self.manager.save_many(pets)
+        iterator = self.manager.iter_all(batch_size=2)
+        next(iterator)
+        
+        saved = []
+        writer = threading.Thread(
+            target=lambda: saved.append(self.manager.save_tamagotchi(Tamagotchi(name="Новый"))))
+        writer.start()
+        writer.join(5)
+        
+        self.assertEqual(saved, [True])
+        self.assertEqual([t.id for t in iterator][:3], [t.id for t in pets[1:]])
+    
+    def test_get_latest_tamagotchi(self):
+        """Тест загрузки последнего созданного тамагочи"""
+        self.assertIsNone(self.manager.get_latest_tamagotchi())
+        
+        first = Tamagotchi(name="Первый")
+        second = Tamagotchi(name="Второй")
+        self.manager.save_many([first, second])
+        
+        latest = self.manager.get_latest_tamagotchi()
+        
+        self.assertEqual(latest.id, second.id)
+        self.assertEqual(self.manager.get_all_tamagotchis()[0].id, latest.id)
+    
+    def test_latest_query_uses_index(self):
+        """Тест: выборка последнего тамагочи идёт по индексу, без сортировки таблицы"""
+        plan = self.manager.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tamagotchis "
+            "ORDER BY created_at DESC, id DESC LIMIT 1").fetchall()
+        details = " ".join(row[-1] for row in plan)
+        
+        self.assertIn('idx_tamagotchis_created_at', details)
+        self.assertNotIn('TEMP B-TREE', details)
+
+class TestSQLiteManagerProfile(unittest.TestCase):
+    """Тесты настроек производительности SQLiteManager"""
+    
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        from database.sqlite_manager import SQLiteManager
+        self.test_dir = tempfile.mkdtemp()
+        self.manager = SQLiteManager(db_path=os.path.join(self.test_dir, 'nested', 'profile.db'))
+    
+    def tearDown(self):
+        """Очистка после каждого теста"""
+        self.manager.connection.close()
+        shutil.rmtree(self.test_dir)
+    
+    def pragma(self, name):
+        """Возвращает текущее значение PRAGMA."""
+        return self.manager.connection.execute(f"PRAGMA {name}").fetchone()[0]
+    
+    def test_creates_database_in_given_path(self):
+        """Тест: база создаётся по указанному пути, включая каталоги"""
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, 'nested', 'profile.db')))
+    
+    def test_wal_profile(self):
+        """Тест: применяются WAL и остальные настройки PRAGMA"""
+        self.assertEqual(self.pragma('journal_mode'), 'wal')
+        self.assertEqual(self.pragma('synchronous'), 1)  # NORMAL
+        self.assertEqual(self.pragma('cache_size'), -8000)
+    
+    def test_custom_pragmas(self):
+        """Тест: настройки можно переопределить"""
+        from database.sqlite_manager import SQLiteManager
+        
+        manager = SQLiteManager(db_path=':memory:', pragmas={"synchronous": "FULL"})
+        self.addCleanup(manager.connection.close)
+        
+        self.assertEqual(manager.connection.execute("PRAGMA synchronous").fetchone()[0], 2)
+    
+    def test_update_statement_text_is_reused(self):
+        """Тест: одинаковый набор столбцов даёт один и тот же текст запроса"""
+        from database.sqlite_manager import _update_sql
+        
+        self.assertIs(_update_sql(('hunger', 'coins')), _update_sql(('hunger', 'coins')))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,165 @@
+"""
+Тесты для модуля game.dirty_rects
+"""
+import unittest
+import sys
+import os
+from unittest.mock import Mock, patch
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Комнаты инициализируют микшер, поэтому используем фиктивные драйверы
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+pygame.init()
+
+from game.dirty_rects import DirtyRectTracker, merge_rects
+
+
+class TestDirtyRectTracker(unittest.TestCase):
+    """Тесты для класса DirtyRectTracker"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.tracker = DirtyRectTracker((0, 0, 800, 600))
+        # Первый кадр всегда полный
+        self.tracker.collect()
+
+    def test_unchanged_state_skips_frame(self):
+        """Тест: неизменное состояние не даёт изменившихся областей"""
+        self.tracker.track('button', (10, 10, 50, 20), False)
+        self.tracker.collect()
+        self.tracker.track('button', (10, 10, 50, 20), False)
+
+        self.assertEqual(self.tracker.collect(), [])
+        self.assertEqual(self.tracker.stats["skipped"], 1)
+
+    def test_changed_state_marks_rect(self):
+        """Тест: изменение состояния помечает область компонента"""
+        self.tracker.track('button', (10, 10, 50, 20), False)
+        self.tracker.collect()
+        self.tracker.track('button', (10, 10, 50, 20), True)
+
+        self.assertEqual(self.tracker.collect(), [pygame.Rect(10, 10, 50, 20)])
+
+    def test_moved_component_marks_old_and_new_rect(self):
+        """Тест: при перемещении помечаются старая и новая области"""
+        self.tracker.track('soap', (100, 100, 20, 20), (100, 100))
+        self.tracker.collect()
+        self.tracker.track('soap', (300, 300, 20, 20), (300, 300))
+
+        rects = self.tracker.collect()
+        self.assertIn(pygame.Rect(100, 100, 20, 20), rects)
+        self.assertIn(pygame.Rect(300, 300, 20, 20), rects)
+
+    def test_vanished_component_marks_last_rect(self):
+        """Тест: исчезнувший компонент перерисовывает свою последнюю область"""
+        self.tracker.track('message', (0, 0, 800, 40), "Привет")
+        self.tracker.collect()
+
+        self.assertEqual(self.tracker.collect(), [pygame.Rect(0, 0, 800, 40)])
+        self.assertEqual(self.tracker.collect(), [])
+
+    def test_large_area_becomes_full_screen(self):
+        """Тест: большие изменения превращаются в обновление всего экрана"""
+        self.tracker.mark((0, 0, 800, 400))
+
+        self.assertEqual(self.tracker.collect(), [pygame.Rect(0, 0, 800, 600)])
+
+    def test_mark_all(self):
+        """Тест пометки всего экрана"""
+        self.tracker.mark_all()
+        self.assertEqual(self.tracker.collect(), [pygame.Rect(0, 0, 800, 600)])
+
+    def test_rects_clipped_to_screen(self):
+        """Тест: области обрезаются по границам экрана"""
+        self.tracker.mark((-10, -10, 30, 30))
+        self.assertEqual(self.tracker.collect(), [pygame.Rect(0, 0, 20, 20)])
+
+    def test_merge_rects(self):
+        """Тест объединения пересекающихся областей"""
+        merged = merge_rects([pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10),
+                              pygame.Rect(100, 100, 5, 5)])
+
+        self.assertEqual(len(merged), 2)
+        self.assertIn(pygame.Rect(0, 0, 15, 15), merged)
+
+
+class TestGameCoreDirtyMode(unittest.TestCase):
+    """Тесты режима dirty rects в GameCore"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        from database.models import Tamagotchi
+
+        self.screen = pygame.display.set_mode((800, 600))
+        patcher = patch('game.core.DatabaseManager')
+        mock_db_manager = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_db = Mock()
+        mock_db.get_latest_tamagotchi.return_value = Tamagotchi(name="Кадр")
+        mock_db_manager.return_value = mock_db
+
+        from game.core import GameCore
+        self.game = GameCore(self.screen, dirty_rects=True)
+
+    def present(self):
+        """Выводит один кадр в режиме dirty rects без обновления дисплея."""
+        with patch('pygame.display.update'):
+            return self.game.present_dirty()
+
+    def test_disabled_by_default(self):
+        """Тест: режим dirty rects включается явно"""
+        from game.core import GameCore
+
+        game = GameCore(self.screen)
+        self.assertIsNone(game.dirty_tracker)
+
+    def test_idle_frames_are_skipped(self):
+        """Тест: кадры без изменений не перерисовываются"""
+        first = self.present()
+        self.present()  # Кнопки вкладок и т.п. стабилизируются после первой отрисовки
+
+        with patch.object(self.game, 'draw') as mock_draw:
+            rects = self.present()
+
+        self.assertEqual(first, [pygame.Rect(0, 0, 800, 600)])
+        self.assertEqual(rects, [])
+        mock_draw.assert_not_called()
+
+    def test_hovered_button_updates_only_its_area(self):
+        """Тест: наведение на кнопку обновляет только её область"""
+        self.present()
+        self.present()
+        button = self.game.rooms["hall"].buttons[0]
+        button.is_hovered = True
+
+        rects = self.present()
+
+        self.assertEqual(rects, [button.rect.inflate(4, 4)])
+
+    def test_dirty_frame_matches_full_redraw(self):
+        """Тест: изображение после частичных обновлений совпадает с полной перерисовкой"""
+        self.present()
+        self.present()
+        hall = self.game.rooms["hall"]
+        hall.buttons[0].is_hovered = True
+        self.present()
+        self.game.show_message("Привет!")
+        self.present()
+        hall.buttons[0].is_hovered = False
+        self.game.current_tamagotchi.data.happiness = 10
+        self.present()
+        partial = pygame.image.tostring(self.screen, "RGB")
+
+        self.game.draw()
+        full = pygame.image.tostring(self.screen, "RGB")
+
+        self.assertEqual(partial, full)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,238 @@
+"""
+Тесты для модуля database.events
+"""
+import unittest
+import tempfile
+import shutil
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from database.memory_manager import MemoryManager
+from database.write_behind import WriteBehindQueue
+from database.events import EventLog, PetEvent
+
+
+class CountingManager(MemoryManager):
+    """MemoryManager, запоминающий запросы событий и умеющий отказывать в записи."""
+
+    def __init__(self):
+        super().__init__()
+        self.event_queries = []
+        self.fail_writes = False
+
+    def append_events(self, events, snapshots=()):
+        if self.fail_writes:
+            return False
+        return super().append_events(events, snapshots)
+
+    def load_events(self, pet_id, after_seq=0, before_seq=None, limit=None, newest_first=False):
+        events = super().load_events(pet_id, after_seq, before_seq, limit, newest_first)
+        self.event_queries.append(len(events))
+        return events
+
+
+class EventLogTests:
+    """Общие тесты EventLog для разных хранилищ"""
+
+    def create_store(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.store = self.create_store()
+        self.log = EventLog(self.store, snapshot_every=5, batch_size=4)
+        self.pet = Tamagotchi(name="Журналист")
+        self.store.save_tamagotchi(self.pet)
+
+    def play_history(self, count):
+        """Записывает count событий и возвращает показатели после каждого."""
+        states = {}
+        for seq in range(1, count + 1):
+            self.pet.hunger = seq
+            if seq % 3 == 0:
+                self.pet.coins += 10
+            self.log.record(self.pet, "feed")
+            states[seq] = (self.pet.hunger, self.pet.coins, self.pet.health)
+        return states
+
+    def test_changes_only_after_first_event(self):
+        """Тест: первое событие хранит все показатели, следующие - только изменения"""
+        first = self.log.record(self.pet, "feed")
+        self.pet.energy = 20
+        second = self.log.record(self.pet, "play", {"room": "playroom"})
+
+        self.assertEqual(first.seq, 1)
+        self.assertEqual(first.changes["health"], 100)
+        self.assertEqual(second.changes, {"energy": 20})
+        self.assertEqual(second.details, {"room": "playroom"})
+
+    def test_batched_writes(self):
+        """Тест: события записываются порциями по batch_size"""
+        self.play_history(3)
+        self.assertEqual(self.store.last_event_seq(self.pet.id), 0)
+
+        self.play_history(1)
+        self.assertEqual(self.store.last_event_seq(self.pet.id), 4)
+
+        self.log.record(self.pet, "decay")
+        self.log.flush()
+        self.assertEqual(self.store.last_event_seq(self.pet.id), 5)
+        self.assertEqual(self.store.load_snapshot(self.pet.id)[0], 5)
+
+    def test_page_includes_unwritten_events(self):
+        """Тест: страницы истории идут от новых к старым, включая буфер"""
+        self.play_history(10)
+
+        first = self.log.page(self.pet.id, limit=3)
+        second = self.log.page(self.pet.id, before_seq=first[-1].seq, limit=3)
+        rest = self.log.page(self.pet.id, before_seq=second[-1].seq, limit=10)
+
+        self.assertEqual([event.seq for event in first], [10, 9, 8])
+        self.assertEqual([event.seq for event in second], [7, 6, 5])
+        self.assertEqual([event.seq for event in rest], [4, 3, 2, 1])
+
+    def test_state_at(self):
+        """Тест: любое прошлое состояние восстанавливается из снимка и событий"""
+        states = self.play_history(13)
+        self.log.flush()
+
+        for seq, expected in states.items():
+            pet = self.log.state_at(self.pet.id, seq)
+            self.assertEqual((pet.hunger, pet.coins, pet.health), expected)
+            self.assertFalse(pet.is_dirty)
+
+    def test_sequence_continues_across_sessions(self):
+        """Тест: новый журнал продолжает нумерацию записанных событий"""
+        self.play_history(4)
+
+        event = EventLog(self.store).record(self.pet, "wake")
+
+        self.assertEqual(event.seq, 5)
+
+
+    def test_start_seeds_sequence(self):
+        """Тест: после start() запись события не обращается к хранилищу"""
+        self.play_history(4)
+        log = EventLog(self.store)
+        log.start(self.pet)
+
+        def no_query(pet_id):
+            raise AssertionError("last_event_seq called from record")
+        self.store.last_event_seq = no_query
+
+        self.assertEqual(log.record(self.pet, "wake").seq, 5)
+
+    def test_request_page_uses_submit(self):
+        """Тест: страница истории читается через submit и передается в callback"""
+        self.play_history(6)
+        self.log.flush()
+        tasks, pages = [], []
+        log = EventLog(self.store, submit=lambda function, *args: tasks.append((function, args)))
+
+        log.request_page(self.pet.id, pages.append, limit=3)
+        self.assertEqual(pages, [])
+        for function, args in tasks:
+            function(*args)
+
+        self.assertEqual([event.seq for event in pages[0]], [6, 5, 4])
+
+class TestEventLogMemory(EventLogTests, unittest.TestCase):
+    """Тесты EventLog поверх MemoryManager"""
+
+    def create_store(self):
+        return CountingManager()
+
+    def test_replay_is_bounded(self):
+        """Тест: восстановление проигрывает не больше snapshot_every событий"""
+        self.play_history(23)
+        self.log.flush()
+
+        self.log.state_at(self.pet.id, 22)
+
+        self.assertEqual(self.store.event_queries[-1], 2)
+
+    def test_failed_write_retried(self):
+        """Тест: незаписанная порция повторяется со следующей"""
+        self.store.fail_writes = True
+        self.play_history(4)
+        self.assertEqual(self.log.stats["failed"], 4)
+        self.assertEqual(len(self.log.page(self.pet.id)), 4)
+
+        self.store.fail_writes = False
+        self.play_history(1)
+        self.log.flush()
+
+        self.assertEqual([event.seq for event in self.store.load_events(self.pet.id)],
+                         [1, 2, 3, 4, 5])
+
+    def test_background_writer(self):
+        """Тест: записью событий занимается поток WriteBehindQueue"""
+        queue = WriteBehindQueue(self.store)
+        self.addCleanup(queue.close, 5)
+        log = EventLog(self.store, submit=queue.submit)
+
+        log.record(self.pet, "feed")
+        log.flush()
+        self.assertTrue(queue.flush(5))
+
+        self.assertEqual(self.store.last_event_seq(self.pet.id), 1)
+        self.assertEqual(log.stats["written"], 1)
+
+    def test_delete_removes_events(self):
+        """Тест: удаление тамагочи удаляет его журнал"""
+        self.play_history(5)
+
+        self.store.delete_tamagotchi(self.pet.id)
+
+        self.assertEqual(self.store.load_events(self.pet.id), [])
+        self.assertIsNone(self.store.load_snapshot(self.pet.id))
+
+
+class TestEventLogSQLite(EventLogTests, unittest.TestCase):
+    """Тесты EventLog поверх SQLiteManager"""
+
+    def create_store(self):
+        from database.sqlite_manager import SQLiteManager
+
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        manager = SQLiteManager(db_path=os.path.join(self.test_dir, 'events.db'))
+        self.addCleanup(manager.close)
+        return manager
+
+    def test_round_trip(self):
+        """Тест: событие читается из базы в том же виде"""
+        event = self.log.record(self.pet, "purchase", {"item": "Яблоко", "price": 10})
+        self.log.flush()
+
+        loaded = self.store.load_events(self.pet.id)[0]
+
+        self.assertEqual(loaded.to_row(), event.to_row())
+        self.assertIsInstance(loaded, PetEvent)
+
+    def test_page_uses_primary_key(self):
+        """Тест: страница истории читается по первичному ключу без сортировки"""
+        plan = self.store.connection.execute(
+            'EXPLAIN QUERY PLAN SELECT seq FROM pet_events WHERE pet_id = ? AND seq > ? '
+            'AND seq < ? ORDER BY seq DESC LIMIT ?', (1, 0, 100, 20)).fetchall()
+        details = " ".join(row[-1] for row in plan)
+
+        self.assertIn("sqlite_autoindex_pet_events_1 (pet_id=? AND seq>? AND seq<?)", details)
+        self.assertNotIn("TEMP B-TREE", details)
+
+    def test_delete_removes_events(self):
+        """Тест: удаление тамагочи удаляет его журнал"""
+        self.play_history(5)
+
+        self.store.delete_tamagotchi(self.pet.id)
+
+        self.assertEqual(self.store.load_events(self.pet.id), [])
+        self.assertEqual(self.store.last_event_seq(self.pet.id), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Тесты для модуля utils.fonts
+"""
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Комнаты инициализируют микшер, поэтому используем фиктивные драйверы
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+pygame.init()
+
+from utils.fonts import FontRegistry, FONT_REGISTRY, get_font
+
+
+class TestFontRegistry(unittest.TestCase):
+    """Тесты для класса FontRegistry"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.registry = FontRegistry()
+
+    def test_same_font_for_same_key(self):
+        """Тест: одна пара (гарнитура, размер) - один объект шрифта"""
+        first = self.registry.get(24)
+        second = self.registry.get(24)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.registry.constructions, 1)
+        self.assertEqual(self.registry.lookups, 2)
+
+    def test_different_sizes(self):
+        """Тест: разные размеры - разные шрифты"""
+        self.assertIsNot(self.registry.get(24), self.registry.get(36))
+        self.assertEqual(self.registry.constructions, 2)
+
+    def test_preload(self):
+        """Тест предварительной загрузки шрифтов"""
+        self.registry.preload((20, 30))
+        self.registry.get(20)
+        self.registry.get(30)
+
+        self.assertEqual(self.registry.stats()["fonts"], 2)
+        self.assertEqual(self.registry.constructions, 2)
+
+    def test_clear(self):
+        """Тест очистки реестра"""
+        self.registry.get(24)
+        self.registry.clear()
+
+        self.assertEqual(self.registry.stats(), {"fonts": 0, "constructions": 0, "lookups": 0})
+
+    def test_get_font_uses_process_registry(self):
+        """Тест функции get_font"""
+        self.assertIs(get_font(24), FONT_REGISTRY.get(24))
+
+
+class TestSteadyStateFrames(unittest.TestCase):
+    """Тесты: в установившихся кадрах шрифты не создаются"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        from database.models import Tamagotchi
+        from entities.tamagotchi import TamagotchiEntity
+
+        self.screen = pygame.display.set_mode((800, 600))
+        FONT_REGISTRY.clear()
+        self.tamagotchi = TamagotchiEntity(Tamagotchi(name="Шрифт"))
+
+    def draw_frame(self, drawables):
+        """Отрисовывает один кадр всеми переданными функциями."""
+        for draw in drawables:
+            draw()
+
+    def test_no_font_constructions_after_first_frame(self):
+        """Тест: после первого кадра счётчик созданий шрифтов не растёт"""
+        from game.rooms.hall import Hall
+        from game.rooms.kitchen import Kitchen
+        from game.rooms.bedroom import Bedroom
+        from game.rooms.playroom import Playroom
+        from game.rooms.bathroom import Bathroom
+        from game.rooms.shop_room import ShopRoom
+        from game.stats_window import StatsWindow
+        from entities.items import FoodItem, Inventory
+        from utils.helpers import draw_text
+
+        rooms = [Hall(), Kitchen(), Bedroom(), Playroom(), Bathroom(), ShopRoom()]
+        for i, room in enumerate(rooms):
+            room.set_neighbors(rooms[i - 1], rooms[(i + 1) % len(rooms)])
+            room.left_arrow['hovered'] = True
+
+        stats_window = StatsWindow()
+        stats_window.visible = True
+        inventory = Inventory()
+        inventory.add_food(FoodItem("Яблоко", 20, 5, 2, 10, (255, 0, 0)))
+
+        drawables = [lambda room=room: room.draw(self.screen, self.tamagotchi) for room in rooms]
+        drawables += [
+            lambda: rooms[0].draw_info_texts(self.screen),
+            lambda: stats_window.draw(self.screen, self.tamagotchi),
+            lambda: inventory.draw(self.screen),
+            lambda: draw_text(self.screen, "Текст", 36, 400, 300),
+        ]
+
+        # Первый кадр может заполнить реестр
+        self.draw_frame(drawables)
+        constructions = FONT_REGISTRY.constructions
+
+        with patch('pygame.font.Font', wraps=pygame.font.Font) as mock_font:
+            for _ in range(3):
+                self.draw_frame(drawables)
+
+        self.assertEqual(FONT_REGISTRY.constructions, constructions)
+        mock_font.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Тесты для модуля game.frame_pacer
+"""
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+pygame.init()
+
+from game.frame_pacer import FramePacer, ACTIVE, IDLE, BACKGROUND
+
+
+class FakeTime:
+    """Управляемые часы: pygame.event.wait и pygame.time.wait сдвигают время."""
+
+    def __init__(self):
+        self.now = 1000
+        self.waits = []
+        self.queue = []
+
+    def get_ticks(self):
+        return self.now
+
+    def event_wait(self, timeout):
+        self.waits.append(timeout)
+        if self.queue:
+            return self.queue.pop(0)
+        self.now += timeout
+        return pygame.event.Event(pygame.NOEVENT)
+
+    def time_wait(self, ms):
+        self.now += ms
+        return ms
+
+
+class TestFramePacer(unittest.TestCase):
+    """Тесты для класса FramePacer"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.time = FakeTime()
+        patchers = [
+            patch('pygame.time.get_ticks', self.time.get_ticks),
+            patch('pygame.event.wait', self.time.event_wait),
+            patch('pygame.time.wait', self.time.time_wait),
+            patch('pygame.event.get', return_value=[]),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.pacer = FramePacer(active_fps=50, idle_fps=10, background_fps=1)
+
+    def test_select_mode(self):
+        """Тест выбора режима"""
+        self.assertEqual(self.pacer.select_mode(True), ACTIVE)
+        self.assertEqual(self.pacer.select_mode(False), IDLE)
+
+        self.pacer.focused = False
+        self.assertEqual(self.pacer.select_mode(True), BACKGROUND)
+
+        self.pacer.focused = True
+        self.pacer.minimized = True
+        self.assertEqual(self.pacer.select_mode(False), BACKGROUND)
+
+    def test_idle_sleeps_in_event_wait(self):
+        """Тест: в простое процесс спит в event.wait до следующего кадра"""
+        self.pacer.wait(False)
+
+        self.assertEqual(self.time.waits, [100])
+        self.assertEqual(self.time.now, 1100)
+
+    def test_active_rate(self):
+        """Тест: во время анимации кадры идут с полной частотой"""
+        self.pacer.wait(True)
+        self.assertEqual(self.time.now, 1020)
+
+    def test_background_rate(self):
+        """Тест: свёрнутое окно просыпается раз в секунду"""
+        self.pacer.minimized = True
+        self.pacer.wait(False)
+
+        self.assertEqual(self.time.now, 2000)
+        self.assertEqual(self.pacer.stats[BACKGROUND], 1)
+
+    def test_event_wakes_idle_loop(self):
+        """Тест: событие будит цикл раньше, но не чаще полной частоты"""
+        click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(10, 10))
+        self.time.queue.append(click)
+
+        events = self.pacer.wait(False)
+
+        self.assertEqual(events, [click])
+        self.assertEqual(self.time.now, 1020)
+
+    def test_focus_events(self):
+        """Тест отслеживания фокуса и сворачивания окна"""
+        self.pacer.observe(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+        self.assertFalse(self.pacer.focused)
+        self.pacer.observe(pygame.event.Event(pygame.WINDOWFOCUSGAINED))
+        self.assertTrue(self.pacer.focused)
+
+        self.pacer.observe(pygame.event.Event(pygame.WINDOWMINIMIZED))
+        self.assertTrue(self.pacer.minimized)
+        self.pacer.observe(pygame.event.Event(pygame.WINDOWRESTORED))
+        self.assertFalse(self.pacer.minimized)
+
+
+class TestGameCoreAnimating(unittest.TestCase):
+    """Тесты выбора полной частоты кадров в GameCore"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        from database.models import Tamagotchi
+
+        pygame.display.set_mode((800, 600))
+        patcher = patch('game.core.DatabaseManager')
+        mock_db_manager = patcher.start()
+        self.addCleanup(patcher.stop)
+        mock_db_manager.return_value.get_latest_tamagotchi.return_value = Tamagotchi(name="Темп")
+
+        from game.core import GameCore
+        self.game = GameCore(pygame.display.get_surface())
+
+    def test_idle_hall(self):
+        """Тест: в зале без анимаций полная частота не нужна"""
+        self.assertFalse(self.game.is_animating())
+
+    def test_eating_animation(self):
+        """Тест: анимация поедания требует полной частоты"""
+        self.game.current_tamagotchi.eating_animation = True
+        self.assertTrue(self.game.is_animating())
+
+    def test_bathroom_dragging(self):
+        """Тест: перетаскивание мыла в ванной требует полной частоты"""
+        self.game.current_room = "bathroom"
+        self.assertFalse(self.game.is_animating())
+
+        self.game.rooms["bathroom"].holding_soap = True
+        self.assertTrue(self.game.is_animating())
+
+    def test_shop_seller(self):
+        """Тест: в магазине продавец анимирован"""
+        self.game.current_room = "shop"
+        self.assertTrue(self.game.is_animating())
+
+
+if __name__ == '__main__':
+    unittest.main()
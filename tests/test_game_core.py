@@ -35,7 +35,7 @@ class TestGameCore(unittest.TestCase):
         from game.core import GameCore
         
         mock_db = Mock()
-        mock_db.get_all_tamagotchis.return_value = []
+        mock_db.get_latest_tamagotchi.return_value = None
         mock_db.save_tamagotchi.return_value = True
         mock_db_manager.return_value = mock_db
         
@@ -53,7 +53,7 @@ class TestGameCore(unittest.TestCase):
         from game.core import GameCore
         
         mock_db = Mock()
-        mock_db.get_all_tamagotchis.return_value = []
+        mock_db.get_latest_tamagotchi.return_value = None
         mock_db.save_tamagotchi.return_value = True
         mock_db_manager.return_value = mock_db
         
@@ -72,7 +72,7 @@ class TestGameCore(unittest.TestCase):
         
         existing_tamagotchi = Tamagotchi(name="Существующий")
         mock_db = Mock()
-        mock_db.get_all_tamagotchis.return_value = [existing_tamagotchi]
+        mock_db.get_latest_tamagotchi.return_value = existing_tamagotchi
         mock_db_manager.return_value = mock_db
         
         game = GameCore(self.mock_screen)
@@ -87,7 +87,7 @@ class TestGameCore(unittest.TestCase):
         from game.core import GameCore
         
         mock_db = Mock()
-        mock_db.get_all_tamagotchis.return_value = []
+        mock_db.get_latest_tamagotchi.return_value = None
         mock_db.save_tamagotchi.return_value = True
         mock_db_manager.return_value = mock_db
         
@@ -108,15 +108,54 @@ class TestGameCore(unittest.TestCase):
         
         tamagotchi_data = Tamagotchi(name="Тест")
         mock_db = Mock()
-        mock_db.get_all_tamagotchis.return_value = [tamagotchi_data]
+        mock_db.get_latest_tamagotchi.return_value = tamagotchi_data
         mock_db.save_tamagotchi.return_value = True
         mock_db_manager.return_value = mock_db
         
         game = GameCore(self.mock_screen)
         game.auto_save()
+        game.save_queue.flush(5)
         
         mock_db.save_tamagotchi.assert_called()
     
+    @patch('game.core.ROOMS_AVAILABLE', False)
+    def test_async_storage(self):
+        """Тест: GameCore работает с асинхронным хранилищем через адаптер"""
+        from game.core import GameCore
+        from database.async_storage import AsyncMemoryStorage, AsyncStorageAdapter
+        
+        storage = AsyncMemoryStorage()
+        game = GameCore(self.mock_screen, storage=storage)
+        self.addCleanup(game.db.close)
+        
+        self.assertIsInstance(game.db, AsyncStorageAdapter)
+        self.assertIsNotNone(game.event_log)
+        self.assertIsNotNone(game.stat_history)
+        self.assertIs(game.achievements.store, game.db)
+        pet = storage.manager.get_latest_tamagotchi()
+        self.assertIs(pet, game.current_tamagotchi.data)
+        
+        pet.hunger = 10
+        game.auto_save()
+        self.assertTrue(game.save_queue.flush(5))
+        
+        self.assertEqual(storage.manager.load_tamagotchi(pet.id).hunger, 10)
+    
+    @patch('game.core.pygame.quit')
+    @patch('game.core.ROOMS_AVAILABLE', False)
+    def test_exit_closes_storage(self, mock_quit):
+        """Тест: при выходе хранилище закрывается после записи очереди"""
+        from game.core import GameCore
+        from database.async_storage import AsyncMemoryStorage
+        
+        game = GameCore(self.mock_screen, storage=AsyncMemoryStorage())
+        game.db.close = Mock(wraps=game.db.close)
+        game.running = False
+        game.run()
+        
+        game.db.close.assert_called_once()
+        self.assertFalse(game.save_queue.enqueue(game.current_tamagotchi.data))
+    
     @patch('game.core.DatabaseManager')
     @patch('game.core.ROOMS_AVAILABLE', False)
     def test_exit_minigame(self, mock_db_manager):
@@ -124,7 +163,7 @@ class TestGameCore(unittest.TestCase):
         from game.core import GameCore
         
         mock_db = Mock()
-        mock_db.get_all_tamagotchis.return_value = []
+        mock_db.get_latest_tamagotchi.return_value = None
         mock_db.save_tamagotchi.return_value = True
         mock_db_manager.return_value = mock_db
         
@@ -141,6 +180,69 @@ class TestGameCore(unittest.TestCase):
         mock_minigame.finish.assert_called_once()
 
 
+    @patch('game.core.ROOMS_AVAILABLE', False)
+    def test_event_log(self):
+        """Тест: действия с тамагочи попадают в журнал событий"""
+        from game.core import GameCore
+        from database.memory_manager import MemoryManager
+        
+        storage = MemoryManager()
+        game = GameCore(self.mock_screen, storage=storage)
+        
+        game.current_tamagotchi.feed(30)
+        game.current_minigame = Mock()
+        game.current_minigame.finish.return_value = (15, 5, 0, 0)
+        game.exit_minigame()
+        self.assertTrue(game.save_queue.flush(5))
+        
+        pet_id = game.current_tamagotchi.data.id
+        events = storage.load_events(pet_id)
+        self.assertEqual([event.kind for event in events], ["feed", "minigame_reward"])
+        self.assertEqual(events[1].details, {"coins": 15, "happiness": 5})
+        self.assertIs(game.stats_window.event_log, game.event_log)
+
+    @patch('game.core.ROOMS_AVAILABLE', False)
+    def test_stat_history(self):
+        """Тест: игровой цикл записывает отсчеты истории показателей"""
+        from game.core import GameCore
+        from database.memory_manager import MemoryManager
+        
+        storage = MemoryManager()
+        game = GameCore(self.mock_screen, storage=storage)
+        
+        game.update()
+        game.update()
+        game.auto_save()
+        self.assertTrue(game.save_queue.flush(5))
+        
+        pet_id = game.current_tamagotchi.data.id
+        chunks = storage.load_stat_chunks(pet_id, 0)
+        # Второй кадр пришел раньше STAT_SAMPLE_INTERVAL - отсчет один
+        self.assertEqual([chunk[4] for chunk in chunks], [1])
+        self.assertIs(game.stats_window.stat_history, game.stat_history)
+
+    @patch('game.core.ROOMS_AVAILABLE', False)
+    def test_achievements(self):
+        """Тест: события тамагочи учитываются в достижениях и сохраняются"""
+        from game.core import GameCore
+        from database.memory_manager import MemoryManager
+        
+        storage = MemoryManager()
+        game = GameCore(self.mock_screen, storage=storage)
+        # Сохраненный прогресс загружается в очереди записи
+        self.assertTrue(game.save_queue.flush(5))
+        self.assertFalse(game.achievements.loading)
+        
+        game.current_minigame = Mock()
+        game.current_minigame.finish.return_value = (15, 5, 0, 0)
+        game.exit_minigame()
+        game.auto_save()
+        self.assertTrue(game.save_queue.flush(5))
+        
+        pet_id = game.current_tamagotchi.data.id
+        self.assertEqual(storage.load_achievements(pet_id)["energizer"], (1, None))
+        self.assertIs(game.stats_window.achievements, game.achievements)
+
 if __name__ == '__main__':
     unittest.main()
 
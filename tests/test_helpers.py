@@ -16,6 +16,7 @@ except:
     pass
 
 from utils.helpers import draw_text, draw_progress_bar
+from utils.fonts import FONT_REGISTRY
 from config import BLACK, RED, GREEN, BLUE
 
 
@@ -26,6 +27,12 @@ class TestDrawText(unittest.TestCase):
         """Настройка перед каждым тестом"""
         self.surface = Mock()
         self.surface.blit = Mock()
+        # Шрифт должен создаваться заново, чтобы попасть в мок pygame.font.Font
+        FONT_REGISTRY.clear()
+    
+    def tearDown(self):
+        """Очистка после каждого теста - убираем мок-шрифты из реестра"""
+        FONT_REGISTRY.clear()
     
     @patch('pygame.font.Font')
     def test_draw_text(self, mock_font):
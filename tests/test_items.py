@@ -10,6 +10,7 @@ from unittest.mock import Mock, patch
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from entities.items import FoodItem, Inventory
+from utils.fonts import FONT_REGISTRY
 
 
 class TestFoodItem(unittest.TestCase):
@@ -32,6 +33,10 @@ class TestFoodItem(unittest.TestCase):
             color=(255, 0, 0)
         )
     
+    def tearDown(self):
+        """Очистка после каждого теста - убираем мок-шрифты из реестра"""
+        FONT_REGISTRY.clear()
+    
     def test_init(self):
         """Тест инициализации предмета еды"""
         self.assertEqual(self.food.name, "Яблоко")
@@ -122,6 +127,10 @@ class TestInventory(unittest.TestCase):
         self.food1 = FoodItem("Яблоко", 20, 10, 5, 10, (255, 0, 0))
         self.food2 = FoodItem("Банан", 15, 8, 3, 8, (255, 255, 0))
     
+    def tearDown(self):
+        """Очистка после каждого теста - убираем мок-шрифты из реестра"""
+        FONT_REGISTRY.clear()
+    
     def test_init(self):
         """Тест инициализации инвентаря"""
         self.assertEqual(len(self.inventory.food_items), 0)
@@ -0,0 +1,210 @@
+"""
+Тесты для модуля database.migrations
+"""
+import unittest
+import sqlite3
+import tempfile
+import sys
+import os
+from unittest.mock import Mock
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.migrations import MigrationRunner, discover_migrations
+from database.migrations.runner import split_statements
+from database.sqlite_manager import SQLiteManager
+
+
+def query_plan(connection, sql, params=()):
+    """Возвращает план запроса SQLite одной строкой."""
+    plan = connection.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return " ".join(row[-1] for row in plan)
+
+
+class TestDiscoverMigrations(unittest.TestCase):
+    """Тесты поиска файлов миграций"""
+
+    def test_dialect_variant_replaces_shared_file(self):
+        """Тест: для SQLite берётся свой вариант начальной миграции"""
+        sqlite_files = [os.path.basename(path) for _, _, path in discover_migrations('sqlite')]
+        postgres_files = [os.path.basename(path) for _, _, path in discover_migrations('postgres')]
+
+        self.assertEqual(sqlite_files[:2], ['001_initial.sqlite.sql', '002_indexes.sql'])
+        self.assertEqual(postgres_files[:2], ['001_initial.sql', '002_indexes.sql'])
+
+    def test_unknown_dialect(self):
+        """Тест: неизвестный диалект отклоняется"""
+        with self.assertRaises(ValueError):
+            discover_migrations('mysql')
+
+    def test_duplicate_version(self):
+        """Тест: две разные миграции с одним номером - ошибка"""
+        with tempfile.TemporaryDirectory() as directory:
+            for filename in ('001_first.sql', '001_second.sql'):
+                with open(os.path.join(directory, filename), 'w') as f:
+                    f.write('SELECT 1;')
+            with self.assertRaises(ValueError):
+                discover_migrations('sqlite', directory)
+
+    def test_split_statements(self):
+        """Тест: точка с запятой внутри строки не разрывает выражение"""
+        statements = split_statements("-- comment\nINSERT INTO t VALUES ('a;b');\nSELECT 1;\n")
+
+        self.assertEqual(len(statements), 2)
+        self.assertIn("'a;b'", statements[0])
+
+
+class TestMigrationRunner(unittest.TestCase):
+    """Тесты применения миграций"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.connection = sqlite3.connect(':memory:')
+        self.runner = MigrationRunner(self.connection, 'sqlite')
+
+    def tearDown(self):
+        """Очистка после каждого теста"""
+        self.connection.close()
+
+    def test_migrate_fresh_database(self):
+        """Тест: пустая база доводится до последней версии"""
+        applied = self.runner.migrate()
+
+        self.assertEqual(applied[:2], [1, 2])
+        self.assertEqual(self.runner.current_version(), applied[-1])
+        tables = {row[0] for row in self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'")}
+        self.assertTrue({'tamagotchis', 'items', 'schema_migrations'} <= tables)
+
+    def test_migrate_is_idempotent(self):
+        """Тест: повторный запуск ничего не применяет"""
+        self.runner.migrate()
+
+        self.assertEqual(self.runner.migrate(), [])
+        self.assertEqual(self.runner.pending(), [])
+        items = self.connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        self.assertEqual(items, 5)
+
+    def test_existing_database_without_versions(self):
+        """Тест: база, созданная до появления миграций, обновляется без потерь"""
+        self.connection.execute('''
+            CREATE TABLE tamagotchis (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                hunger INTEGER DEFAULT 50,
+                happiness INTEGER DEFAULT 50,
+                health INTEGER DEFAULT 100,
+                cleanliness INTEGER DEFAULT 50,
+                energy INTEGER DEFAULT 100,
+                age INTEGER DEFAULT 0,
+                coins INTEGER DEFAULT 100,
+                evolution_stage INTEGER DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                last_updated TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        self.connection.execute("INSERT INTO tamagotchis (name) VALUES ('Старичок')")
+        self.connection.commit()
+
+        self.runner.migrate()
+
+        names = [row[0] for row in self.connection.execute("SELECT name FROM tamagotchis")]
+        self.assertEqual(names, ['Старичок'])
+
+    def test_existing_items_are_not_duplicated(self):
+        """Тест: предметы из базы, созданной до миграций, не добавляются повторно"""
+        self.connection.execute('''
+            CREATE TABLE items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                type TEXT NOT NULL,
+                price INTEGER NOT NULL,
+                effect_value INTEGER NOT NULL
+            )
+        ''')
+        self.connection.execute(
+            "INSERT INTO items (name, type, price, effect_value) VALUES ('Apple', 'food', 10, 15)")
+        self.connection.commit()
+
+        self.runner.migrate()
+
+        names = [row[0] for row in self.connection.execute("SELECT name FROM items ORDER BY id")]
+        self.assertEqual(names, ['Apple', 'Pizza', 'Ball', 'Medicine', 'Soap'])
+
+    def test_failed_migration_rolls_back(self):
+        """Тест: ошибка в миграции откатывает её целиком"""
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, '001_good.sql'), 'w') as f:
+                f.write('CREATE TABLE first (id INTEGER);\n')
+            with open(os.path.join(directory, '002_bad.sql'), 'w') as f:
+                f.write('CREATE TABLE second (id INTEGER);\nNOT VALID SQL;\n')
+            runner = MigrationRunner(self.connection, 'sqlite', directory)
+
+            with self.assertRaises(sqlite3.Error):
+                runner.migrate()
+
+            self.assertEqual(runner.current_version(), 1)
+            tables = {row[0] for row in self.connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'")}
+            self.assertIn('first', tables)
+            self.assertNotIn('second', tables)
+
+    def test_postgres_dialect(self):
+        """Тест: для PostgreSQL файл выполняется целиком, версия пишется с %s"""
+        connection = Mock()
+        cursor = Mock()
+        cursor.fetchall.return_value = [(1,)]
+        connection.cursor.return_value = cursor
+        runner = MigrationRunner(connection, 'postgres')
+
+        self.assertEqual(runner.migrate()[0], 2)
+
+        statements = [call[0][0] for call in cursor.execute.call_args_list]
+        self.assertTrue(any('idx_tamagotchis_last_updated' in sql for sql in statements))
+        self.assertIn('VALUES (%s, %s)', statements[-1])
+        connection.commit.assert_called()
+
+
+class TestIndexes(unittest.TestCase):
+    """Тесты использования индексов в частых запросах"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.manager = SQLiteManager(db_path=':memory:')
+        self.connection = self.manager.connection
+
+    def tearDown(self):
+        """Очистка после каждого теста"""
+        self.connection.close()
+
+    def test_schema_version(self):
+        """Тест: менеджер запоминает версию схемы"""
+        self.assertGreaterEqual(self.manager.schema_version, 2)
+
+    def test_newest_first_uses_index(self):
+        """Тест: список от новых к старым читается по индексу без сортировки"""
+        details = query_plan(self.connection,
+                             "SELECT * FROM tamagotchis ORDER BY created_at DESC, id DESC LIMIT 1")
+
+        self.assertIn('idx_tamagotchis_created_at', details)
+        self.assertNotIn('TEMP B-TREE', details)
+
+    def test_last_updated_uses_index(self):
+        """Тест: поиск давно не сохранявшихся питомцев идёт по индексу"""
+        details = query_plan(self.connection,
+                             "SELECT id FROM tamagotchis WHERE last_updated < ? "
+                             "ORDER BY last_updated", ('2024-01-01 00:00:00',))
+
+        self.assertIn('idx_tamagotchis_last_updated', details)
+        self.assertNotIn('TEMP B-TREE', details)
+
+    def test_lookup_by_id_uses_primary_key(self):
+        """Тест: загрузка по ID не просматривает таблицу целиком"""
+        details = query_plan(self.connection, "SELECT * FROM tamagotchis WHERE id = ?", (1,))
+
+        self.assertIn('INTEGER PRIMARY KEY', details)
+
+
+if __name__ == '__main__':
+    unittest.main()
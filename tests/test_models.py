@@ -131,6 +131,77 @@ class TestTamagotchi(unittest.TestCase):
         self.assertEqual(original.coins, restored.coins)
         self.assertEqual(original.evolution_stage, restored.evolution_stage)
 
+    
+    def test_new_tamagotchi_is_dirty(self):
+        """Тест: новый объект ещё не сохранён, все поля изменены"""
+        t = Tamagotchi(name="Новый")
+        self.assertTrue(t.is_dirty)
+        self.assertIn('hunger', t.dirty_fields)
+        self.assertEqual(t.version, 0)
+    
+    def test_from_dict_is_clean(self):
+        """Тест: загруженный объект не содержит изменений"""
+        t = Tamagotchi.from_dict({'id': 1, 'name': 'Загруженный'})
+        self.assertFalse(t.is_dirty)
+        self.assertEqual(t.version, 0)
+    
+    def test_change_tracking(self):
+        """Тест отслеживания изменённых полей и счётчика версий"""
+        t = Tamagotchi.from_dict({'id': 1, 'name': 'Отслеживаемый'})
+        
+        t.hunger = 50  # То же значение - не изменение
+        self.assertFalse(t.is_dirty)
+        
+        t.hunger = 40
+        t.coins = 150
+        t.last_updated = datetime(2024, 1, 1)  # Не отслеживается
+        self.assertEqual(t.dirty_fields, {'hunger', 'coins'})
+        self.assertEqual(t.changed_columns(), ['hunger', 'coins'])
+        self.assertEqual(t.version, 2)
+        
+        t.mark_clean()
+        self.assertFalse(t.is_dirty)
+        self.assertEqual(t.version, 2)
+    
+    def test_snapshot(self):
+        """Тест: копия сохраняет данные, изменённые поля и версию"""
+        t = Tamagotchi.from_dict({'id': 3, 'name': 'Оригинал'})
+        t.energy = 10
+        
+        copy = t.snapshot()
+        t.energy = 20
+        
+        self.assertEqual(copy.energy, 10)
+        self.assertEqual(copy.dirty_fields, {'energy'})
+        self.assertEqual(copy.version, 1)
+        self.assertEqual(copy.id, 3)
+
+
+    def test_from_row(self):
+        """Тест: объект из строки таблицы сохранён и не содержит изменений"""
+        created = datetime(2024, 1, 1, 12, 0)
+        row = (7, 'Строка', 10, 20, 30, 40, 50, 3, 250, 2, created, created)
+        
+        t = Tamagotchi.from_row(row)
+        
+        self.assertEqual(t.id, 7)
+        self.assertEqual(t.name, 'Строка')
+        self.assertEqual(t.coins, 250)
+        self.assertEqual(t.evolution_stage, 2)
+        self.assertEqual(t.created_at, created)
+        self.assertFalse(t.is_dirty)
+        self.assertEqual(t.version, 0)
+        self.assertEqual(t.to_row(), row)
+        
+        t.hunger = 15
+        self.assertEqual(t.dirty_fields, {'hunger'})
+        self.assertEqual(t.version, 1)
+    
+    def test_slots(self):
+        """Тест: у объекта нет словаря экземпляра"""
+        self.assertFalse(hasattr(self.tamagotchi, '__dict__'))
+        with self.assertRaises(AttributeError):
+            self.tamagotchi.mood = 'весёлый'
 
 if __name__ == '__main__':
     unittest.main()
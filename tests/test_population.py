@@ -0,0 +1,133 @@
+"""
+Тесты для модуля game.population
+"""
+import unittest
+import random
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from game.simulation import PetSimulation, ManualClock
+from game.population import PetPopulation, NUMPY_AVAILABLE
+
+FIELDS = ("hunger", "happiness", "health", "cleanliness", "energy", "age", "evolution_stage")
+TIMERS = ("is_sleeping", "last_update_time", "last_energy_regen", "sleep_start_time",
+          "last_passive_update")
+
+
+def random_simulations(count, seed=7):
+    """Создаёт симуляции со случайными показателями и таймерами."""
+    rng = random.Random(seed)
+    simulations = []
+    for index in range(count):
+        clock = ManualClock()
+        pet = Tamagotchi(name=f"Питомец {index}")
+        pet.hunger = rng.randint(0, 100)
+        pet.happiness = rng.randint(0, 100)
+        pet.health = rng.randint(0, 100)
+        pet.cleanliness = rng.choice([rng.randint(0, 100), rng.uniform(0, 100)])
+        pet.energy = rng.randint(0, 100)
+        pet.age = rng.randint(0, 20)
+        pet.evolution_stage = rng.randint(1, 3)
+        simulation = PetSimulation(pet, clock)
+        clock.set(rng.randint(0, 40000))
+        simulation.last_update_time = rng.randint(0, 30000)
+        simulation.last_passive_update = rng.randint(0, 120000)
+        if rng.random() < 0.5:
+            simulation.sleep()
+        simulations.append(simulation)
+    return simulations
+
+
+def snapshot(simulations):
+    """Возвращает состояние симуляций для сравнения."""
+    return [tuple(getattr(s.data, f) for f in FIELDS) + tuple(getattr(s, t) for t in TIMERS)
+            for s in simulations]
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy не установлен")
+class TestPetPopulation(unittest.TestCase):
+    """Тесты для класса PetPopulation"""
+
+    def test_step_matches_scalar(self):
+        """Тест: векторизованный шаг совпадает со скалярным бит в бит"""
+        scalar = random_simulations(200)
+        batch = random_simulations(200)
+        population = PetPopulation.from_simulations(batch, now=0)
+
+        for now in (30001, 45000, 400000, 400500, 1000000):
+            for simulation in scalar:
+                simulation.step(now)
+            population.step(now)
+
+        population.write_back(batch)
+        self.assertEqual(snapshot(batch), snapshot(scalar))
+
+    def test_advance_matches_scalar(self):
+        """Тест: прокрутка популяции совпадает с PetSimulation.advance()"""
+        scalar = random_simulations(50, seed=3)
+        batch = random_simulations(50, seed=3)
+        population = PetPopulation.from_simulations(batch, now=40000)
+
+        for simulation in scalar:
+            simulation.clock.set(40000)
+            simulation.advance(3 * 60 * 60 * 1000)
+        population.advance(3 * 60 * 60 * 1000)
+
+        population.write_back(batch)
+        self.assertEqual(snapshot(batch), snapshot(scalar))
+
+    def test_advance_staggered_timers(self):
+        """Тест: число шагов не растёт с числом питомцев с разными таймерами"""
+        hour = 60 * 60 * 1000
+        scalar = random_simulations(400, seed=11)
+        batch = random_simulations(400, seed=11)
+        population = PetPopulation.from_simulations(batch, now=40000)
+
+        for simulation in scalar:
+            simulation.clock.set(40000)
+            simulation.advance(hour)
+        steps = population.advance(hour)
+
+        population.write_back(batch)
+        self.assertEqual(snapshot(batch), snapshot(scalar))
+        # Не больше срабатываний самого активного питомца: сон, снижение и пассивные эффекты
+        self.assertLessEqual(steps, hour // 10001 + hour // 30001 + hour // 120001 + 3)
+
+    def test_evolution(self):
+        """Тест: шаг возвращает индексы эволюционировавших питомцев"""
+        young, grown = Tamagotchi(name="Малыш"), Tamagotchi(name="Подросток")
+        grown.age = 6
+        population = PetPopulation([young, grown])
+
+        evolved = population.step(300001)
+
+        self.assertEqual(list(evolved), [1])
+        population.write_back([young, grown])
+        self.assertEqual((young.evolution_stage, grown.evolution_stage), (1, 2))
+        self.assertEqual(grown.age, 7)
+
+    def test_write_back_types(self):
+        """Тест: целые показатели возвращаются как int"""
+        pet = Tamagotchi(name="Тип")
+        pet.cleanliness = 42.5
+        population = PetPopulation([pet])
+        population.step(30001)
+        population.write_back([pet])
+
+        self.assertIsInstance(pet.hunger, int)
+        self.assertEqual(pet.hunger, 45)
+        self.assertEqual(pet.cleanliness, 40.5)
+
+    def test_empty_population(self):
+        """Тест пустой популяции"""
+        population = PetPopulation([])
+        self.assertEqual(len(population), 0)
+        self.assertEqual(population.advance(100000), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@
 import unittest
 import sys
 import os
+import threading
 from unittest.mock import Mock, patch, MagicMock
 
 # Добавляем корневую директорию проекта в путь
@@ -19,6 +20,19 @@ except ImportError:
     PSYCOPG2_AVAILABLE = False
 
 
+def row(id, name='Pou'):
+    """Возвращает строку таблицы tamagotchis в порядке ROW_COLUMNS."""
+    return (id, name, 50, 50, 100, 50, 100, 0, 100, 1, None, None)
+
+
+def open_connection():
+    """Возвращает мок открытого соединения без активной транзакции."""
+    connection = Mock()
+    connection.closed = 0
+    connection.info.transaction_status = 0  # TRANSACTION_STATUS_IDLE
+    return connection
+
+
 class TestPostgresManager(unittest.TestCase):
     """Тесты для класса PostgresManager"""
     
@@ -32,14 +46,14 @@ class TestPostgresManager(unittest.TestCase):
         """Тест инициализации PostgresManager"""
         from database.postgres_manager import PostgresManager
         
-        mock_connection = Mock()
+        mock_connection = open_connection()
         mock_cursor = Mock()
         mock_connection.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_connection
         
         manager = PostgresManager()
         
-        self.assertIsNotNone(manager.connection)
+        self.assertIsNotNone(manager.pool)
         mock_connect.assert_called_once()
         mock_cursor.execute.assert_called()
     
@@ -49,7 +63,7 @@ class TestPostgresManager(unittest.TestCase):
         """Тест сохранения нового тамагочи"""
         from database.postgres_manager import PostgresManager
         
-        mock_connection = Mock()
+        mock_connection = open_connection()
         mock_cursor = Mock()
         mock_cursor.fetchone.return_value = [1]  # Возвращаем ID
         mock_connection.cursor.return_value = mock_cursor
@@ -70,7 +84,7 @@ class TestPostgresManager(unittest.TestCase):
         """Тест обновления существующего тамагочи"""
         from database.postgres_manager import PostgresManager
         
-        mock_connection = Mock()
+        mock_connection = open_connection()
         mock_cursor = Mock()
         mock_connection.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_connection
@@ -89,23 +103,11 @@ class TestPostgresManager(unittest.TestCase):
         """Тест загрузки тамагочи"""
         from database.postgres_manager import PostgresManager
         
-        mock_connection = Mock()
+        mock_connection = open_connection()
         mock_cursor = Mock()
-        mock_row = {
-            'id': 1,
-            'name': 'Загруженный',
-            'hunger': 50,
-            'happiness': 50,
-            'health': 100,
-            'cleanliness': 50,
-            'energy': 100,
-            'age': 0,
-            'coins': 100,
-            'evolution_stage': 1,
-            'created_at': None,
-            'last_updated': None
-        }
-        mock_cursor.fetchone.return_value = mock_row
+        # Строка в порядке ROW_COLUMNS
+        mock_row = (1, 'Загруженный', 50, 50, 100, 50, 100, 0, 100, 1, None, None)
+        mock_cursor.fetchall.return_value = [mock_row]
         mock_connection.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_connection
         
@@ -115,6 +117,9 @@ class TestPostgresManager(unittest.TestCase):
         
         self.assertIsNotNone(result)
         self.assertEqual(result.name, 'Загруженный')
+        self.assertEqual(result.evolution_stage, 1)
+        self.assertFalse(result.is_dirty)
+        self.assertNotIn('SELECT *', mock_cursor.execute.call_args[0][0])
     
     @unittest.skipIf(not PSYCOPG2_AVAILABLE, "psycopg2 не установлен")
     @patch('database.postgres_manager.psycopg2.connect')
@@ -122,9 +127,9 @@ class TestPostgresManager(unittest.TestCase):
         """Тест загрузки несуществующего тамагочи"""
         from database.postgres_manager import PostgresManager
         
-        mock_connection = Mock()
+        mock_connection = open_connection()
         mock_cursor = Mock()
-        mock_cursor.fetchone.return_value = None
+        mock_cursor.fetchall.return_value = []
         mock_connection.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_connection
         
@@ -140,17 +145,14 @@ class TestPostgresManager(unittest.TestCase):
         """Тест получения всех тамагочи"""
         from database.postgres_manager import PostgresManager
         
-        mock_connection = Mock()
+        mock_connection = open_connection()
         mock_cursor = Mock()
         mock_rows = [
-            {'id': 1, 'name': 'Первый', 'hunger': 50, 'happiness': 50, 'health': 100,
-             'cleanliness': 50, 'energy': 100, 'age': 0, 'coins': 100, 'evolution_stage': 1,
-             'created_at': None, 'last_updated': None},
-            {'id': 2, 'name': 'Второй', 'hunger': 60, 'happiness': 60, 'health': 90,
-             'cleanliness': 60, 'energy': 90, 'age': 1, 'coins': 150, 'evolution_stage': 2,
-             'created_at': None, 'last_updated': None}
+            (1, 'Первый', 50, 50, 100, 50, 100, 0, 100, 1, None, None),
+            (2, 'Второй', 60, 60, 90, 60, 90, 1, 150, 2, None, None)
         ]
-        mock_cursor.fetchall.return_value = mock_rows
+        # Список читается порциями через серверный курсор
+        mock_cursor.fetchmany.side_effect = [mock_rows, []]
         mock_connection.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_connection
         
@@ -177,6 +179,353 @@ class TestPostgresManager(unittest.TestCase):
         # (зависит от реализации, может быть None или установлен)
         mock_connect.assert_called_once()
 
+    
+    @unittest.skipIf(not PSYCOPG2_AVAILABLE, "psycopg2 не установлен")
+    @patch('database.postgres_manager.psycopg2.connect')
+    def test_save_changed_columns_only(self, mock_connect):
+        """Тест: UPDATE содержит только изменённые столбцы"""
+        from database.postgres_manager import PostgresManager
+        
+        mock_connection = open_connection()
+        mock_cursor = Mock()
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+        
+        manager = PostgresManager()
+        mock_cursor.execute.reset_mock()
+        
+        tamagotchi = Tamagotchi.from_dict({'id': 7, 'name': 'Частичный'})
+        tamagotchi.hunger = 80
+        result = manager.save_tamagotchi(tamagotchi)
+        
+        self.assertTrue(result)
+        sql, params = mock_cursor.execute.call_args[0]
+        self.assertIn('hunger=%s', sql)
+        self.assertNotIn('coins=%s', sql)
+        self.assertEqual(params, [80, 7])
+        self.assertFalse(tamagotchi.is_dirty)
+    
+    @unittest.skipIf(not PSYCOPG2_AVAILABLE, "psycopg2 не установлен")
+    @patch('database.postgres_manager.psycopg2.connect')
+    def test_save_clean_tamagotchi_skipped(self, mock_connect):
+        """Тест: сохранение без изменений не выполняет запросов"""
+        from database.postgres_manager import PostgresManager
+        
+        mock_connection = open_connection()
+        mock_connect.return_value = mock_connection
+        
+        manager = PostgresManager()
+        mock_connection.reset_mock()
+        
+        result = manager.save_tamagotchi(Tamagotchi.from_dict({'id': 7, 'name': 'Чистый'}))
+        
+        self.assertTrue(result)
+        mock_connection.cursor.assert_not_called()
+        mock_connection.commit.assert_not_called()
+
+    
+    @unittest.skipIf(not PSYCOPG2_AVAILABLE, "psycopg2 не установлен")
+    @patch('database.postgres_manager.execute_values')
+    @patch('database.postgres_manager.psycopg2.connect')
+    def test_save_many(self, mock_connect, mock_execute_values):
+        """Тест: save_many вставляет и обновляет группы одним запросом каждую"""
+        from database.postgres_manager import PostgresManager
+        
+        mock_connection = open_connection()
+        mock_connect.return_value = mock_connection
+        mock_execute_values.return_value = [(10,), (11,)]
+        manager = PostgresManager()
+        
+        new = [Tamagotchi(name="Первый"), Tamagotchi(name="Второй")]
+        existing = Tamagotchi.from_dict({'id': 3, 'name': 'Старый'})
+        existing.hunger = 5
+        clean = Tamagotchi.from_dict({'id': 4, 'name': 'Чистый'})
+        
+        result = manager.save_many(new + [existing, clean])
+        
+        self.assertTrue(result)
+        self.assertEqual([t.id for t in new], [10, 11])
+        self.assertEqual(mock_execute_values.call_count, 2)
+        insert_sql = mock_execute_values.call_args_list[0][0][1]
+        update_sql, update_rows = mock_execute_values.call_args_list[1][0][1:3]
+        self.assertIn('INSERT INTO tamagotchis', insert_sql)
+        self.assertIn('hunger=v.hunger', update_sql)
+        self.assertEqual(update_rows, [(3, 5)])
+        mock_connection.commit.assert_called()
+        self.assertFalse(existing.is_dirty)
+    
+    @unittest.skipIf(not PSYCOPG2_AVAILABLE, "psycopg2 не установлен")
+    @patch('database.postgres_manager.psycopg2.connect')
+    def test_load_many(self, mock_connect):
+        """Тест загрузки нескольких тамагочи одним запросом"""
+        from database.postgres_manager import PostgresManager
+        
+        mock_connection = open_connection()
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = [row(1, 'Первый'), row(2, 'Второй')]
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+        manager = PostgresManager()
+        
+        result = manager.load_many([2, 1, 3])
+        
+        self.assertEqual([t.name for t in result], ['Второй', 'Первый'])
+        self.assertIn('ANY', mock_cursor.execute.call_args[0][0])
+    
+    @unittest.skipIf(not PSYCOPG2_AVAILABLE, "psycopg2 не установлен")
+    @patch('database.postgres_manager.psycopg2.connect')
+    def test_iter_all(self, mock_connect):
+        """Тест потокового перебора через серверный курсор"""
+        from database.postgres_manager import PostgresManager
+        
+        mock_connection = open_connection()
+        mock_cursor = Mock()
+        mock_cursor.fetchmany.side_effect = [[row(1), row(2)], [row(3)], []]
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+        manager = PostgresManager()
+        
+        result = [t.id for t in manager.iter_all(batch_size=2)]
+        
+        self.assertEqual(result, [1, 2, 3])
+        self.assertTrue(mock_connection.cursor.call_args[1]['name'].startswith('tamagotchis_iter'))
+        mock_cursor.close.assert_called()
+    
+    @unittest.skipIf(not PSYCOPG2_AVAILABLE, "psycopg2 не установлен")
+    @patch('database.postgres_manager.psycopg2.connect')
+    def test_get_latest_tamagotchi(self, mock_connect):
+        """Тест загрузки последнего тамагочи одним запросом с LIMIT 1"""
+        from database.postgres_manager import PostgresManager
+        
+        mock_connection = open_connection()
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = [row(9, 'Последний')]
+        mock_connection.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_connection
+        manager = PostgresManager()
+        
+        result = manager.get_latest_tamagotchi()
+        
+        self.assertEqual(result.name, 'Последний')
+        self.assertIn('LIMIT 1', mock_cursor.execute.call_args[0][0])
+
+
+class FakeServer:
+    """Заменитель сервера PostgreSQL для тестов пула.
+
+    Каждое подключение получает своё соединение-мок. Пока сервер «лежит»,
+    подключение и запросы завершаются OperationalError, как у psycopg2.
+    """
+
+    def __init__(self):
+        self.down = False
+        self.generation = 0
+        self.connections = []
+        self.active = 0
+        self.max_active = 0
+        self.next_id = 1
+        self.lock = threading.Lock()
+
+    def connect(self, **kwargs):
+        if self.down:
+            raise psycopg2.OperationalError("could not connect to server")
+        connection = open_connection()
+        connection.generation = self.generation
+        cursor = connection.cursor.return_value
+        cursor.fetchall.return_value = []
+        cursor.execute.side_effect = lambda *args: self.execute(connection)
+        cursor.fetchone.side_effect = self.fetchone
+        self.connections.append(connection)
+        return connection
+
+    def execute(self, connection):
+        if self.down or connection.generation != self.generation:
+            connection.closed = 2
+            raise psycopg2.OperationalError("server closed the connection unexpectedly")
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        # time.sleep в тестах заменён моком
+        threading.Event().wait(0.001)
+        with self.lock:
+            self.active -= 1
+
+    def restart(self):
+        """Перезапускает сервер: все открытые соединения становятся мёртвыми."""
+        self.generation += 1
+
+    def fetchone(self):
+        with self.lock:
+            self.next_id += 1
+            return (self.next_id - 1,)
+
+
+@unittest.skipIf(not PSYCOPG2_AVAILABLE, "psycopg2 не установлен")
+class TestPostgresPool(unittest.TestCase):
+    """Тесты пула соединений и переподключения"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        from database.postgres_manager import PostgresManager
+
+        self.server = FakeServer()
+        connect = patch('database.postgres_manager.psycopg2.connect',
+                        side_effect=self.server.connect)
+        sleep = patch('database.postgres_manager.time.sleep')
+        connect.start()
+        self.sleep = sleep.start()
+        self.addCleanup(connect.stop)
+        self.addCleanup(sleep.stop)
+        self.manager = PostgresManager(max_connections=2)
+
+    def test_closed_connection_replaced_on_checkout(self):
+        """Тест: закрытое соединение из пула заменяется новым без запроса к серверу"""
+        first = self.server.connections[0]
+        first.closed = 2
+
+        self.assertTrue(self.manager.ping())
+
+        first.close.assert_called()
+        self.assertEqual(len(self.server.connections), 2)
+        self.sleep.assert_not_called()
+
+    def test_reconnect_after_server_restart(self):
+        """Тест: после обрыва соединения пул пересоздаётся и сохранение повторяется"""
+        self.server.restart()
+
+        tamagotchi = Tamagotchi(name="Живучий")
+        self.assertTrue(self.manager.save_tamagotchi(tamagotchi))
+
+        self.assertIsNotNone(tamagotchi.id)
+        self.assertEqual(len(self.server.connections), 2)
+        self.assertEqual(self.sleep.call_count, 1)
+
+    def test_retry_with_backoff(self):
+        """Тест: при недоступном сервере попытки повторяются с удвоением паузы"""
+        self.server.down = True
+
+        self.assertFalse(self.manager.save_tamagotchi(Tamagotchi(name="Упорный")))
+
+        delays = [call[0][0] for call in self.sleep.call_args_list]
+        self.assertEqual(delays, [0.2, 0.4, 0.8])
+
+    def test_recovers_when_server_returns(self):
+        """Тест: после восстановления сервера менеджер снова работает"""
+        self.server.down = True
+        self.assertFalse(self.manager.ping())
+
+        self.server.down = False
+
+        self.assertTrue(self.manager.ping())
+        self.assertTrue(self.manager.save_tamagotchi(Tamagotchi(name="Вернувшийся")))
+
+    def test_insert_not_retried_after_commit_lost(self):
+        """Тест: обрыв во время COMMIT вставки не повторяется, чтобы не создать дубликат"""
+        connection = self.server.connections[0]
+        connection.commit.side_effect = psycopg2.OperationalError("connection lost during commit")
+        cursor = connection.cursor.return_value
+        cursor.execute.reset_mock()
+
+        tamagotchi = Tamagotchi(name="Единственный")
+        self.assertFalse(self.manager.save_tamagotchi(tamagotchi))
+
+        inserts = [call for call in cursor.execute.call_args_list if 'INSERT' in call[0][0]]
+        self.assertEqual(len(inserts), 1)
+        self.assertIsNone(tamagotchi.id)
+        self.sleep.assert_not_called()
+        # Соединение считается потерянным и закрывается
+        connection.close.assert_called()
+
+    def test_update_retried_after_commit_lost(self):
+        """Тест: UPDATE повторяется после обрыва во время COMMIT"""
+        connection = self.server.connections[0]
+        connection.commit.side_effect = psycopg2.OperationalError("connection lost during commit")
+        tamagotchi = Tamagotchi.from_dict({'id': 7, 'name': 'Обновлённый'})
+        tamagotchi.hunger = 10
+
+        self.assertTrue(self.manager.save_tamagotchi(tamagotchi))
+
+        self.assertEqual(self.sleep.call_count, 1)
+        self.assertFalse(tamagotchi.is_dirty)
+
+    def test_concurrent_saves(self):
+        """Тест: несколько потоков сохраняют одновременно, не превышая размер пула"""
+        pets = [Tamagotchi(name=f"Питомец {i}") for i in range(16)]
+        results = []
+
+        def save(pet):
+            results.append(self.manager.save_tamagotchi(pet))
+
+        threads = [threading.Thread(target=save, args=(pet,)) for pet in pets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(results, [True] * len(pets))
+        self.assertEqual(len({pet.id for pet in pets}), len(pets))
+        self.assertLessEqual(self.server.max_active, 2)
+
+    def test_delete_tamagotchi(self):
+        """Тест удаления тамагочи"""
+        connection = self.server.connections[0]
+
+        self.assertTrue(self.manager.delete_tamagotchi(5))
+
+        calls = [call[0] for call in connection.cursor.return_value.execute.call_args_list[-4:]]
+        # Вместе с тамагочи удаляются его журнал событий и достижения
+        self.assertIn('DELETE FROM tamagotchis', calls[0][0])
+        self.assertIn('DELETE FROM pet_events', calls[1][0])
+        self.assertIn('DELETE FROM pet_snapshots', calls[2][0])
+        self.assertIn('DELETE FROM pet_achievements', calls[3][0])
+        self.assertEqual({params for _, params in calls}, {(5,)})
+        connection.commit.assert_called()
+
+    def test_close(self):
+        """Тест: close закрывает соединения, следующий вызов открывает пул заново"""
+        self.manager.close()
+
+        self.server.connections[0].close.assert_called()
+        self.assertTrue(self.manager.ping())
+        self.assertEqual(len(self.server.connections), 2)
+
+
+@unittest.skipIf(not PSYCOPG2_AVAILABLE or 'TAMAGOTCHI_DB_HOST' not in os.environ,
+                 "нужен локальный PostgreSQL (TAMAGOTCHI_DB_HOST)")
+class TestPostgresIntegration(unittest.TestCase):
+    """Тесты с настоящим PostgreSQL, адрес берётся из переменных TAMAGOTCHI_DB_*"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        from database.postgres_manager import PostgresManager
+
+        self.manager = PostgresManager()
+        self.addCleanup(self.manager.close)
+
+    def test_round_trip(self):
+        """Тест сохранения, загрузки и удаления"""
+        tamagotchi = Tamagotchi(name="Настоящий")
+        self.assertTrue(self.manager.save_tamagotchi(tamagotchi))
+
+        loaded = self.manager.load_tamagotchi(tamagotchi.id)
+
+        self.assertEqual(loaded.name, "Настоящий")
+        self.assertTrue(self.manager.delete_tamagotchi(tamagotchi.id))
+        self.assertIsNone(self.manager.load_tamagotchi(tamagotchi.id))
+
+    def test_concurrent_saves(self):
+        """Тест одновременного сохранения из нескольких потоков"""
+        pets = [Tamagotchi(name=f"Поток {i}") for i in range(8)]
+        threads = [threading.Thread(target=self.manager.save_tamagotchi, args=(pet,))
+                   for pet in pets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(len(self.manager.load_many([pet.id for pet in pets])), len(pets))
+        for pet in pets:
+            self.manager.delete_tamagotchi(pet.id)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+"""
+Тесты для модуля utils.scroll_surface
+"""
+import unittest
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+pygame.init()
+
+from utils.scroll_surface import ScrollSurface
+
+
+def stripes(surface, top):
+    """Рисует полосы высотой 10 пикселей: цвет зависит от координаты содержимого."""
+    for y in range(top - top % 10, top + surface.get_height(), 10):
+        shade = (y // 10) % 256
+        pygame.draw.rect(surface, (shade, 0, 0), (0, y - top, surface.get_width(), 10))
+
+
+class TestScrollSurface(unittest.TestCase):
+    """Тесты для класса ScrollSurface"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.screen = pygame.Surface((100, 100))
+        self.rect = pygame.Rect(10, 20, 50, 40)
+
+    def test_single_tile(self):
+        """Тест: короткое содержимое рисуется один раз и выводится одним blit"""
+        content = ScrollSurface(50, 200, stripes)
+
+        self.assertEqual(content.blit(self.screen, self.rect, 0), 1)
+        self.assertEqual(content.blit(self.screen, self.rect, 35), 1)
+
+        self.assertEqual(content.rendered, 1)
+        self.assertEqual(self.screen.get_at((10, 20))[0], 3)
+        self.assertEqual(self.screen.get_at((10, 59))[0], 7)
+
+    def test_tiles_rendered_lazily(self):
+        """Тест: рисуются только плитки, попавшие в видимую область"""
+        content = ScrollSurface(50, 100000, stripes, tile_height=100)
+
+        count = content.blit(self.screen, self.rect, 50080)
+
+        # Видимая часть 50080-50120 лежит на двух плитках
+        self.assertEqual(count, 2)
+        self.assertEqual(content.rendered, 2)
+        self.assertEqual(self.screen.get_at((10, 20))[0], 5008 % 256)
+        self.assertEqual(self.screen.get_at((10, 59))[0], 5011 % 256)
+
+    def test_tiles_evicted(self):
+        """Тест: количество хранимых плиток ограничено"""
+        content = ScrollSurface(50, 10000, stripes, tile_height=100, max_tiles=3)
+
+        for offset in range(0, 1000, 100):
+            content.blit(self.screen, self.rect, offset)
+        content.blit(self.screen, self.rect, 0)
+
+        self.assertEqual(len(content._tiles), 3)
+        self.assertEqual(content.rendered, 11)
+
+    def test_resize_keeps_valid_tiles(self):
+        """Тест: при росте содержимого перерисовываются только изменившиеся плитки"""
+        content = ScrollSurface(50, 250, stripes, tile_height=100)
+        for offset in (0, 100, 200):
+            content.blit(self.screen, self.rect, offset)
+
+        content.resize(500, valid_until=200)
+        content.blit(self.screen, self.rect, 0)
+        content.blit(self.screen, self.rect, 100)
+        content.blit(self.screen, self.rect, 200)
+
+        self.assertEqual(content.rendered, 4)
+        self.assertEqual(content.tile(2).get_height(), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
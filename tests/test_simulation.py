@@ -0,0 +1,157 @@
+"""
+Тесты для модуля game.simulation
+"""
+import unittest
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from game.simulation import PetSimulation, ManualClock
+
+
+def stats(data):
+    """Возвращает кортеж показателей питомца для сравнения."""
+    return (data.hunger, data.happiness, data.energy, data.cleanliness,
+            data.health, data.age, data.evolution_stage)
+
+
+class TestManualClock(unittest.TestCase):
+    """Тесты для класса ManualClock"""
+
+    def test_clock(self):
+        """Тест управления часами"""
+        clock = ManualClock(100)
+        self.assertEqual(clock(), 100)
+        clock.advance(50)
+        self.assertEqual(clock(), 150)
+        clock.set(10)
+        self.assertEqual(clock(), 10)
+
+
+class TestPetSimulation(unittest.TestCase):
+    """Тесты для класса PetSimulation"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.clock = ManualClock()
+        self.data = Tamagotchi(name="Симулянт")
+        self.simulation = PetSimulation(self.data, self.clock)
+
+    def test_runs_without_pygame(self):
+        """Тест: модуль симуляции не импортирует pygame"""
+        import game.simulation
+        self.assertNotIn('pygame', vars(game.simulation))
+
+    def test_decay_after_interval(self):
+        """Тест снижения показателей после 30 секунд"""
+        self.clock.set(30000)
+        self.simulation.update_stats()
+        self.assertEqual(self.data.hunger, 50)
+
+        self.clock.set(30001)
+        self.simulation.update_stats()
+        self.assertEqual(self.data.hunger, 45)
+        self.assertEqual(self.data.happiness, 47)
+        self.assertEqual(self.data.energy, 96)
+        self.assertEqual(self.simulation.last_update_time, 30001)
+
+    def test_advance_decay(self):
+        """Тест прокрутки: за 5 минут показатели снижаются 9 раз"""
+        self.simulation.advance(5 * 60 * 1000)
+
+        self.assertEqual(self.clock(), 300000)
+        self.assertEqual(self.data.hunger, 50 - 9 * 5)
+
+    def test_advance_clamps_to_zero(self):
+        """Тест: долгая прокрутка не уводит показатели ниже нуля"""
+        self.simulation.advance(24 * 60 * 60 * 1000)
+
+        self.assertEqual(self.data.hunger, 0)
+        self.assertEqual(self.data.health, 0)
+
+    def test_sleep_regenerates_and_wakes(self):
+        """Тест: во сне энергия восстанавливается, а питомец просыпается сам"""
+        self.data.energy = 20
+        self.assertTrue(self.simulation.sleep())
+
+        self.simulation.advance(60000)
+        self.assertTrue(self.simulation.is_sleeping)
+        self.assertEqual(self.data.energy, 95)
+
+        self.simulation.advance(10001)
+        self.assertFalse(self.simulation.is_sleeping)
+        self.assertEqual(self.data.energy, 100)
+
+    def test_wake_up_early_penalty(self):
+        """Тест штрафа к счастью за раннее пробуждение"""
+        self.data.energy = 20
+        self.simulation.sleep()
+        self.clock.advance(5000)
+
+        self.assertTrue(self.simulation.wake_up())
+        self.assertEqual(self.data.happiness, 45)
+
+    def test_advance_matches_frame_loop(self):
+        """Тест: прокрутка совпадает с покадровым циклом"""
+        frame_clock = ManualClock()
+        frame_data = Tamagotchi(name="Кадр")
+        frame_data.energy = 30
+        frame_simulation = PetSimulation(frame_data, frame_clock)
+        frame_simulation.sleep()
+        for now in range(1, 200001):
+            frame_clock.set(now)
+            frame_simulation.step()
+
+        self.data.energy = 30
+        self.simulation.sleep()
+        self.simulation.advance(200000)
+
+        self.assertEqual(stats(self.data), stats(frame_data))
+        self.assertEqual(self.simulation.last_update_time, frame_simulation.last_update_time)
+        self.assertEqual(self.simulation.is_sleeping, frame_simulation.is_sleeping)
+
+    def test_advance_requires_manual_clock(self):
+        """Тест: прокрутка невозможна с настоящими часами"""
+        simulation = PetSimulation(self.data, lambda: 0)
+        with self.assertRaises(TypeError):
+            simulation.advance(1000)
+
+    def test_actions(self):
+        """Тест действий игрока"""
+        self.assertTrue(self.simulation.feed(30))
+        self.assertEqual(self.data.hunger, 80)
+        self.assertTrue(self.simulation.clean())
+        self.assertTrue(self.simulation.play())
+        self.assertTrue(self.simulation.eat(10, 5, 5))
+
+    def test_check_evolution(self):
+        """Тест эволюции"""
+        self.data.age = 7
+        self.data.evolution_stage = 1
+        self.assertTrue(self.simulation.check_evolution())
+        self.assertEqual(self.data.evolution_stage, 2)
+
+
+    def test_listener(self):
+        """Тест: слушатель получает события действий и снижения показателей"""
+        events = []
+        self.simulation.listener = lambda kind, details: events.append((kind, details))
+
+        self.simulation.feed(30)
+        self.data.energy = 50
+        self.simulation.sleep()
+        self.simulation.wake_up()
+        self.clock.set(30001)
+        self.simulation.update_stats()
+        self.data.age = 7
+        self.simulation.check_evolution()
+
+        self.assertEqual([kind for kind, _ in events],
+                         ["feed", "sleep", "wake", "decay", "evolve"])
+        self.assertEqual(events[-1][1], {"stage": 2})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,280 @@
+"""
+Тесты для модуля database.stat_history
+"""
+import unittest
+import tempfile
+import shutil
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from database.memory_manager import MemoryManager
+from database.stat_history import (StatChunk, StatHistory, STAT_FIELDS, CHUNK_SAMPLES,
+                                   MAX_TIME_DELTA, STAT_LEVELS, MINUTE, HOUR, DAY)
+
+# Начало тестового времени - ровно начало часа
+START = 1_700_000_000 - 1_700_000_000 % HOUR
+
+
+class FakeClock:
+    """Часы, которые двигает тест."""
+
+    def __init__(self, now=START):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestStatChunk(unittest.TestCase):
+    """Тесты для класса StatChunk"""
+
+    def test_round_trip(self):
+        """Тест: блок восстанавливается из строки таблицы без потерь"""
+        chunk = StatChunk(1, 0, START)
+        samples = [(START + i * 30, (i % 101, 100 - i % 101, 50, 0, 100)) for i in range(100)]
+        for timestamp, values in samples:
+            self.assertTrue(chunk.append(timestamp, values))
+
+        row = chunk.to_row()
+        restored = StatChunk.from_row(row)
+
+        self.assertEqual(restored.samples(), samples)
+        self.assertEqual(row[2:5], (START, samples[-1][0], 100))
+        # Отсчет занимает 2 байта времени и по байту на показатель
+        self.assertEqual(len(row[5]), 100 * (2 + len(STAT_FIELDS)))
+
+    def test_append_after_restore(self):
+        """Тест: в восстановленный блок можно дописывать отсчеты"""
+        chunk = StatChunk(1, 0, START)
+        chunk.append(START, (10, 20, 30, 40, 50))
+        restored = StatChunk.from_row(chunk.to_row())
+
+        restored.append(START + 30, (15, 20, 30, 40, 0))
+
+        self.assertEqual(restored.samples()[-1], (START + 30, (15, 20, 30, 40, 0)))
+
+    def test_full_chunk(self):
+        """Тест: заполненный блок и слишком долгий перерыв требуют нового блока"""
+        chunk = StatChunk(1, 0, START)
+        for i in range(CHUNK_SAMPLES):
+            chunk.append(START + i, (0,) * len(STAT_FIELDS))
+
+        self.assertFalse(chunk.append(START + CHUNK_SAMPLES, (0,) * len(STAT_FIELDS)))
+
+        chunk = StatChunk(1, 0, START)
+        chunk.append(START, (0,) * len(STAT_FIELDS))
+        self.assertFalse(chunk.append(START + MAX_TIME_DELTA + 1, (0,) * len(STAT_FIELDS)))
+
+
+class StatHistoryTests:
+    """Общие тесты StatHistory для разных хранилищ"""
+
+    def create_store(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.store = self.create_store()
+        self.clock = FakeClock()
+        self.history = StatHistory(self.store, clock=self.clock)
+        self.pet = Tamagotchi(name="Летописец")
+        self.store.save_tamagotchi(self.pet)
+
+    def play(self, seconds, step=30, flush_every=10):
+        """Записывает отсчеты каждые step секунд; голод меняется по кругу."""
+        for i in range(seconds // step):
+            self.pet.hunger = (self.clock.now // MINUTE) % 100
+            self.history.record(self.pet)
+            self.clock.now += step
+            if i % flush_every == 0:
+                self.history.flush()
+        self.history.flush()
+
+    def test_query_raw_samples(self):
+        """Тест: короткий промежуток возвращается сырыми отсчетами"""
+        self.play(10 * MINUTE)
+
+        samples = self.history.query(self.pet.id, self.clock.now - 5 * MINUTE)
+
+        self.assertEqual(len(samples), 10)
+        self.assertEqual(samples[-1][0], self.clock.now - 30)
+        self.assertEqual(samples[-1][1][0], ((self.clock.now - 30) // MINUTE) % 100)
+
+    def test_rollup_averages(self):
+        """Тест: сырые отсчеты сворачиваются в средние за минуту и за час"""
+        self.pet.happiness = 40
+        self.history.record(self.pet)
+        self.clock.now += 30
+        self.pet.happiness = 60
+        self.history.record(self.pet)
+        self.clock.now += 2 * HOUR
+        self.history.flush()
+
+        minutes = self.history._level_samples(self.pet.id, MINUTE, START, self.clock.now)
+        hours = self.history._level_samples(self.pet.id, HOUR, START, self.clock.now)
+
+        self.assertEqual([(timestamp, values[1]) for timestamp, values in minutes], [(START, 50)])
+        self.assertEqual([(timestamp, values[1]) for timestamp, values in hours], [(START, 50)])
+
+    def test_long_range_uses_rollups(self):
+        """Тест: длинный промежуток читается из свернутых уровней"""
+        self.play(3 * DAY, flush_every=120)
+
+        samples = self.history.query(self.pet.id, self.clock.now - 2 * DAY, max_points=200)
+
+        self.assertLessEqual(len(samples), 200)
+        # Часовые средние, затем последние минуты и сырые отсчеты
+        self.assertEqual(samples[1][0] - samples[0][0], HOUR)
+        self.assertEqual(samples[-1][0], self.clock.now - 30)
+        times = [timestamp for timestamp, _ in samples]
+        self.assertEqual(times, sorted(set(times)))
+
+    def test_retention(self):
+        """Тест: данные старше срока хранения уровня удаляются"""
+        self.play(8 * HOUR, step=60, flush_every=60)
+
+        raw = self.store.load_stat_chunks(self.pet.id, 0)
+        minutes = self.store.load_stat_chunks(self.pet.id, MINUTE)
+
+        raw_retention = STAT_LEVELS[0][1]
+        self.assertGreaterEqual(raw[0][3], self.clock.now - raw_retention - HOUR)
+        self.assertEqual(minutes[0][2], START)
+
+    def test_history_continues_across_sessions(self):
+        """Тест: новая история досворачивает отсчеты прошлого сеанса"""
+        self.history.record(self.pet)
+        self.history.flush()
+
+        self.clock.now += 2 * MINUTE
+        history = StatHistory(self.store, clock=self.clock)
+        history.record(self.pet)
+        history.flush()
+
+        minutes = history._level_samples(self.pet.id, MINUTE, START, self.clock.now)
+        self.assertEqual([timestamp for timestamp, _ in minutes], [START])
+
+    def test_failed_write_is_retried(self):
+        """Тест: блок, запись которого не удалась, записывается при следующем flush"""
+        save = self.store.save_stat_chunks
+        self.store.save_stat_chunks = lambda rows: False
+        self.history.record(self.pet)
+        self.history.flush()
+
+        self.assertEqual(len(self.history.query(self.pet.id, START)), 1)
+        self.store.save_stat_chunks = save
+        self.history.flush()
+
+        self.assertEqual(len(self.store.load_stat_chunks(self.pet.id, 0)), 1)
+
+    def test_delete_removes_history(self):
+        """Тест: удаление тамагочи удаляет его историю показателей"""
+        self.play(5 * MINUTE)
+
+        self.store.delete_tamagotchi(self.pet.id)
+
+        self.assertEqual(self.store.load_stat_chunks(self.pet.id, 0), [])
+
+
+class TestStatHistoryMemory(StatHistoryTests, unittest.TestCase):
+    """Тесты StatHistory поверх MemoryManager"""
+
+    def create_store(self):
+        return MemoryManager()
+
+    def test_delete_keeps_other_pets_history(self):
+        """Тест: удаление тамагочи убирает только его блоки истории"""
+        other = Tamagotchi(name="Сосед")
+        self.store.save_tamagotchi(other)
+        self.history.record(self.pet)
+        self.history.record(other)
+        self.history.flush()
+
+        self.store.delete_tamagotchi(self.pet.id)
+
+        self.assertNotIn(self.pet.id, self.store.stat_chunks)
+        self.assertEqual(len(self.store.load_stat_chunks(other.id, 0)), 1)
+
+    def test_unsaved_samples_in_query(self):
+        """Тест: запрос учитывает отсчеты, еще не отправленные на запись"""
+        writes = []
+        history = StatHistory(self.store, clock=self.clock,
+                              submit=lambda function, *args: writes.append(args)
+                              if function == history._write else function(*args))
+        history.record(self.pet)
+        self.clock.now += 30
+        history.record(self.pet)
+
+        self.assertEqual(len(history.query(self.pet.id, START)), 2)
+        self.assertEqual(writes, [])
+
+    def test_record_does_not_read_store(self):
+        """Тест: отсчеты прошлого сеанса читаются через submit, а не в record"""
+        self.history.record(self.pet)
+        self.history.flush()
+        self.clock.now += 2 * MINUTE
+        queued = []
+        history = StatHistory(self.store, clock=self.clock,
+                              submit=lambda function, *args: queued.append((function, args)))
+        load = self.store.load_stat_chunks
+        self.store.load_stat_chunks = None
+
+        history.start(self.pet)
+        history.record(self.pet)
+        # Пока прошлый сеанс не прочитан, минута не сворачивается
+        history.flush()
+
+        self.assertEqual(queued[0][0], history._load)
+        self.store.load_stat_chunks = load
+        for function, args in queued:
+            function(*args)
+        queued.clear()
+        history.flush()
+        for function, args in queued:
+            function(*args)
+
+        minutes = history._level_samples(self.pet.id, MINUTE, START, self.clock.now)
+        self.assertEqual([timestamp for timestamp, _ in minutes], [START])
+
+    def test_request_query(self):
+        """Тест: запрос истории выполняется через submit и передается в callback"""
+        queued = []
+        history = StatHistory(self.store, clock=self.clock,
+                              submit=lambda function, *args: queued.append((function, args)))
+        results = []
+        history.request_query(self.pet.id, START, results.append, max_points=10)
+
+        self.assertEqual(results, [])
+        function, args = queued.pop()
+        function(*args)
+        self.assertEqual(results, [[]])
+
+
+class TestStatHistorySQLite(StatHistoryTests, unittest.TestCase):
+    """Тесты StatHistory поверх SQLiteManager"""
+
+    def create_store(self):
+        from database.sqlite_manager import SQLiteManager
+
+        self.test_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.test_dir)
+        manager = SQLiteManager(db_path=os.path.join(self.test_dir, 'stats.db'))
+        self.addCleanup(manager.close)
+        return manager
+
+    def test_range_uses_primary_key(self):
+        """Тест: промежуток времени читается по первичному ключу без сортировки"""
+        plan = self.store.connection.execute(
+            'EXPLAIN QUERY PLAN SELECT data FROM stat_samples WHERE pet_id = ? AND resolution = ? '
+            'AND chunk_start <= ? AND chunk_end >= ? ORDER BY chunk_start', (1, 0, 10, 0)).fetchall()
+        details = " ".join(row[-1] for row in plan)
+
+        self.assertIn("PRIMARY KEY (pet_id=? AND resolution=? AND chunk_start<?)", details)
+        self.assertNotIn("TEMP B-TREE", details)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+"""
+Тесты для модуля game.stats_window
+"""
+import unittest
+import sys
+import os
+import time
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+pygame.init()
+
+from database.models import Tamagotchi
+from entities.tamagotchi import TamagotchiEntity
+from database.memory_manager import MemoryManager
+from database.events import EventLog
+from database.stat_history import StatHistory
+from game.stats_window import StatsWindow, HISTORY_PAGE_SIZE
+
+
+class TestStatsTab(unittest.TestCase):
+    """Тесты вкладки статистики"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.screen = pygame.Surface((800, 600))
+        self.tamagotchi = TamagotchiEntity(Tamagotchi(name="Версия"))
+        self.window = StatsWindow()
+        self.window.visible = True
+
+    def test_surface_reused_while_unchanged(self):
+        """Тест: без изменений тамагочи содержимое не перерисовывается"""
+        self.window.draw(self.screen, self.tamagotchi)
+        surface = self.window.tab_surfaces["stats"]
+
+        self.window.draw(self.screen, self.tamagotchi)
+        self.window.scroll_offsets["stats"] = 100
+        self.window.draw(self.screen, self.tamagotchi)
+
+        self.assertIs(self.window.tab_surfaces["stats"], surface)
+
+    def test_change_rerenders(self):
+        """Тест: изменение показателя или сна перерисовывает содержимое"""
+        self.window.draw(self.screen, self.tamagotchi)
+        surface = self.window.tab_surfaces["stats"]
+
+        self.tamagotchi.data.hunger = 10
+        self.window.draw(self.screen, self.tamagotchi)
+        self.assertIsNot(self.window.tab_surfaces["stats"], surface)
+        self.assertIn("Очень голоден! Срочно нужна еда!", self.window.status_messages)
+
+        surface = self.window.tab_surfaces["stats"]
+        self.tamagotchi.simulation.is_sleeping = True
+        self.window.draw(self.screen, self.tamagotchi)
+        self.assertIsNot(self.window.tab_surfaces["stats"], surface)
+        self.assertIn("В данный момент спит", self.window.status_messages)
+
+    def test_status_messages_memoized(self):
+        """Тест: сообщения о состоянии пересчитываются только при новой версии модели"""
+        first = self.window.get_status_messages(self.tamagotchi)
+        self.assertIs(self.window.get_status_messages(self.tamagotchi), first)
+
+        self.tamagotchi.data.energy = 10
+
+        self.assertIn("Изнурён! Нужно поспать!", self.window.get_status_messages(self.tamagotchi))
+
+    def test_scroll_shows_lower_content(self):
+        """Тест: прокрутка выводит нижнюю часть поверхности содержимого"""
+        self.window.draw(self.screen, self.tamagotchi)
+        max_scroll = self.window.max_scrolls["stats"]
+        self.assertGreater(max_scroll, 0)
+        surface = self.window.tab_surfaces["stats"]
+
+        self.window.scroll_offsets["stats"] = max_scroll
+        self.window.draw(self.screen, self.tamagotchi)
+
+        content = pygame.Rect(self.window.window_rect.x + 20, self.window.window_rect.y + 120, 10, 10)
+        self.assertEqual(self.screen.get_at(content.topleft), surface.tile(0).get_at((0, max_scroll)))
+
+
+    def test_chart_loaded_off_render_thread(self):
+        """Тест: график показателей запрашивается через submit и выводится, когда готов"""
+        store = MemoryManager()
+        store.save_tamagotchi(self.tamagotchi.data)
+        tasks = []
+        history = StatHistory(store, submit=lambda function, *args: tasks.append((function, args)))
+        self.window.stat_history = history
+
+        self.window.draw(self.screen, self.tamagotchi)
+        self.window.draw(self.screen, self.tamagotchi)
+        self.assertEqual(([function for function, _ in tasks], self.window.stat_chart),
+                         ([history._load_query], []))
+        surface = self.window.tab_surfaces["stats"]
+
+        # Отсчет внутри запрошенного промежутка, даже если секунда успела смениться
+        history.record(self.tamagotchi.data, timestamp=int(time.time()) - 1)
+        function, args = tasks.pop(0)
+        function(*args)
+        self.window.draw(self.screen, self.tamagotchi)
+
+        self.assertEqual(len(self.window.stat_chart), 1)
+        self.assertIsNot(self.window.tab_surfaces["stats"], surface)
+
+
+class TestHistoryTab(unittest.TestCase):
+    """Тесты вкладки истории"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.screen = pygame.Surface((800, 600))
+        store = MemoryManager()
+        pet = Tamagotchi(name="Летопись")
+        store.save_tamagotchi(pet)
+        log = EventLog(store)
+        for i in range(2000):
+            pet.hunger = i % 100
+            log.record(pet, "feed")
+        log.flush()
+        self.tamagotchi = TamagotchiEntity(pet)
+        self.window = StatsWindow()
+        self.window.visible = True
+        self.window.current_tab = "history"
+        self.window.event_log = log
+
+    def scroll_to_end(self):
+        """Прокручивает историю до конца, как колесико мыши."""
+        frames = 0
+        while (not self.window.history_complete
+               or self.window.scroll_offsets["history"] < self.window.max_scrolls["history"]):
+            self.window.scroll_offsets["history"] = min(self.window.max_scrolls["history"],
+                                                        self.window.scroll_offsets["history"] + 300)
+            self.window.draw(self.screen, self.tamagotchi)
+            frames += 1
+        return frames
+
+    def test_pages_loaded_while_scrolling(self):
+        """Тест: страницы истории догружаются по мере прокрутки"""
+        self.window.draw(self.screen, self.tamagotchi)
+        self.assertLessEqual(len(self.window.history), 2 * HISTORY_PAGE_SIZE)
+
+        self.scroll_to_end()
+
+        self.assertEqual(len(self.window.history), 2000)
+
+    def test_page_loaded_off_render_thread(self):
+        """Тест: отрисовка только запрашивает страницу и показывает ее, когда она готова"""
+        tasks = []
+        self.window.event_log._submit = lambda function, *args: tasks.append((function, args))
+
+        self.window.draw(self.screen, self.tamagotchi)
+        self.window.draw(self.screen, self.tamagotchi)
+        self.assertEqual((len(self.window.history), len(tasks)), (0, 1))
+
+        function, args = tasks.pop()
+        function(*args)
+        self.window.draw(self.screen, self.tamagotchi)
+
+        self.assertEqual(len(self.window.history), HISTORY_PAGE_SIZE)
+
+    def test_rows_rendered_once(self):
+        """Тест: каждая плитка истории рисуется один раз, а память ограничена"""
+        self.window.draw(self.screen, self.tamagotchi)
+        frames = self.scroll_to_end()
+        content = self.window.tab_surfaces["history"]
+
+        tiles = -(-content.height // content.tile_height)
+        # Страницы догружаются раньше, чем до них доходит прокрутка,
+        # поэтому каждая плитка рисуется один раз за сотни кадров
+        self.assertGreater(frames, tiles)
+        self.assertEqual(content.rendered, tiles)
+        self.assertLessEqual(len(content._tiles), content.max_tiles)
+
+        rendered = content.rendered
+        self.window.draw(self.screen, self.tamagotchi)
+        self.assertEqual(content.rendered, rendered)
+
+    def test_reset_rebuilds(self):
+        """Тест: повторное открытие вкладки загружает историю заново"""
+        self.window.draw(self.screen, self.tamagotchi)
+        content = self.window.tab_surfaces["history"]
+
+        self.window.reset_history()
+        self.window.draw(self.screen, self.tamagotchi)
+
+        self.assertIsNot(self.window.tab_surfaces["history"], content)
+
+if __name__ == '__main__':
+    unittest.main()
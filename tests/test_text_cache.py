@@ -0,0 +1,140 @@
+"""
+Тесты для модуля utils.text_cache
+"""
+import unittest
+import sys
+import os
+from unittest.mock import Mock
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+pygame.init()
+
+from utils.text_cache import TextCache, TEXT_CACHE, render_text
+from utils.fonts import get_font
+from config import BLACK, WHITE, RED
+
+
+class TestTextCache(unittest.TestCase):
+    """Тесты для класса TextCache"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.cache = TextCache(max_size=3)
+        self.font = Mock()
+        self.font.render.side_effect = lambda text, aa, color: Mock(name=text)
+
+    def test_hit_returns_same_surface(self):
+        """Тест: повторная отрисовка берёт поверхность из кэша"""
+        first = self.cache.render(self.font, "Зал", True, WHITE)
+        second = self.cache.render(self.font, "Зал", True, WHITE)
+
+        self.assertIs(first, second)
+        self.font.render.assert_called_once_with("Зал", True, WHITE)
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_key_includes_color_and_antialias(self):
+        """Тест: разные цвет и сглаживание - разные записи"""
+        self.cache.render(self.font, "Зал", True, WHITE)
+        self.cache.render(self.font, "Зал", True, BLACK)
+        self.cache.render(self.font, "Зал", False, WHITE)
+
+        self.assertEqual(self.font.render.call_count, 3)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_color_list_and_tuple_share_entry(self):
+        """Тест: цвет в виде списка и кортежа даёт один ключ"""
+        self.cache.render(self.font, "Зал", True, [255, 0, 0])
+        self.cache.render(self.font, "Зал", True, RED)
+
+        self.assertEqual(self.cache.misses, 1)
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использованной записи"""
+        self.cache.render(self.font, "a", True, BLACK)
+        self.cache.render(self.font, "b", True, BLACK)
+        self.cache.render(self.font, "c", True, BLACK)
+        # "a" становится самой свежей, вытесняется "b"
+        self.cache.render(self.font, "a", True, BLACK)
+        self.cache.render(self.font, "d", True, BLACK)
+
+        self.assertEqual(len(self.cache), 3)
+        self.assertEqual(self.cache.evictions, 1)
+        self.cache.render(self.font, "a", True, BLACK)
+        self.assertEqual(self.cache.hits, 2)
+        self.cache.render(self.font, "b", True, BLACK)
+        self.assertEqual(self.cache.misses, 5)
+
+    def test_stats_and_clear(self):
+        """Тест статистики и очистки"""
+        self.cache.render(self.font, "a", True, BLACK)
+        self.cache.render(self.font, "a", True, BLACK)
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertAlmostEqual(stats["hit_rate"], 0.5)
+
+        self.cache.clear()
+        self.assertEqual(self.cache.stats()["size"], 0)
+        self.assertEqual(self.cache.stats()["hit_rate"], 0.0)
+
+
+class TestCachedDrawing(unittest.TestCase):
+    """Тесты: неизменный текст в интерфейсе не отрисовывается повторно"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.screen = pygame.display.set_mode((800, 600))
+        TEXT_CACHE.clear()
+
+    def test_render_text_matches_font_render(self):
+        """Тест: поверхность из кэша совпадает с прямой отрисовкой"""
+        font = get_font(24)
+        cached = render_text(font, "Привет", True, BLACK)
+        direct = font.render("Привет", True, BLACK)
+
+        self.assertEqual(cached.get_size(), direct.get_size())
+
+    def test_button_label_rendered_once(self):
+        """Тест: надпись кнопки растеризуется один раз"""
+        from entities.buttons import Button
+
+        button = Button(10, 10, 150, 50, "Кнопка")
+        for _ in range(5):
+            button.draw(self.screen)
+
+        self.assertEqual(TEXT_CACHE.misses, 1)
+        self.assertEqual(TEXT_CACHE.hits, 4)
+
+    def test_stats_window_steady_state(self):
+        """Тест: повторная отрисовка окна статистики не вызывает font.render"""
+        from database.models import Tamagotchi
+        from entities.tamagotchi import TamagotchiEntity
+        from game.stats_window import StatsWindow
+
+        tamagotchi = TamagotchiEntity(Tamagotchi(name="Кэш"))
+        window = StatsWindow()
+        window.visible = True
+
+        for tab in window.scroll_offsets:
+            window.current_tab = tab
+            window.draw(self.screen, tamagotchi)
+        misses = TEXT_CACHE.misses
+
+        for tab in window.scroll_offsets:
+            window.current_tab = tab
+            window.draw(self.screen, tamagotchi)
+
+        self.assertEqual(TEXT_CACHE.misses, misses)
+        self.assertGreater(TEXT_CACHE.hits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
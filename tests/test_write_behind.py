@@ -0,0 +1,183 @@
+"""
+Тесты для модуля database.write_behind
+"""
+import unittest
+import threading
+import sys
+import os
+
+# Добавляем корневую директорию проекта в путь
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.models import Tamagotchi
+from database.memory_manager import MemoryManager
+from database.write_behind import WriteBehindQueue
+
+
+class SlowManager(MemoryManager):
+    """MemoryManager, запись в который ждёт разрешения теста."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.saved = []
+
+    def save_tamagotchi(self, tamagotchi):
+        self.started.set()
+        self.release.wait(5)
+        self.saved.append((tamagotchi.name, tamagotchi.hunger))
+        return super().save_tamagotchi(tamagotchi)
+
+
+class TestWriteBehindQueue(unittest.TestCase):
+    """Тесты для класса WriteBehindQueue"""
+
+    def setUp(self):
+        """Настройка перед каждым тестом"""
+        self.db = SlowManager()
+        self.queue = WriteBehindQueue(self.db)
+        self.addCleanup(self.queue.close, 5)
+        self.addCleanup(self.db.release.set)
+
+    def test_enqueue_does_not_block(self):
+        """Тест: постановка в очередь не ждёт записи"""
+        pet = Tamagotchi(name="Быстрый")
+
+        self.assertTrue(self.queue.enqueue(pet))
+        self.assertTrue(self.db.started.wait(5))
+        self.assertEqual(self.db.saved, [])
+
+        self.db.release.set()
+        self.assertTrue(self.queue.flush(5))
+        self.assertEqual(self.db.saved, [("Быстрый", 50)])
+
+    def test_latest_state_wins(self):
+        """Тест: пока идёт запись, новые снимки объединяются, записывается последний"""
+        pet = Tamagotchi(name="Жадный")
+        self.queue.enqueue(pet)
+        self.assertTrue(self.db.started.wait(5))
+
+        for hunger in (60, 70, 80):
+            pet.hunger = hunger
+            self.queue.enqueue(pet)
+
+        self.db.release.set()
+        self.assertTrue(self.queue.flush(5))
+
+        self.assertEqual(self.db.saved, [("Жадный", 50), ("Жадный", 80)])
+        self.assertEqual(self.queue.stats["coalesced"], 2)
+        self.assertEqual(self.queue.stats["saved"], 2)
+
+    def test_snapshot_is_copied(self):
+        """Тест: изменения после постановки в очередь не попадают в снимок"""
+        pet = Tamagotchi(name="Снимок")
+        pet.hunger = 10
+        self.queue.enqueue(pet)
+        pet.hunger = 99
+
+        self.db.release.set()
+        self.queue.flush(5)
+
+        self.assertEqual(self.db.saved, [("Снимок", 10)])
+
+    def test_new_pet_gets_id_once(self):
+        """Тест: новый тамагочи получает ID и не создаётся дважды"""
+        pet = Tamagotchi(name="Новичок")
+        self.queue.enqueue(pet)
+        self.assertTrue(self.db.started.wait(5))
+        self.queue.enqueue(pet)
+
+        self.db.release.set()
+        self.queue.flush(5)
+
+        self.assertEqual(pet.id, 1)
+        self.assertEqual(len(self.db.tamagotchis), 1)
+
+    def test_close_flushes_and_rejects(self):
+        """Тест: закрытие записывает очередь и больше не принимает снимки"""
+        self.db.release.set()
+        self.queue.enqueue(Tamagotchi(name="Последний"))
+
+        self.assertTrue(self.queue.close(5))
+        self.assertEqual(self.queue.pending_count(), 0)
+        self.assertEqual(len(self.db.saved), 1)
+        self.assertFalse(self.queue.enqueue(Tamagotchi(name="Поздний")))
+
+    def test_failed_save_is_counted(self):
+        """Тест: ошибка записи не останавливает поток"""
+        self.db.release.set()
+        self.db.save_tamagotchi = lambda tamagotchi: 1 / 0
+        self.queue.enqueue(Tamagotchi(name="Сбой"))
+
+        self.assertTrue(self.queue.flush(5))
+        self.assertEqual(self.queue.stats["failed"], 1)
+
+
+    def test_close_retries_failed_save(self):
+        """Тест: закрытие ещё раз записывает тамагочи, сохранение которого не удалось"""
+        self.db.release.set()
+        save = self.db.save_tamagotchi
+        self.db.save_tamagotchi = lambda tamagotchi: False
+        pet = Tamagotchi.from_dict({'id': 6, 'name': 'Упрямый'})
+        pet.hunger = 10
+        self.queue.enqueue(pet)
+        self.queue.flush(5)
+        self.db.save_tamagotchi = save
+
+        self.assertTrue(self.queue.close(5))
+        self.assertEqual(self.db.saved, [("Упрямый", 10)])
+
+    def test_close_reports_unwritten(self):
+        """Тест: если последнее сохранение не удалось, close возвращает False"""
+        self.db.release.set()
+        self.db.save_tamagotchi = lambda tamagotchi: False
+        self.queue.enqueue(Tamagotchi(name="Потерянный"))
+
+        self.assertFalse(self.queue.close(5))
+        self.assertEqual(self.queue.stats["failed"], 2)
+
+    def test_clean_pet_is_skipped(self):
+        """Тест: тамагочи без изменений не ставится в очередь"""
+        pet = Tamagotchi.from_dict({'id': 4, 'name': 'Чистый'})
+
+        self.assertTrue(self.queue.enqueue(pet))
+        self.assertEqual(self.queue.pending_count(), 0)
+        self.assertEqual(self.queue.stats["skipped"], 1)
+
+    def test_failed_fields_are_retried(self):
+        """Тест: поля из неудачной записи попадают в следующий снимок"""
+        self.db.release.set()
+        pet = Tamagotchi.from_dict({'id': 5, 'name': 'Повтор'})
+        written = []
+        self.db.save_tamagotchi = lambda tamagotchi: written.append(tamagotchi.dirty_fields) and False
+
+        pet.hunger = 10
+        self.queue.enqueue(pet)
+        self.queue.flush(5)
+        pet.coins = 5
+        self.queue.enqueue(pet)
+        self.queue.flush(5)
+
+        self.assertFalse(pet.is_dirty)
+        self.assertEqual(written, [{'hunger'}, {'hunger', 'coins'}])
+
+
+    def test_batch_uses_save_many(self):
+        """Тест: накопившиеся снимки записываются одной пачкой"""
+        pets = [Tamagotchi(name=f"Питомец {i}") for i in range(3)]
+        self.queue.enqueue(pets[0])
+        self.assertTrue(self.db.started.wait(5))
+        batches = []
+        self.db.save_many = lambda snapshots: batches.append(len(snapshots)) or True
+        for pet in pets[1:]:
+            self.queue.enqueue(pet)
+
+        self.db.release.set()
+        self.assertTrue(self.queue.flush(5))
+
+        self.assertEqual(batches, [2])
+        self.assertEqual(self.queue.stats["saved"], 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,11 +7,16 @@
 
 Основные компоненты:
 - Функции отрисовки текста и прогресс-баров
+- Общий реестр шрифтов
+- LRU-кэш отрисованного текста
 - Классы для работы с анимациями и спрайт-листами
 """
 
+from .fonts import FONT_REGISTRY, get_font
+from .text_cache import TEXT_CACHE, TextCache, render_text
 from .helpers import draw_text, draw_progress_bar
 from .animation import Animation, SpriteSheet
 
 # Экспортируемые имена для использования в других модулях
-__all__ = ['draw_text', 'draw_progress_bar', 'Animation', 'SpriteSheet']
+__all__ = ['draw_text', 'draw_progress_bar', 'Animation', 'SpriteSheet',
+           'FONT_REGISTRY', 'get_font', 'TEXT_CACHE', 'TextCache', 'render_text']
@@ -0,0 +1,96 @@
+"""
+Модуль реестра шрифтов для игры Tamagotchi Pou.
+
+Создание pygame.font.Font - дорогая операция: шрифт загружается и
+разбирается заново при каждом вызове. Реестр хранит единственный объект
+шрифта для каждой пары (гарнитура, размер) на весь процесс, поэтому
+комнаты, окна и виджеты используют общие шрифты, а в обычных кадрах
+новые шрифты не создаются вовсе.
+"""
+
+import pygame
+
+# Размеры шрифтов, которые использует интерфейс игры
+UI_FONT_SIZES = (18, 20, 24, 28, 32, 36, 48)
+
+
+class FontRegistry:
+    """Общий для процесса реестр шрифтов.
+
+    Атрибуты:
+        constructions: Количество созданных объектов pygame.font.Font
+        lookups: Количество обращений к реестру
+    """
+
+    def __init__(self):
+        """Инициализирует пустой реестр."""
+        self._fonts = {}
+        self.constructions = 0
+        self.lookups = 0
+
+    def get(self, size, face=None):
+        """Возвращает шрифт заданного размера, создавая его при первом обращении.
+
+        Аргументы:
+            size: Размер шрифта в пунктах
+            face: Путь к файлу шрифта или None для шрифта по умолчанию
+
+        Возвращает:
+            pygame.font.Font: Общий объект шрифта
+        """
+        self.lookups += 1
+        key = (face, size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(face, size)
+            self._fonts[key] = font
+            self.constructions += 1
+        return font
+
+    def preload(self, sizes=UI_FONT_SIZES, face=None):
+        """Заранее создаёт шрифты указанных размеров (вызывается при запуске).
+
+        Аргументы:
+            sizes: Последовательность размеров шрифтов
+            face: Путь к файлу шрифта или None для шрифта по умолчанию
+        """
+        for size in sizes:
+            self.get(size, face)
+
+    def stats(self):
+        """Возвращает статистику реестра.
+
+        Возвращает:
+            dict: Количество шрифтов, созданий и обращений
+        """
+        return {
+            "fonts": len(self._fonts),
+            "constructions": self.constructions,
+            "lookups": self.lookups,
+        }
+
+    def clear(self):
+        """Удаляет все шрифты из реестра и сбрасывает счётчики."""
+        self._fonts.clear()
+        self.constructions = 0
+        self.lookups = 0
+
+
+# Единственный экземпляр реестра на процесс
+FONT_REGISTRY = FontRegistry()
+
+
+def get_font(size, face=None):
+    """Возвращает общий шрифт заданного размера из реестра процесса.
+
+    Аргументы:
+        size: Размер шрифта в пунктах
+        face: Путь к файлу шрифта или None для шрифта по умолчанию
+
+    Возвращает:
+        pygame.font.Font: Общий объект шрифта
+
+    Пример использования:
+        title = get_font(36).render("Hall", True, WHITE)
+    """
+    return FONT_REGISTRY.get(size, face)
@@ -1,5 +1,6 @@
 import pygame
 from config import *
+from .fonts import get_font
 
 
 def draw_text(surface, text, size, x, y, color=BLACK):
@@ -19,9 +20,9 @@ def draw_text(surface, text, size, x, y, color=BLACK):
     Пример использования:
         draw_text(screen, "Hello World", 36, 400, 300, RED)
     """
-    # Создаем объект шрифта с заданным размером
-    # None означает использование системного шрифта по умолчанию
-    font = pygame.font.Font(None, size)
+    # Берём общий шрифт заданного размера из реестра шрифтов
+    # (шрифт создаётся только при первом обращении)
+    font = get_font(size)
     
     # Рендерим текст в поверхность (True означает сглаживание)
     text_surface = font.render(text, True, color)
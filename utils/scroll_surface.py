@@ -0,0 +1,117 @@
+"""
+Модуль заранее нарисованного прокручиваемого содержимого.
+
+Вместо того чтобы в каждом кадре заново рисовать все строки списка и
+отбрасывать невидимые, содержимое рисуется один раз на внеэкранные
+поверхности, а прокрутка выводит видимую часть через blit с областью
+(area). Короткое содержимое целиком помещается на одну поверхность.
+Длинное (история из тысяч строк) делится на плитки фиксированной высоты,
+которые рисуются лениво, только когда попадают в видимую область, и
+вытесняются по LRU: память не растет с длиной списка, а кадр стоит одного
+или двух blit.
+"""
+
+from collections import OrderedDict
+
+import pygame
+
+from config import WHITE
+
+# Сколько нарисованных плиток хранится одновременно
+DEFAULT_MAX_TILES = 4
+
+
+class ScrollSurface:
+    """Прокручиваемое содержимое, нарисованное на внеэкранных плитках.
+
+    Функция render(surface, top) рисует на поверхности плитки часть
+    содержимого, начинающуюся с координаты top: элемент с координатой y
+    содержимого рисуется на плитке в y - top.
+
+    Атрибуты:
+        width: Ширина содержимого
+        height: Полная высота содержимого
+        tile_height: Высота плитки (равна высоте содержимого, если не задана)
+        rendered: Сколько раз рисовались плитки
+    """
+
+    def __init__(self, width, height, render, tile_height=None, background=WHITE,
+                 max_tiles=DEFAULT_MAX_TILES):
+        """Создает содержимое без нарисованных плиток.
+
+        Аргументы:
+            width: Ширина содержимого
+            height: Полная высота содержимого
+            render: Функция render(surface, top), рисующая плитку
+            tile_height: Высота плитки (None - одна плитка на всё содержимое)
+            background: Цвет фона плиток
+            max_tiles: Сколько нарисованных плиток хранить
+        """
+        self.width = width
+        self.height = max(1, height)
+        self.tile_height = tile_height or self.height
+        self.render = render
+        self.background = background
+        self.max_tiles = max_tiles
+        self.rendered = 0
+        self._tiles = OrderedDict()
+
+    def tile(self, index):
+        """Возвращает плитку, рисуя ее при первом обращении.
+
+        Аргументы:
+            index: Номер плитки сверху вниз
+
+        Возвращает:
+            pygame.Surface: Поверхность плитки
+        """
+        surface = self._tiles.get(index)
+        if surface is not None:
+            self._tiles.move_to_end(index)
+            return surface
+
+        top = index * self.tile_height
+        surface = pygame.Surface((self.width, min(self.tile_height, self.height - top)))
+        surface.fill(self.background)
+        self.render(surface, top)
+        self.rendered += 1
+        self._tiles[index] = surface
+        if len(self._tiles) > self.max_tiles:
+            self._tiles.popitem(last=False)
+        return surface
+
+    def resize(self, height, valid_until=0):
+        """Меняет высоту содержимого, сохраняя плитки, которые не изменились.
+
+        Аргументы:
+            height: Новая полная высота содержимого
+            valid_until: Содержимое выше этой координаты не изменилось
+        """
+        self.height = max(1, height)
+        for index in [index for index in self._tiles
+                      if (index + 1) * self.tile_height > valid_until]:
+            del self._tiles[index]
+
+    def blit(self, screen, rect, offset):
+        """Выводит видимую часть содержимого.
+
+        Аргументы:
+            screen: Поверхность PyGame для отрисовки
+            rect: Прямоугольник видимой области на экране
+            offset: Смещение прокрутки (координата содержимого у верхнего края rect)
+
+        Возвращает:
+            int: Количество выполненных blit
+        """
+        offset = max(0, offset)
+        bottom = min(self.height, offset + rect.height)
+        count = 0
+        index = offset // self.tile_height
+        while index * self.tile_height < bottom:
+            top = index * self.tile_height
+            area = pygame.Rect(0, max(0, offset - top), self.width,
+                               min(self.tile_height, bottom - top) - max(0, offset - top))
+            screen.blit(self.tile(index), (rect.x, rect.y + top + area.y - offset), area)
+            count += 1
+            index += 1
+        return count
@@ -0,0 +1,117 @@
+"""
+Модуль кэша отрисованного текста для игры Tamagotchi Pou.
+
+font.render() растеризует строку заново при каждом вызове, хотя заголовки
+комнат, надписи на кнопках, подсказки и списки в окне статистики почти
+никогда не меняются. Кэш хранит готовые поверхности с ключом
+(шрифт, текст, сглаживание, цвет) и вытесняет давно не использованные
+записи (LRU), поэтому неизменный текст стоит только одного blit.
+
+Поверхности из кэша общие: их нельзя изменять после получения.
+"""
+
+from collections import OrderedDict
+
+# Максимальное количество поверхностей в кэше по умолчанию
+DEFAULT_TEXT_CACHE_SIZE = 512
+
+
+class TextCache:
+    """Кэш поверхностей с отрисованным текстом с вытеснением LRU.
+
+    Атрибуты:
+        max_size: Максимальное количество хранимых поверхностей
+        hits: Количество попаданий в кэш
+        misses: Количество промахов (вызовов font.render)
+        evictions: Количество вытесненных записей
+    """
+
+    def __init__(self, max_size=DEFAULT_TEXT_CACHE_SIZE):
+        """Инициализирует пустой кэш.
+
+        Аргументы:
+            max_size: Максимальное количество хранимых поверхностей
+        """
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        """Возвращает поверхность с текстом, отрисовывая её только при промахе.
+
+        Аргументы:
+            font: Объект pygame.font.Font
+            text: Строка для отрисовки
+            antialias: Использовать ли сглаживание
+            color: Цвет текста
+
+        Возвращает:
+            pygame.Surface: Общая поверхность с отрисованным текстом
+        """
+        key = (font, text, bool(antialias), tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self):
+        """Возвращает статистику кэша.
+
+        Возвращает:
+            dict: Размер, попадания, промахи, вытеснения и доля попаданий
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._surfaces),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        """Удаляет все поверхности из кэша и сбрасывает счётчики."""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+# Единственный экземпляр кэша на процесс
+TEXT_CACHE = TextCache()
+
+
+def render_text(font, text, antialias, color):
+    """Отрисовывает текст через общий кэш процесса.
+
+    Аргументы совпадают с font.render(), поэтому вызов можно заменить
+    без изменения остального кода.
+
+    Аргументы:
+        font: Объект pygame.font.Font
+        text: Строка для отрисовки
+        antialias: Использовать ли сглаживание
+        color: Цвет текста
+
+    Возвращает:
+        pygame.Surface: Общая поверхность с отрисованным текстом
+
+    Пример использования:
+        title = render_text(self.font, "Hall", True, WHITE)
+    """
+    return TEXT_CACHE.render(font, text, antialias, color)